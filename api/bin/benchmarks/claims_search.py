@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+#
+# Measure GetClaimsQuery.add_search_filter latency, as used by GET /claims?search= and
+# POST /claims/search, on a seeded dataset of claims.
+#
+# Employees and claims are generated with generate_series inside a transaction that is rolled back
+# at the end, so this can be pointed at a local, fully migrated database. Each search shape is run
+# with the trigram indexes available and again with index scans disabled, to show what the indexes
+# save.
+#
+# Usage: poetry run python bin/benchmarks/claims_search.py [claim_count] [iterations]
+#
+
+import statistics
+import sys
+import time
+
+from sqlalchemy import text
+
+import massgov.pfml.db as db
+from massgov.pfml.api.models.common import SearchEnvelope
+from massgov.pfml.api.util.paginate.paginator import PaginationAPIContext
+from massgov.pfml.db.models.employees import Claim
+from massgov.pfml.db.queries.get_claims_query import GetClaimsQuery
+
+SEARCHES = {
+    "single name": "mith42",
+    "full name": "first42 smith42",
+    "absence id": "ABS-4242",
+}
+
+
+def seed(db_session: db.Session, claim_count: int) -> None:
+    employee_count = max(claim_count // 2, 1)
+    db_session.execute(
+        text(
+            """
+            INSERT INTO employee (
+                employee_id, first_name, middle_name, last_name,
+                fineos_employee_first_name, fineos_employee_last_name
+            )
+            SELECT
+                gen_random_uuid(),
+                'first' || (i % 5000),
+                CASE WHEN i % 3 = 0 THEN NULL ELSE 'middle' || (i % 700) END,
+                'smith' || (i % 20000),
+                'first' || (i % 5000),
+                'smith' || (i % 20000)
+            FROM generate_series(1, :employee_count) AS i
+            """
+        ),
+        {"employee_count": employee_count},
+    )
+    db_session.execute(
+        text(
+            """
+            INSERT INTO claim (claim_id, employee_id, fineos_absence_id, claim_type_id)
+            SELECT gen_random_uuid(), e.employee_id, 'NTN-' || i || '-ABS-' || (i % 10000), 1
+            FROM generate_series(1, :claim_count) AS i
+            JOIN (
+                SELECT employee_id, row_number() OVER () AS n FROM employee
+            ) e ON e.n = 1 + (i % :employee_count)
+            """
+        ),
+        {"claim_count": claim_count, "employee_count": employee_count},
+    )
+    db_session.execute(text("ANALYZE employee"))
+    db_session.execute(text("ANALYZE claim"))
+
+
+def run_search(db_session: db.Session, search_string: str) -> float:
+    query = GetClaimsQuery(db_session)
+    query.add_search_filter(search_string)
+    context = PaginationAPIContext(Claim, request=SearchEnvelope[None](terms=None))  # type: ignore
+    query.add_order_by(context, None)
+
+    start = time.perf_counter()
+    # Runs the count query and fetches the first page, as the endpoints do
+    query.get_paginated_results(context)
+    return time.perf_counter() - start
+
+
+def measure(db_session: db.Session, search_string: str, iterations: int) -> str:
+    timings = sorted(run_search(db_session, search_string) for _ in range(iterations))
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    return "p50 %8.1fms  p95 %8.1fms" % (statistics.median(timings) * 1000, p95 * 1000)
+
+
+def main():
+    claim_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    db_session = db.init(sync_lookups=False)()
+
+    try:
+        start = time.perf_counter()
+        seed(db_session, claim_count)
+        print("seeded %i claims in %.1fs" % (claim_count, time.perf_counter() - start))
+
+        for name, search_string in SEARCHES.items():
+            print("%-12s indexed    %s" % (name, measure(db_session, search_string, iterations)))
+
+            db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+            db_session.execute(text("SET LOCAL enable_indexscan = off"))
+            print("%-12s seq scan   %s" % (name, measure(db_session, search_string, iterations)))
+            db_session.execute(text("SET LOCAL enable_bitmapscan = on"))
+            db_session.execute(text("SET LOCAL enable_indexscan = on"))
+    finally:
+        db_session.rollback()
+        db_session.close()
+
+
+if __name__ == "__main__":
+    main()
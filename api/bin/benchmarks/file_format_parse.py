@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+#
+# Compare FileFormat.parse_line (dict per line) with FileFormat.parse_lines (bulk, per column) on
+# synthetic DOR employee wage rows.
+#
+# Usage: poetry run python bin/benchmarks/file_format_parse.py [line_count] [buffer_length]
+#
+
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+from massgov.pfml.dor.importer.dor_file_formats import EMPLOYEE_FORMAT
+
+
+def generate_employee_line(rng: random.Random) -> str:
+    quarter = rng.choice(["20210331", "20210630", "20210930", "20211231"])
+    wages = "%.2f" % rng.uniform(0, 40000)
+    contribution = "%.2f" % rng.uniform(0, 400)
+
+    return "".join(
+        (
+            "B",
+            str(rng.randint(10**10, 10**11 - 1)),
+            quarter,
+            "FIRSTNAME{}".format(rng.randint(0, 9999)).ljust(255),
+            "LASTNAME{}".format(rng.randint(0, 9999)).ljust(255),
+            str(rng.randint(10**8, 10**9 - 1)),
+            rng.choice("TF"),
+            rng.choice("TF"),
+            wages.rjust(20),
+            wages.rjust(20),
+            contribution.rjust(20),
+            contribution.rjust(20),
+            contribution.rjust(20),
+            contribution.rjust(20),
+        )
+    )
+
+
+def bench_parse_line(lines):
+    return [EMPLOYEE_FORMAT.parse_line(line) for line in lines]
+
+
+def bench_parse_lines(lines, buffer_length):
+    records: List[Dict[str, Any]] = []
+    for start in range(0, len(lines), buffer_length):
+        parsed = EMPLOYEE_FORMAT.parse_lines(lines[start : start + buffer_length])
+        records.extend(parsed.records())
+    return records
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    buffer_length = int(sys.argv[2]) if len(sys.argv) > 2 else 25000
+
+    rng = random.Random(0)
+    lines = [generate_employee_line(rng) for _ in range(line_count)]
+
+    start = time.perf_counter()
+    per_line = bench_parse_line(lines)
+    per_line_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk = bench_parse_lines(lines, buffer_length)
+    bulk_seconds = time.perf_counter() - start
+
+    assert per_line == bulk, "parse_lines output differs from parse_line"
+
+    print(f"lines: {line_count}, buffer length: {buffer_length}")
+    print(f"parse_line:  {per_line_seconds:.3f}s ({line_count / per_line_seconds:,.0f} lines/s)")
+    print(f"parse_lines: {bulk_seconds:.3f}s ({line_count / bulk_seconds:,.0f} lines/s)")
+    print(f"speedup: {per_line_seconds / bulk_seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+#
+# Compare JsonFormatter with FastJsonFormatter on log records like the ones batch tasks write per
+# payment or per employee, outside and inside a Flask request.
+#
+# Usage: poetry run python bin/benchmarks/json_formatter.py [record_count]
+#
+
+import copy
+import json
+import logging  # noqa: B1
+import sys
+import time
+import uuid
+
+import flask
+
+from massgov.pfml.util.logging import formatters
+
+
+def generate_records(record_count):
+    return [
+        logging.makeLogRecord(  # noqa: B1
+            {
+                "name": "massgov.pfml.delegated_payments.address_validation",
+                "msg": "Payment passed address validation for %s",
+                "args": ("NTN-%i-ABS-01" % i,),
+                "levelno": logging.INFO,  # noqa: B1
+                "levelname": "INFO",
+                "funcName": "_create_end_state_by_payment_type",
+                "payment_id": str(uuid.uuid4()),
+                "claim_id": str(uuid.uuid4()),
+                "absence_case_id": "NTN-%i-ABS-01" % i,
+                "fineos_customer_number": str(100000 + i),
+                "payment_amount": 1234.56,
+                "count": i,
+                "is_eft": i % 2 == 0,
+            }
+        )
+        for i in range(record_count)
+    ]
+
+
+def bench(formatter, records):
+    start = time.perf_counter()
+    lines = [formatter.format(record) for record in records]
+    return time.perf_counter() - start, lines
+
+
+def compare(label, records):
+    slow_seconds, slow_lines = bench(formatters.JsonFormatter(), copy.deepcopy(records))
+    fast_seconds, fast_lines = bench(formatters.FastJsonFormatter(), copy.deepcopy(records))
+
+    assert [json.loads(line) for line in slow_lines] == [
+        json.loads(line) for line in fast_lines
+    ], "FastJsonFormatter output differs from JsonFormatter"
+
+    count = len(records)
+    print(label)
+    print(f"  JsonFormatter:     {slow_seconds:.3f}s ({count / slow_seconds:,.0f} lines/s)")
+    print(f"  FastJsonFormatter: {fast_seconds:.3f}s ({count / fast_seconds:,.0f} lines/s)")
+    print(f"  speedup: {slow_seconds / fast_seconds:.2f}x")
+
+
+def main():
+    record_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    records = generate_records(record_count)
+
+    print(f"records: {record_count}")
+    compare("batch task (no request)", records)
+
+    app = flask.Flask(__name__)
+    with app.test_request_context(
+        "/v1/notifications", method="POST", headers={"x-amzn-requestid": str(uuid.uuid4())}
+    ):
+        compare("API request", records)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+#
+# Compare page by offset with page by cursor (KeysetPaginator), and the ways of counting the total
+# records, for the claims of one large employer, as GET /claims pages through them.
+#
+# Claims are generated with generate_series inside a transaction that is rolled back at the end, so
+# this can be pointed at a local, fully migrated database.
+#
+# Usage: poetry run python bin/benchmarks/pagination.py [claim_count] [iterations]
+#
+
+import statistics
+import sys
+import time
+import uuid
+from typing import Any, Callable
+
+from sqlalchemy import text
+
+import massgov.pfml.db as db
+from massgov.pfml.api.models.common import TotalRecordsMode
+from massgov.pfml.api.util.paginate import paginator as paginator_module
+from massgov.pfml.api.util.paginate.paginator import KeysetPaginator, Paginator, encode_cursor
+from massgov.pfml.db.models.employees import Claim
+
+PAGE_SIZE = 25
+
+
+def seed(db_session: db.Session, claim_count: int) -> uuid.UUID:
+    employer_id = uuid.uuid4()
+    db_session.execute(
+        text(
+            "INSERT INTO employer (employer_id, employer_fein) VALUES (:employer_id, '000000001')"
+        ),
+        {"employer_id": employer_id},
+    )
+    db_session.execute(
+        text(
+            """
+            INSERT INTO claim (claim_id, employer_id, fineos_absence_id, claim_type_id, created_at)
+            SELECT
+                gen_random_uuid(),
+                CASE WHEN i % 2 = 0 THEN :employer_id ELSE NULL END,
+                'NTN-' || i || '-ABS-01',
+                1,
+                now() - (i || ' seconds')::interval
+            FROM generate_series(1, :claim_count) AS i
+            """
+        ),
+        {"claim_count": claim_count, "employer_id": employer_id},
+    )
+    db_session.execute(text("ANALYZE claim"))
+    return employer_id
+
+
+def timed(fn: Callable[[], Any], iterations: int) -> str:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return "p50 %8.1fms" % (statistics.median(timings) * 1000)
+
+
+def main():
+    claim_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    db_session = db.init(sync_lookups=False)()
+
+    try:
+        start = time.perf_counter()
+        employer_id = seed(db_session, claim_count)
+        print("seeded %i claims in %.1fs" % (claim_count, time.perf_counter() - start))
+
+        query = (
+            db_session.query(Claim)
+            .filter(Claim.employer_id == employer_id)
+            .order_by(Claim.created_at.desc())
+        )
+        employer_claim_count = query.count()
+
+        for page_offset in (1, 100, 1000, employer_claim_count // PAGE_SIZE):
+            # The cursor a client would hold after paging to just before page_offset
+            if page_offset == 1:
+                cursor = ""
+            else:
+                last_claim = query.order_by(None).order_by(
+                    Claim.created_at.desc(), Claim.claim_id.desc()
+                )[(page_offset - 1) * PAGE_SIZE - 1]
+                cursor = encode_cursor(
+                    "created_at", "descending", [last_claim.created_at, last_claim.claim_id]
+                )
+
+            def offset_page():
+                Paginator(
+                    Claim, query, PAGE_SIZE, total_records_mode=TotalRecordsMode.none
+                ).page_at(page_offset)
+
+            def keyset_page():
+                KeysetPaginator(
+                    Claim,
+                    query,
+                    Claim.created_at,
+                    "descending",
+                    PAGE_SIZE,
+                    total_records_mode=TotalRecordsMode.none,
+                ).page_after(cursor)
+
+            offset_values = (
+                Paginator(Claim, query, PAGE_SIZE, total_records_mode=TotalRecordsMode.none)
+                .page_at(page_offset)
+                .values
+            )
+            keyset_values = (
+                KeysetPaginator(
+                    Claim, query, Claim.created_at, "descending", PAGE_SIZE, TotalRecordsMode.none
+                )
+                .page_after(cursor)
+                .values
+            )
+            assert [claim.claim_id for claim in offset_values] == [
+                claim.claim_id for claim in keyset_values
+            ], "offset and cursor pages differ"
+
+            print("page %-7i offset  %s" % (page_offset, timed(offset_page, iterations)))
+            print("page %-7i cursor  %s" % (page_offset, timed(keyset_page, iterations)))
+
+        for mode in (TotalRecordsMode.exact, TotalRecordsMode.cached, TotalRecordsMode.estimated):
+            paginator_module.total_records_cache.clear()
+            paginator = Paginator(Claim, query, PAGE_SIZE, total_records_mode=mode)
+            print(
+                "total %-9s %s (%s records%s)"
+                % (
+                    mode.value,
+                    timed(
+                        lambda: Paginator(
+                            Claim, query, PAGE_SIZE, total_records_mode=mode
+                        ).total_records,
+                        iterations,
+                    ),
+                    paginator.total_records,
+                    ", approximate" if paginator.total_records_approximate else "",
+                )
+            )
+        print("exact total: %i records" % employer_claim_count)
+    finally:
+        db_session.rollback()
+        db_session.close()
+
+
+if __name__ == "__main__":
+    main()
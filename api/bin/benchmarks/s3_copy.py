@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+#
+# Compare the old copy_file (download to a tempfile, then upload) with the server side copy in
+# util.files.copy_file, and with the batch copy in util.files.copy_files, against a moto S3 mock.
+#
+# moto keeps objects in memory in this process, so the times measure the client side work and the
+# bytes moved through it rather than real S3 throughput. Against real S3 a server side copy moves
+# no object bytes through the task at all.
+#
+# Usage: poetry run python bin/benchmarks/s3_copy.py [file_count] [file_size_mb]
+#
+
+import os
+import sys
+import tempfile
+import time
+
+import boto3
+import moto
+
+import massgov.pfml.util.files as file_util
+
+BUCKET = "benchmark-bucket"
+
+
+def legacy_copy_file(source: str, destination: str) -> None:
+    source_bucket, source_path = file_util.split_s3_url(source)
+    dest_bucket, dest_path = file_util.split_s3_url(destination)
+
+    file_descriptor, tempfile_path = tempfile.mkstemp()
+    try:
+        file_util.get_s3_client(source_bucket).download_file(
+            source_bucket, source_path, tempfile_path
+        )
+        file_util.get_s3_client(dest_bucket).upload_file(tempfile_path, dest_bucket, dest_path)
+    finally:
+        os.close(file_descriptor)
+        os.remove(tempfile_path)
+
+
+def copies_to(prefix, file_count):
+    return [
+        (f"s3://{BUCKET}/received/extract{i}.csv", f"s3://{BUCKET}/{prefix}/extract{i}.csv")
+        for i in range(file_count)
+    ]
+
+
+def report(label, seconds, size_bytes, baseline_seconds):
+    megabytes_per_second = size_bytes / (1024 * 1024) / seconds
+    print(
+        f"{label:<26} {seconds:8.3f}s {megabytes_per_second:10.1f} MB/s"
+        f" {baseline_seconds / seconds:6.2f}x"
+    )
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    file_size = int(float(sys.argv[2]) * 1024 * 1024) if len(sys.argv) > 2 else 16 * 1024 * 1024
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+    with moto.mock_s3():
+        s3 = boto3.client("s3")
+        s3.create_bucket(Bucket=BUCKET)
+        body = os.urandom(file_size)
+        for i in range(file_count):
+            s3.put_object(Bucket=BUCKET, Key=f"received/extract{i}.csv", Body=body)
+        total_bytes = file_count * file_size
+
+        print(f"files: {file_count}, size: {file_size / (1024 * 1024):.1f} MB each")
+
+        start = time.perf_counter()
+        for source, destination in copies_to("legacy", file_count):
+            legacy_copy_file(source, destination)
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for source, destination in copies_to("copy_file", file_count):
+            file_util.copy_file(source, destination)
+        copy_file_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = file_util.copy_files(copies_to("copy_files", file_count))
+        copy_files_seconds = time.perf_counter() - start
+
+        assert result.size_bytes == total_bytes
+        for prefix in ("legacy", "copy_file", "copy_files"):
+            copied = s3.get_object(Bucket=BUCKET, Key=f"{prefix}/extract{file_count - 1}.csv")
+            assert copied["Body"].read() == body, f"{prefix} copy differs from the source"
+
+        report("download + upload", legacy_seconds, total_bytes, legacy_seconds)
+        report("copy_file (server side)", copy_file_seconds, total_bytes, legacy_seconds)
+        report("copy_files (batch)", copy_files_seconds, total_bytes, legacy_seconds)
+
+
+if __name__ == "__main__":
+    main()
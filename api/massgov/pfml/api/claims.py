@@ -237,6 +237,8 @@ def _prepare_request_body(request: flask.Request, terms: ClaimSearchTerms) -> Di
     paging = {
         "offset": request.args.get("page_offset", paging_data.offset, type=int),
         "size": request.args.get("page_size", paging_data.size, type=int),
+        "cursor": request.args.get("page_cursor", paging_data.cursor, type=str),
+        "total_records": request.args.get("total_records", paging_data.total_records, type=str),
     }
     return {"terms": terms, "paging": paging, "order": order}
 
@@ -36,6 +36,7 @@ class AppConfig:
     new_plan_proofs_active_at: datetime
     enable_generate_1099_pdf: bool
     generate_1099_max_files: int
+    generate_1099_max_workers: int
     enable_merge_1099_pdf: bool
     enable_upload_1099_pdf: bool
     upload_max_files_to_fineos: int
@@ -43,6 +44,7 @@ class AppConfig:
     enable_1099_testfile_generation: bool
     disable_sending_emails: bool
     enable_response_validation: bool
+    enable_service_now_outbox: bool
 
 
 def get_config() -> AppConfig:
@@ -69,6 +71,7 @@ def get_config() -> AppConfig:
         ),
         enable_generate_1099_pdf=os.environ.get("ENABLE_GENERATE_1099_PDF", "0") == "1",
         generate_1099_max_files=int(os.environ.get("GENERATE_1099_MAX_FILES", 1000)),
+        generate_1099_max_workers=int(os.environ.get("GENERATE_1099_MAX_WORKERS", 1)),
         enable_merge_1099_pdf=os.environ.get("ENABLE_MERGE_1099_PDF", "0") == "1",
         enable_upload_1099_pdf=os.environ.get("ENABLE_UPLOAD_1099_PDF", "0") == "1",
         upload_max_files_to_fineos=int(os.environ.get("UPLOAD_MAX_FILES_TO_FINEOS", 10)),
@@ -79,4 +82,7 @@ def get_config() -> AppConfig:
         # desired eg for local development
         disable_sending_emails=os.environ.get("DISABLE_SENDING_EMAILS", "0") == "1",
         enable_response_validation=os.environ.get("ENABLE_RESPONSE_VALIDATION", "0") == "1",
+        # Queue ServiceNow notifications for the service-now-deliver-outbox task instead of
+        # sending them during the request
+        enable_service_now_outbox=os.environ.get("ENABLE_SERVICE_NOW_OUTBOX", "0") == "1",
     )
@@ -1,6 +1,10 @@
 import datetime
 import decimal
-from typing import Tuple
+import os
+import threading
+import time
+from bisect import bisect_right
+from typing import List, Optional, Tuple
 
 import massgov.pfml.db
 from massgov.pfml.api.eligibility.benefit import calculate_weekly_benefit_amount
@@ -9,10 +13,122 @@ from massgov.pfml.db.models.applications import BenefitsMetrics, UnemploymentMet
 logger = massgov.pfml.util.logging.get_logger(__name__)
 
 
+class StateMetricRanges:
+    """All state metrics, as the range of dates each one is effective for.
+
+    A metric is effective from its effective_date until the next metric's effective_date. The
+    metrics are transient copies, so they can be shared between sessions and threads.
+    """
+
+    def __init__(
+        self,
+        benefits_metrics: List[BenefitsMetrics],
+        unemployment_metrics: List[UnemploymentMetric],
+    ):
+        self.benefits_metrics = sorted(benefits_metrics, key=lambda m: m.effective_date)
+        self.unemployment_metrics = sorted(unemployment_metrics, key=lambda m: m.effective_date)
+        self._benefits_metrics_dates = [m.effective_date for m in self.benefits_metrics]
+        self._unemployment_metrics_dates = [m.effective_date for m in self.unemployment_metrics]
+
+    @classmethod
+    def load(cls, db_session: massgov.pfml.db.Session) -> "StateMetricRanges":
+        return cls(
+            [
+                BenefitsMetrics(
+                    metric.effective_date,
+                    str(metric.average_weekly_wage),
+                    str(metric.maximum_weekly_benefit_amount),
+                )
+                for metric in db_session.query(BenefitsMetrics)
+            ],
+            [
+                UnemploymentMetric(metric.effective_date, str(metric.unemployment_minimum_earnings))
+                for metric in db_session.query(UnemploymentMetric)
+            ],
+        )
+
+    def get(self, effective_date: datetime.date) -> Tuple[BenefitsMetrics, UnemploymentMetric]:
+        """Return state metrics effective on the given date, as fetch_state_metric does."""
+        position = bisect_right(self._benefits_metrics_dates, effective_date)
+        if position == 0:
+            logger.warning("Benefits metrics were not found for effective_date %s", effective_date)
+            raise RuntimeError(
+                "Benefits metrics were not found for effective_date {}".format(effective_date)
+            )
+        benefits_metrics = self.benefits_metrics[position - 1]
+
+        position = bisect_right(self._unemployment_metrics_dates, effective_date)
+        if position == 0:
+            logger.warning(
+                "Unemployment metrics were not found for effective_date %s", effective_date
+            )
+            raise RuntimeError(
+                "Unemployment metrics were not found for effective_date {}".format(effective_date)
+            )
+        unemployment_metric = self.unemployment_metrics[position - 1]
+
+        return (benefits_metrics, unemployment_metric)
+
+
+class StateMetricsCache:
+    """Process-level cache of the state metrics, which change about once a year.
+
+    All metrics are loaded at once and kept for ttl seconds. A ttl of 0 disables the cache.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self._ranges: Optional[StateMetricRanges] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get_ranges(self, db_session: massgov.pfml.db.Session) -> StateMetricRanges:
+        with self._lock:
+            if self._ranges is None or time.monotonic() >= self._expires_at:
+                self._ranges = StateMetricRanges.load(db_session)
+                self._expires_at = time.monotonic() + self.ttl
+
+            return self._ranges
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ranges = None
+
+
+state_metrics_cache = None  # Singleton instance of StateMetricsCache
+
+
+def get_state_metrics_cache() -> StateMetricsCache:
+    global state_metrics_cache
+
+    if state_metrics_cache is None:
+        state_metrics_cache = StateMetricsCache(
+            ttl=int(os.environ.get("STATE_METRICS_CACHE_TTL_SECONDS", "3600"))
+        )
+
+    return state_metrics_cache
+
+
+def get_state_metric_ranges(db_session: massgov.pfml.db.Session) -> StateMetricRanges:
+    """Get all state metrics, from the cache when it is enabled."""
+    cache = get_state_metrics_cache()
+    if cache.enabled:
+        return cache.get_ranges(db_session)
+
+    return StateMetricRanges.load(db_session)
+
+
 def fetch_state_metric(
     db_session: massgov.pfml.db.Session, effective_date: datetime.date
 ) -> Tuple[BenefitsMetrics, UnemploymentMetric]:
     """Return state metrics effective on the given date."""
+    cache = get_state_metrics_cache()
+    if cache.enabled:
+        return cache.get_ranges(db_session).get(effective_date)
 
     benefits_metrics = (
         db_session.query(BenefitsMetrics)
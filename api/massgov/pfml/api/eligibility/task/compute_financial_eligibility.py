@@ -0,0 +1,118 @@
+#
+# Compute financial eligibility for a CSV file of requests, with the batch engine.
+#
+# The input file has the columns employee_id, employer_id, leave_start_date,
+# application_submitted_date and employment_status, dates as YYYY-MM-DD. Each input row is written
+# to the output file along with its result. Either path can be local or on S3.
+#
+
+import argparse
+import csv
+import uuid
+from datetime import date
+from typing import Iterator, TextIO
+
+import massgov.pfml.util.files as file_util
+import massgov.pfml.util.logging as logging
+from massgov.pfml import db
+from massgov.pfml.api.eligibility.batch import (
+    FinancialEligibilityRequest,
+    compute_financial_eligibility_batch,
+)
+from massgov.pfml.api.models.applications.common import EligibilityEmploymentStatus
+from massgov.pfml.util.batch import log
+from massgov.pfml.util.bg import background_task
+
+logger = logging.get_logger(__name__)
+
+OUTPUT_COLUMNS = [
+    "employee_id",
+    "employer_id",
+    "leave_start_date",
+    "application_submitted_date",
+    "employment_status",
+    "financially_eligible",
+    "description",
+    "total_wages",
+    "state_average_weekly_wage",
+    "unemployment_minimum",
+    "employer_average_weekly_wage",
+    "error",
+]
+
+
+class Metrics:
+    REQUEST_COUNT = "request_count"
+    ELIGIBLE_COUNT = "eligible_count"
+    INELIGIBLE_COUNT = "ineligible_count"
+    ERROR_COUNT = "error_count"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Compute financial eligibility for a CSV file of requests"
+    )
+    parser.add_argument("input_path", help="CSV file of requests, local or s3://")
+    parser.add_argument("output_path", help="CSV file to write the results to, local or s3://")
+    return parser.parse_args()
+
+
+@background_task("compute-financial-eligibility")
+def main():
+    args = parse_args()
+
+    with db.session_scope(db.init(), close=True) as db_session, db.session_scope(
+        db.init(), close=True
+    ) as log_entry_db_session:
+        with log.LogEntry(log_entry_db_session, "ComputeFinancialEligibility") as log_entry:
+            with file_util.open_stream(args.input_path) as input_file, file_util.open_stream(
+                args.output_path, "w"
+            ) as output_file:
+                compute_financial_eligibility_file(db_session, input_file, output_file, log_entry)
+
+            logger.info(
+                "Finished computing financial eligibility", extra={"Metrics": log_entry.metrics}
+            )
+
+
+def read_requests(input_file: TextIO) -> Iterator[FinancialEligibilityRequest]:
+    for row in csv.DictReader(input_file):
+        yield FinancialEligibilityRequest(
+            employee_id=uuid.UUID(row["employee_id"]),
+            employer_id=uuid.UUID(row["employer_id"]),
+            leave_start_date=date.fromisoformat(row["leave_start_date"]),
+            application_submitted_date=date.fromisoformat(row["application_submitted_date"]),
+            employment_status=EligibilityEmploymentStatus(row["employment_status"]),
+        )
+
+
+def compute_financial_eligibility_file(
+    db_session: db.Session, input_file: TextIO, output_file: TextIO, log_entry: log.LogEntry
+) -> None:
+    output_csv = csv.DictWriter(output_file, fieldnames=OUTPUT_COLUMNS, lineterminator="\n")
+    output_csv.writeheader()
+
+    for result in compute_financial_eligibility_batch(db_session, read_requests(input_file)):
+        log_entry.increment(Metrics.REQUEST_COUNT)
+
+        request = result.request
+        row = {
+            "employee_id": request.employee_id,
+            "employer_id": request.employer_id,
+            "leave_start_date": request.leave_start_date.isoformat(),
+            "application_submitted_date": request.application_submitted_date.isoformat(),
+            "employment_status": request.employment_status.value,
+            "error": result.error,
+        }
+
+        if result.response is None:
+            log_entry.increment(Metrics.ERROR_COUNT)
+        else:
+            row.update(result.response.dict())
+            log_entry.increment(
+                Metrics.ELIGIBLE_COUNT
+                if result.response.financially_eligible
+                else Metrics.INELIGIBLE_COUNT
+            )
+
+        output_csv.writerow(row)
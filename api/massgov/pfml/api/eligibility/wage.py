@@ -8,7 +8,7 @@ import uuid
 from collections import defaultdict
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy.orm.query import Query
 
@@ -22,16 +22,23 @@ from . import base_period
 logger = massgov.pfml.util.logging.get_logger(__name__)
 
 
+def wage_filing_period_range(
+    effective_quarter: quarter.Quarter,
+) -> Tuple[datetime.date, datetime.date]:
+    """First and last filing period dates of the wages needed to compute eligibility."""
+    earliest_quarter = effective_quarter.subtract_quarters(5)
+    return (earliest_quarter.start_date(), effective_quarter.as_date())
+
+
 def _employee_wages_query(
     db_session: massgov.pfml.db.Session, effective_quarter: quarter.Quarter, employee_id: uuid.UUID
 ) -> "Query[employees.WagesAndContributions]":
-    earliest_quarter = effective_quarter.subtract_quarters(5)
     query = (
         db_session.query(employees.WagesAndContributions)
         .filter(
             employees.WagesAndContributions.employee_id == employee_id,
             employees.WagesAndContributions.filing_period.between(
-                earliest_quarter.start_date(), effective_quarter.as_date()
+                *wage_filing_period_range(effective_quarter)
             ),
             employees.WagesAndContributions.employee_qtr_wages != 0,
         )
@@ -54,6 +61,57 @@ def query_employee_wages(
     return qry.all()
 
 
+@dataclass
+class QuarterWage:
+    employer_id: uuid.UUID
+    filing_period: datetime.date
+    period: quarter.Quarter
+    employee_qtr_wages: decimal.Decimal
+
+
+def query_wages_for_employees(
+    db_session: massgov.pfml.db.Session,
+    employee_ids: Iterable[uuid.UUID],
+    start_date: datetime.date,
+    end_date: datetime.date,
+) -> Dict[uuid.UUID, List[QuarterWage]]:
+    """Read the DOR wage data of many employees with one query, grouped by employee.
+
+    Each employee's wages are in the order query_employee_wages returns them.
+    """
+    rows = (
+        db_session.query(
+            employees.WagesAndContributions.employee_id,
+            employees.WagesAndContributions.employer_id,
+            employees.WagesAndContributions.filing_period,
+            employees.WagesAndContributions.employee_qtr_wages,
+        )
+        .filter(
+            employees.WagesAndContributions.employee_id.in_(list(employee_ids)),
+            employees.WagesAndContributions.filing_period.between(start_date, end_date),
+            employees.WagesAndContributions.employee_qtr_wages != 0,
+        )
+        .order_by(
+            employees.WagesAndContributions.employee_id,
+            employees.WagesAndContributions.employer_id,
+            employees.WagesAndContributions.filing_period,
+        )
+    )
+
+    wages_by_employee: DefaultDict[uuid.UUID, List[QuarterWage]] = defaultdict(list)
+    for row in rows:
+        wages_by_employee[row.employee_id].append(
+            QuarterWage(
+                row.employer_id,
+                row.filing_period,
+                quarter.Quarter.from_date(row.filing_period),
+                row.employee_qtr_wages,
+            )
+        )
+
+    return wages_by_employee
+
+
 class WageCalculator:
     """Calculate various wages for an employee.
 
@@ -284,6 +342,24 @@ def get_wage_calculator(
     return calculator
 
 
+def get_wage_calculator_from_wages(
+    effective_date: datetime.date, wages: Iterable[QuarterWage]
+) -> WageCalculator:
+    """Setup a calculator from wages already read for the employee, see query_wages_for_employees.
+
+    Wages outside of the filing periods get_wage_calculator would read are ignored.
+    """
+    calculator = _get_wage_calculator(effective_date)
+
+    start_date, end_date = wage_filing_period_range(calculator.effective_quarter)
+    for wage in wages:
+        if start_date <= wage.filing_period <= end_date:
+            calculator.set_quarter_wage(wage.employer_id, wage.period, wage.employee_qtr_wages)
+    calculator.set_base_period()
+
+    return calculator
+
+
 def get_retroactive_base_period(
     db_session: massgov.pfml.db.Session, employee_id: uuid.UUID, effective_date: datetime.date
 ) -> Tuple[quarter.Quarter, ...]:
@@ -402,9 +402,19 @@ class OrderData(PydanticBaseModel):
     direction: OrderDirection = OrderDirection.desc
 
 
+class TotalRecordsMode(str, Enum):
+    exact = "exact"
+    cached = "cached"
+    estimated = "estimated"
+    none = "none"
+
+
 class PagingData(PydanticBaseModel):
     offset: int = 1
     size: int = 25
+    # Set, even to an empty string for the first page, to page by cursor instead of offset
+    cursor: Optional[str] = None
+    total_records: TotalRecordsMode = TotalRecordsMode.exact
 
 
 class SearchEnvelope(GenericModel, Generic[SearchTermsT]):
@@ -15,11 +15,15 @@ import massgov.pfml.util.logging
 from massgov.pfml import db
 from massgov.pfml.api.authorization.flask import CREATE, ensure
 from massgov.pfml.api.models.notifications.requests import NotificationRequest
+from massgov.pfml.api.services.absence_periods_cache import get_absence_periods_cache
 from massgov.pfml.api.services.fineos_actions import get_absence_periods_from_claim
 from massgov.pfml.api.services.managed_requirements import (
     get_fineos_managed_requirements_from_notification,
 )
-from massgov.pfml.api.services.service_now_actions import send_notification_to_service_now
+from massgov.pfml.api.services.service_now_actions import (
+    queue_notification_to_service_now,
+    send_notification_to_service_now,
+)
 from massgov.pfml.db.models.applications import Notification
 from massgov.pfml.db.models.employees import Claim, Employee, Employer, ManagedRequirement
 from massgov.pfml.db.queries.absence_periods import sync_customer_api_absence_periods_to_db
@@ -61,6 +65,9 @@ def notifications_post():
     for k, v in log_attributes.items():
         newrelic.agent.add_custom_parameter(k, v)
 
+    # Queue the message for ServiceNow instead of sending it during the request
+    use_service_now_outbox = app.get_app_config().enable_service_now_outbox
+
     with app.db_session() as db_session:
         # Persist the notification to the DB
         notification = Notification()
@@ -72,6 +79,9 @@ def notifications_post():
         db_session.add(notification)
         db_session.commit()
 
+        # FINEOS changed the claim, so its cached absence periods are out of date
+        get_absence_periods_cache().invalidate(notification_request.absence_case_id)
+
         # Find or create an associated claim
         claim = (
             db_session.query(Claim)
@@ -179,10 +189,22 @@ def notifications_post():
                 newrelic.agent.notice_error(attributes=log_attributes)
                 db_session.rollback()  # handle insert errors
 
-    # Send the request to Service Now
-    send_notification_to_service_now(notification_request, employer)
-
-    logger.info("Sent notification", extra=log_attributes)
+        if use_service_now_outbox:
+            outbox_message = queue_notification_to_service_now(
+                db_session, notification_request, employer, notification
+            )
+            log_attributes = {
+                **log_attributes,
+                "service_now_outbox_message_id": str(outbox_message.service_now_outbox_message_id),
+            }
+
+    if use_service_now_outbox:
+        logger.info("Queued notification", extra=log_attributes)
+    else:
+        # Send the request to Service Now
+        send_notification_to_service_now(notification_request, employer)
+
+        logger.info("Sent notification", extra=log_attributes)
     return response_util.success_response(
         message="Successfully started notification process.", status_code=201, data={}
     ).to_api_response()
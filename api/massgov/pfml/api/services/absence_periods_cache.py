@@ -0,0 +1,130 @@
+#
+# Process-local cache of the absence periods FINEOS returns for a claim.
+#
+# Claimants reload the claim status page often, and each load otherwise costs a FINEOS web ID
+# lookup, a get_absence call and a sync of the absence_period table. Entries expire after a TTL
+# and are dropped when the API changes the claim in FINEOS or FINEOS notifies the API of a change.
+#
+# Each API process has its own cache, and invalidation only reaches the process that handled the
+# change, so another process may serve absence periods up to the TTL old. The TTL is therefore
+# the staleness limit, and is capped at MAX_TTL_SECONDS.
+#
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional
+
+import newrelic.agent
+
+import massgov.pfml.util.logging as logging
+from massgov.pfml.fineos.models.customer_api.spec import AbsencePeriod as FineosAbsencePeriod
+
+logger = logging.get_logger(__name__)
+
+MAX_TTL_SECONDS = 60
+
+
+@dataclass
+class CachedAbsencePeriods:
+    absence_periods: List[FineosAbsencePeriod]
+    payload_hash: str
+    expires_at: float
+    synced_to_db: bool = False
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+def hash_absence_periods(absence_periods: List[FineosAbsencePeriod]) -> str:
+    payload = json.dumps(
+        [absence_period.dict() for absence_period in absence_periods], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AbsencePeriodsCache:
+    """TTL and LRU bounded cache of FINEOS absence periods, keyed by fineos_absence_id.
+
+    Expired entries are kept (subject to the size bound) so that the hash of the last payload
+    synced to the DB is still known when the absence periods are fetched again. A ttl of 0
+    disables the cache.
+    """
+
+    def __init__(self, ttl: int, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, CachedAbsencePeriods]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def get(self, fineos_absence_id: str) -> Optional[CachedAbsencePeriods]:
+        """Get the cached absence periods for a claim, expired or not."""
+        with self._lock:
+            entry = self._entries.get(fineos_absence_id)
+            if entry is not None:
+                self._entries.move_to_end(fineos_absence_id)
+            return entry
+
+    def put(
+        self, fineos_absence_id: Optional[str], absence_periods: List[FineosAbsencePeriod]
+    ) -> CachedAbsencePeriods:
+        """Cache a claim's absence periods, unless the claim has no absence id."""
+        entry = CachedAbsencePeriods(
+            absence_periods=absence_periods,
+            payload_hash=hash_absence_periods(absence_periods),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        if not self.enabled or fineos_absence_id is None:
+            return entry
+
+        with self._lock:
+            self._entries[fineos_absence_id] = entry
+            self._entries.move_to_end(fineos_absence_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def invalidate(self, fineos_absence_id: Optional[str]) -> None:
+        """Drop a claim's absence periods, after the API changes the claim in FINEOS."""
+        if fineos_absence_id is None:
+            return
+
+        with self._lock:
+            self._entries.pop(fineos_absence_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+absence_periods_cache = None  # Singleton instance of AbsencePeriodsCache
+
+
+def get_absence_periods_cache() -> AbsencePeriodsCache:
+    global absence_periods_cache
+
+    if absence_periods_cache is None:
+        absence_periods_cache = AbsencePeriodsCache(
+            ttl=min(
+                int(os.environ.get("CLAIM_ABSENCE_PERIODS_CACHE_TTL_SECONDS", "0")),
+                MAX_TTL_SECONDS,
+            ),
+            max_size=int(os.environ.get("CLAIM_ABSENCE_PERIODS_CACHE_MAX_SIZE", "1000")),
+        )
+
+    return absence_periods_cache
+
+
+def record_cache_result(hit: bool) -> None:
+    newrelic.agent.record_custom_metric(
+        "Custom/ClaimAbsencePeriodsCache/Hit" if hit else "Custom/ClaimAbsencePeriodsCache/Miss", 1
+    )
@@ -5,6 +5,10 @@ import newrelic.agent
 import massgov
 import massgov.pfml.api.app as app
 from massgov.pfml.api.models.claims.responses import DetailedClaimResponse
+from massgov.pfml.api.services.absence_periods_cache import (
+    get_absence_periods_cache,
+    record_cache_result,
+)
 from massgov.pfml.api.services.fineos_actions import get_absence_periods_from_claim
 from massgov.pfml.db.models.employees import Claim, Employee, TaxIdentifier
 from massgov.pfml.db.queries.absence_periods import (
@@ -22,29 +26,51 @@ class ClaimWithdrawnError(Exception):
 
 def get_claim_detail(claim: Claim, log_attributes: Dict) -> DetailedClaimResponse:
     absence_periods = []
-
-    with app.db_session() as db_session:
-        try:
-            absence_periods = get_absence_periods_from_claim(claim, db_session)
-        except exception.FINEOSForbidden as error:
-            if _is_withdrawn_claim_error(error):
-                raise ClaimWithdrawnError
-            raise error
-
-        if len(absence_periods) == 0:
-            raise Exception("No absence periods found for claim")
-        try:
-            sync_customer_api_absence_periods_to_db(
-                absence_periods, claim, db_session, log_attributes
-            )
-        except Exception as error:  # catch all exception handler
-            logger.error(
-                "Failed to handle update of absence period table.",
-                extra=log_attributes,
-                exc_info=error,
-            )
-            newrelic.agent.notice_error(attributes=log_attributes)
-            db_session.rollback()  # handle insert errors
+    absence_periods_cache = get_absence_periods_cache()
+    cached = (
+        absence_periods_cache.get(claim.fineos_absence_id)
+        if absence_periods_cache.enabled and claim.fineos_absence_id
+        else None
+    )
+
+    if cached and cached.is_fresh():
+        # Already fetched and synced to the DB within the TTL
+        record_cache_result(hit=True)
+        absence_periods = cached.absence_periods
+    else:
+        if absence_periods_cache.enabled:
+            record_cache_result(hit=False)
+
+        with app.db_session() as db_session:
+            try:
+                absence_periods = get_absence_periods_from_claim(claim, db_session)
+            except exception.FINEOSForbidden as error:
+                if _is_withdrawn_claim_error(error):
+                    raise ClaimWithdrawnError
+                raise error
+
+            if len(absence_periods) == 0:
+                raise Exception("No absence periods found for claim")
+
+            entry = absence_periods_cache.put(claim.fineos_absence_id, absence_periods)
+
+            if cached and cached.synced_to_db and cached.payload_hash == entry.payload_hash:
+                # FINEOS returned the same absence periods that were last synced
+                entry.synced_to_db = True
+            else:
+                try:
+                    sync_customer_api_absence_periods_to_db(
+                        absence_periods, claim, db_session, log_attributes
+                    )
+                    entry.synced_to_db = True
+                except Exception as error:  # catch all exception handler
+                    logger.error(
+                        "Failed to handle update of absence period table.",
+                        extra=log_attributes,
+                        exc_info=error,
+                    )
+                    newrelic.agent.notice_error(attributes=log_attributes)
+                    db_session.rollback()  # handle insert errors
 
     detailed_claim = DetailedClaimResponse.from_orm(claim)
     detailed_claim.absence_periods = [
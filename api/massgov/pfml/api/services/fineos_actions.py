@@ -29,6 +29,7 @@ from massgov.pfml.api.models.applications.common import DocumentResponse
 from massgov.pfml.api.models.applications.common import LeaveReason as LeaveReasonApi
 from massgov.pfml.api.models.applications.common import OtherIncome
 from massgov.pfml.api.models.common import ConcurrentLeave, EmployerBenefit, PreviousLeave
+from massgov.pfml.api.services.absence_periods_cache import get_absence_periods_cache
 from massgov.pfml.db.models.applications import (
     Application,
     Document,
@@ -1093,6 +1094,7 @@ def upload_document(
     fineos_document = upload_fn(
         fineos_web_id, absence_id, document_type, file_content, file_name, content_type, description
     )
+    get_absence_periods_cache().invalidate(absence_id)
     return fineos_document
 
 
@@ -1122,6 +1124,7 @@ def upload_document_with_claim(
     fineos_document = upload_fn(
         fineos_web_id, absence_id, document_type, file_content, file_name, content_type, description
     )
+    get_absence_periods_cache().invalidate(absence_id)
     return fineos_document
 
 
@@ -1607,6 +1610,7 @@ def submit_change_request(
     fineos.create_or_update_leave_period_change_request(
         fineos_web_id, absence_id, fineos_change_request
     )
+    get_absence_periods_cache().invalidate(absence_id)
 
     change_request.submitted_time = utcnow()
 
@@ -1,5 +1,8 @@
+from massgov.pfml import db
 from massgov.pfml.api.models.notifications.requests import NotificationRequest
+from massgov.pfml.db.models.applications import Notification, ServiceNowOutboxMessage
 from massgov.pfml.db.models.employees import Employer
+from massgov.pfml.servicenow import outbox
 from massgov.pfml.servicenow.factory import create_client
 from massgov.pfml.servicenow.transforms.notifications import TransformNotificationRequest
 
@@ -14,3 +17,21 @@ def send_notification_to_service_now(
     service_now_client = create_client()
 
     service_now_client.send_message(transformed_notification_request)
+
+
+def queue_notification_to_service_now(
+    db_session: db.Session,
+    notification_request: NotificationRequest,
+    employer: Employer,
+    notification: Notification,
+) -> ServiceNowOutboxMessage:
+    """Add the notification to the ServiceNow outbox, to be sent by the delivery worker."""
+    transformed_notification_request = TransformNotificationRequest.to_service_now(
+        notification_request, employer
+    )
+
+    outbox_message = outbox.enqueue_message(
+        db_session, transformed_notification_request, notification.notification_id
+    )
+    db_session.commit()
+    return outbox_message
@@ -69,8 +69,12 @@ def pagination_log_info_from_request(
         "pagination.order_direction": request.order.direction.value,
         "pagination.page_offset": request.paging.offset,
         "pagination.page_size": request.paging.size,
-        "pagination.total_pages": page.total_pages,
-        "pagination.total_records": page.total_records,
     }
 
+    # Left out when the records weren't counted
+    if page.total_pages is not None:
+        response_keys["pagination.total_pages"] = page.total_pages
+    if page.total_records is not None:
+        response_keys["pagination.total_records"] = page.total_records
+
     return response_keys
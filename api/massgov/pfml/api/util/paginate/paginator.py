@@ -1,18 +1,45 @@
+import base64
+import binascii
+import hashlib
+import json
 import math
-from typing import Any, List, Union
+import threading
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Union
+from uuid import UUID
 
 import flask
-from sqlalchemy import distinct, func
+from sqlalchemy import distinct, func, literal, tuple_
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import ColumnProperty, Query
+from sqlalchemy.sql.expression import ClauseElement, Executable
 from werkzeug.exceptions import BadRequest
 
-from massgov.pfml.api.models.common import OrderData, OrderDirection, PagingData, SearchEnvelope
+from massgov.pfml.api.models.common import (
+    OrderData,
+    OrderDirection,
+    PagingData,
+    SearchEnvelope,
+    TotalRecordsMode,
+)
 from massgov.pfml.db.models.base import Base
 
 DEFAULT_PAGE_OFFSET = 1
 DEFAULT_PAGE_SIZE = 25
 
+# How long a count is reused for TotalRecordsMode.cached
+TOTAL_RECORDS_CACHE_TTL_SECONDS = 60
+
+# Counts kept for TotalRecordsMode.cached, oldest dropped first
+TOTAL_RECORDS_CACHE_MAX_SIZE = 10000
+
+# Planner estimates at or below this are replaced with an exact count, which is cheap for so few
+# rows, and is where the planner's estimates are least reliable
+EXACT_COUNT_THRESHOLD = 1000
+
 
 class PaginationAPIContext:
     def __init__(self, entity: Any, request: Union[flask.Request, SearchEnvelope]):
@@ -21,6 +48,8 @@ class PaginationAPIContext:
         self.entity = entity
         self.page_size = pagination_params.paging.size
         self.page_offset = pagination_params.paging.offset
+        self.page_cursor = pagination_params.paging.cursor
+        self.total_records_mode = pagination_params.paging.total_records
         self.order_by = pagination_params.order.by
         self.order_direction = pagination_params.order.direction.value
 
@@ -33,6 +62,9 @@ class PaginationAPIContext:
 
         self.order_key = getattr(entity, self.order_by)
 
+        if self.page_cursor is not None and not is_keyset_order_key(self.order_key):
+            raise BadRequest(f"Paging by cursor is not supported for order by '{self.order_by}'")
+
     def __enter__(self):
         return self
 
@@ -41,23 +73,34 @@ class PaginationAPIContext:
 
 
 class Page:
-    def __init__(self, values: List[Any], paginator: "Paginator", offset: int):
+    def __init__(
+        self,
+        values: List[Any],
+        paginator: "Paginator",
+        offset: int,
+        next_cursor: Optional[str] = None,
+    ):
         self.values = values
         self.paginator = paginator
         self.offset = offset
+        self.next_cursor = next_cursor
 
     @property
     def size(self) -> int:
         return self.paginator.page_size
 
     @property
-    def total_records(self) -> int:
+    def total_records(self) -> Optional[int]:
         return self.paginator.total_records
 
     @property
-    def total_pages(self) -> int:
+    def total_pages(self) -> Optional[int]:
         return self.paginator.total_pages
 
+    @property
+    def total_records_approximate(self) -> bool:
+        return self.paginator.total_records_approximate
+
 
 class Paginator:
     def __init__(
@@ -66,15 +109,19 @@ class Paginator:
         query_set: Query,
         page_size: int = DEFAULT_PAGE_SIZE,
         page_offset: int = 1,
+        total_records_mode: TotalRecordsMode = TotalRecordsMode.exact,
     ):
         self.entity = entity
         self.query_set = query_set
+        self.total_records_mode = total_records_mode
 
         if page_size <= 0:
             page_size = DEFAULT_PAGE_SIZE  # set default page_size value to prevent divide by zero
         self.page_size = page_size
 
-        self._total_records = -1
+        self._total_records: Optional[int] = None
+        self._total_records_approximate = False
+        self._total_records_counted = False
 
         if not page_offset or page_offset < 1:
             page_offset = DEFAULT_PAGE_SIZE
@@ -92,7 +139,7 @@ class Paginator:
         return page
 
     def page_at(self, page_offset: int) -> Page:
-        if page_offset < 1 or page_offset > self.total_pages:
+        if page_offset < 1 or self._is_past_last_page(page_offset):
             page_values = []
         else:
             offset = self.page_size * (page_offset - 1)
@@ -100,26 +147,131 @@ class Paginator:
 
         return Page(page_values, self, page_offset)
 
+    def _is_past_last_page(self, page_offset: int) -> bool:
+        # Without an exact count, the only way to know is to fetch the page
+        total_pages = self.total_pages
+        if total_pages is None or self.total_records_approximate:
+            return False
+        return page_offset > total_pages
+
     @property
-    def total_records(self) -> int:
-        if self._total_records >= 0:
-            return self._total_records
+    def total_records(self) -> Optional[int]:
+        self._count_total_records()
+        return self._total_records
+
+    @property
+    def total_records_approximate(self) -> bool:
+        self._count_total_records()
+        return self._total_records_approximate
 
-        primary_key = inspect(self.entity).primary_key[0]
+    def _count_total_records(self) -> None:
+        if self._total_records_counted:
+            return
 
-        total_records_query = self.query_set.order_by(None).statement.with_only_columns(
-            [func.count(distinct(primary_key))]
+        self._total_records, self._total_records_approximate = count_total_records(
+            self.entity, self.query_set, self.total_records_mode
         )
-        self._total_records = self.query_set.session.execute(total_records_query).scalar()
-        return self._total_records
+        self._total_records_counted = True
 
     @property
-    def total_pages(self) -> int:
+    def total_pages(self) -> Optional[int]:
+        if self.total_records is None:
+            return None
         return int(math.ceil(self.total_records / self.page_size))
 
 
+class KeysetPaginator(Paginator):
+    """Pages through a query by cursor rather than by offset.
+
+    Each page is fetched with a WHERE (order key, primary key) > (the last row of the previous page)
+    instead of an OFFSET, so later pages cost the same as the first and rows aren't skipped or
+    repeated when rows are added while paging. The order key must be a non-nullable column, see
+    is_keyset_order_key(). The primary key breaks ties.
+    """
+
+    def __init__(
+        self,
+        entity: Any,
+        query_set: Query,
+        order_key: Any,
+        order_direction: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        total_records_mode: TotalRecordsMode = TotalRecordsMode.exact,
+    ):
+        super().__init__(entity, query_set, page_size, DEFAULT_PAGE_OFFSET, total_records_mode)
+
+        mapper = inspect(entity)
+        self.order_key = order_key
+        self.order_direction = order_direction
+        self.primary_key = getattr(entity, mapper.get_property_by_column(mapper.primary_key[0]).key)
+
+    def page_after(self, cursor: Optional[str]) -> Page:
+        """Get the page after the one that returned cursor as its next_cursor, or the first page if
+        cursor is empty."""
+        is_asc = self.order_direction == OrderDirection.asc.value
+        sort_keys = [self.order_key, self.primary_key]
+        query = self.query_set.order_by(None).order_by(
+            *[sort_key.asc() if is_asc else sort_key.desc() for sort_key in sort_keys]
+        )
+
+        if cursor:
+            after_values = decode_cursor(cursor, self.order_key.key, self.order_direction)
+            after = tuple_(
+                *[
+                    literal(value, type_=sort_key.type)
+                    for sort_key, value in zip(sort_keys, after_values)
+                ]
+            )
+            keys = tuple_(*sort_keys)
+            query = query.filter(keys > after if is_asc else keys < after)
+
+        page_values = query.limit(self.page_size + 1).all()
+
+        next_cursor = None
+        if len(page_values) > self.page_size:
+            page_values = page_values[: self.page_size]
+            last_value = page_values[-1]
+            next_cursor = encode_cursor(
+                self.order_key.key,
+                self.order_direction,
+                [getattr(last_value, sort_key.key) for sort_key in sort_keys],
+            )
+
+        return Page(page_values, self, DEFAULT_PAGE_OFFSET, next_cursor)
+
+
+def is_keyset_order_key(order_key: Any) -> bool:
+    """Whether results can be paged by cursor when ordered by this entity attribute.
+
+    Only plain columns that can't be NULL are supported. Relationships and hybrid properties are
+    ordered by expressions that the cursor can't hold.
+    """
+    order_property = getattr(order_key, "property", None)
+    if not isinstance(order_property, ColumnProperty):
+        return False
+
+    column = order_property.columns[0]
+    return not getattr(column, "nullable", True)
+
+
 def page_for_api_context(context: PaginationAPIContext, query: Query) -> Page:
-    paginator = Paginator(context.entity, query, page_size=context.page_size)
+    if context.page_cursor is not None:
+        keyset_paginator = KeysetPaginator(
+            context.entity,
+            query,
+            context.order_key,
+            context.order_direction,
+            page_size=context.page_size,
+            total_records_mode=context.total_records_mode,
+        )
+        return keyset_paginator.page_after(context.page_cursor)
+
+    paginator = Paginator(
+        context.entity,
+        query,
+        page_size=context.page_size,
+        total_records_mode=context.total_records_mode,
+    )
     return paginator.page_at(page_offset=context.page_offset)
 
 
@@ -127,7 +279,7 @@ def make_pagination_params(request: Union[flask.Request, SearchEnvelope]) -> Sea
     if isinstance(request, SearchEnvelope):
         return request
 
-    page_data = {}
+    page_data: Dict[str, Any] = {}
 
     if page_size := request.args.get("page_size", default=None, type=int):
         page_data["size"] = page_size
@@ -135,6 +287,13 @@ def make_pagination_params(request: Union[flask.Request, SearchEnvelope]) -> Sea
     if page_offset := request.args.get("page_offset", default=None, type=int):
         page_data["offset"] = page_offset
 
+    # An empty page_cursor asks for the first page by cursor, so it's checked against None
+    if (page_cursor := request.args.get("page_cursor", default=None, type=str)) is not None:
+        page_data["cursor"] = page_cursor
+
+    if total_records := request.args.get("total_records", default=None, type=str):
+        page_data["total_records"] = TotalRecordsMode(total_records)
+
     order_data = {}
 
     if order_by := request.args.get("order_by", default=None, type=str):
@@ -146,3 +305,158 @@ def make_pagination_params(request: Union[flask.Request, SearchEnvelope]) -> Sea
     return SearchEnvelope[None](  # type: ignore
         terms=None, order=OrderData(**order_data), paging=PagingData(**page_data)  # type: ignore
     )
+
+
+# == cursors ==
+
+
+def encode_cursor(order_by: str, order_direction: str, after_values: List[Any]) -> str:
+    payload = {
+        "by": order_by,
+        "direction": order_direction,
+        "after": [_encode_cursor_value(value) for value in after_values],
+    }
+    encoded = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode())
+    return encoded.decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str, order_direction: str) -> List[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        cursor_order = (payload["by"], payload["direction"])
+        after_values = [_decode_cursor_value(value) for value in payload["after"]]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise BadRequest("Invalid page_cursor")
+
+    if cursor_order != (order_by, order_direction):
+        raise BadRequest("page_cursor was issued for a different order_by or order_direction")
+
+    if len(after_values) != 2:
+        raise BadRequest("Invalid page_cursor")
+
+    return after_values
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"date": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    if isinstance(value, Decimal):
+        return {"decimal": str(value)}
+    return value
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+
+    ((value_type, encoded),) = value.items()
+    if value_type == "datetime":
+        return datetime.fromisoformat(encoded)
+    if value_type == "date":
+        return date.fromisoformat(encoded)
+    if value_type == "uuid":
+        return UUID(encoded)
+    if value_type == "decimal":
+        return Decimal(encoded)
+    raise ValueError(f"Unknown cursor value type {value_type}")
+
+
+# == total records ==
+
+
+# B903 suggests a namedtuple, but SQLAlchemy only executes and compiles ClauseElement subclasses
+class Explain(Executable, ClauseElement):  # noqa: B903
+    """EXPLAIN (FORMAT JSON) of a statement, to read the planner's row estimate."""
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+class TotalRecordsCache:
+    """Counts by query and parameters, each reused for ttl_seconds.
+
+    The parameters include the filters for the current user, so users never share a count.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = TOTAL_RECORDS_CACHE_TTL_SECONDS,
+        max_size: int = TOTAL_RECORDS_CACHE_MAX_SIZE,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._counts: Dict[str, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_count(self, query_set: Query, count_query: Any) -> Tuple[int, bool]:
+        """Get the cached count, or run count_query and cache it. Also returns whether the count
+        came from the cache."""
+        key = self._key(query_set, count_query)
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._counts.get(key)
+        if cached is not None and now - cached[0] < self.ttl_seconds:
+            return cached[1], True
+
+        count = query_set.session.execute(count_query).scalar()
+
+        with self._lock:
+            self._counts.pop(key, None)
+            self._counts[key] = (now, count)
+            while len(self._counts) > self.max_size:
+                del self._counts[next(iter(self._counts))]
+
+        return count, False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    @staticmethod
+    def _key(query_set: Query, count_query: Any) -> str:
+        compiled = count_query.compile(dialect=query_set.session.get_bind().dialect)
+        params = sorted(compiled.params.items())
+        return hashlib.sha256(f"{compiled}|{params!r}".encode()).hexdigest()
+
+
+total_records_cache = TotalRecordsCache()
+
+
+def count_total_records(
+    entity: Any, query_set: Query, mode: TotalRecordsMode = TotalRecordsMode.exact
+) -> Tuple[Optional[int], bool]:
+    """Count the records for a paginated query. Also returns whether the count is approximate."""
+    if mode == TotalRecordsMode.none:
+        return None, False
+
+    primary_key = inspect(entity).primary_key[0]
+
+    total_records_query = query_set.order_by(None).statement.with_only_columns(
+        [func.count(distinct(primary_key))]
+    )
+
+    if mode == TotalRecordsMode.cached:
+        return total_records_cache.get_or_count(query_set, total_records_query)
+
+    if mode == TotalRecordsMode.estimated:
+        estimate = estimate_total_records(query_set)
+        if estimate > EXACT_COUNT_THRESHOLD:
+            return estimate, True
+
+    return query_set.session.execute(total_records_query).scalar(), False
+
+
+def estimate_total_records(query_set: Query) -> int:
+    """The Postgres planner's estimate of the rows the query returns, without running it."""
+    plan = query_set.session.execute(Explain(query_set.order_by(None).statement)).scalar()
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -25,10 +25,12 @@ if TYPE_CHECKING:
 class PagingMetaData:
     page_offset: int
     page_size: int
-    total_records: int
-    total_pages: int
+    total_records: Optional[int]
+    total_pages: Optional[int]
     order_by: str
     order_direction: str
+    total_records_approximate: bool = False
+    next_page_cursor: Optional[str] = None
 
 
 @dataclass
@@ -107,6 +109,8 @@ def paginated_success_response(
         page_size=context.page_size,
         order_by=context.order_by,
         order_direction=context.order_direction,
+        total_records_approximate=page.total_records_approximate,
+        next_page_cursor=page.next_cursor,
     )
 
     # resource and method values are injected in Metadata.to_api_response function
@@ -1,5 +1,6 @@
 import json
 import os
+import time
 import urllib.parse
 from contextlib import contextmanager
 from typing import Any, Dict, Generator, Iterable, List, Optional, TypeVar, Union
@@ -28,6 +29,7 @@ def init(
     check_migrations_current: bool = False,
 ) -> scoped_session:
     logger.info("connecting to postgres db")
+    start_time = time.monotonic()
 
     engine = create_engine(config)
     conn = engine.connect()
@@ -47,6 +49,7 @@ def init(
         },
     )
     verify_ssl(conn_info)
+    connected_time = time.monotonic()
 
     # Explicitly commit sessions — usually with session_scope. Also disable expiry on commit,
     # as we don't need to be strict on consistency within our routes. Once we've retrieved data
@@ -56,18 +59,29 @@ def init(
         sessionmaker(autocommit=False, expire_on_commit=False, bind=engine)
     )
 
+    lookup_sync_full = None
     if sync_lookups:
-        massgov.pfml.db.models.init_lookup_tables(session_factory)
-        massgov.pfml.db.models.applications.sync_state_metrics(session_factory)
-        massgov.pfml.db.models.azure.sync_azure_permissions(session_factory)
-        massgov.pfml.db.models.payments.sync_lookup_tables(session_factory)
-        massgov.pfml.db.models.applications.sync_holidays(session_factory)
+        lookup_sync_full = massgov.pfml.db.models.sync_lookups(session_factory)
+    synced_time = time.monotonic()
 
     if check_migrations_current:
         have_all_migrations_run(engine)
 
     engine.dispose()
 
+    end_time = time.monotonic()
+    logger.info(
+        "db init took %.2fs",
+        end_time - start_time,
+        extra={
+            "db_init.connect_seconds": round(connected_time - start_time, 3),
+            "db_init.lookup_sync_seconds": round(synced_time - connected_time, 3),
+            "db_init.lookup_sync_full": lookup_sync_full,
+            "db_init.check_migrations_seconds": round(end_time - synced_time, 3),
+            "db_init.total_seconds": round(end_time - start_time, 3),
+        },
+    )
+
     return session_factory
 
 
@@ -0,0 +1,76 @@
+#
+# Bulk load rows into a table with PostgreSQL COPY ... FROM STDIN.
+#
+
+import io
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+import massgov.pfml.util.logging
+
+logger = massgov.pfml.util.logging.get_logger(__name__)
+
+# Number of rows buffered in memory and sent per COPY statement
+COPY_CHUNK_SIZE = 50000
+
+
+def format_copy_value(value: Any) -> str:
+    """Format a value for COPY's text format, None is NULL"""
+    if value is None:
+        return "\\N"
+
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_rows(
+    db_session: Session,
+    table_name: str,
+    column_names: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    chunk_size: int = COPY_CHUNK_SIZE,
+    on_chunk: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Stream rows into a table with COPY, a chunk at a time, and return the number of rows.
+
+    The rows are written on the connection bound to the session's current transaction, so they
+    are committed or rolled back along with everything else in it. Anything pending in the session
+    that the rows depend on (e.g. foreign keys) must be flushed first. `on_chunk` is called with the
+    running row count after each chunk is sent.
+    """
+    cursor = db_session.connection().connection.cursor()
+    copy_sql = "COPY {} ({}) FROM STDIN".format(table_name, ", ".join(column_names))
+
+    row_count = 0
+    chunk_row_count = 0
+    buffer = io.StringIO()
+
+    def send_chunk() -> None:
+        buffer.seek(0)
+        cursor.copy_expert(copy_sql, buffer)
+        buffer.seek(0)
+        buffer.truncate()
+
+        if on_chunk:
+            on_chunk(row_count)
+
+    for row in rows:
+        buffer.write("\t".join(map(format_copy_value, row)))
+        buffer.write("\n")
+        row_count += 1
+        chunk_row_count += 1
+
+        if chunk_row_count >= chunk_size:
+            send_chunk()
+            chunk_row_count = 0
+
+    if chunk_row_count > 0:
+        send_chunk()
+
+    return row_count
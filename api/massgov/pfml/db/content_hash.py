@@ -0,0 +1,125 @@
+#
+# Stable content hashes of table rows, for deduplicating rows that have no natural key.
+#
+# The hash is computed in Python when rows are loaded, and must agree with content_hash_sql, which
+# is what migrations use to backfill existing rows. Values are normalized to the column's type
+# first, so a row read from a CSV file hashes the same as the row loaded into the database.
+#
+
+import decimal
+import hashlib
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Sequence
+
+from sqlalchemy import Column, Date, Integer, Numeric, Table
+
+# Date formats accepted in files loaded into hashed tables
+DATE_FORMATS = ("%Y%m%d", "%Y-%m-%d", "%m/%d/%Y")
+
+SEPARATOR = "|"
+
+
+def normalize_value(column: Column, value: Any) -> Any:
+    """Convert a raw value (e.g. a string from a CSV file) to the Python type of the column.
+
+    Empty strings are treated as null. Raises ValueError or decimal.InvalidOperation if the value
+    can not be converted.
+    """
+    if value is None or value == "":
+        return None
+
+    if isinstance(column.type, Date):
+        return _parse_date(value)
+
+    if isinstance(column.type, Integer):
+        return int(value)
+
+    if isinstance(column.type, Numeric):
+        return decimal.Decimal(str(value))
+
+    return str(value)
+
+
+def _parse_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+
+    if isinstance(value, date):
+        return value
+
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            pass
+
+    raise ValueError("invalid date value: %s" % value)
+
+
+def _canonical_text(column: Column, value: Any) -> str:
+    # Null and empty are the same, as in the coalesce() unique indexes these hashes replace
+    if value is None:
+        return ""
+
+    if isinstance(column.type, Date):
+        return value.isoformat()
+
+    if isinstance(column.type, Integer):
+        return str(value)
+
+    if isinstance(column.type, Numeric):
+        # Numeric keeps the scale of its input, so 50 and 50.00 are the same value
+        if value == 0:
+            return "0"
+        text = format(value, "f")
+        return text.rstrip("0").rstrip(".") if "." in text else text
+
+    return value.replace("\\", "\\\\").replace(SEPARATOR, "\\" + SEPARATOR)
+
+
+def content_hash(table: Table, column_names: Sequence[str], values: Dict[str, Any]) -> str:
+    """Hash the normalized values of the given columns of a row."""
+    canonical = SEPARATOR.join(
+        _canonical_text(table.c[name], normalize_value(table.c[name], values.get(name)))
+        for name in column_names
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def content_hash_default(column_names: Sequence[str]) -> Callable[[Any], str]:
+    """Column default that fills in the content hash of rows inserted without one."""
+
+    def default(context: Any) -> str:
+        table = context.compiled.statement.table
+        return content_hash(table, column_names, context.get_current_parameters())
+
+    return default
+
+
+def content_hash_sql(column_types: Dict[str, str]) -> str:
+    """SQL expression equal to content_hash, for a mapping of column name to its type name.
+
+    Type names are "text", "date", "integer" or "numeric". The migrations that added the hashes
+    (b71e4d0c9a25 and e4a7c91b5d30) backfilled them with copies of this expression, so a change
+    here needs a new migration to rehash existing rows.
+    """
+    expressions = []
+    for name, type_name in column_types.items():
+        if type_name == "date":
+            expression = f"to_char({name}, 'YYYY-MM-DD')"
+        elif type_name == "integer":
+            expression = f"{name}::text"
+        elif type_name == "numeric":
+            expression = (
+                f"CASE WHEN {name} = 0 THEN '0' WHEN position('.' in {name}::text) > 0 "
+                f"THEN rtrim(rtrim({name}::text, '0'), '.') ELSE {name}::text END"
+            )
+        elif type_name == "text":
+            expression = f"replace(replace({name}, '\\', '\\\\'), '{SEPARATOR}', '\\{SEPARATOR}')"
+        else:
+            raise ValueError("unsupported column type: %s" % type_name)
+
+        expressions.append(f"coalesce({expression}, '')")
+
+    joined = f" || '{SEPARATOR}' || ".join(expressions)
+    return f"encode(sha256(convert_to({joined}, 'UTF8')), 'hex')"
@@ -4,6 +4,8 @@
 
 from typing import Any, Dict
 
+from sqlalchemy.orm import make_transient_to_detached
+
 import massgov.pfml.util.logging
 
 logger = massgov.pfml.util.logging.get_logger(__name__)
@@ -30,7 +32,8 @@ class LookupTable:
     caution as other tables may refer to the lookup table. Row ids can not be changed.
 
     Use the sync_to_database() method to add or update rows in the database to match the template
-    instances. Rows will not be removed.
+    instances. Rows will not be removed. When the database is known to match already, the
+    populate_db_instance_cache() method fills in the same caches without reading the table.
 
     Attributes of the template model instances can be used directly safely and without a database
     session::
@@ -147,6 +150,35 @@ class LookupTable:
         cls.description_to_id[description] = row_id
         return row_was_updated
 
+    @classmethod
+    def populate_db_instance_cache(cls):
+        """Fill in the caches that sync_to_database() fills, from the template instances alone.
+
+        Only valid when the database rows are known to match the template instances, for example
+        when the lookup sync fingerprint stored in the database is current. No queries are made."""
+
+        if not hasattr(cls, "attr_name_to_template_instance"):
+            cls.populate_lookup_cache()
+
+        cls.template_instance_to_db_instance = {}
+        cls.description_to_db_instance = {}
+        cls.description_to_id = {}
+
+        for template_instance in cls.attr_name_to_template_instance.values():
+            row = tuple(map(template_instance.__getattribute__, cls.column_names))
+            row_id, description = row[0], row[1]
+
+            # A detached copy, as if it was loaded by a session that has since been closed, so
+            # that get_instance() can merge it without loading it
+            instance = cls.model.__mapper__.class_manager.new_instance()
+            for column_name, value in zip(cls.column_names, row):
+                setattr(instance, column_name, value)
+            make_transient_to_detached(instance)
+
+            cls.template_instance_to_db_instance[template_instance] = instance
+            cls.description_to_db_instance[description] = instance
+            cls.description_to_id[description] = row_id
+
     @classmethod
     def get_all(cls):
         """Get all instances of a model."""
@@ -0,0 +1,58 @@
+"""add trigram indexes for claim search
+
+Revision ID: 3a8f1c2d4b6e
+Revises: 626ad4463740
+Create Date: 2022-04-20 10:15:42.418903
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3a8f1c2d4b6e"
+down_revision = "626ad4463740"
+branch_labels = None
+depends_on = None
+
+# Full name expressions searched by GetClaimsQuery.add_search_filter. They must match
+# FULL_NAME_SEARCH_EXPRESSIONS in massgov/pfml/db/queries/get_claims_query.py exactly for Postgres
+# to use these indexes.
+EMPLOYEE_FULL_NAME_INDEXES = {
+    "ix_employee_first_last_name": ("first_name", "last_name"),
+    "ix_employee_last_first_name": ("last_name", "first_name"),
+    "ix_employee_full_name": ("first_name", "middle_name", "last_name"),
+    "ix_employee_fineos_first_last_name": (
+        "fineos_employee_first_name",
+        "fineos_employee_last_name",
+    ),
+    "ix_employee_fineos_last_first_name": (
+        "fineos_employee_last_name",
+        "fineos_employee_first_name",
+    ),
+    "ix_employee_fineos_full_name": (
+        "fineos_employee_first_name",
+        "fineos_employee_middle_name",
+        "fineos_employee_last_name",
+    ),
+}
+
+
+def upgrade():
+    # enable trigram index extension
+    op.execute('CREATE EXTENSION IF NOT EXISTS "pg_trgm";')
+
+    op.execute(
+        "CREATE INDEX ix_claim_fineos_absence_id_trgm ON claim USING GIN (fineos_absence_id public.gin_trgm_ops);"
+    )
+
+    for index_name, columns in EMPLOYEE_FULL_NAME_INDEXES.items():
+        expression = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        op.execute(
+            f"CREATE INDEX {index_name} ON employee USING GIN (({expression}) public.gin_trgm_ops);"
+        )
+
+
+def downgrade():
+    for index_name in EMPLOYEE_FULL_NAME_INDEXES:
+        op.drop_index(index_name, table_name="employee")
+
+    op.drop_index("ix_claim_fineos_absence_id_trgm", table_name="claim")
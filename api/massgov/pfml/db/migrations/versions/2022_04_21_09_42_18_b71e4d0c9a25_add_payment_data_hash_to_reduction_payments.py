@@ -0,0 +1,96 @@
+"""add payment_data_hash to dua and dia reduction payments
+
+Revision ID: b71e4d0c9a25
+Revises: 3a8f1c2d4b6e
+Create Date: 2022-04-21 09:42:18.260731
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b71e4d0c9a25"
+down_revision = "3a8f1c2d4b6e"
+branch_labels = None
+depends_on = None
+
+# Payment data columns of each table, in the order they are hashed. These must match
+# payment_data_columns on DuaReductionPayment and DiaReductionPayment.
+PAYMENT_DATA_COLUMNS = {
+    "dua_reduction_payment": {
+        "fineos_customer_number": "text",
+        "employer_fein": "text",
+        "payment_date": "date",
+        "request_week_begin_date": "date",
+        "gross_payment_amount_cents": "integer",
+        "payment_amount_cents": "integer",
+        "fraud_indicator": "text",
+        "benefit_year_begin_date": "date",
+        "benefit_year_end_date": "date",
+    },
+    "dia_reduction_payment": {
+        "fineos_customer_number": "text",
+        "board_no": "text",
+        "event_id": "text",
+        "event_description": "text",
+        "eve_created_date": "date",
+        "event_occurrence_date": "date",
+        "award_id": "text",
+        "award_code": "text",
+        "award_amount": "numeric",
+        "award_date": "date",
+        "start_date": "date",
+        "end_date": "date",
+        "weekly_amount": "numeric",
+        "award_created_date": "date",
+        "termination_date": "date",
+    },
+}
+
+
+def content_hash_sql(column_types):
+    # A copy of massgov.pfml.db.content_hash.content_hash_sql as of this migration, so the backfill
+    # stays the same if that changes
+    expressions = []
+    for name, type_name in column_types.items():
+        if type_name == "date":
+            expression = f"to_char({name}, 'YYYY-MM-DD')"
+        elif type_name == "integer":
+            expression = f"{name}::text"
+        elif type_name == "numeric":
+            expression = (
+                f"CASE WHEN {name} = 0 THEN '0' WHEN position('.' in {name}::text) > 0 "
+                f"THEN rtrim(rtrim({name}::text, '0'), '.') ELSE {name}::text END"
+            )
+        elif type_name == "text":
+            expression = f"replace(replace({name}, '\\', '\\\\'), '|', '\\|')"
+        else:
+            raise ValueError("unsupported column type: %s" % type_name)
+
+        expressions.append(f"coalesce({expression}, '')")
+
+    joined = " || '|' || ".join(expressions)
+    return f"encode(sha256(convert_to({joined}, 'UTF8')), 'hex')"
+
+
+def upgrade():
+    for table_name, column_types in PAYMENT_DATA_COLUMNS.items():
+        op.add_column(table_name, sa.Column("payment_data_hash", sa.Text(), nullable=True))
+
+        # Backfill existing rows. The existing unique indexes on these tables coalesce the same
+        # fields, so the hashes of existing rows are unique too.
+        op.execute(f"UPDATE {table_name} SET payment_data_hash = {content_hash_sql(column_types)}")
+
+        op.alter_column(table_name, "payment_data_hash", nullable=False)
+        op.create_index(
+            op.f(f"ix_{table_name}_payment_data_hash"),
+            table_name,
+            ["payment_data_hash"],
+            unique=True,
+        )
+
+
+def downgrade():
+    for table_name in PAYMENT_DATA_COLUMNS:
+        op.drop_index(op.f(f"ix_{table_name}_payment_data_hash"), table_name=table_name)
+        op.drop_column(table_name, "payment_data_hash")
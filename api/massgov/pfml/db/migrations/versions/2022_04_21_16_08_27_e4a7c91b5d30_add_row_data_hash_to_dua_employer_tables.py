@@ -0,0 +1,96 @@
+"""add row_data_hash to dua employer and reporting unit data
+
+Revision ID: e4a7c91b5d30
+Revises: b71e4d0c9a25
+Create Date: 2022-04-21 16:08:27.518204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e4a7c91b5d30"
+down_revision = "b71e4d0c9a25"
+branch_labels = None
+depends_on = None
+
+# Columns of each table, in the order they are hashed. These must match row_data_columns on
+# DuaEmployer and DuaReportingUnitRaw.
+ROW_DATA_COLUMNS = {
+    "dua_employer_data": (
+        "fineos_employer_id",
+        "dba",
+        "attention",
+        "email",
+        "phone_number",
+        "address_line_1",
+        "address_line_2",
+        "address_city",
+        "address_zip_code",
+        "address_state",
+        "naics_code",
+        "naics_description",
+    ),
+    "dua_reporting_unit_data": (
+        "fineos_employer_id",
+        "dua_id",
+        "dba",
+        "attention",
+        "email",
+        "phone_number",
+        "address_line_1",
+        "address_line_2",
+        "address_city",
+        "address_zip_code",
+        "address_state",
+    ),
+}
+
+PRIMARY_KEYS = {
+    "dua_employer_data": "dua_employer_id",
+    "dua_reporting_unit_data": "dua_reporting_unit_data_id",
+}
+
+
+def content_hash_sql(column_names):
+    # A copy of massgov.pfml.db.content_hash.content_hash_sql for text columns as of this
+    # migration, so the backfill stays the same if that changes
+    expressions = [
+        f"coalesce(replace(replace({name}, '\\', '\\\\'), '|', '\\|'), '')" for name in column_names
+    ]
+    joined = " || '|' || ".join(expressions)
+    return f"encode(sha256(convert_to({joined}, 'UTF8')), 'hex')"
+
+
+def upgrade():
+    for table_name, column_names in ROW_DATA_COLUMNS.items():
+        primary_key = PRIMARY_KEYS[table_name]
+        op.add_column(table_name, sa.Column("row_data_hash", sa.Text(), nullable=True))
+
+        op.execute(f"UPDATE {table_name} SET row_data_hash = {content_hash_sql(column_names)}")
+
+        # The existing unique constraints let repeated rows with a null column in, so keep only the
+        # first loaded copy of each
+        op.execute(
+            f"""
+            DELETE FROM {table_name} duplicate
+            USING {table_name} original
+            WHERE duplicate.row_data_hash = original.row_data_hash
+              AND (duplicate.created_at, duplicate.{primary_key})
+                > (original.created_at, original.{primary_key})
+            """
+        )
+
+        op.alter_column(table_name, "row_data_hash", nullable=False)
+        op.create_index(
+            op.f(f"ix_{table_name}_row_data_hash"),
+            table_name,
+            ["row_data_hash"],
+            unique=True,
+        )
+
+
+def downgrade():
+    for table_name in ROW_DATA_COLUMNS:
+        op.drop_index(op.f(f"ix_{table_name}_row_data_hash"), table_name=table_name)
+        op.drop_column(table_name, "row_data_hash")
@@ -3,6 +3,7 @@
 #
 
 import time
+from typing import TYPE_CHECKING
 
 import massgov.pfml.util.logging
 
@@ -15,13 +16,25 @@ from . import (  # noqa: F401
     flags,
     geo,
     industry_codes,
+    lookup_sync,
     payments,
     state,
     verifications,
 )
 
+if TYPE_CHECKING:
+    # massgov.pfml.db imports this package, so only import it back for type checking
+    import massgov.pfml.db as db
+
 logger = massgov.pfml.util.logging.get_logger(__name__)
 
+# Lookup tables of the models, and the fingerprint of every row sync_lookups() writes, which is
+# stored in the database after a full sync
+LOOKUP_SYNC_TABLES = lookup_sync.get_lookup_tables()
+LOOKUP_SYNC_FINGERPRINT = lookup_sync.compute_fingerprint(
+    LOOKUP_SYNC_TABLES, [*applications.get_state_metrics(), *applications.get_holidays()]
+)
+
 
 def init_lookup_tables(db_session):
     """Initialize models in the database if necessary."""
@@ -36,3 +49,30 @@ def init_lookup_tables(db_session):
     industry_codes.sync_lookup_tables(db_session)
     azure.sync_lookup_tables(db_session)
     logger.info("sync took %.2fs", time.monotonic() - start_time)
+
+
+def sync_lookups(db_session: "db.Session") -> bool:
+    """Sync lookup tables and other static rows, unless the database already matches the code.
+
+    When the fingerprint stored by the last full sync is current, only the lookup caches are
+    filled in. Otherwise a full sync runs, one process at a time. Returns True if it did.
+    """
+    if lookup_sync.get_fingerprint(db_session) == LOOKUP_SYNC_FINGERPRINT:
+        lookup_sync.populate_lookup_caches(LOOKUP_SYNC_TABLES)
+        return False
+
+    with lookup_sync.advisory_lock(db_session):
+        # Another process may have finished the sync while this one waited for the lock
+        if lookup_sync.get_fingerprint(db_session) == LOOKUP_SYNC_FINGERPRINT:
+            lookup_sync.populate_lookup_caches(LOOKUP_SYNC_TABLES)
+            return False
+
+        logger.info("lookup sync fingerprint changed, running full sync")
+        init_lookup_tables(db_session)
+        applications.sync_state_metrics(db_session)
+        azure.sync_azure_permissions(db_session)
+        payments.sync_lookup_tables(db_session)
+        applications.sync_holidays(db_session)
+        lookup_sync.set_fingerprint(db_session, LOOKUP_SYNC_FINGERPRINT)
+
+    return True
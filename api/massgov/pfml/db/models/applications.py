@@ -993,13 +993,13 @@ class BenefitsMetrics(Base, TimestampMixin):
         )
 
 
-def sync_state_metrics(db_session):
+def get_state_metrics() -> list[Base]:
     # For the first year of the program, the maximum weekly benefit is $850, which needs to
     # be set directly. Beyond that, we should only directly set the unempleoyment minimum
     # earnings and the average weekly wage. The maximum weekly benefit amount will then be
     # calculated based on the average weekly wage.
 
-    state_metrics = [
+    return [
         BenefitsMetrics(
             effective_date=datetime.date(2020, 10, 1),
             average_weekly_wage="1431.66",
@@ -1022,7 +1022,9 @@ def sync_state_metrics(db_session):
         ),
     ]
 
-    for metric in state_metrics:
+
+def sync_state_metrics(db_session):
+    for metric in get_state_metrics():
         instance = db_session.merge(metric)
         if db_session.is_modified(instance):
             logger.info("updating metric %r", instance)
@@ -1037,6 +1039,28 @@ class Notification(Base, TimestampMixin):
     fineos_absence_id = Column(Text, index=True)
 
 
+class ServiceNowOutboxMessage(Base, TimestampMixin):
+    """A message waiting to be sent to ServiceNow, or already sent.
+
+    A message is pending until delivered_at or failed_at is set. See massgov.pfml.servicenow.outbox.
+    """
+
+    __tablename__ = "service_now_outbox_message"
+    service_now_outbox_message_id = Column(PostgreSQLUUID, primary_key=True, default=uuid_gen)
+    notification_id = Column(
+        PostgreSQLUUID, ForeignKey("notification.notification_id"), index=True, nullable=True
+    )
+    table_name = Column(Text, nullable=False)
+    message = Column(JSONB, nullable=False)
+    attempt_count = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
+    delivered_at = Column(TIMESTAMP(timezone=True))
+    failed_at = Column(TIMESTAMP(timezone=True))
+    last_error = Column(Text)
+
+    notification = relationship(Notification)
+
+
 class PhoneType(LookupTable):
     model = LkPhoneType
     column_names = ("phone_type_id", "phone_type_description")
@@ -1091,9 +1115,9 @@ def _are_holidays_valid(holidays: list[Holiday]) -> bool:
     return all_days_valid
 
 
-def sync_holidays(db_session):
+def get_holidays() -> list[Holiday]:
     # See: https://www.sec.state.ma.us/cis/cispdf/ma_legal_holiday.pdf
-    holidays = [
+    return [
         Holiday(holiday_id=1, date=datetime.date(2022, 1, 1), holiday_name="New Year's Day"),
         Holiday(
             holiday_id=2,
@@ -1118,6 +1142,10 @@ def sync_holidays(db_session):
         Holiday(holiday_id=12, date=datetime.date(2022, 12, 26), holiday_name="Christmas Day"),
     ]
 
+
+def sync_holidays(db_session):
+    holidays = get_holidays()
+
     if not _are_holidays_valid(holidays):
         raise Exception(
             "Configured dates were not valid.  Please make sure all have a unique holiday_id and dates do not follow on a Sunday"
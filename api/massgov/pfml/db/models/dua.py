@@ -1,5 +1,7 @@
 from sqlalchemy import Column, Date, Index, Text, UniqueConstraint
 
+from massgov.pfml.db.content_hash import content_hash_default
+
 from .base import Base, TimestampMixin, uuid_gen
 from .common import PostgreSQLUUID
 
@@ -70,6 +72,30 @@ class DuaEmployer(Base, TimestampMixin):
     naics_code = Column(Text, nullable=True)
     naics_description = Column(Text, nullable=True)
 
+    # uix_dua_employer never matches rows with a null column, so rows are deduplicated on a hash of
+    # the same columns instead, which treats null and empty as equal.
+    row_data_columns = (
+        "fineos_employer_id",
+        "dba",
+        "attention",
+        "email",
+        "phone_number",
+        "address_line_1",
+        "address_line_2",
+        "address_city",
+        "address_zip_code",
+        "address_state",
+        "naics_code",
+        "naics_description",
+    )
+    row_data_hash = Column(
+        Text,
+        nullable=False,
+        index=True,
+        unique=True,
+        default=content_hash_default(row_data_columns),
+    )
+
 
 class DuaReportingUnitRaw(Base, TimestampMixin):
     __tablename__ = "dua_reporting_unit_data"
@@ -101,3 +127,25 @@ class DuaReportingUnitRaw(Base, TimestampMixin):
     address_city = Column(Text, nullable=True)
     address_zip_code = Column(Text, nullable=True)
     address_state = Column(Text, nullable=True)
+
+    # As with DuaEmployer, rows are deduplicated on a hash of the uix_dua_reporting_unit_data columns
+    row_data_columns = (
+        "fineos_employer_id",
+        "dua_id",
+        "dba",
+        "attention",
+        "email",
+        "phone_number",
+        "address_line_1",
+        "address_line_2",
+        "address_city",
+        "address_zip_code",
+        "address_state",
+    )
+    row_data_hash = Column(
+        Text,
+        nullable=False,
+        index=True,
+        unique=True,
+        default=content_hash_default(row_data_columns),
+    )
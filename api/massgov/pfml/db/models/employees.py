@@ -37,6 +37,7 @@ from sqlalchemy.sql.expression import func
 from sqlalchemy.types import JSON
 
 import massgov.pfml.util.logging
+from massgov.pfml.db.content_hash import content_hash_default
 from massgov.pfml.util.datetime import utcnow
 
 from ..lookup import LookupTable
@@ -628,6 +629,16 @@ class ExperianAddressPair(Base, TimestampMixin):
     )
 
 
+class ExperianAddressValidationResult(Base, TimestampMixin):
+    __tablename__ = "experian_address_validation_result"
+    # SHA-256 of the normalized Experian search request
+    address_hash = Column(Text, primary_key=True)
+    verify_level = Column(Text, nullable=False)
+    # Full Experian search response, including any suggested addresses
+    search_response = Column(JSON, nullable=False)
+    validated_at = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
+
+
 class EmployeeAddress(Base, TimestampMixin):
     __tablename__ = "link_employee_address"
     employee_id = Column(PostgreSQLUUID, ForeignKey("employee.employee_id"), primary_key=True)
@@ -1606,6 +1617,8 @@ class ImportLog(Base, TimestampMixin):
     report = Column(Text)
     start = Column(TIMESTAMP(timezone=True), index=True)
     end = Column(TIMESTAMP(timezone=True))
+    # Progress of a step that commits in chunks, for resuming after a failure
+    checkpoint = Column(JSON)
     report_queue_item = relationship(
         "ImportLogReportQueue",
         back_populates="import_log",
@@ -1791,6 +1804,26 @@ class DuaReductionPayment(Base, TimestampMixin):
     # have to coalesce those null values to empty strings. We've manually adjusted the migration
     # that adds this unique constraint to coalesce those nullable fields.
     # See: 2021_01_29_15_51_16_14155f78d8e6_create_dua_reduction_payment_table.py
+    #
+    # payment_data_hash is a hash of those same fields, which new rows are deduplicated on.
+    payment_data_columns = (
+        "fineos_customer_number",
+        "employer_fein",
+        "payment_date",
+        "request_week_begin_date",
+        "gross_payment_amount_cents",
+        "payment_amount_cents",
+        "fraud_indicator",
+        "benefit_year_begin_date",
+        "benefit_year_end_date",
+    )
+    payment_data_hash = Column(
+        Text,
+        nullable=False,
+        index=True,
+        unique=True,
+        default=content_hash_default(payment_data_columns),
+    )
 
 
 class DiaReductionPayment(Base, TimestampMixin):
@@ -1813,7 +1846,32 @@ class DiaReductionPayment(Base, TimestampMixin):
     award_created_date = Column(Date)
     termination_date = Column(Date)
 
-    # Each row should be unique.
+    # Each row should be unique. payment_data_hash is a hash of every payment field, which new rows
+    # are deduplicated on.
+    payment_data_columns = (
+        "fineos_customer_number",
+        "board_no",
+        "event_id",
+        "event_description",
+        "eve_created_date",
+        "event_occurrence_date",
+        "award_id",
+        "award_code",
+        "award_amount",
+        "award_date",
+        "start_date",
+        "end_date",
+        "weekly_amount",
+        "award_created_date",
+        "termination_date",
+    )
+    payment_data_hash = Column(
+        Text,
+        nullable=False,
+        index=True,
+        unique=True,
+        default=content_hash_default(payment_data_columns),
+    )
 
     Index(
         "ix_dia_reduction_payment_fineos_customer_number_board_no",
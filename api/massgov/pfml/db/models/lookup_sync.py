@@ -0,0 +1,121 @@
+""" Grouping for tables related to syncing lookup tables """
+# ORM models for lookup table sync state
+#
+# A model's ORM representation should always match the database so we can
+# properly read and write data. If you make a change, follow the instructions
+# in the API README to generate an associated table migration.
+#
+# Syncing every lookup table reads each table and compares it to the template rows in the code,
+# which every API worker and ECS task does at startup. Instead, a fingerprint of all the rows the
+# sync writes is stored in the database once a sync finishes. A process that finds its own
+# fingerprint there knows the database is current, and only fills in its lookup caches.
+
+import hashlib
+import json
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, List, Optional, Type
+
+import sqlalchemy.exc
+from sqlalchemy import Column, Text, text
+
+import massgov.pfml.util.logging
+
+from ..lookup import LookupTable
+from .base import Base, TimestampMixin
+
+logger = massgov.pfml.util.logging.get_logger(__name__)
+
+# Row of lookup_sync_metadata holding the fingerprint of the lookup sync
+LOOKUP_SYNC_NAME = "lookup_tables"
+
+# Key of the Postgres advisory lock held while a full sync runs
+LOOKUP_SYNC_ADVISORY_LOCK_ID = 7_305_118_942
+
+
+class LookupSyncMetadata(Base, TimestampMixin):
+    __tablename__ = "lookup_sync_metadata"
+    name = Column(Text, primary_key=True)
+    fingerprint = Column(Text, nullable=False)
+
+
+def get_lookup_tables() -> List[Type[LookupTable]]:
+    """Get every LookupTable class defined by the models, in table name order."""
+    lookup_tables = []
+    pending = list(LookupTable.__subclasses__())
+    while pending:
+        lookup_table = pending.pop()
+        lookup_tables.append(lookup_table)
+        pending.extend(lookup_table.__subclasses__())
+
+    return sorted(lookup_tables, key=lambda lookup_table: lookup_table.model.__table__.name)
+
+
+def compute_fingerprint(lookup_tables: Iterable[Type[LookupTable]], rows: Iterable[Base]) -> str:
+    """Hash the template rows of the lookup tables and the other rows synced along with them."""
+    content: List[Any] = []
+
+    for lookup_table in lookup_tables:
+        template_rows = sorted(
+            (
+                [getattr(template, column_name) for column_name in lookup_table.column_names]
+                for template in lookup_table.get_all()
+            ),
+            key=lambda row: str(row[0]),
+        )
+        content.append([lookup_table.model.__table__.name, template_rows])
+
+    for row in rows:
+        content.append([row.__table__.name, row.dict()])  # type: ignore
+
+    payload = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_fingerprint(db_session: Any) -> Optional[str]:
+    """Get the fingerprint of the last full sync, or None if there is none."""
+    try:
+        # Query the column rather than the model, so a row already in the session's identity map
+        # does not hide a sync finished by another process
+        return (
+            db_session.query(LookupSyncMetadata.fingerprint)
+            .filter(LookupSyncMetadata.name == LOOKUP_SYNC_NAME)
+            .scalar()
+        )
+    except sqlalchemy.exc.ProgrammingError:
+        # The migration that creates the table has not run yet
+        logger.warning("lookup sync metadata table is missing, running full sync")
+        db_session.rollback()
+        return None
+
+
+def set_fingerprint(db_session: Any, fingerprint: str) -> None:
+    db_session.merge(LookupSyncMetadata(name=LOOKUP_SYNC_NAME, fingerprint=fingerprint))
+    try:
+        db_session.commit()
+    except sqlalchemy.exc.ProgrammingError:
+        logger.warning("lookup sync metadata table is missing, fingerprint not saved")
+        db_session.rollback()
+
+
+def populate_lookup_caches(lookup_tables: Iterable[Type[LookupTable]]) -> None:
+    for lookup_table in lookup_tables:
+        lookup_table.populate_db_instance_cache()
+
+
+@contextmanager
+def advisory_lock(db_session: Any) -> Iterator[None]:
+    """Hold the lookup sync advisory lock, waiting for any other process holding it.
+
+    The lock is taken on a connection of its own, as the sync commits more than once and the
+    session's connection goes back to the pool in between.
+    """
+    with db_session.get_bind().connect() as connection:
+        connection.execute(
+            text("SELECT pg_advisory_lock(:lock_id)"), lock_id=LOOKUP_SYNC_ADVISORY_LOCK_ID
+        )
+        try:
+            yield
+        finally:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(:lock_id)"), lock_id=LOOKUP_SYNC_ADVISORY_LOCK_ID
+            )
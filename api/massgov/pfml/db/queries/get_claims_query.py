@@ -1,10 +1,10 @@
 import re
-from typing import Any, Callable, Optional, Set, Type, Union, no_type_check
+from typing import Any, Callable, Optional, Set, Tuple, Type, Union, no_type_check
 from uuid import UUID
 
-from sqlalchemy import Column, and_, asc, desc, func, or_
+from sqlalchemy import Column, and_, asc, desc, func, or_, select, union
 from sqlalchemy.sql.elements import UnaryExpression
-from sqlalchemy.sql.selectable import Alias
+from sqlalchemy.sql.selectable import Alias, Select
 
 from massgov.pfml import db
 from massgov.pfml.api.util.paginate.paginator import (
@@ -25,6 +25,41 @@ from massgov.pfml.db.models.employees import (
     User,
 )
 
+# Name columns matched by a single word search, each has a trigram index on Employee
+NAME_SEARCH_COLUMNS: Tuple[Column, ...] = (
+    Employee.first_name,
+    Employee.middle_name,
+    Employee.last_name,
+    Employee.fineos_employee_first_name,
+    Employee.fineos_employee_middle_name,
+    Employee.fineos_employee_last_name,
+)
+
+
+def _join_names(*columns: Column) -> Any:
+    # Same result as concat(first, ' ', last), but built from immutable functions so that it can be
+    # indexed. These must match the trigram expression indexes on Employee created in migration
+    # 2022_04_20_10_15_42_3a8f1c2d4b6e_add_trigram_indexes_for_claim_search exactly
+    expression = func.coalesce(columns[0], "")
+    for column in columns[1:]:
+        expression = expression + " " + func.coalesce(column, "")
+    return expression
+
+
+# Full name permutations matched by a search with a space in it
+FULL_NAME_SEARCH_EXPRESSIONS = (
+    _join_names(Employee.first_name, Employee.last_name),
+    _join_names(Employee.last_name, Employee.first_name),
+    _join_names(Employee.first_name, Employee.middle_name, Employee.last_name),
+    _join_names(Employee.fineos_employee_first_name, Employee.fineos_employee_last_name),
+    _join_names(Employee.fineos_employee_last_name, Employee.fineos_employee_first_name),
+    _join_names(
+        Employee.fineos_employee_first_name,
+        Employee.fineos_employee_middle_name,
+        Employee.fineos_employee_last_name,
+    ),
+)
+
 
 # Wrapper for the DB layer of the `get_claims` endpoint
 # Create a query for filtering and ordering Claim results
@@ -121,30 +156,6 @@ class GetClaimsQuery:
         )
         self.query = self.query.filter(filter)
 
-    def employee_search_sub_query(self) -> Alias:
-        search_columns = [
-            Employee,
-            func.concat(Employee.first_name, " ", Employee.last_name).label("first_last"),
-            func.concat(Employee.last_name, " ", Employee.first_name).label("last_first"),
-            func.concat(
-                Employee.first_name, " ", Employee.middle_name, " ", Employee.last_name
-            ).label("full_name"),
-            func.concat(
-                Employee.fineos_employee_first_name, " ", Employee.fineos_employee_last_name
-            ).label("first_last_fineos"),
-            func.concat(
-                Employee.fineos_employee_last_name, " ", Employee.fineos_employee_first_name
-            ).label("last_first_fineos"),
-            func.concat(
-                Employee.fineos_employee_first_name,
-                " ",
-                Employee.fineos_employee_middle_name,
-                " ",
-                Employee.fineos_employee_last_name,
-            ).label("full_name_fineos"),
-        ]
-        return self.session.query(*search_columns).subquery()
-
     def format_search_string(self, search_string: str) -> str:
         return re.sub(r"\s+", " ", search_string).strip()
 
@@ -153,39 +164,30 @@ class GetClaimsQuery:
         self.join(Claim.employee, isouter=True)  # type:ignore
 
         search_string = self.format_search_string(search_string)
+        pattern = f"%{search_string}%"
         # if there is no space in the search string
         # then it is either a first_name, last_name, middle_name or absence_case_id search
         #  if there is a space then we run the full_name search
+        #
+        # Each branch is a separate select on a single table so that Postgres can answer it from
+        # the trigram indexes on those expressions rather than scanning Claim joined to Employee
         if " " in search_string:
-            search_sub_query = self.employee_search_sub_query()
-            self.join(search_sub_query, isouter=True)
-            filters = and_(
-                search_sub_query.c.employee_id == Claim.employee_id,
-                or_(
-                    search_sub_query.c.first_last.ilike(f"%{search_string}%"),
-                    search_sub_query.c.last_first.ilike(f"%{search_string}%"),
-                    search_sub_query.c.full_name.ilike(f"%{search_string}%"),
-                    search_sub_query.c.first_last_fineos.ilike(f"%{search_string}%"),
-                    search_sub_query.c.last_first_fineos.ilike(f"%{search_string}%"),
-                    search_sub_query.c.full_name_fineos.ilike(f"%{search_string}%"),
-                ),
+            matching_claim_ids = self.employee_claim_ids_query(
+                or_(*[expression.ilike(pattern) for expression in FULL_NAME_SEARCH_EXPRESSIONS])
             )
         else:
-            filters = or_(
-                Claim.fineos_absence_id.ilike(f"%{search_string}%"),
-                and_(
-                    Employee.employee_id == Claim.employee_id,
-                    or_(
-                        Employee.first_name.ilike(f"%{search_string}%"),
-                        Employee.middle_name.ilike(f"%{search_string}%"),
-                        Employee.last_name.ilike(f"%{search_string}%"),
-                        Employee.fineos_employee_first_name.ilike(f"%{search_string}%"),
-                        Employee.fineos_employee_middle_name.ilike(f"%{search_string}%"),
-                        Employee.fineos_employee_last_name.ilike(f"%{search_string}%"),
-                    ),
+            # The stubs don't list a union as an argument to in_(), though SQLAlchemy accepts it
+            matching_claim_ids = union(  # type: ignore
+                select([Claim.claim_id]).where(Claim.fineos_absence_id.ilike(pattern)),
+                self.employee_claim_ids_query(
+                    or_(*[column.ilike(pattern) for column in NAME_SEARCH_COLUMNS])
                 ),
             )
-        self.query = self.query.filter(filters)
+        self.query = self.query.filter(Claim.claim_id.in_(matching_claim_ids))
+
+    def employee_claim_ids_query(self, employee_filter: Any) -> Select:
+        matching_employee_ids = select([Employee.employee_id]).where(employee_filter)
+        return select([Claim.claim_id]).where(Claim.employee_id.in_(matching_employee_ids))
 
     def add_managed_requirements_filter(self) -> None:
         filters = [
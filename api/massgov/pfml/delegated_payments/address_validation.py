@@ -20,6 +20,7 @@ from massgov.pfml.delegated_payments.step import Step
 from massgov.pfml.delegated_payments.util.fineos_writeback_util import (
     stage_payment_fineos_writeback,
 )
+from massgov.pfml.experian.address_validate_soap.cached_client import CachedClient
 from massgov.pfml.experian.address_validate_soap.service import (
     address_to_experian_verification_search,
     experian_verification_response_to_address,
@@ -67,12 +68,27 @@ class AddressValidationStep(Step):
         VALIDATED_ADDRESS_COUNT = "validated_address_count"
         VERIFIED_EXPERIAN_MATCH = "verified_experian_match"
         ADDRESS_MISSING_COMPONENT_COUNT = "address_missing_component_count"
+        EXPERIAN_CACHE_HIT_COUNT = "experian_cache_hit_count"
+        EXPERIAN_CACHE_MISS_COUNT = "experian_cache_miss_count"
+        EXPERIAN_CACHE_STALE_COUNT = "experian_cache_stale_count"
+        EXPERIAN_SEARCH_COUNT = "experian_search_count"
+        EXPERIAN_SEARCH_MILLISECONDS = "experian_search_milliseconds"
 
     def run_step(self) -> None:
 
-        experian_soap_client = _get_experian_soap_client()
+        experian_soap_client = CachedClient(
+            _get_experian_soap_client(), self.db_session, increment=self.increment
+        )
 
         payments = _get_payments_awaiting_address_validation(self.db_session)
+
+        # Search Experian for every address that needs it up front, in parallel
+        experian_soap_client.prefetch(
+            address_to_experian_verification_search(payment.experian_address_pair.fineos_address)
+            for payment in payments
+            if self._needs_experian_search(payment.experian_address_pair)
+        )
+
         for payment in payments:
             logger.info(
                 "Doing address validation for payment", extra=get_traceable_payment_details(payment)
@@ -131,6 +147,13 @@ class AddressValidationStep(Step):
 
         return None
 
+    def _needs_experian_search(self, address_pair: ExperianAddressPair) -> bool:
+        return (
+            not _address_has_been_validated(address_pair)
+            and address_pair.fineos_address is not None
+            and self._does_address_have_all_parts(address_pair.fineos_address)
+        )
+
     def _process_address_via_soap_api(
         self,
         experian_soap_client: soap_api.Client,
@@ -2,7 +2,7 @@ import enum
 import os
 import pathlib
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from sqlalchemy.sql.functions import func
 
@@ -28,6 +28,7 @@ from massgov.pfml.db.models.geo import GeoState
 from massgov.pfml.db.models.payments import FineosExtractEmployeeFeed, MmarsPaymentData
 from massgov.pfml.delegated_payments.address_validation import _get_experian_soap_client
 from massgov.pfml.delegated_payments.step import Step
+from massgov.pfml.experian.address_validate_soap.cached_client import CachedClient
 from massgov.pfml.experian.address_validate_soap.layouts import Layout
 from massgov.pfml.experian.address_validate_soap.service import (
     experian_verification_response_to_address,
@@ -99,6 +100,11 @@ class ClaimantAddressValidationStep(Step):
         VALIDATED_ADDRESS_COUNT = "validated_address_count"
         VERIFIED_EXPERIAN_MATCH = "verified_experian_match"
         ADDRESS_MISSING_COMPONENT_COUNT = "address_missing_component_count"
+        EXPERIAN_CACHE_HIT_COUNT = "experian_cache_hit_count"
+        EXPERIAN_CACHE_MISS_COUNT = "experian_cache_miss_count"
+        EXPERIAN_CACHE_STALE_COUNT = "experian_cache_stale_count"
+        EXPERIAN_SEARCH_COUNT = "experian_search_count"
+        EXPERIAN_SEARCH_MILLISECONDS = "experian_search_milliseconds"
 
     def run_step(self) -> None:
 
@@ -206,60 +212,85 @@ class ClaimantAddressValidationStep(Step):
         addressResults = []
         logger.info("Claimant Address Validation Step - Start")
         try:
-            experian_soap_client = _get_experian_soap_client()
+            experian_soap_client = CachedClient(
+                _get_experian_soap_client(), self.db_session, increment=self.increment
+            )
             fin_employee_feed_data = self.get_fineos_employee_feed()
 
+            # Address pairs by employee and normalized address, so an address that is repeated
+            # for an employee shares one pair, including pairs created during this run
+            address_pairs: Dict[Tuple[Any, ...], Optional[ExperianAddressPair]] = {}
+            created_pair_keys: Set[Tuple[Any, ...]] = set()
+
+            employee_addresses = []
             for f_employee_data in fin_employee_feed_data:
                 logger.debug("Customer number from fineos %s", f_employee_data.customerno)
                 employee = self.get_employee_record(f_employee_data.customerno)
                 if employee:
                     logger.debug("There is an employee match %s", employee.employee_id)
                     employee_feed_address_data = self.construct_address_data(f_employee_data)
-                    logger.debug(
-                        "Check if there is an existing address pair for this address %s",
-                        employee_feed_address_data.address_line_one,
+                    pair_key = (
+                        employee.employee_id,
+                        *payments_util.address_key(employee_feed_address_data),
                     )
-                    address_pair = payments_util.find_existing_address_pair(
-                        employee, employee_feed_address_data, self.db_session
-                    )
-                    if address_pair and address_pair.experian_address is not None:
-                        self.increment(self.Metrics.PREVIOUSLY_VALIDATED_MATCH_COUNT)
-                    # Does it have all the address lines
-                    elif not self._does_address_have_all_parts(employee_feed_address_data):
-                        logger.info(
-                            "Address missing parts for customer %s", f_employee_data.customerno
+                    if pair_key not in address_pairs:
+                        logger.debug(
+                            "Check if there is an existing address pair for this address %s",
+                            employee_feed_address_data.address_line_one,
                         )
-                        self.increment(self.Metrics.ADDRESS_MISSING_COMPONENT_COUNT)
-                        result = self._outcome_for_search_result(
-                            None,
-                            Constants.MESSAGE_ADDRESS_MISSING_PART,
-                            employee_feed_address_data,
-                            f_employee_data.customerno,
-                            f_employee_data.firstnames,
-                            f_employee_data.lastname,
+                        address_pairs[pair_key] = payments_util.find_existing_address_pair(
+                            employee, employee_feed_address_data, self.db_session
                         )
-                        addressResults.append(result.get("experian_result"))
-                    else:
-                        if not address_pair:
-                            address_pair = ExperianAddressPair(
-                                fineos_address=employee_feed_address_data
-                            )
-                            new_address = True
-                        else:
-                            new_address = False
-                        # Call validation if new address or address not validated
-                        result_soap = self.process_address_via_soap_api(
-                            experian_soap_client,
-                            employee_feed_address_data,
-                            address_pair,
-                            new_address,
-                            f_employee_data.customerno,
-                            f_employee_data.firstnames,
-                            f_employee_data.lastname,
+                    employee_addresses.append(
+                        (f_employee_data, employee_feed_address_data, pair_key)
+                    )
+
+            # Search Experian for every address that needs it up front, in parallel
+            experian_soap_client.prefetch(
+                self.address_to_experian_verification_search(address)
+                for _, address, pair_key in employee_addresses
+                if getattr(address_pairs[pair_key], "experian_address", None) is None
+                and self._does_address_have_all_parts(address)
+            )
+
+            for f_employee_data, employee_feed_address_data, pair_key in employee_addresses:
+                address_pair = address_pairs[pair_key]
+                if address_pair and address_pair.experian_address is not None:
+                    self.increment(self.Metrics.PREVIOUSLY_VALIDATED_MATCH_COUNT)
+                # Does it have all the address lines
+                elif not self._does_address_have_all_parts(employee_feed_address_data):
+                    logger.info("Address missing parts for customer %s", f_employee_data.customerno)
+                    self.increment(self.Metrics.ADDRESS_MISSING_COMPONENT_COUNT)
+                    result = self._outcome_for_search_result(
+                        None,
+                        Constants.MESSAGE_ADDRESS_MISSING_PART,
+                        employee_feed_address_data,
+                        f_employee_data.customerno,
+                        f_employee_data.firstnames,
+                        f_employee_data.lastname,
+                    )
+                    addressResults.append(result.get("experian_result"))
+                else:
+                    if not address_pair:
+                        address_pair = ExperianAddressPair(
+                            fineos_address=employee_feed_address_data
                         )
-                        self.increment(self.Metrics.VALIDATED_ADDRESS_COUNT)
-                        if result_soap:
-                            addressResults.append(result_soap.get("experian_result"))
+                        address_pairs[pair_key] = address_pair
+                        created_pair_keys.add(pair_key)
+                    new_address = pair_key in created_pair_keys
+                    # Call validation if new address or address not validated
+                    result_soap = self.process_address_via_soap_api(
+                        experian_soap_client,
+                        employee_feed_address_data,
+                        address_pair,
+                        new_address,
+                        f_employee_data.customerno,
+                        f_employee_data.firstnames,
+                        f_employee_data.lastname,
+                    )
+                    self.increment(self.Metrics.VALIDATED_ADDRESS_COUNT)
+                    if result_soap:
+                        addressResults.append(result_soap.get("experian_result"))
             logger.info("Uploading results ")
             ref_file = self.upload_results_s3(addressResults)
             self.increment(Constants.TRANSACTION_FILES_SENT_COUNT)
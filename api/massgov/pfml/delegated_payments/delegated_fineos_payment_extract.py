@@ -1,12 +1,14 @@
 import enum
 import uuid
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from typing import Any, Callable, DefaultDict, Dict, Iterable, Iterator, List, Optional, Tuple, cast
 
 from sqlalchemy.exc import SQLAlchemyError
 
 import massgov.pfml.api.util.state_log_util as state_log_util
+import massgov.pfml.db as db
 import massgov.pfml.delegated_payments.delegated_payments_util as payments_util
 import massgov.pfml.util.logging as logging
 from massgov.pfml.db.models.employees import (
@@ -106,6 +108,11 @@ AUTO_ALT_EVENT_REASON = "Automatic Alternate Payment"
 
 TAX_IDENTIFICATION_NUMBER = "Tax Identification Number"
 
+# Max number of values bound in a single IN clause when prefetching
+PREFETCH_CHUNK_SIZE = 5000
+
+CiKey = Tuple[str, str]
+
 # TASKTYPENAME of VBI Task Report Som for other income-related tasks
 OTHER_INCOME_TASKTYPENAMES = [
     "Employee Reported Other Income",
@@ -810,6 +817,137 @@ class PaymentData:
         return self.payment_type == "Adhoc"
 
 
+def _chunks(values: Iterable[str], size: int = PREFETCH_CHUNK_SIZE) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class PaymentExtractPrefetch:
+    """In-memory indexes of everything a payment extract run looks up per PEI record.
+
+    Each staging table for the reference file is read once and grouped by C/I value (requested
+    absences by leave request ID), and the claims, tax identifiers and employees referenced by the
+    extract are resolved with chunked IN queries. Building PaymentData from these is then pure
+    in-memory work instead of several round trips per payment.
+    """
+
+    def __init__(
+        self,
+        db_session: db.Session,
+        reference_file: ReferenceFile,
+        latest_claimant_extract_reference_file: ReferenceFile,
+        raw_payment_records: List[FineosExtractVpei],
+    ):
+        self.payment_details_by_ci: DefaultDict[
+            CiKey, List[FineosExtractVpeiPaymentDetails]
+        ] = defaultdict(list)
+        for payment_details in db_session.query(FineosExtractVpeiPaymentDetails).filter(
+            FineosExtractVpeiPaymentDetails.reference_file_id == reference_file.reference_file_id
+        ):
+            self.payment_details_by_ci[
+                (cast(str, payment_details.peclassid), cast(str, payment_details.peindexid))
+            ].append(payment_details)
+
+        self.payment_lines_by_ci: DefaultDict[
+            CiKey, List[FineosExtractVpeiPaymentLine]
+        ] = defaultdict(list)
+        for payment_line in db_session.query(FineosExtractVpeiPaymentLine).filter(
+            FineosExtractVpeiPaymentLine.reference_file_id == reference_file.reference_file_id
+        ):
+            self.payment_lines_by_ci[
+                (
+                    cast(str, payment_line.c_pymnteif_paymentlines),
+                    cast(str, payment_line.i_pymnteif_paymentlines),
+                )
+            ].append(payment_line)
+
+        self.claim_details_by_ci: DefaultDict[
+            CiKey, List[FineosExtractVpeiClaimDetails]
+        ] = defaultdict(list)
+        for claim_details in db_session.query(FineosExtractVpeiClaimDetails).filter(
+            FineosExtractVpeiClaimDetails.reference_file_id == reference_file.reference_file_id
+        ):
+            self.claim_details_by_ci[
+                (cast(str, claim_details.peclassid), cast(str, claim_details.peindexid))
+            ].append(claim_details)
+
+        # The claimant extract's requested absence file covers every claim, so only load
+        # the leave requests referenced by this payment extract. Empty IDs are kept, they
+        # match requested absences with an empty ID the same as the per-payment query does.
+        leave_request_ids = {
+            claim_details.leaverequesti
+            for claim_details_records in self.claim_details_by_ci.values()
+            for claim_details in claim_details_records
+            if claim_details.leaverequesti is not None
+        }
+        self.requested_absences_by_leave_request_id: Dict[
+            str, List[FineosExtractVbiRequestedAbsence]
+        ] = {leave_request_id: [] for leave_request_id in leave_request_ids}
+        for leave_request_id_chunk in _chunks(leave_request_ids):
+            for requested_absence in db_session.query(FineosExtractVbiRequestedAbsence).filter(
+                FineosExtractVbiRequestedAbsence.leaverequest_id.in_(leave_request_id_chunk),
+                FineosExtractVbiRequestedAbsence.reference_file_id
+                == latest_claimant_extract_reference_file.reference_file_id,
+            ):
+                self.requested_absences_by_leave_request_id[
+                    cast(str, requested_absence.leaverequest_id)
+                ].append(requested_absence)
+
+        # Claims, keyed by every absence case number in the extract, None if not in the DB
+        absence_case_numbers = {
+            claim_details.absencecasenu
+            for claim_details_records in self.claim_details_by_ci.values()
+            for claim_details in claim_details_records
+            if claim_details.absencecasenu
+        }
+        self.claims_by_absence_case_number: Dict[str, Optional[Claim]] = dict.fromkeys(
+            absence_case_numbers
+        )
+        for absence_case_number_chunk in _chunks(absence_case_numbers):
+            for claim in db_session.query(Claim).filter(
+                Claim.fineos_absence_id.in_(absence_case_number_chunk)
+            ):
+                self.claims_by_absence_case_number[cast(str, claim.fineos_absence_id)] = claim
+
+        # Whether a tax identifier exists, and its employee, keyed by every TIN in the extract
+        tins = {
+            raw_payment_record.payeesocnumbe
+            for raw_payment_record in raw_payment_records
+            if raw_payment_record.payeesocnumbe
+        }
+        self.tax_identifier_found_by_tin: Dict[str, bool] = dict.fromkeys(tins, False)
+        self.employees_by_tin: Dict[str, Optional[Employee]] = dict.fromkeys(tins)
+        for tin_chunk in _chunks(tins):
+            for tin, employee in (
+                db_session.query(TaxIdentifier.tax_identifier, Employee)
+                .select_from(TaxIdentifier)
+                .outerjoin(Employee, Employee.tax_identifier_id == TaxIdentifier.tax_identifier_id)
+                .filter(TaxIdentifier.tax_identifier.in_(tin_chunk))
+            ):
+                self.tax_identifier_found_by_tin[tin] = True
+                self.employees_by_tin[tin] = employee
+
+        logger.info(
+            "Prefetched payment extract data",
+            extra={
+                "payment_details_ci_count": len(self.payment_details_by_ci),
+                "payment_lines_ci_count": len(self.payment_lines_by_ci),
+                "claim_details_ci_count": len(self.claim_details_by_ci),
+                "requested_absence_leave_request_count": len(
+                    self.requested_absences_by_leave_request_id
+                ),
+                "claim_count": len(absence_case_numbers),
+                "tin_count": len(tins),
+            },
+        )
+
+
 class PaymentExtractStep(Step):
     class Metrics(str, enum.Enum):
         EXTRACT_PATH = "extract_path"
@@ -845,6 +983,9 @@ class PaymentExtractStep(Step):
         STATE_WITHHOLDING_PAYMENT_COUNT = "state_withholding_payment_count"
         EXEMPT_EMPLOYER_COUNT = "exempt_employer_count"
 
+    # Populated by process_records, lookups fall back to per-record queries when unset
+    prefetch: Optional[PaymentExtractPrefetch] = None
+
     def run_step(self):
         logger.info("Processing payment extract data")
         self.process_records()
@@ -896,6 +1037,37 @@ class PaymentExtractStep(Step):
 
         return None
 
+    def _get_claim(self, absence_case_number: Optional[str]) -> Optional[Claim]:
+        if self.prefetch and absence_case_number in self.prefetch.claims_by_absence_case_number:
+            return self.prefetch.claims_by_absence_case_number[absence_case_number]
+
+        return (
+            self.db_session.query(Claim)
+            .filter_by(fineos_absence_id=absence_case_number)
+            .one_or_none()
+        )
+
+    def _get_tax_identifier_and_employee(
+        self, tin: Optional[str]
+    ) -> Tuple[bool, Optional[Employee]]:
+        """Whether a tax identifier exists for the TIN, and the employee attached to it"""
+        if self.prefetch and tin in self.prefetch.tax_identifier_found_by_tin:
+            return (
+                self.prefetch.tax_identifier_found_by_tin[tin],
+                self.prefetch.employees_by_tin[tin],
+            )
+
+        tax_identifier = (
+            self.db_session.query(TaxIdentifier).filter_by(tax_identifier=tin).one_or_none()
+        )
+        if not tax_identifier:
+            return False, None
+
+        employee = (
+            self.db_session.query(Employee).filter_by(tax_identifier=tax_identifier).one_or_none()
+        )
+        return True, employee
+
     def get_employee_and_claim(
         self, payment_data: PaymentData
     ) -> Tuple[Optional[Employee], Optional[Claim]]:
@@ -903,11 +1075,7 @@ class PaymentExtractStep(Step):
         # Get the TIN, employee and claim associated with the payment to be made
         employee, claim = None, None
         try:
-            claim = (
-                self.db_session.query(Claim)
-                .filter_by(fineos_absence_id=payment_data.absence_case_number)
-                .one_or_none()
-            )
+            claim = self._get_claim(payment_data.absence_case_number)
             # If the employee is required and should be validated, do so
             # Otherwise, we know we aren't going to find an employee, so don't look
             if payment_data.is_employee_required:
@@ -925,12 +1093,10 @@ class PaymentExtractStep(Step):
                             "employee",
                         )
                 else:
-                    tax_identifier = (
-                        self.db_session.query(TaxIdentifier)
-                        .filter_by(tax_identifier=payment_data.tin)
-                        .one_or_none()
+                    tax_identifier_found, employee = self._get_tax_identifier_and_employee(
+                        payment_data.tin
                     )
-                    if not tax_identifier:
+                    if not tax_identifier_found:
                         self.increment(self.Metrics.TAX_IDENTIFIER_MISSING_IN_DB_COUNT)
                         payment_data.validation_container.add_validation_issue(
                             payments_util.ValidationReason.MISSING_IN_DB,
@@ -938,11 +1104,6 @@ class PaymentExtractStep(Step):
                             "tax_identifier",
                         )
                     else:
-                        employee = (
-                            self.db_session.query(Employee)
-                            .filter_by(tax_identifier=tax_identifier)
-                            .one_or_none()
-                        )
                         if not employee:
                             self.increment(self.Metrics.EMPLOYEE_MISSING_IN_DB_COUNT)
                             payment_data.validation_container.add_validation_issue(
@@ -1652,46 +1813,59 @@ class PaymentExtractStep(Step):
             # We expect multiple payment detail records
             # joined on the C/I value. Each of these represents
             # a pay period within a payment (although most payments will have exactly 1)
-            payment_details_records = (
-                self.db_session.query(FineosExtractVpeiPaymentDetails)
-                .filter(
-                    FineosExtractVpeiPaymentDetails.peclassid == c_value,
-                    FineosExtractVpeiPaymentDetails.peindexid == i_value,
-                    FineosExtractVpeiPaymentDetails.reference_file_id
-                    == reference_file.reference_file_id,
+            if self.prefetch:
+                payment_details_records = self.prefetch.payment_details_by_ci.get(
+                    (c_value, i_value), []
+                )
+            else:
+                payment_details_records = (
+                    self.db_session.query(FineosExtractVpeiPaymentDetails)
+                    .filter(
+                        FineosExtractVpeiPaymentDetails.peclassid == c_value,
+                        FineosExtractVpeiPaymentDetails.peindexid == i_value,
+                        FineosExtractVpeiPaymentDetails.reference_file_id
+                        == reference_file.reference_file_id,
+                    )
+                    .all()
                 )
-                .all()
-            )
             self.increment(self.Metrics.PAYMENT_DETAILS_RECORD_COUNT, len(payment_details_records))
 
             # We expect multiple payment line records for each payment
             # joined on the C/I value. Each of these represents
             # a specific amount+type that makes up the payment
             # eg. $500 for base benefit, or -$50 removed for tax
-            payment_line_records = (
-                self.db_session.query(FineosExtractVpeiPaymentLine)
-                .filter(
-                    FineosExtractVpeiPaymentLine.c_pymnteif_paymentlines == c_value,
-                    FineosExtractVpeiPaymentLine.i_pymnteif_paymentlines == i_value,
-                    FineosExtractVpeiPaymentLine.reference_file_id
-                    == reference_file.reference_file_id,
+            if self.prefetch:
+                payment_line_records = self.prefetch.payment_lines_by_ci.get((c_value, i_value), [])
+            else:
+                payment_line_records = (
+                    self.db_session.query(FineosExtractVpeiPaymentLine)
+                    .filter(
+                        FineosExtractVpeiPaymentLine.c_pymnteif_paymentlines == c_value,
+                        FineosExtractVpeiPaymentLine.i_pymnteif_paymentlines == i_value,
+                        FineosExtractVpeiPaymentLine.reference_file_id
+                        == reference_file.reference_file_id,
+                    )
+                    .all()
                 )
-                .all()
-            )
             self.increment(self.Metrics.PAYMENT_LINE_RECORD_COUNT, len(payment_line_records))
 
             # We expect only one claim details record
             # joined on the C/I value
-            claim_details_records = (
-                self.db_session.query(FineosExtractVpeiClaimDetails)
-                .filter(
-                    FineosExtractVpeiClaimDetails.peclassid == c_value,
-                    FineosExtractVpeiClaimDetails.peindexid == i_value,
-                    FineosExtractVpeiClaimDetails.reference_file_id
-                    == reference_file.reference_file_id,
+            if self.prefetch:
+                claim_details_records = self.prefetch.claim_details_by_ci.get(
+                    (c_value, i_value), []
+                )
+            else:
+                claim_details_records = (
+                    self.db_session.query(FineosExtractVpeiClaimDetails)
+                    .filter(
+                        FineosExtractVpeiClaimDetails.peclassid == c_value,
+                        FineosExtractVpeiClaimDetails.peindexid == i_value,
+                        FineosExtractVpeiClaimDetails.reference_file_id
+                        == reference_file.reference_file_id,
+                    )
+                    .all()
                 )
-                .all()
-            )
             self.increment(self.Metrics.CLAIM_DETAILS_RECORD_COUNT, len(claim_details_records))
 
             claim_details_record = None
@@ -1721,15 +1895,23 @@ class PaymentExtractStep(Step):
                 # are the absence period start/end dates (which we do not use)
                 # Fetch all of them, we'll filter it to one and log a message
                 # just in case it ever matters.
-                requested_absence_records = (
-                    self.db_session.query(FineosExtractVbiRequestedAbsence)
-                    .filter(
-                        FineosExtractVbiRequestedAbsence.leaverequest_id == leave_request_id,
-                        FineosExtractVbiRequestedAbsence.reference_file_id
-                        == latest_claimant_extract_reference_file.reference_file_id,
+                if (
+                    self.prefetch
+                    and leave_request_id in self.prefetch.requested_absences_by_leave_request_id
+                ):
+                    requested_absence_records = (
+                        self.prefetch.requested_absences_by_leave_request_id[leave_request_id]
+                    )
+                else:
+                    requested_absence_records = (
+                        self.db_session.query(FineosExtractVbiRequestedAbsence)
+                        .filter(
+                            FineosExtractVbiRequestedAbsence.leaverequest_id == leave_request_id,
+                            FineosExtractVbiRequestedAbsence.reference_file_id
+                            == latest_claimant_extract_reference_file.reference_file_id,
+                        )
+                        .all()
                     )
-                    .all()
-                )
                 self.increment(
                     self.Metrics.REQUESTED_ABSENCE_RECORD_COUNT, len(requested_absence_records)
                 )
@@ -1824,6 +2006,14 @@ class PaymentExtractStep(Step):
             .filter(FineosExtractVpei.reference_file_id == reference_file.reference_file_id)
             .all()
         )
+
+        self.prefetch = PaymentExtractPrefetch(
+            self.db_session,
+            reference_file,
+            latest_claimant_extract_reference_file,
+            raw_payment_records,
+        )
+
         for raw_payment_record in raw_payment_records:
             self.increment(self.Metrics.PEI_RECORD_COUNT)
             self.process_payment_record(
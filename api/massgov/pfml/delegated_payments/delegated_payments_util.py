@@ -911,6 +911,9 @@ def copy_fineos_data_to_archival_bucket(
     # keep a mapping of expected to mapped files grouped by date
     copied_file_mapping_by_date: Dict[str, Dict[str, str]] = {}
 
+    # Copies to make once every expected file has been found, by destination
+    pending_copies: Dict[str, str] = {}
+
     def copy_files(files, folder, check_already_processed=False):
         previously_processed_date_group = set()
 
@@ -977,7 +980,7 @@ def copy_fineos_data_to_archival_bucket(
                             f"Error while copying fineos extracts - duplicate files found for {expected_file_name}: {existing_expected_file} and {source_file}"
                         )
 
-                    file_util.copy_file(source_file, destination_file)
+                    pending_copies[destination_file] = source_file
                     copied_file_mapping_by_date[date_str][expected_file_name] = destination_file
 
     # process top level files
@@ -1018,6 +1021,13 @@ def copy_fineos_data_to_archival_bucket(
         subfolder_files = file_util.list_files(subfolder_path)
         copy_files(subfolder_files, folder=date_folder, check_already_processed=False)
 
+    file_util.copy_files(
+        [
+            (source_file, destination_file)
+            for destination_file, source_file in pending_copies.items()
+        ]
+    )
+
     # check for missing files in each group
     missing_files = []
     for date_str, copied_file_mapping in copied_file_mapping_by_date.items():
@@ -1084,6 +1094,28 @@ def is_same_address(first: Address, second: Address) -> bool:
         return False
 
 
+def address_key(address: Address) -> Tuple[Any, ...]:
+    """Key that is equal for addresses is_same_address() considers the same."""
+
+    def normalize(field: str) -> Any:
+        value = getattr(address, field)
+        if type(value) is str:
+            value = value.strip().lower()
+        return "" if value is None else value
+
+    return tuple(
+        normalize(field)
+        for field in (
+            "address_line_one",
+            "city",
+            "zip_code",
+            "geo_state_id",
+            "country_id",
+            "address_line_two",
+        )
+    )
+
+
 def find_existing_address_pair(
     employee: Optional[Employee], new_address: Address, db_session: db.Session
 ) -> Optional[ExperianAddressPair]:
@@ -1576,6 +1608,10 @@ def is_employer_reimbursement_payments_enabled() -> bool:
     return os.environ.get("ENABLE_EMPLOYER_REIMBURSEMENT_PAYMENTS", "0") == "1"
 
 
+def is_fineos_extract_copy_loader_enabled() -> bool:
+    return os.environ.get("ENABLE_FINEOS_EXTRACT_COPY_LOADER", "0") == "1"
+
+
 def get_earliest_absence_period_for_payment_leave_request(
     db_session: db.Session, payment: Payment
 ) -> Optional[AbsencePeriod]:
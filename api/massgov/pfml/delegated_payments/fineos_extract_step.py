@@ -1,16 +1,19 @@
 import enum
+import itertools
 import os
 import pathlib
 import tempfile
 import uuid
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 
+import massgov.pfml.db.bulk_copy as bulk_copy
 import massgov.pfml.delegated_payments.delegated_config as payments_config
 import massgov.pfml.delegated_payments.delegated_payments_util as payments_util
 import massgov.pfml.util.files as file_util
 import massgov.pfml.util.logging as logging
 from massgov.pfml import db
+from massgov.pfml.db.models.base import uuid_gen
 from massgov.pfml.db.models.employees import LkReferenceFileType, ReferenceFile, ReferenceFileType
 from massgov.pfml.delegated_payments.step import Step
 from massgov.pfml.util.collections.dict import make_keys_lowercase
@@ -126,12 +129,18 @@ class FineosExtractStep(Step):
         db_session: db.Session,
         log_entry_db_session: db.Session,
         extract_config: ExtractConfig,
+        use_copy_loader: Optional[bool] = None,
     ) -> None:
         super().__init__(db_session=db_session, log_entry_db_session=log_entry_db_session)
         self.extract_config = extract_config
         self.active_extract_data = None
         self.active_extract_data_date_str = None
 
+        # Load staging tables with COPY rather than an ORM object per row
+        if use_copy_loader is None:
+            use_copy_loader = payments_util.is_fineos_extract_copy_loader_enabled()
+        self.use_copy_loader = use_copy_loader
+
     def get_import_type(self) -> str:
         """Use the reference file type description for an import log type distinction"""
         return self.extract_config.reference_file_type.reference_file_type_description
@@ -267,6 +276,7 @@ class FineosExtractStep(Step):
             extract_data.date_str, self.extract_config.reference_file_type
         )
 
+        renames = []
         for file_path, extract in extract_data.extract_path_mapping.items():
             new_path = file_path.replace(
                 payments_util.Constants.S3_INBOUND_RECEIVED_DIR,
@@ -274,7 +284,9 @@ class FineosExtractStep(Step):
             )
 
             logger.info("Moving %s file from %s to %s", extract.file_name, file_path, new_path)
-            file_util.rename_file(file_path, new_path)
+            renames.append((file_path, new_path))
+
+        file_util.rename_files(renames)
 
         original_file_location = extract_data.reference_file.file_location
         new_file_location = original_file_location.replace(
@@ -293,9 +305,18 @@ class FineosExtractStep(Step):
         self.set_metrics({self.Metrics.ARCHIVE_PATH: new_file_location})
 
     def _download_and_index_data(self, extract_data: ExtractData, download_directory: str) -> None:
+        if self.use_copy_loader:
+            # The staging rows reference the reference file, which must exist before COPY
+            self.db_session.add(extract_data.reference_file)
+            self.db_session.flush()
+
         for file_location, extract in extract_data.extract_path_mapping.items():
             records = download_and_parse_csv(file_location, download_directory)
 
+            if self.use_copy_loader:
+                self._copy_records_to_staging_table(extract_data, file_location, extract, records)
+                continue
+
             logger.info(
                 "Storing extract data from %s to %s with reference_file_id %s and import_log_id %s",
                 file_location,
@@ -341,3 +362,86 @@ class FineosExtractStep(Step):
                     self.increment(self.Metrics.RECORDS_PROCESSED_COUNT)
                 else:
                     self.increment(self.Metrics.RECORDS_FILTERED_OUT_COUNT)
+
+    def _copy_records_to_staging_table(
+        self,
+        extract_data: ExtractData,
+        file_location: str,
+        extract: payments_util.FineosExtract,
+        records: Iterable[Dict[str, Any]],
+    ) -> None:
+        """Stream extract records that pass validation and filters into the staging table with COPY.
+
+        Same checks as the ORM path in _download_and_index_data, but rows are never materialized
+        as model instances. The primary key is generated here as it has no server default, and the
+        reference file and import log IDs are constant for the file.
+        """
+        table = extract.table.__table__
+        primary_key_name = table.primary_key.columns.values()[0].name
+        constant_values = {
+            "reference_file_id": extract_data.reference_file.reference_file_id,
+            "fineos_extract_import_log_id": self.get_import_log_id(),
+        }
+        reserved_column_names = {primary_key_name, "created_at", "updated_at", *constant_values}
+        table_column_names = set(table.columns.keys()) - reserved_column_names
+
+        logger.info(
+            "Copying extract data from %s to %s with reference_file_id %s and import_log_id %s",
+            file_location,
+            extract.table.__name__,
+            extract_data.reference_file.reference_file_id,
+            self.get_import_log_id(),
+        )
+
+        record_column_names: List[str] = []
+
+        def staging_rows() -> Iterator[Sequence[Any]]:
+            for i, record in enumerate(records):
+                lower_key_record = make_keys_lowercase(record)
+
+                if i == 0:
+                    payments_util.validate_columns_present(lower_key_record, extract)
+
+                    unconfigured_columns = payments_util.get_unconfigured_fineos_columns(
+                        lower_key_record, extract.table
+                    )
+                    if len(unconfigured_columns) > 0:
+                        logger.warning(
+                            "Unconfigured columns in FINEOS extract.",
+                            extra={
+                                "extract.table.__name__": extract.table.__name__,
+                                "fields": ",".join(unconfigured_columns),
+                            },
+                        )
+
+                    # The CSV header is the same for every record, so the columns can be fixed
+                    record_column_names.extend(
+                        column for column in lower_key_record if column in table_column_names
+                    )
+
+                if payments_util.matches_all_filters(lower_key_record, extract):
+                    self.increment(self.Metrics.RECORDS_PROCESSED_COUNT)
+                    yield (
+                        uuid_gen(),
+                        *constant_values.values(),
+                        *(lower_key_record.get(column) for column in record_column_names),
+                    )
+                else:
+                    self.increment(self.Metrics.RECORDS_FILTERED_OUT_COUNT)
+
+        rows = staging_rows()
+
+        # Pull the first row so the record columns are known before the COPY statement is built
+        first_row = next(rows, None)
+        if first_row is None:
+            return
+
+        bulk_copy.copy_rows(
+            self.db_session,
+            table.name,
+            [primary_key_name, *constant_values, *record_column_names],
+            itertools.chain([first_row], rows),
+            on_chunk=lambda row_count: logger.info(
+                "Copied %i rows to %s", row_count, extract.table.__name__
+            ),
+        )
@@ -1,8 +1,11 @@
 import enum
 import math
-from typing import List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
 
 import requests
+import requests.adapters
 
 import massgov.pfml.delegated_payments.irs_1099.pfml_1099_util as pfml_1099_util
 import massgov.pfml.util.logging
@@ -12,11 +15,18 @@ from massgov.pfml.delegated_payments.step import Step
 
 logger = massgov.pfml.util.logging.get_logger(__name__)
 
+MAX_RECORDS_IN_SUBBATCH = 250
+
+# Number of generated documents whose s3_location is committed together in concurrent mode
+COMMIT_BATCH_SIZE = 100
+
 
 class Generate1099DocumentsStep(Step):
     class Metrics(str, enum.Enum):
         DOCUMENT_COUNT = "document_count"
         DOCUMENT_ERROR = "document_errors"
+        DOCUMENTS_PER_SECOND = "documents_per_second"
+        DOCUMENT_ERROR_RATE = "document_error_rate"
 
     def run_step(self) -> None:
         self.pdfApiEndpoint = pfml_1099_util.get_pdf_api_generate_endpoint()
@@ -49,8 +59,14 @@ class Generate1099DocumentsStep(Step):
             # Determine how many have already been generated so that we start at the right subbatch
             generated = pfml_1099_util.get_1099_generated_count(self.db_session, batchId=batch_id)
 
-            if records_len > 0:
-                max_records_in_subbatch = 250
+            max_workers = pfml_1099_util.get_generate_1099_max_workers()
+            if records_len > 0 and max_workers > 1:
+                first_subbatch = math.ceil(generated / MAX_RECORDS_IN_SUBBATCH) + 1
+                self._generate_1099_documents_concurrently(
+                    batch_id, records[:generate_limit], first_subbatch, max_workers
+                )
+            elif records_len > 0:
+                max_records_in_subbatch = MAX_RECORDS_IN_SUBBATCH
                 con_subbatch = math.ceil(generated / max_records_in_subbatch) + 1
                 con = 1
 
@@ -87,6 +103,109 @@ class Generate1099DocumentsStep(Step):
     def get_records(self, batch_id: str) -> List[Pfml1099]:
         return pfml_1099_util.get_1099_records_to_generate(self.db_session, batchId=batch_id)
 
+    def _generate_1099_documents_concurrently(
+        self, batch_id: str, records: List[Pfml1099], first_subbatch: int, max_workers: int
+    ) -> None:
+        """Generate documents with a bounded pool of threads posting to the PDF API.
+
+        Only the HTTP requests run on the worker threads. Tax identifiers are fetched for all the
+        records up front, and the DB session is only used from this thread, committing the
+        s3_location of generated documents in batches. Each record's sub-batch comes from its
+        position in the list, so the folder layout does not depend on the order requests finish.
+        A record that fails is logged and counted as an error without stopping the others.
+        """
+        logger.info("Generating %i 1099 documents with %i workers", len(records), max_workers)
+        start_time = time.monotonic()
+
+        tax_ids = pfml_1099_util.get_tax_ids(
+            self.db_session, [record.tax_identifier_id for record in records]
+        )
+
+        http_session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        http_session.mount("http://", adapter)
+        http_session.mount("https://", adapter)
+
+        document_count = 0
+        error_count = 0
+        pending_commit = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for i, record in enumerate(records):
+                sub_batch_folder = f"Sub-batch-{first_subbatch + i // MAX_RECORDS_IN_SUBBATCH}"
+                tax_id = tax_ids.get(record.tax_identifier_id)
+                if not tax_id:
+                    logger.error("%s has an invalid tax identifier.", str(record.tax_identifier_id))
+                    continue
+                ssn = mask_util.mask_tax_identifier(tax_id)
+
+                s3_location = f"Batch-{batch_id}/Forms/{sub_batch_folder}/{record.pfml_1099_id}.pdf"
+                try:
+                    document_dto = self._build_document_dto(record, sub_batch_folder, ssn)
+                except Exception as error:
+                    logger.error(error)
+                    error_count += 1
+                    self.increment(self.Metrics.DOCUMENT_ERROR)
+                    continue
+
+                future = executor.submit(
+                    self._post_document, http_session, self.pdfApiEndpoint, document_dto
+                )
+                futures[future] = (record, s3_location)
+
+            for future in as_completed(futures):
+                record, s3_location = futures[future]
+                try:
+                    response = future.result()
+                except Exception as error:
+                    logger.error(error)
+                    error_count += 1
+                    self.increment(self.Metrics.DOCUMENT_ERROR)
+                    continue
+
+                if response.ok:
+                    record.s3_location = s3_location
+                    document_count += 1
+                    self.increment(self.Metrics.DOCUMENT_COUNT)
+                    pending_commit += 1
+                    if pending_commit >= COMMIT_BATCH_SIZE:
+                        self.db_session.commit()
+                        pending_commit = 0
+                else:
+                    logger.error(response.text)
+                    error_count += 1
+                    self.increment(self.Metrics.DOCUMENT_ERROR)
+
+        if pending_commit > 0:
+            self.db_session.commit()
+
+        elapsed_seconds = time.monotonic() - start_time
+        documents_per_second = document_count / elapsed_seconds if elapsed_seconds > 0 else 0
+        attempted = document_count + error_count
+        error_rate = error_count / attempted if attempted else 0
+
+        logger.info(
+            "Generated 1099 documents: %i, errors: %i, %.1f documents/sec",
+            document_count,
+            error_count,
+            documents_per_second,
+        )
+        self.set_metrics(
+            {
+                self.Metrics.DOCUMENTS_PER_SECOND: round(documents_per_second, 2),
+                self.Metrics.DOCUMENT_ERROR_RATE: round(error_rate, 4),
+            }
+        )
+
+    def _post_document(
+        self, http_session: requests.Session, url: str, document_dto: Dict[str, Any]
+    ) -> requests.Response:
+        return http_session.post(
+            url,
+            json=document_dto,
+            headers={"Content-type": "application/json", "Accept": "application/json"},
+        )
+
     def generate_document(
         self, record: Pfml1099, sub_bacth: str, url: str, s3_location: str
     ) -> None:
@@ -100,24 +219,7 @@ class Generate1099DocumentsStep(Step):
             return
 
         try:
-            documentDto = {
-                "id": str(record.pfml_1099_id),
-                "batchId": str(record.pfml_1099_batch_id),
-                "year": record.tax_year,
-                "corrected": record.correction_ind,
-                "paymentAmount": str(record.gross_payments),
-                "socialNumber": ssn,
-                "federalTaxesWithheld": str(record.federal_tax_withholdings),
-                "stateTaxesWithheld": str(record.state_tax_withholdings),
-                "repayments": str(record.overpayment_repayments),
-                "name": f"{sub_bacth}/{record.first_name} {record.last_name}",
-                "address": record.address_line_1,
-                "address2": record.address_line_2,
-                "city": record.city,
-                "state": record.state,
-                "zipCode": record.zip,
-                "accountNumber": record.account_number,
-            }
+            documentDto = self._build_document_dto(record, sub_bacth, ssn)
 
             response = requests.post(
                 url,
@@ -135,3 +237,25 @@ class Generate1099DocumentsStep(Step):
                 self.increment(self.Metrics.DOCUMENT_ERROR)
         except requests.exceptions.RequestException as error:
             raise error
+
+    def _build_document_dto(
+        self, record: Pfml1099, sub_batch: str, ssn: Optional[str]
+    ) -> Dict[str, Any]:
+        return {
+            "id": str(record.pfml_1099_id),
+            "batchId": str(record.pfml_1099_batch_id),
+            "year": record.tax_year,
+            "corrected": record.correction_ind,
+            "paymentAmount": str(record.gross_payments),
+            "socialNumber": ssn,
+            "federalTaxesWithheld": str(record.federal_tax_withholdings),
+            "stateTaxesWithheld": str(record.state_tax_withholdings),
+            "repayments": str(record.overpayment_repayments),
+            "name": f"{sub_batch}/{record.first_name} {record.last_name}",
+            "address": record.address_line_1,
+            "address2": record.address_line_2,
+            "city": record.city,
+            "state": record.state,
+            "zipCode": record.zip,
+            "accountNumber": record.account_number,
+        }
@@ -1837,6 +1837,28 @@ def get_tax_id(db_session: Any, tax_id_str: str) -> str:
         raise
 
 
+# Limit on the number of IDs in a single IN clause when prefetching tax identifiers
+TAX_ID_QUERY_CHUNK_SIZE = 10000
+
+
+def get_tax_ids(db_session: db.Session, tax_identifier_ids: List[UUID]) -> Dict[UUID, str]:
+    """Get the tax identifiers for many 1099 records in one query, keyed by tax_identifier_id."""
+    tax_ids: Dict[UUID, str] = {}
+    unique_ids = list(set(tax_identifier_ids))
+
+    for i in range(0, len(unique_ids), TAX_ID_QUERY_CHUNK_SIZE):
+        rows = (
+            db_session.query(TaxIdentifier.tax_identifier_id, TaxIdentifier.tax_identifier)
+            .filter(
+                TaxIdentifier.tax_identifier_id.in_(unique_ids[i : i + TAX_ID_QUERY_CHUNK_SIZE])
+            )
+            .all()
+        )
+        tax_ids.update(rows)
+
+    return tax_ids
+
+
 def get_upload_max_files_to_fineos() -> int:
     return app.get_config().upload_max_files_to_fineos
 
@@ -1845,6 +1867,10 @@ def get_generate_1099_max_files() -> int:
     return app.get_config().generate_1099_max_files
 
 
+def get_generate_1099_max_workers() -> int:
+    return app.get_config().generate_1099_max_workers
+
+
 def get_1099_record(db_session: db.Session, status: str, batch_id: str) -> Optional[Pfml1099]:
     """Get a 1099 record based on specific status and order by Created_at Asc"""
     return (
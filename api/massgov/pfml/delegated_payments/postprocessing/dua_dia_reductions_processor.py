@@ -1,9 +1,8 @@
-from datetime import timedelta
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import List, Optional
-
-from sqlalchemy import and_, or_
-from sqlalchemy.sql.expression import asc
+from typing import Dict, Iterable, List, Optional, Set, cast
 
 import massgov.pfml.util.logging as logging
 from massgov.pfml.db.models.employees import (
@@ -26,12 +25,59 @@ from massgov.pfml.delegated_payments.step import Step
 
 logger = logging.get_logger(__name__)
 
+# Number of FINEOS customer numbers per query when preloading reductions
+PRELOAD_CHUNK_SIZE = 1000
+
+
+class DuaReductionIndex:
+    """A claimant's DUA reductions, sorted by request_week_begin_date for overlap lookups"""
+
+    def __init__(self, dua_reductions: Iterable[DuaReductionPayment]):
+        # Reductions without a request week can never overlap a payment period
+        self.dua_reductions = sorted(
+            (r for r in dua_reductions if r.request_week_begin_date is not None),
+            key=lambda r: cast(date, r.request_week_begin_date),
+        )
+        self.request_week_begin_dates = [r.request_week_begin_date for r in self.dua_reductions]
+
+    def _between(self, start: date, end: date) -> range:
+        return range(
+            bisect_left(self.request_week_begin_dates, start),
+            bisect_right(self.request_week_begin_dates, end),
+        )
+
+    def overlapping(
+        self, period_start_date: Optional[date], period_end_date: Optional[date]
+    ) -> List[DuaReductionPayment]:
+        """Reductions whose request week begins, or ends (begin date + 6), within the period"""
+        if period_start_date is None or period_end_date is None:
+            return []
+
+        positions = set(self._between(period_start_date, period_end_date))
+        positions.update(
+            self._between(period_start_date - timedelta(6), period_end_date - timedelta(6))
+        )
+        return [self.dua_reductions[position] for position in sorted(positions)]
+
+
+def _sort_dia_reductions(
+    dia_reductions: Iterable[DiaReductionPayment],
+) -> List[DiaReductionPayment]:
+    # Same order as ORDER BY award_created_date, where nulls sort last
+    return sorted(
+        dia_reductions,
+        key=lambda r: (r.award_created_date is None, r.award_created_date or date.min),
+    )
+
 
 class DuaDiaReductionsProcessor(AbstractStepProcessor):
     """
     Checks for existing DUA or DIA reductions with the current payment.
     Returns a message for overlapping reductions for use by the audit report.
 
+    The reductions for every claimant in a batch of payments can be loaded up front with
+    preload_reductions, otherwise they are queried for each payment.
+
     https://lwd.atlassian.net/wiki/spaces/API/pages/1961033777/Checking+payments+for+DUA+DIA+reductions
     """
 
@@ -39,6 +85,69 @@ class DuaDiaReductionsProcessor(AbstractStepProcessor):
 
     def __init__(self, step: Step) -> None:
         super().__init__(step)
+        self._dua_indexes: Dict[str, DuaReductionIndex] = {}
+        self._dia_reductions: Dict[str, List[DiaReductionPayment]] = {}
+
+    def preload_reductions(self, payments: Iterable[Payment]) -> None:
+        customer_numbers: Set[str] = set()
+        for payment in payments:
+            employee = self._get_employee(payment)
+            if employee is not None and employee.fineos_customer_number is not None:
+                customer_numbers.add(employee.fineos_customer_number)
+
+        dua_reductions: Dict[str, List[DuaReductionPayment]] = defaultdict(list)
+        dia_reductions: Dict[str, List[DiaReductionPayment]] = defaultdict(list)
+
+        sorted_customer_numbers = sorted(customer_numbers)
+        for start in range(0, len(sorted_customer_numbers), PRELOAD_CHUNK_SIZE):
+            chunk = sorted_customer_numbers[start : start + PRELOAD_CHUNK_SIZE]
+
+            for dua_reduction in self.db_session.query(DuaReductionPayment).filter(
+                DuaReductionPayment.fineos_customer_number.in_(chunk)
+            ):
+                dua_reductions[dua_reduction.fineos_customer_number].append(dua_reduction)
+
+            for dia_reduction in self.db_session.query(DiaReductionPayment).filter(
+                DiaReductionPayment.fineos_customer_number.in_(chunk)
+            ):
+                dia_reductions[dia_reduction.fineos_customer_number].append(dia_reduction)
+
+        for customer_number in customer_numbers:
+            self._dua_indexes[customer_number] = DuaReductionIndex(dua_reductions[customer_number])
+            self._dia_reductions[customer_number] = _sort_dia_reductions(
+                dia_reductions[customer_number]
+            )
+
+        logger.info(
+            "Preloaded DUA and DIA reductions",
+            extra={
+                "claimant_count": len(customer_numbers),
+                "dua_reduction_count": sum(len(rows) for rows in dua_reductions.values()),
+                "dia_reduction_count": sum(len(rows) for rows in dia_reductions.values()),
+            },
+        )
+
+    def _get_dua_index(self, fineos_customer_number: str) -> DuaReductionIndex:
+        dua_index = self._dua_indexes.get(fineos_customer_number)
+        if dua_index is not None:
+            return dua_index
+
+        return DuaReductionIndex(
+            self.db_session.query(DuaReductionPayment).filter(
+                DuaReductionPayment.fineos_customer_number == fineos_customer_number
+            )
+        )
+
+    def _get_dia_reductions(self, fineos_customer_number: str) -> List[DiaReductionPayment]:
+        dia_reductions = self._dia_reductions.get(fineos_customer_number)
+        if dia_reductions is not None:
+            return dia_reductions
+
+        return _sort_dia_reductions(
+            self.db_session.query(DiaReductionPayment).filter(
+                DiaReductionPayment.fineos_customer_number == fineos_customer_number
+            )
+        )
 
     def process(self, payment: Payment) -> None:
         self.check_dua(payment)
@@ -51,26 +160,9 @@ class DuaDiaReductionsProcessor(AbstractStepProcessor):
 
         # Include DUA reductions where the request_week_begin_date overlaps with the payment period start and end
         # Also include if the derived end date (request_week_begin_date + 6) also overlaps
-        overlapping_dua_reductions = (
-            self.db_session.query(DuaReductionPayment)
-            .filter(
-                DuaReductionPayment.fineos_customer_number == employee.fineos_customer_number,
-                or_(
-                    and_(
-                        DuaReductionPayment.request_week_begin_date >= payment.period_start_date,
-                        DuaReductionPayment.request_week_begin_date <= payment.period_end_date,
-                    ),
-                    and_(
-                        DuaReductionPayment.request_week_begin_date + timedelta(6)
-                        >= payment.period_start_date,
-                        DuaReductionPayment.request_week_begin_date + timedelta(6)
-                        <= payment.period_end_date,
-                    ),
-                ),
-            )
-            .order_by(asc(DuaReductionPayment.request_week_begin_date))
-            .all()
-        )
+        overlapping_dua_reductions = self._get_dua_index(
+            cast(str, employee.fineos_customer_number)
+        ).overlapping(payment.period_start_date, payment.period_end_date)
 
         if len(overlapping_dua_reductions) > 0:
             lines: List[str] = []
@@ -137,12 +229,7 @@ class DuaDiaReductionsProcessor(AbstractStepProcessor):
         if employee is None:
             return
 
-        dia_reductions = (
-            self.db_session.query(DiaReductionPayment)
-            .filter(DiaReductionPayment.fineos_customer_number == employee.fineos_customer_number)
-            .order_by(asc(DiaReductionPayment.award_created_date))
-            .all()
-        )
+        dia_reductions = self._get_dia_reductions(cast(str, employee.fineos_customer_number))
 
         if len(dia_reductions) > 0:
             lines: List[str] = []
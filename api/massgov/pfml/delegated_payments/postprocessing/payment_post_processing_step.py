@@ -74,6 +74,10 @@ class PaymentPostProcessingStep(Step):
         payment_date_mismatch_processor = PaymentDateMismatchProcessor(self)
         leave_duration_processor = FineosTotalLeaveDurationProcessor(self)
 
+        dua_dia_processor.preload_reductions(
+            payment_container.payment for payment_container in payment_containers
+        )
+
         for payment_container in payment_containers:
             dua_dia_processor.process(payment_container.payment)
             name_mismatch_processor.process(payment_container.payment)
@@ -1,10 +1,13 @@
 import enum
 import uuid
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
 from functools import total_ordering
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import selectinload
 
 import massgov.pfml.delegated_payments.delegated_payments_util as payments_util
 import massgov.pfml.util.logging
@@ -25,6 +28,9 @@ logger = massgov.pfml.util.logging.get_logger(__name__)
 
 DATE_FORMAT = "%Y-%m-%d"
 
+# Number of employees whose prior payments are loaded per query
+PRIOR_PAYMENTS_EMPLOYEE_CHUNK_SIZE = 1000
+
 
 class PostProcessingMetrics(str, enum.Enum):
     # General metrics
@@ -241,45 +247,58 @@ class PayPeriodGroup:
 def get_all_paid_payments_associated_with_employee(
     employee_id: uuid.UUID, current_payment_ids: List[uuid.UUID], db_session: db.Session
 ) -> List[PaymentContainer]:
-
-    # Get all payment IDs of payments associated with the same employee
-    # That aren't the payments we're attempting to validate, that are
-    # standard/employer reimbursement payments (eg. no cancellations, overpayments, etc.) that are
-    # not adhoc payments (adhoc payments don't factor into the calculation whatsoever)
-    subquery = (
-        db_session.query(Payment.payment_id)
-        .join(Claim)
-        .filter(
-            Claim.employee_id == employee_id,
-            Payment.payment_transaction_type_id.in_(
-                [
-                    PaymentTransactionType.STANDARD.payment_transaction_type_id,
-                    PaymentTransactionType.EMPLOYER_REIMBURSEMENT.payment_transaction_type_id,
-                ]
-            ),
-            Payment.payment_id.notin_(current_payment_ids),
-            Payment.is_adhoc_payment != True,  # noqa: E712
+    return get_all_paid_payments_associated_with_employees(
+        [employee_id], current_payment_ids, db_session
+    ).get(employee_id, [])
+
+
+def get_all_paid_payments_associated_with_employees(
+    employee_ids: Iterable[uuid.UUID],
+    current_payment_ids: List[uuid.UUID],
+    db_session: db.Session,
+) -> Dict[uuid.UUID, List[PaymentContainer]]:
+    """Get the prior paid payments of each employee, with their claims and payment details"""
+    containers: Dict[uuid.UUID, List[PaymentContainer]] = defaultdict(list)
+
+    for employee_id_chunk in _chunk_employee_ids(employee_ids):
+        # Get all payment IDs of payments associated with the same employees
+        # That aren't the payments we're attempting to validate, that are
+        # standard/employer reimbursement payments (eg. no cancellations, overpayments, etc.) that are
+        # not adhoc payments (adhoc payments don't factor into the calculation whatsoever)
+        subquery = (
+            db_session.query(Payment.payment_id)
+            .join(Claim)
+            .filter(
+                Claim.employee_id.in_(employee_id_chunk),
+                Payment.payment_transaction_type_id.in_(
+                    [
+                        PaymentTransactionType.STANDARD.payment_transaction_type_id,
+                        PaymentTransactionType.EMPLOYER_REIMBURSEMENT.payment_transaction_type_id,
+                    ]
+                ),
+                Payment.payment_id.notin_(current_payment_ids),
+                Payment.is_adhoc_payment != True,  # noqa: E712
+            )
         )
-    )
 
-    # For the payment IDs fetched above, look for any payments
-    # that we have sent to PUB or have returned as paid
-    # Payments that errored after sending to PUB will be excluded
-    # as they're moved to a separate end state
-    payments = (
-        db_session.query(Payment)
-        .join(StateLog)
-        .join(LatestStateLog)
-        .filter(
-            Payment.payment_id.in_(subquery),
-            StateLog.end_state_id.in_(SharedPaymentConstants.PAID_STATE_IDS),
+        # For the payment IDs fetched above, look for any payments
+        # that we have sent to PUB or have returned as paid
+        # Payments that errored after sending to PUB will be excluded
+        # as they're moved to a separate end state
+        payments = (
+            db_session.query(Payment)
+            .join(StateLog)
+            .join(LatestStateLog)
+            .filter(
+                Payment.payment_id.in_(subquery),
+                StateLog.end_state_id.in_(SharedPaymentConstants.PAID_STATE_IDS),
+            )
+            .options(selectinload(Payment.claim), selectinload(Payment.payment_details))
+            .all()
         )
-        .all()
-    )
 
-    containers = []
-    for payment in payments:
-        containers.append(PaymentContainer(payment))
+        for payment in payments:
+            containers[payment.claim.employee_id].append(PaymentContainer(payment))
 
     return containers
 
@@ -287,36 +306,56 @@ def get_all_paid_payments_associated_with_employee(
 def get_all_overpayments_associated_with_employee(
     employee_id: uuid.UUID, db_session: db.Session
 ) -> List[PaymentContainer]:
-    # Query to grab all overpayments for a claimant
-    # that are either standard Overpayments OR Overpayment Adjustments
-    # (Excludes recovery scenarios that represent claimant paying back an overpayment)
-    subquery = (
-        db_session.query(Payment.payment_id)
-        .join(Claim)
-        .filter(
-            Claim.employee_id == employee_id,
-            Payment.payment_transaction_type_id
-            == PaymentTransactionType.OVERPAYMENT.payment_transaction_type_id,
-        )
+    return get_all_overpayments_associated_with_employees([employee_id], db_session).get(
+        employee_id, []
     )
 
-    overpayments = (
-        db_session.query(Payment)
-        .join(StateLog)
-        .filter(
-            Payment.payment_id.in_(subquery),
-            StateLog.end_state_id == State.DELEGATED_PAYMENT_PROCESSED_OVERPAYMENT.state_id,
+
+def get_all_overpayments_associated_with_employees(
+    employee_ids: Iterable[uuid.UUID], db_session: db.Session
+) -> Dict[uuid.UUID, List[PaymentContainer]]:
+    """Get the overpayments of each employee, with their claims and payment details"""
+    overpayment_containers: Dict[uuid.UUID, List[PaymentContainer]] = defaultdict(list)
+
+    for employee_id_chunk in _chunk_employee_ids(employee_ids):
+        # Query to grab all overpayments for the claimants
+        # that are either standard Overpayments OR Overpayment Adjustments
+        # (Excludes recovery scenarios that represent claimant paying back an overpayment)
+        subquery = (
+            db_session.query(Payment.payment_id)
+            .join(Claim)
+            .filter(
+                Claim.employee_id.in_(employee_id_chunk),
+                Payment.payment_transaction_type_id
+                == PaymentTransactionType.OVERPAYMENT.payment_transaction_type_id,
+            )
+        )
+
+        overpayments = (
+            db_session.query(Payment)
+            .join(StateLog)
+            .filter(
+                Payment.payment_id.in_(subquery),
+                StateLog.end_state_id == State.DELEGATED_PAYMENT_PROCESSED_OVERPAYMENT.state_id,
+            )
+            .options(selectinload(Payment.claim), selectinload(Payment.payment_details))
+            .all()
         )
-        .all()
-    )
 
-    overpayment_containers = []
-    for overpayment in overpayments:
-        overpayment_containers.append(PaymentContainer(overpayment))
+        for overpayment in overpayments:
+            overpayment_containers[overpayment.claim.employee_id].append(
+                PaymentContainer(overpayment)
+            )
 
     return overpayment_containers
 
 
+def _chunk_employee_ids(employee_ids: Iterable[uuid.UUID]) -> Iterator[List[uuid.UUID]]:
+    unique_employee_ids = list(dict.fromkeys(employee_ids))
+    for start in range(0, len(unique_employee_ids), PRIOR_PAYMENTS_EMPLOYEE_CHUNK_SIZE):
+        yield unique_employee_ids[start : start + PRIOR_PAYMENTS_EMPLOYEE_CHUNK_SIZE]
+
+
 def get_payment_detail_amount(payment_detail: PaymentDetails) -> Decimal:
     """
     Get the amount for a payment.
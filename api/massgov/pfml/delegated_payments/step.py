@@ -2,13 +2,14 @@ import abc
 import enum
 import uuid
 from datetime import datetime
-from typing import Any, Optional, Set
+from typing import Any, Callable, Dict, Iterable, Optional, Set, TypeVar, Union, cast
 
 import massgov.pfml.util.logging as logging
 from massgov.pfml import db
 from massgov.pfml.db.models.employees import (
     Employee,
     EmployeeReferenceFile,
+    ImportLog,
     ImportLogReportQueue,
     Payment,
     PaymentReferenceFile,
@@ -19,6 +20,11 @@ from massgov.pfml.util.datetime.business_day import BusinessDay
 
 logger = logging.get_logger(__name__)
 
+RecordT = TypeVar("RecordT")
+
+# Keys of the records a chunked step processes, see Step.process_records_with_checkpoints()
+CheckpointKey = Union[int, str]
+
 
 class Step(abc.ABC, metaclass=abc.ABCMeta):
     log_entry: Optional[LogEntry] = None
@@ -30,6 +36,15 @@ class Step(abc.ABC, metaclass=abc.ABCMeta):
 
     should_add_to_report_queue: bool
 
+    # Set to commit every checkpoint_interval records processed with
+    # process_records_with_checkpoints(), and to resume after the last checkpoint when the step
+    # runs again after failing. Steps that must process everything or nothing leave it unset, and
+    # commit once at the end of run().
+    checkpoint_interval: Optional[int] = None
+
+    # Key of the last record committed by the failed run being resumed, if any
+    resume_key: Optional[CheckpointKey] = None
+
     class Metrics(str, enum.Enum):
         pass
 
@@ -66,6 +81,9 @@ class Step(abc.ABC, metaclass=abc.ABCMeta):
                 self.get_import_log_id(),
             )
 
+            if self.checkpoint_interval:
+                self.resume_from_checkpoint()
+
             try:
                 self.run_step()
                 self.add_to_report_queue()
@@ -89,6 +107,109 @@ class Step(abc.ABC, metaclass=abc.ABCMeta):
     def run_step(self) -> None:
         pass
 
+    def process_records_with_checkpoints(
+        self,
+        records: Iterable[RecordT],
+        get_key: Callable[[RecordT], CheckpointKey],
+        process_record: Callable[[RecordT], None],
+    ) -> None:
+        """Call process_record for each record, committing a checkpoint every checkpoint_interval
+        records.
+
+        Records must come in ascending order of get_key. When resuming, records up to and
+        including resume_key were committed by the failed run and are skipped. Without a
+        checkpoint_interval, nothing is committed here.
+        """
+        records_since_checkpoint = 0
+        last_key: Optional[CheckpointKey] = None
+
+        for record in records:
+            key = get_key(record)
+            if self.resume_key is not None and key <= self.resume_key:  # type: ignore
+                continue
+
+            process_record(record)
+            last_key = key
+            records_since_checkpoint += 1
+
+            if self.checkpoint_interval and records_since_checkpoint >= self.checkpoint_interval:
+                self.commit_checkpoint(last_key)
+                records_since_checkpoint = 0
+
+        if self.checkpoint_interval and last_key is not None and records_since_checkpoint:
+            self.commit_checkpoint(last_key)
+
+    def commit_checkpoint(self, last_key: CheckpointKey) -> None:
+        """Commit the records processed so far, with a checkpoint on the import log.
+
+        The checkpoint is written through db_session, so it is committed in the same transaction
+        as the records it covers.
+        """
+        metrics = dict(self.log_entry.metrics) if self.log_entry else {}
+        checkpoint = {"last_key": last_key, "metrics": metrics}
+
+        if import_log_id := self.get_import_log_id():
+            self.db_session.query(ImportLog).filter(
+                ImportLog.import_log_id == import_log_id
+            ).update({ImportLog.checkpoint: checkpoint}, synchronize_session=False)
+        self.db_session.commit()
+
+        logger.info(
+            "Committed checkpoint for step %s",
+            self.__class__.__name__,
+            extra={"import_log_id": import_log_id, "last_key": last_key, **metrics},
+        )
+
+    def resume_from_checkpoint(self) -> None:
+        """Pick up from the checkpoint of the previous run of this step, if that run didn't
+        finish."""
+        previous_import_log = self.get_previous_import_log()
+        if (
+            previous_import_log is None
+            or previous_import_log.status == "success"
+            or not previous_import_log.checkpoint
+        ):
+            return
+
+        checkpoint = cast(Dict[str, Any], previous_import_log.checkpoint)
+        self.resume_key = checkpoint["last_key"]
+
+        # Carry the checkpoint over, so it isn't lost if this run fails before its first one
+        if self.log_entry:
+            self.log_entry.import_log.checkpoint = checkpoint
+            self.log_entry_db_session.commit()
+
+        self.set_metrics(
+            {
+                **checkpoint["metrics"],
+                "resumed_from_import_log_id": previous_import_log.import_log_id,
+            }
+        )
+
+        logger.info(
+            "Resuming step %s from checkpoint",
+            self.__class__.__name__,
+            extra={
+                "import_log_id": self.get_import_log_id(),
+                "resumed_from_import_log_id": previous_import_log.import_log_id,
+                "last_key": self.resume_key,
+            },
+        )
+
+    def get_previous_import_log(self) -> Optional[ImportLog]:
+        return (
+            self.log_entry_db_session.query(ImportLog)
+            # Checkpoints are written through db_session, so reload rows this session already has
+            .populate_existing()
+            .filter(
+                ImportLog.source == self.__class__.__name__,
+                ImportLog.import_type == self.get_import_type(),
+                ImportLog.import_log_id != self.get_import_log_id(),
+            )
+            .order_by(ImportLog.import_log_id.desc())
+            .first()
+        )
+
     # The below are all wrapper functions around the import
     # log to handle it not being set. Any calls to run() will
     # have it set in subsequent processing, but specific calls
@@ -0,0 +1,238 @@
+#
+# Run the steps of a payments task, overlapping the ones that don't depend on each other.
+#
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence
+
+import massgov.pfml.util.logging as logging
+from massgov.pfml import db
+from massgov.pfml.delegated_payments.step import Step
+
+logger = logging.get_logger(__name__)
+
+# Steps run at a time unless configured otherwise, which keeps the order the steps are listed in
+DEFAULT_MAX_PARALLELISM = 1
+
+
+def tables(*models: type) -> FrozenSet[str]:
+    """Names of the tables behind the given models, for StepDefinition.reads and writes"""
+    return frozenset(model.__tablename__ for model in models)  # type: ignore
+
+
+@dataclass(frozen=True)
+class StepDefinition:
+    """A step of a task, with the data it reads and writes.
+
+    reads and writes are names of tables (or other shared resources, like an S3 folder). Inserting
+    rows that no other step looks at, like a step's own reference_file, doesn't need declaring.
+    """
+
+    # The value of --steps that selects the step
+    name: str
+    make_step: Callable[[db.Session, db.Session], Step]
+    reads: FrozenSet[str] = frozenset()
+    writes: FrozenSet[str] = frozenset()
+
+    def depends_on(self, earlier: "StepDefinition") -> bool:
+        """Whether this step has to wait for a step listed before it.
+
+        It does if either step writes something the other reads or writes, so every step sees the
+        same data it would if the steps ran one at a time in the order they are listed.
+        """
+        return bool(earlier.writes & (self.reads | self.writes) or self.writes & earlier.reads)
+
+
+@dataclass
+class StepTiming:
+    name: str
+    # Seconds from the start of the run
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class StepGraph:
+    """The steps in the order they are listed, and the earlier steps each one waits for.
+
+    Dependencies that follow from other dependencies are left out, so if C waits for B and B
+    waits for A, C is only listed as waiting for B.
+    """
+
+    steps: List[StepDefinition]
+    dependencies: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, steps: Sequence[StepDefinition]) -> "StepGraph":
+        names = [step.name for step in steps]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Step names must be unique: {names}")
+
+        dependencies: Dict[str, List[str]] = {}
+        ancestors: Dict[str, set] = {}
+        for i, step in enumerate(steps):
+            direct = [earlier for earlier in steps[:i] if step.depends_on(earlier)]
+
+            ancestors[step.name] = set()
+            for earlier in direct:
+                ancestors[step.name] |= {earlier.name} | ancestors[earlier.name]
+
+            dependencies[step.name] = [
+                earlier.name
+                for earlier in direct
+                if not any(earlier.name in ancestors[other.name] for other in direct)
+            ]
+
+        return cls(list(steps), dependencies)
+
+    def format(self) -> str:
+        lines = []
+        for step in self.steps:
+            waits_for = ", ".join(self.dependencies[step.name]) or "-"
+            lines.append(f"{step.name:<40} after: {waits_for}")
+            lines.append(f"{'':<40} reads: {', '.join(sorted(step.reads)) or '-'}")
+            lines.append(f"{'':<40} writes: {', '.join(sorted(step.writes)) or '-'}")
+        return "\n".join(lines)
+
+
+class StepRunner:
+    """Run steps as soon as the earlier steps they depend on have finished, up to
+    max_parallelism at a time.
+
+    Ready steps start in the order they are listed. With a max_parallelism of 1, the steps run one
+    after another in that order on the db_session and log_entry_db_session given to run(). Above
+    that, each step runs in its own thread with its own pair of sessions from make_db_session.
+
+    If a step fails, no more steps are started, the ones already running are left to finish, and
+    the error is raised.
+    """
+
+    def __init__(
+        self,
+        steps: Sequence[StepDefinition],
+        max_parallelism: int = DEFAULT_MAX_PARALLELISM,
+        make_db_session: Optional[Callable[[], db.Session]] = None,
+    ):
+        if max_parallelism < 1:
+            raise ValueError("max_parallelism must be at least 1")
+        if max_parallelism > 1 and make_db_session is None:
+            raise ValueError("make_db_session is required to run steps in parallel")
+
+        self.graph = StepGraph.build(steps)
+        self.max_parallelism = max_parallelism
+        self.make_db_session = make_db_session
+        self.timings: List[StepTiming] = []
+        self._start_time = 0.0
+
+    def run(self, db_session: db.Session, log_entry_db_session: db.Session) -> None:
+        self._start_time = time.monotonic()
+        self.timings = []
+
+        try:
+            if self.max_parallelism == 1:
+                for step in self.graph.steps:
+                    self._run_step(step, db_session, log_entry_db_session)
+            else:
+                self._run_parallel()
+        finally:
+            self._log_timeline()
+
+    def _run_parallel(self) -> None:
+        pending = list(self.graph.steps)
+        finished: set = set()
+        running: Dict[Future, StepDefinition] = {}
+        error: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_parallelism, thread_name_prefix="step"
+        ) as executor:
+            while pending or running:
+                if error is None:
+                    for step in self._ready(pending, finished):
+                        if len(running) >= self.max_parallelism:
+                            break
+                        pending.remove(step)
+                        running[executor.submit(self._run_step_in_own_session, step)] = step
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                # Handle finished steps in the order they are listed, so the next ones start in
+                # that order too
+                for future in sorted(done, key=lambda f: self.graph.steps.index(running[f])):
+                    step = running.pop(future)
+                    if future.exception() is None:
+                        finished.add(step.name)
+                    elif error is None:
+                        error = future.exception()
+
+        if error is not None:
+            raise error
+
+    def _ready(self, pending: List[StepDefinition], finished: set) -> List[StepDefinition]:
+        return [
+            step
+            for step in pending
+            if all(name in finished for name in self.graph.dependencies[step.name])
+        ]
+
+    def _run_step_in_own_session(self, step: StepDefinition) -> None:
+        assert self.make_db_session
+        with db.session_scope(self.make_db_session(), close=True) as db_session, db.session_scope(
+            self.make_db_session(), close=True
+        ) as log_entry_db_session:
+            self._run_step(step, db_session, log_entry_db_session)
+
+    def _run_step(
+        self, step: StepDefinition, db_session: db.Session, log_entry_db_session: db.Session
+    ) -> None:
+        start = time.monotonic() - self._start_time
+        outcome = "error"
+        try:
+            # mypy takes a Callable field for a method, see https://github.com/python/mypy/issues/5485
+            step.make_step(db_session, log_entry_db_session).run()  # type: ignore
+            outcome = "success"
+        finally:
+            timing = StepTiming(step.name, start, time.monotonic() - self._start_time)
+            self.timings.append(timing)
+            logger.info(
+                "Finished step %s in %.2fs",
+                step.name,
+                timing.duration,
+                extra={
+                    "step": step.name,
+                    "outcome": outcome,
+                    "start_seconds": round(timing.start, 3),
+                    "end_seconds": round(timing.end, 3),
+                    "duration_seconds": round(timing.duration, 3),
+                    "waited_for": ",".join(self.graph.dependencies[step.name]),
+                },
+            )
+
+    def _log_timeline(self) -> None:
+        if not self.timings:
+            return
+
+        elapsed = time.monotonic() - self._start_time
+        step_seconds = sum(timing.duration for timing in self.timings)
+        timeline = "; ".join(
+            f"{timing.name} {timing.start:.2f}s-{timing.end:.2f}s"
+            for timing in sorted(self.timings, key=lambda t: t.start)
+        )
+        logger.info(
+            "Step timeline: %s",
+            timeline,
+            extra={
+                "step_count": len(self.timings),
+                "max_parallelism": self.max_parallelism,
+                "elapsed_seconds": round(elapsed, 3),
+                "step_seconds": round(step_seconds, 3),
+            },
+        )
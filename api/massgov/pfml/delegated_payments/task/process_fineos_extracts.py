@@ -1,10 +1,33 @@
 import argparse
 import sys
-from typing import List
+from typing import Callable, FrozenSet, List, Optional
 
 import massgov.pfml.db as db
 import massgov.pfml.delegated_payments.delegated_payments_util as payments_util
 import massgov.pfml.util.logging as logging
+from massgov.pfml.db.models.employees import (
+    AbsencePeriod,
+    Address,
+    Claim,
+    Employee,
+    EmployeePubEftPair,
+    Employer,
+    ExperianAddressPair,
+    ImportLogReportQueue,
+    OrganizationUnit,
+    Payment,
+    PaymentDetails,
+    PubEft,
+    StateLog,
+    TaxIdentifier,
+)
+from massgov.pfml.db.models.payments import (
+    FineosWritebackDetails,
+    LinkSplitPayment,
+    PaymentAuditReportDetails,
+    PaymentLine,
+    Pfml1099Request,
+)
 from massgov.pfml.delegated_payments.address_validation import AddressValidationStep
 from massgov.pfml.delegated_payments.audit.delegated_payment_audit_report import (
     PaymentAuditReportStep,
@@ -21,6 +44,7 @@ from massgov.pfml.delegated_payments.fineos_extract_step import (
     PAYMENT_EXTRACT_CONFIG,
     REQUEST_1099_EXTRACT_CONFIG,
     VBI_TASKREPORT_SOM_EXTRACT_CONFIG,
+    ExtractConfig,
     FineosExtractStep,
 )
 from massgov.pfml.delegated_payments.postprocessing.payment_post_processing_step import (
@@ -31,6 +55,13 @@ from massgov.pfml.delegated_payments.reporting.delegated_payment_sql_reports imp
     PROCESS_FINEOS_EXTRACT_REPORTS,
 )
 from massgov.pfml.delegated_payments.state_cleanup_step import StateCleanupStep
+from massgov.pfml.delegated_payments.step_runner import (
+    DEFAULT_MAX_PARALLELISM,
+    StepDefinition,
+    StepGraph,
+    StepRunner,
+    tables,
+)
 from massgov.pfml.delegated_payments.weekly_max.max_weekly_benefit_amount_validation_step import (
     MaxWeeklyBenefitAmountValidationStep,
 )
@@ -93,6 +124,8 @@ class Configuration:
     make_audit_report: bool
     create_pei_writeback: bool
     make_reports: bool
+    max_parallelism: int
+    dry_run: bool
 
     def __init__(self, input_args: List[str]):
         parser = argparse.ArgumentParser(
@@ -105,8 +138,21 @@ class Configuration:
             default=[ALL],
             help="Indicate which steps of the process to run",
         )
+        parser.add_argument(
+            "--max-parallelism",
+            type=int,
+            default=DEFAULT_MAX_PARALLELISM,
+            help="Run up to this many steps at a time, when they don't depend on each other",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print the steps that would run and the steps each one waits for, then exit",
+        )
 
         args = parser.parse_args(input_args)
+        self.max_parallelism = args.max_parallelism
+        self.dry_run = args.dry_run
         steps = set(args.steps)
 
         if ALL in steps:
@@ -153,104 +199,266 @@ def main():
     """Entry point for PUB Payment Processing"""
     config = Configuration(sys.argv[1:])
 
+    if config.dry_run:
+        print(StepGraph.build(get_step_definitions(config)).format())
+        return
+
+    # Steps that run in parallel each get their own sessions, on one engine shared between them
+    make_step_db_session = None
+    if config.max_parallelism > 1:
+        make_step_db_session = db.init(sync_lookups=False).session_factory
+
     with db.session_scope(make_db_session(), close=True) as db_session, db.session_scope(
         make_db_session(), close=True
     ) as log_entry_db_session:
-        _process_fineos_extracts(db_session, log_entry_db_session, config)
+        _process_fineos_extracts(db_session, log_entry_db_session, config, make_step_db_session)
 
 
-def _process_fineos_extracts(
-    db_session: db.Session, log_entry_db_session: db.Session, config: Configuration
-) -> None:
-    """Process FINEOS Payments Extracts"""
-    logger.info("Start - FINEOS Payment+Claimant Extract ECS Task")
-    start_time = get_now_us_eastern()
+def extract_tables(extract_config: ExtractConfig) -> FrozenSet[str]:
+    return tables(*(extract.table for extract in extract_config.extracts))
+
+
+# Tables nearly every step after the payment extract reads and writes, which keeps those steps in
+# order
+PAYMENT_STATE_TABLES = tables(Payment, StateLog)
+
+
+def get_step_definitions(config: Configuration) -> List[StepDefinition]:
+    """The steps selected by config, in the order they run one at a time, with the tables each
+    reads and writes"""
+    step_definitions: List[StepDefinition] = []
 
     if config.do_audit_cleanup:
-        StateCleanupStep(db_session=db_session, log_entry_db_session=log_entry_db_session).run()
+        step_definitions.append(
+            StepDefinition(
+                RUN_AUDIT_CLEANUP,
+                lambda db_session, log_entry_db_session: StateCleanupStep(
+                    db_session=db_session, log_entry_db_session=log_entry_db_session
+                ),
+                reads=PAYMENT_STATE_TABLES,
+                writes=tables(StateLog),
+            )
+        )
 
     if config.consume_fineos_claimant:
-        FineosExtractStep(
-            db_session=db_session,
-            log_entry_db_session=log_entry_db_session,
-            extract_config=CLAIMANT_EXTRACT_CONFIG,
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                CONSUME_FINEOS_CLAIMANT,
+                lambda db_session, log_entry_db_session: FineosExtractStep(
+                    db_session=db_session,
+                    log_entry_db_session=log_entry_db_session,
+                    extract_config=CLAIMANT_EXTRACT_CONFIG,
+                ),
+                writes=extract_tables(CLAIMANT_EXTRACT_CONFIG),
+            )
+        )
 
     if config.consume_fineos_payment:
-        FineosExtractStep(
-            db_session=db_session,
-            log_entry_db_session=log_entry_db_session,
-            extract_config=PAYMENT_EXTRACT_CONFIG,
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                CONSUME_FINEOS_PAYMENT,
+                lambda db_session, log_entry_db_session: FineosExtractStep(
+                    db_session=db_session,
+                    log_entry_db_session=log_entry_db_session,
+                    extract_config=PAYMENT_EXTRACT_CONFIG,
+                ),
+                writes=extract_tables(PAYMENT_EXTRACT_CONFIG),
+            )
+        )
 
     if config.do_vbi_taskreport_extract:
-        FineosExtractStep(
-            db_session=db_session,
-            log_entry_db_session=log_entry_db_session,
-            extract_config=VBI_TASKREPORT_SOM_EXTRACT_CONFIG,
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                VBI_TASKREPORT_EXTRACT,
+                lambda db_session, log_entry_db_session: FineosExtractStep(
+                    db_session=db_session,
+                    log_entry_db_session=log_entry_db_session,
+                    extract_config=VBI_TASKREPORT_SOM_EXTRACT_CONFIG,
+                ),
+                writes=extract_tables(VBI_TASKREPORT_SOM_EXTRACT_CONFIG),
+            )
+        )
 
     if config.do_claimant_extract:
-        ClaimantExtractStep(
-            db_session=db_session,
-            log_entry_db_session=log_entry_db_session,
-            should_add_to_report_queue=True,
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                CLAIMANT_EXTRACT,
+                lambda db_session, log_entry_db_session: ClaimantExtractStep(
+                    db_session=db_session,
+                    log_entry_db_session=log_entry_db_session,
+                    should_add_to_report_queue=True,
+                ),
+                reads=extract_tables(CLAIMANT_EXTRACT_CONFIG) | tables(Employer, OrganizationUnit),
+                writes=tables(
+                    Employee,
+                    TaxIdentifier,
+                    Claim,
+                    AbsencePeriod,
+                    PubEft,
+                    EmployeePubEftPair,
+                    StateLog,
+                    ImportLogReportQueue,
+                ),
+            )
+        )
 
     if config.do_payment_extract:
-        PaymentExtractStep(
-            db_session=db_session,
-            log_entry_db_session=log_entry_db_session,
-            should_add_to_report_queue=True,
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                PAYMENT_EXTRACT,
+                lambda db_session, log_entry_db_session: PaymentExtractStep(
+                    db_session=db_session,
+                    log_entry_db_session=log_entry_db_session,
+                    should_add_to_report_queue=True,
+                ),
+                reads=extract_tables(CLAIMANT_EXTRACT_CONFIG)
+                | extract_tables(PAYMENT_EXTRACT_CONFIG)
+                | tables(Claim, TaxIdentifier),
+                writes=PAYMENT_STATE_TABLES
+                | tables(
+                    PaymentDetails,
+                    PaymentLine,
+                    Employee,
+                    Address,
+                    ExperianAddressPair,
+                    PubEft,
+                    EmployeePubEftPair,
+                    ImportLogReportQueue,
+                ),
+            )
+        )
 
     if config.consume_fineos_1099_request:
-        FineosExtractStep(
-            db_session=db_session,
-            log_entry_db_session=log_entry_db_session,
-            extract_config=REQUEST_1099_EXTRACT_CONFIG,
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                CONSUME_FINEOS_1099_REQUEST_EXTRACT,
+                lambda db_session, log_entry_db_session: FineosExtractStep(
+                    db_session=db_session,
+                    log_entry_db_session=log_entry_db_session,
+                    extract_config=REQUEST_1099_EXTRACT_CONFIG,
+                ),
+                writes=extract_tables(REQUEST_1099_EXTRACT_CONFIG),
+            )
+        )
 
     if config.do_irs_1099_request_extract:
-        Data1099ExtractStep(db_session=db_session, log_entry_db_session=log_entry_db_session).run()
+        step_definitions.append(
+            StepDefinition(
+                IRS_1099_REQUEST_EXTRACT,
+                lambda db_session, log_entry_db_session: Data1099ExtractStep(
+                    db_session=db_session, log_entry_db_session=log_entry_db_session
+                ),
+                reads=extract_tables(REQUEST_1099_EXTRACT_CONFIG) | tables(Employee),
+                writes=tables(Pfml1099Request),
+            )
+        )
 
     if config.validate_addresses:
-        AddressValidationStep(
-            db_session=db_session, log_entry_db_session=log_entry_db_session
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                VALIDATE_ADDRESSES,
+                lambda db_session, log_entry_db_session: AddressValidationStep(
+                    db_session=db_session, log_entry_db_session=log_entry_db_session
+                ),
+                reads=PAYMENT_STATE_TABLES,
+                writes=tables(StateLog, Address, ExperianAddressPair, FineosWritebackDetails),
+            )
+        )
 
     if config.validate_max_weekly_benefit_amount:
-        MaxWeeklyBenefitAmountValidationStep(
-            db_session=db_session, log_entry_db_session=log_entry_db_session
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                VALIDATE_MAX_WEEKLY_BENEFIT_AMOUNT,
+                lambda db_session, log_entry_db_session: MaxWeeklyBenefitAmountValidationStep(
+                    db_session=db_session, log_entry_db_session=log_entry_db_session
+                ),
+                reads=PAYMENT_STATE_TABLES | tables(PaymentDetails, Claim, AbsencePeriod),
+                writes=PAYMENT_STATE_TABLES | tables(FineosWritebackDetails),
+            )
+        )
 
     if config.do_payment_post_processing:
-        PaymentPostProcessingStep(
-            db_session=db_session, log_entry_db_session=log_entry_db_session
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                PAYMENT_POST_PROCESSING,
+                lambda db_session, log_entry_db_session: PaymentPostProcessingStep(
+                    db_session=db_session, log_entry_db_session=log_entry_db_session
+                ),
+                reads=PAYMENT_STATE_TABLES | tables(Employee, Claim, AbsencePeriod),
+                writes=PAYMENT_STATE_TABLES | tables(FineosWritebackDetails),
+            )
+        )
 
     if config.do_related_payment_processing:
-        RelatedPaymentsProcessingStep(
-            db_session=db_session, log_entry_db_session=log_entry_db_session
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                RELATED_PAYMENT_PROCESSING,
+                lambda db_session, log_entry_db_session: RelatedPaymentsProcessingStep(
+                    db_session=db_session, log_entry_db_session=log_entry_db_session
+                ),
+                reads=PAYMENT_STATE_TABLES | tables(FineosWritebackDetails),
+                writes=PAYMENT_STATE_TABLES | tables(LinkSplitPayment, FineosWritebackDetails),
+            )
+        )
 
     if config.make_audit_report:
-        PaymentAuditReportStep(
-            db_session=db_session, log_entry_db_session=log_entry_db_session
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                CREATE_AUDIT_REPORT,
+                lambda db_session, log_entry_db_session: PaymentAuditReportStep(
+                    db_session=db_session, log_entry_db_session=log_entry_db_session
+                ),
+                reads=PAYMENT_STATE_TABLES | tables(Employee, Claim, LinkSplitPayment),
+                writes=PAYMENT_STATE_TABLES | tables(PaymentAuditReportDetails),
+            )
+        )
 
     if config.create_pei_writeback:
-        FineosPeiWritebackStep(
-            db_session=db_session, log_entry_db_session=log_entry_db_session
-        ).run()
+        step_definitions.append(
+            StepDefinition(
+                CREATE_PEI_WRITEBACK,
+                lambda db_session, log_entry_db_session: FineosPeiWritebackStep(
+                    db_session=db_session, log_entry_db_session=log_entry_db_session
+                ),
+                reads=PAYMENT_STATE_TABLES | tables(FineosWritebackDetails),
+                writes=PAYMENT_STATE_TABLES | tables(FineosWritebackDetails),
+            )
+        )
 
     if config.make_reports:
-        ReportStep(
-            db_session=db_session,
-            log_entry_db_session=log_entry_db_session,
-            report_names=PROCESS_FINEOS_EXTRACT_REPORTS,
-            sources_to_clear_from_report_queue=[ClaimantExtractStep],
-        ).run()
+        # The reports query across everything the earlier steps wrote
+        step_definitions.append(
+            StepDefinition(
+                REPORT,
+                lambda db_session, log_entry_db_session: ReportStep(
+                    db_session=db_session,
+                    log_entry_db_session=log_entry_db_session,
+                    report_names=PROCESS_FINEOS_EXTRACT_REPORTS,
+                    sources_to_clear_from_report_queue=[ClaimantExtractStep],
+                ),
+                reads=frozenset(table for step in step_definitions for table in step.writes),
+                writes=tables(ImportLogReportQueue),
+            )
+        )
+
+    return step_definitions
+
+
+def _process_fineos_extracts(
+    db_session: db.Session,
+    log_entry_db_session: db.Session,
+    config: Configuration,
+    make_step_db_session: Optional[Callable[[], db.Session]] = None,
+) -> None:
+    """Process FINEOS Payments Extracts"""
+    logger.info("Start - FINEOS Payment+Claimant Extract ECS Task")
+    start_time = get_now_us_eastern()
+
+    StepRunner(
+        get_step_definitions(config),
+        max_parallelism=config.max_parallelism,
+        make_db_session=make_step_db_session,
+    ).run(db_session, log_entry_db_session)
 
     payments_util.create_success_file(start_time, "pub-payments-process-fineos")
     logger.info("End - FINEOS Payment+Claimant Extract ECS Task")
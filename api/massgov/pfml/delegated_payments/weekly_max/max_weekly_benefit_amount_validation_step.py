@@ -1,10 +1,12 @@
 import uuid
 from typing import Dict, List, cast
 
+from sqlalchemy.orm import selectinload
+
 import massgov.pfml.api.util.state_log_util as state_log_util
 import massgov.pfml.delegated_payments.delegated_payments_util as payments_util
 import massgov.pfml.util.logging as logging
-from massgov.pfml.db.models.employees import State
+from massgov.pfml.db.models.employees import Claim, Payment, State
 from massgov.pfml.db.models.payments import FineosWritebackTransactionStatus
 from massgov.pfml.delegated_payments.postprocessing.payment_post_processing_util import (
     PaymentContainer,
@@ -23,6 +25,9 @@ from massgov.pfml.delegated_payments.weekly_max.maximum_weekly_benefits_processo
 
 logger = logging.get_logger(__name__)
 
+# Number of payments awaiting validation loaded per query
+PAYMENT_PRELOAD_CHUNK_SIZE = 1000
+
 
 class MaxWeeklyBenefitAmountValidationStep(Step):
     Metrics = MaxWeeklyBenefitAmountMetrics
@@ -39,13 +44,39 @@ class MaxWeeklyBenefitAmountValidationStep(Step):
             db_session=self.db_session,
         )
 
+        # Hold on to the payments, the session only keeps weak references to them
+        payments = self._preload_payments(
+            [state_log.payment_id for state_log in state_logs if state_log.payment_id is not None]
+        )
+
         payment_containers = []
         for state_log in state_logs:
             self.increment(self.Metrics.PAYMENTS_PROCESSED_COUNT)
             payment_containers.append(PaymentContainer(state_log.payment))
 
+        logger.info("Loaded %i payments awaiting validation", len(payments))
+
         return payment_containers
 
+    def _preload_payments(self, payment_ids: List[uuid.UUID]) -> List[Payment]:
+        # Load the payments with their claims, employees and payment details in a few queries,
+        # the state logs and the processor then find them in the session instead of lazy loading
+        payments: List[Payment] = []
+        for start in range(0, len(payment_ids), PAYMENT_PRELOAD_CHUNK_SIZE):
+            payments.extend(
+                self.db_session.query(Payment)
+                .filter(
+                    Payment.payment_id.in_(payment_ids[start : start + PAYMENT_PRELOAD_CHUNK_SIZE])
+                )
+                .options(
+                    selectinload(Payment.claim).selectinload(Claim.employee),
+                    selectinload(Payment.payment_details),
+                )
+                .all()
+            )
+
+        return payments
+
     def _process_max_weekly_benefit_amount_by_employee(
         self, payment_containers: List[PaymentContainer]
     ) -> None:
@@ -63,6 +94,11 @@ class MaxWeeklyBenefitAmountValidationStep(Step):
             employee_to_containers[employee_id].append(container)
 
         maximum_weekly_processor = MaximumWeeklyBenefitsStepProcessor(self)
+        maximum_weekly_processor.preload_prior_payments(
+            employee_to_containers.keys(),
+            [container.payment.payment_id for container in payment_containers],
+        )
+
         # Run various validation rules on these groups
         for employee_id, payment_containers in employee_to_containers.items():
             # Employee ID was useful for grouping, but we want the employee itself
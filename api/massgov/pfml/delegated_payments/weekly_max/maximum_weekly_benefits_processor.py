@@ -1,6 +1,7 @@
+import uuid
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, cast
+from typing import Dict, Iterable, List, Optional, cast
 
 import massgov.pfml.delegated_payments.delegated_payments_util as payments_util
 import massgov.pfml.util.logging
@@ -13,10 +14,13 @@ from massgov.pfml.delegated_payments.postprocessing.payment_post_processing_util
     PaymentScenario,
     PayPeriodGroup,
     get_all_overpayments_associated_with_employee,
+    get_all_overpayments_associated_with_employees,
     get_all_paid_payments_associated_with_employee,
+    get_all_paid_payments_associated_with_employees,
     get_payment_detail_amount,
     make_payment_log,
 )
+from massgov.pfml.delegated_payments.step import Step
 from massgov.pfml.delegated_payments.weekly_max.max_weekly_benefit_amount_util import (
     MaxWeeklyBenefitAmountMetrics,
 )
@@ -35,20 +39,53 @@ class MaximumWeeklyBenefitsStepProcessor(AbstractStepProcessor):
 
     This processor uses common post processing utilities to generate error messages.
     The max_weekly_benefit_validation step will handle creating payment containers and state transition.
+
+    The prior payments of every employee in a batch can be loaded up front with
+    preload_prior_payments, otherwise they are queried for each employee.
     """
 
     Metrics = MaxWeeklyBenefitAmountMetrics
     benefits_metrics_cache: Optional[List[BenefitsMetrics]] = None
 
-    def process(self, employee: Employee, payment_containers: List[PaymentContainer]) -> None:
-        """
-        This method updates the payment containers'
-        audit_report_maximum_weekly_msg message if
-        the payment would go over the maximum weekly cap
+    def __init__(self, step: Step) -> None:
+        super().__init__(step)
+        self._prior_payments: Dict[uuid.UUID, List[PaymentContainer]] = {}
+
+    def preload_prior_payments(
+        self, employee_ids: Iterable[uuid.UUID], current_payment_ids: List[uuid.UUID]
+    ) -> None:
+        """Load the prior paid payments and overpayments of all employees in the batch.
+
+        current_payment_ids must cover every payment that will be processed, so that none of them
+        is counted as a prior payment.
         """
-        current_payment_ids = [
-            payment_container.payment.payment_id for payment_container in payment_containers
-        ]
+        employee_ids = list(dict.fromkeys(employee_ids))
+
+        paid_payments = get_all_paid_payments_associated_with_employees(
+            employee_ids, current_payment_ids, self.db_session
+        )
+        overpayments = get_all_overpayments_associated_with_employees(employee_ids, self.db_session)
+
+        for employee_id in employee_ids:
+            self._prior_payments[employee_id] = paid_payments.get(
+                employee_id, []
+            ) + overpayments.get(employee_id, [])
+
+        logger.info(
+            "Preloaded prior payments for maximum weekly benefits",
+            extra={
+                "employee_count": len(employee_ids),
+                "paid_payment_count": sum(len(rows) for rows in paid_payments.values()),
+                "overpayment_count": sum(len(rows) for rows in overpayments.values()),
+            },
+        )
+
+    def _get_prior_payments(
+        self, employee: Employee, current_payment_ids: List[uuid.UUID]
+    ) -> List[PaymentContainer]:
+        prior_payments = self._prior_payments.get(employee.employee_id)
+        if prior_payments is not None:
+            return list(prior_payments)
 
         prior_payments = get_all_paid_payments_associated_with_employee(
             employee.employee_id, current_payment_ids, self.db_session
@@ -61,6 +98,20 @@ class MaximumWeeklyBenefitsStepProcessor(AbstractStepProcessor):
         )
         prior_payments.extend(overpayments)
 
+        return prior_payments
+
+    def process(self, employee: Employee, payment_containers: List[PaymentContainer]) -> None:
+        """
+        This method updates the payment containers'
+        audit_report_maximum_weekly_msg message if
+        the payment would go over the maximum weekly cap
+        """
+        current_payment_ids = [
+            payment_container.payment.payment_id for payment_container in payment_containers
+        ]
+
+        prior_payments = self._get_prior_payments(employee, current_payment_ids)
+
         # Filter out previously errored payments + adhoc payments
         payment_containers_to_process = self._filter_payments_from_maximum_weekly_processing(
             payment_containers
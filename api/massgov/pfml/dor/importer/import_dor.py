@@ -18,6 +18,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
 
 import massgov.pfml.dor.importer.lib.dor_persistence_util as dor_persistence_util
+import massgov.pfml.dor.importer.lib.wage_staging as wage_staging
 import massgov.pfml.util.batch.log
 import massgov.pfml.util.files as file_util
 import massgov.pfml.util.logging as logging
@@ -34,7 +35,6 @@ from massgov.pfml.db.models.employees import (
     WagesAndContributionsHistory,
 )
 from massgov.pfml.dor.importer.dor_file_formats import (
-    EMPLOYEE_FILE_ROW_LENGTH,
     EMPLOYEE_FORMAT,
     EMPLOYER_FILE_FORMAT,
     EMPLOYER_FILE_ROW_LENGTH,
@@ -124,10 +124,16 @@ def handler() -> None:
     try:
         folder_path = os.environ["FOLDER_PATH"]
         decrypt_files = os.getenv("DECRYPT") == "true"
+        # Load wages through a COPY staging table and set-based SQL instead of the ORM
+        copy_wage_import = os.getenv("COPY_WAGE_IMPORT") == "true"
 
         logger.info(
             "Starting import run",
-            extra={"folder_path": folder_path, "decrypt_files": decrypt_files},
+            extra={
+                "folder_path": folder_path,
+                "decrypt_files": decrypt_files,
+                "copy_wage_import": copy_wage_import,
+            },
         )
 
         import_batches = get_files_to_process(folder_path)
@@ -136,7 +142,9 @@ def handler() -> None:
             logger.info("no files found to import")
             report.message = "no files found to import"
         else:
-            import_reports = process_import_batches(import_batches, decrypt_files)
+            import_reports = process_import_batches(
+                import_batches, decrypt_files, copy_wage_import=copy_wage_import
+            )
             report.imports = import_reports
             report.message = "files imported"
 
@@ -167,6 +175,7 @@ def process_import_batches(
     import_batches: List[ImportBatch],
     decrypt_files: bool,
     optional_db_session: Optional[Session] = None,
+    copy_wage_import: bool = False,
 ) -> List[ImportReport]:
     try:
         import_reports: List[ImportReport] = []
@@ -196,6 +205,7 @@ def process_import_batches(
                     str(import_batch.employer_file),
                     str(import_batch.employee_file),
                     decrypter,
+                    copy_wage_import=copy_wage_import,
                 )
                 import_reports.append(import_report)
     except ImportException as ie:
@@ -213,6 +223,7 @@ class EmployeeWriter(object):
         db_session: Session,
         report: ImportReport,
         report_log_entry: ImportLog,
+        copy_wage_import: bool = False,
     ):
         self.line_count: int = 0
         self.line_buffer_length: int = line_buffer_length
@@ -226,51 +237,51 @@ class EmployeeWriter(object):
         self.report: ImportReport = report
         self.report_log_entry: ImportLog = report_log_entry
         self.employee_ssns_created_in_current_import_run: Dict[str, uuid.UUID] = {}
+        self.copy_wage_import: bool = copy_wage_import
         logger.info("Created EmployeeWriter, buffer length: %i", line_buffer_length)
 
     def flush_buffer(self) -> None:
         logger.info("Flushing buffer, %i lines", len(self.lines))
 
-        employees_info = []
-        employers_quarterly_info = []
+        # Split the buffer by record type and parse each group in bulk, a column at a time
+        first_line_number = self.line_count - len(self.lines)
+        employer_quarter_lines = []
+        employer_quarter_line_numbers = []
+        employee_lines = []
+        employee_line_numbers = []
 
-        count = 0
-        for row in self.lines:
-            count += 1
+        for count, row in enumerate(self.lines, start=1):
             if row.startswith("A"):
-                try:
-                    employer_quarterly_info = EMPLOYER_QUARTER_INFO_FORMAT.parse_line(row)
-                    employers_quarterly_info.append(employer_quarterly_info)
-
-                    self.parsed_employer_quarterly_info_count += 1
-                except Exception:
-                    logger.exception(
-                        "Parse error with employer quarterly line. . Line: %i",
-                        (self.line_count - len(self.lines)) + count,
-                    )
-                    self.report.parsed_employer_quarter_exception_count += 1
-
-            if row.startswith("B"):
-                try:
-                    employee_info = EMPLOYEE_FORMAT.parse_line(row)
-
-                    line_length = len(row.strip("\n\r"))
-                    if line_length != EMPLOYEE_FILE_ROW_LENGTH:
-                        logger.warning(
-                            "Incorrect employee line length - account key {0}, line length: {1}".format(
-                                employee_info["account_key"], line_length
-                            )
-                        )
-                        self.report.invalid_employee_lines_count += 1
-
-                    employees_info.append(employee_info)
-                    self.parsed_employees_info_count = self.parsed_employees_info_count + 1
-                except Exception:
-                    logger.exception(
-                        "Parse error with employee line. Line: %i",
-                        (self.line_count - len(self.lines)) + count,
-                    )
-                    self.report.parsed_employees_exception_count += 1
+                employer_quarter_lines.append(row)
+                employer_quarter_line_numbers.append(first_line_number + count)
+            elif row.startswith("B"):
+                employee_lines.append(row)
+                employee_line_numbers.append(first_line_number + count)
+
+        parsed_employer_quarters = EMPLOYER_QUARTER_INFO_FORMAT.parse_lines(employer_quarter_lines)
+        for index, error in parsed_employer_quarters.errors:
+            logger.error(
+                "Parse error with employer quarterly line. . Line: %i",
+                employer_quarter_line_numbers[index],
+                exc_info=error,
+            )
+            self.report.parsed_employer_quarter_exception_count += 1
+
+        employers_quarterly_info = list(parsed_employer_quarters.records())
+        self.parsed_employer_quarterly_info_count += len(parsed_employer_quarters)
+
+        # Lines of an incorrect length are rejected by the parser and counted as exceptions here
+        parsed_employees = EMPLOYEE_FORMAT.parse_lines(employee_lines)
+        for index, error in parsed_employees.errors:
+            logger.error(
+                "Parse error with employee line. Line: %i",
+                employee_line_numbers[index],
+                exc_info=error,
+            )
+            self.report.parsed_employees_exception_count += 1
+
+        employees_info = list(parsed_employees.records())
+        self.parsed_employees_info_count += len(parsed_employees)
 
         if len(employers_quarterly_info) > 0:
             import_employer_pfml_contributions(
@@ -287,6 +298,7 @@ class EmployeeWriter(object):
                 self.employee_ssns_created_in_current_import_run,
                 self.report,
                 self.report_log_entry.import_log_id,
+                copy_wage_import=self.copy_wage_import,
             )
 
         logger.info(
@@ -453,7 +465,11 @@ def handle_import_exception(
 
 
 def process_daily_import(
-    db_session: Session, employer_file_path: str, employee_file_path: str, decrypter: Crypt
+    db_session: Session,
+    employer_file_path: str,
+    employee_file_path: str,
+    decrypter: Crypt,
+    copy_wage_import: bool = False,
 ) -> ImportReport:
     logger.info("Starting to process files")
     report = ImportReport(
@@ -491,6 +507,7 @@ def process_daily_import(
                 db_session=db_session,
                 report=report,
                 report_log_entry=report_log_entry,
+                copy_wage_import=copy_wage_import,
             )
             decrypter.set_on_data(writer)
             file_stream = file_util.open_stream(employee_file_path, "rb")
@@ -1298,6 +1315,45 @@ def import_wage_data(
     )
 
 
+def import_wage_data_with_copy(
+    db_session: Session,
+    wage_info_list: List,
+    account_key_to_employer_id_map: Dict[str, uuid.UUID],
+    employee_ssns_to_id_created_in_current_import_run: Dict[str, uuid.UUID],
+    ssn_to_existing_employee_model: Dict[str, Employee],
+    report: ImportReport,
+    import_log_entry_id: int,
+) -> None:
+    """Set-based alternative to import_wage_data, see wage_staging"""
+    ssn_to_employee_id = {
+        ssn: employee.employee_id for ssn, employee in ssn_to_existing_employee_model.items()
+    }
+    ssn_to_employee_id.update(employee_ssns_to_id_created_in_current_import_run)
+
+    logger.info("Importing wage information with COPY: %i", len(wage_info_list))
+
+    counts = wage_staging.import_wage_data_with_copy(
+        db_session,
+        wage_info_list,
+        account_key_to_employer_id_map,
+        ssn_to_employee_id,
+        import_log_entry_id,
+    )
+
+    report.created_wages_and_contributions_count += counts.created
+    report.updated_wages_and_contributions_count += counts.updated
+    report.unmodified_wages_and_contributions_count += counts.unmodified
+    report.skipped_wages_count += counts.skipped
+
+    logger.info(
+        "Done - Importing wage information with COPY - created: %i, updated: %i, unmodified: %i, skipped: %i",
+        counts.created,
+        counts.updated,
+        counts.unmodified,
+        counts.skipped,
+    )
+
+
 def import_employer_pfml_contributions(
     db_session: massgov.pfml.db.Session,
     employer_quarterly_info_list: List[ParsedEmployerQuarterLine],
@@ -1415,6 +1471,7 @@ def import_employees_and_wage_data(
     employee_ssns_created_in_current_import_run: Dict[str, uuid.UUID],
     report: ImportReport,
     import_log_entry_id: int,
+    copy_wage_import: bool = False,
 ) -> None:
     # 1 - Create account key to existing employer id reference map
     account_keys = {employee_info["account_key"] for employee_info in employee_and_wage_info_list}
@@ -1472,6 +1529,18 @@ def import_employees_and_wage_data(
     )
 
     # 5 - Import wages
+    if copy_wage_import:
+        import_wage_data_with_copy(
+            db_session,
+            employee_and_wage_info_list,
+            account_key_to_employer_id_map,
+            employee_ssns_created_in_current_import_run,
+            ssn_to_existing_employee_model,
+            report,
+            import_log_entry_id,
+        )
+        return
+
     import_wage_data(
         db_session,
         employee_and_wage_info_list,
@@ -0,0 +1,282 @@
+#
+# Set-based import of DOR wage rows through a PostgreSQL staging table.
+#
+# Instead of loading every existing WagesAndContributions row for a batch into Python and comparing
+# them one at a time, parsed wage rows are streamed into a temporary table with COPY and the
+# create / update / unchanged classification, history capture and writes are done in SQL.
+#
+
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, Sequence
+
+from sqlalchemy import text
+
+import massgov.pfml.db as db
+import massgov.pfml.db.bulk_copy as bulk_copy
+import massgov.pfml.util.logging as logging
+from massgov.pfml.dor.importer.dor_file_formats import ParsedEmployeeWageLine
+
+logger = logging.get_logger(__name__)
+
+STAGING_TABLE_NAME = "dor_wage_import_staging"
+
+# Wage columns compared to decide whether an existing row changed, and copied into history
+WAGE_VALUE_COLUMNS = (
+    "is_independent_contractor",
+    "is_opted_in",
+    "employee_ytd_wages",
+    "employee_qtr_wages",
+    "employee_med_contribution",
+    "employer_med_contribution",
+    "employee_fam_contribution",
+    "employer_fam_contribution",
+)
+
+STAGING_COLUMNS = (
+    "account_key",
+    "filing_period",
+    "employee_id",
+    "employer_id",
+) + WAGE_VALUE_COLUMNS
+
+WAGE_KEY_COLUMNS = ("employer_id", "employee_id", "filing_period")
+
+
+@dataclass
+class WageImportCounts:
+    created: int = 0
+    updated: int = 0
+    unmodified: int = 0
+    skipped: int = 0
+    duplicates: int = 0
+
+
+def import_wage_data_with_copy(
+    db_session: db.Session,
+    wage_info_list: Iterable[ParsedEmployeeWageLine],
+    account_key_to_employer_id_map: Dict[str, uuid.UUID],
+    ssn_to_employee_id: Dict[str, uuid.UUID],
+    import_log_entry_id: int,
+) -> WageImportCounts:
+    """Create or update wage rows for a batch of parsed employee lines using set-based SQL.
+
+    Rows for unknown employers or employees are skipped. When the same employer, employee and
+    filing period appears more than once in the batch, the last line wins. The staging table is
+    dropped when the transaction is committed at the end of the import.
+    """
+    counts = WageImportCounts()
+
+    # Employees created earlier in the batch must be visible to the raw COPY connection
+    db_session.flush()
+
+    _create_staging_table(db_session)
+
+    staged_count = _copy_to_staging_table(
+        db_session,
+        _staging_rows(wage_info_list, account_key_to_employer_id_map, ssn_to_employee_id, counts),
+    )
+    logger.info("Staged wage rows: %i, skipped: %i", staged_count, counts.skipped)
+
+    counts.duplicates = _delete_duplicate_staging_rows(db_session)
+    if counts.duplicates > 0:
+        logger.warning("Duplicate wage rows in batch, keeping last: %i", counts.duplicates)
+
+    db_session.execute(text(f"ANALYZE {STAGING_TABLE_NAME}"))
+
+    _match_existing_wages(db_session)
+
+    history_count = _insert_wage_history(db_session)
+    counts.updated = _update_changed_wages(db_session, import_log_entry_id)
+    counts.created = _insert_new_wages(db_session, import_log_entry_id)
+    counts.unmodified = staged_count - counts.duplicates - counts.updated - counts.created
+
+    logger.info(
+        "Wage data set-based import - created: %i, updated: %i, unmodified: %i, history: %i",
+        counts.created,
+        counts.updated,
+        counts.unmodified,
+        history_count,
+    )
+
+    db_session.commit()
+
+    return counts
+
+
+def _staging_rows(
+    wage_info_list: Iterable[ParsedEmployeeWageLine],
+    account_key_to_employer_id_map: Dict[str, uuid.UUID],
+    ssn_to_employee_id: Dict[str, uuid.UUID],
+    counts: WageImportCounts,
+) -> Iterator[Sequence[Any]]:
+    for wage_info in wage_info_list:
+        account_key = wage_info["account_key"]
+
+        employer_id = account_key_to_employer_id_map.get(account_key, None)
+        if employer_id is None:
+            counts.skipped += 1
+            continue
+
+        employee_id = ssn_to_employee_id.get(wage_info["employee_ssn"], None)
+        if employee_id is None:
+            logger.warning(
+                "Attempted to save a wage row for unknown employee: %s",
+                account_key,
+                extra={"account_key": account_key},
+            )
+            counts.skipped += 1
+            continue
+
+        yield (
+            account_key,
+            wage_info["filing_period"],
+            employee_id,
+            employer_id,
+            wage_info["independent_contractor"],
+            wage_info["opt_in"],
+            wage_info["employee_ytd_wages"],
+            wage_info["employee_qtr_wages"],
+            wage_info["employee_medical"],
+            wage_info["employer_medical"],
+            wage_info["employee_family"],
+            wage_info["employer_family"],
+        )
+
+
+def _create_staging_table(db_session: db.Session) -> None:
+    # The table is only dropped on commit, so one left by an earlier batch in the same
+    # transaction still holds that batch's rows
+    db_session.execute(text(f"DROP TABLE IF EXISTS pg_temp.{STAGING_TABLE_NAME}"))
+    db_session.execute(
+        text(
+            f"""
+            CREATE TEMPORARY TABLE {STAGING_TABLE_NAME} (
+                staging_row_id bigserial PRIMARY KEY,
+                account_key text NOT NULL,
+                filing_period date NOT NULL,
+                employee_id uuid NOT NULL,
+                employer_id uuid NOT NULL,
+                is_independent_contractor boolean NOT NULL,
+                is_opted_in boolean NOT NULL,
+                employee_ytd_wages numeric NOT NULL,
+                employee_qtr_wages numeric NOT NULL,
+                employee_med_contribution numeric NOT NULL,
+                employer_med_contribution numeric NOT NULL,
+                employee_fam_contribution numeric NOT NULL,
+                employer_fam_contribution numeric NOT NULL,
+                wage_and_contribution_id uuid,
+                is_changed boolean NOT NULL DEFAULT false
+            ) ON COMMIT DROP
+            """
+        )
+    )
+
+
+def _copy_to_staging_table(db_session: db.Session, rows: Iterable[Sequence[Any]]) -> int:
+    return bulk_copy.copy_rows(
+        db_session,
+        STAGING_TABLE_NAME,
+        STAGING_COLUMNS,
+        rows,
+        on_chunk=lambda staged_count: logger.info("Staged wage rows: %i", staged_count),
+    )
+
+
+def _key_match(left: str, right: str) -> str:
+    return " AND ".join(f"{left}.{column} = {right}.{column}" for column in WAGE_KEY_COLUMNS)
+
+
+def _delete_duplicate_staging_rows(db_session: db.Session) -> int:
+    result = db_session.execute(
+        text(
+            f"""
+            DELETE FROM {STAGING_TABLE_NAME} s
+            USING {STAGING_TABLE_NAME} later
+            WHERE {_key_match("s", "later")}
+              AND s.staging_row_id < later.staging_row_id
+            """
+        )
+    )
+    return result.rowcount
+
+
+def _match_existing_wages(db_session: db.Session) -> None:
+    changed = " OR ".join(
+        f"w.{column} IS DISTINCT FROM s.{column}" for column in WAGE_VALUE_COLUMNS
+    )
+    db_session.execute(
+        text(
+            f"""
+            UPDATE {STAGING_TABLE_NAME} s
+            SET wage_and_contribution_id = w.wage_and_contribution_id,
+                is_changed = ({changed})
+            FROM wages_and_contributions w
+            WHERE {_key_match("w", "s")}
+            """
+        )
+    )
+
+
+def _insert_wage_history(db_session: db.Session) -> int:
+    # Capture the current state of rows about to be updated, as check_and_update_wages_and_contributions
+    # does for the row-by-row import
+    value_columns = ", ".join(WAGE_VALUE_COLUMNS)
+    w_value_columns = ", ".join(f"w.{column}" for column in WAGE_VALUE_COLUMNS)
+    result = db_session.execute(
+        text(
+            f"""
+            INSERT INTO wages_and_contributions_history (
+                wages_and_contributions_history_id,
+                {value_columns},
+                import_log_id,
+                wage_and_contribution_id
+            )
+            SELECT gen_random_uuid(), {w_value_columns}, w.latest_import_log_id, w.wage_and_contribution_id
+            FROM wages_and_contributions w
+            JOIN {STAGING_TABLE_NAME} s ON s.wage_and_contribution_id = w.wage_and_contribution_id
+            WHERE s.is_changed
+            """
+        )
+    )
+    return result.rowcount
+
+
+def _update_changed_wages(db_session: db.Session, import_log_entry_id: int) -> int:
+    assignments = ", ".join(f"{column} = s.{column}" for column in WAGE_VALUE_COLUMNS)
+    result = db_session.execute(
+        text(
+            f"""
+            UPDATE wages_and_contributions w
+            SET {assignments},
+                latest_import_log_id = :import_log_id,
+                updated_at = now()
+            FROM {STAGING_TABLE_NAME} s
+            WHERE s.wage_and_contribution_id = w.wage_and_contribution_id
+              AND s.is_changed
+            """
+        ),
+        {"import_log_id": import_log_entry_id},
+    )
+    return result.rowcount
+
+
+def _insert_new_wages(db_session: db.Session, import_log_entry_id: int) -> int:
+    columns = ", ".join(STAGING_COLUMNS)
+    s_columns = ", ".join(f"s.{column}" for column in STAGING_COLUMNS)
+    result = db_session.execute(
+        text(
+            f"""
+            INSERT INTO wages_and_contributions (
+                wage_and_contribution_id,
+                {columns},
+                latest_import_log_id
+            )
+            SELECT gen_random_uuid(), {s_columns}, :import_log_id
+            FROM {STAGING_TABLE_NAME} s
+            WHERE s.wage_and_contribution_id IS NULL
+            """
+        ),
+        {"import_log_id": import_log_entry_id},
+    )
+    return result.rowcount
@@ -1,6 +1,12 @@
+import itertools
 import os
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, cast
+from uuid import UUID
+
+from sqlalchemy.orm import joinedload
 
 import massgov.pfml.db as db
 import massgov.pfml.util.batch.log as batch_log
@@ -22,6 +28,10 @@ from massgov.pfml.dua.util import download_files_from_moveit, load_rows_from_fil
 
 logger = logging.get_logger(__name__)
 
+# Number of demographics rows whose employees, employers, reporting units and occupations are
+# loaded and updated together
+DEMOGRAPHICS_CHUNK_SIZE = 1000
+
 
 def download_demographics_file_from_moveit(
     db_session: db.Session,
@@ -104,11 +114,83 @@ def load_demographics_file(
     return total_row_count, inserted_row_count
 
 
+@dataclass
+class DemographicsChunkLookups:
+    """Records referenced by a chunk of DuaEmployeeDemographics rows, loaded in a few queries."""
+
+    employees_by_customer_number: Dict[str, List[Employee]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    employers_by_fein: Dict[str, Employer] = field(default_factory=dict)
+    # Keyed by the reporting unit number of a row, which may be missing
+    reporting_units: Dict[Tuple[Optional[str], UUID], DuaReportingUnit] = field(
+        default_factory=dict
+    )
+    occupations: Dict[Tuple[UUID, UUID], List[EmployeeOccupation]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+
+
+def _load_chunk_lookups(
+    db_session: db.Session, rows: List[DuaEmployeeDemographics]
+) -> DemographicsChunkLookups:
+    lookups = DemographicsChunkLookups()
+
+    customer_numbers = {row.fineos_customer_number for row in rows if row.fineos_customer_number}
+    for employee in db_session.query(Employee).filter(
+        Employee.fineos_customer_number.in_(customer_numbers)
+    ):
+        lookups.employees_by_customer_number[cast(str, employee.fineos_customer_number)].append(
+            employee
+        )
+
+    feins = {cast(str, row.employer_fein).zfill(9) for row in rows}
+    for employer in db_session.query(Employer).filter(Employer.employer_fein.in_(feins)):
+        lookups.employers_by_fein[employer.employer_fein] = employer
+
+    employee_ids = [
+        employee.employee_id
+        for employees in lookups.employees_by_customer_number.values()
+        for employee in employees
+    ]
+    employer_ids = [employer.employer_id for employer in lookups.employers_by_fein.values()]
+    if not employee_ids or not employer_ids:
+        return lookups
+
+    reporting_unit_numbers = {row.employer_reporting_unit_number for row in rows}
+    # Key on the dua_id as the database returns it, the same as it compares the rows' values
+    # against, rather than on an attribute of a reporting unit the session may already hold
+    for dua_id, reporting_unit in (
+        db_session.query(DuaReportingUnit.dua_id, DuaReportingUnit)
+        .options(joinedload(DuaReportingUnit.organization_unit))
+        .filter(
+            DuaReportingUnit.dua_id.in_(reporting_unit_numbers),
+            DuaReportingUnit.employer_id.in_(employer_ids),
+        )
+    ):
+        lookups.reporting_units[(dua_id, reporting_unit.employer_id)] = reporting_unit
+
+    for occupation in db_session.query(EmployeeOccupation).filter(
+        EmployeeOccupation.employee_id.in_(employee_ids),
+        EmployeeOccupation.employer_id.in_(employer_ids),
+    ):
+        lookups.occupations[(occupation.employee_id, occupation.employer_id)].append(occupation)
+
+    return lookups
+
+
 def set_employee_occupation_from_demographic_data(
     db_session: db.Session,
     log_entry: batch_log.LogEntry,
     after_created_at: Optional[datetime] = None,
+    chunk_size: int = DEMOGRAPHICS_CHUNK_SIZE,
 ) -> None:
+    """Set the organization unit of employee occupations from the latest DUA demographics data.
+
+    Demographics rows are processed a chunk at a time: the employees, employers, DUA reporting
+    units and occupations a chunk refers to are loaded up front in one query each, and the new and
+    updated records are flushed together at the end of the chunk.
+    """
     if not after_created_at:
         after_created_at = datetime.min
 
@@ -125,128 +207,130 @@ def set_employee_occupation_from_demographic_data(
             DuaEmployeeDemographics.employer_fein,
             DuaEmployeeDemographics.created_at.desc(),
         )
-    ).yield_per(1000)
-
-    for row in demographic_data:
-        fineos_customer_number = row.fineos_customer_number
-        employer_reporting_unit_number = row.employer_reporting_unit_number
-        # some of the FEINs in the DUA data are missing their leading zeros/are
-        # not 9 digits long, so to have best chance to match against our
-        # Employer records (which all correctly have 9 digit FEINs) pad the left
-        # with zero
-        employer_fein = row.employer_fein.zfill(9)
-
-        log_attributes = {
-            "employee_fineos_customer_number": fineos_customer_number,
-            "dua_employee_demographics_id": row.dua_employee_demographics_id,
-            "dua_reporting_unit_number": employer_reporting_unit_number,
-        }
-
-        # we *should* always have fineos_customer_number given this is how DUA
-        # identifies employees in the return file and a missing FEIN would seem
-        # very unlikely, but just in case...
-        if not fineos_customer_number or not employer_fein:
-            logger.warning(
-                "Employee FINEOS customer number or Employer FEIN missing. Skipping.",
-                extra=log_attributes,
-            )
-            continue
-
-        existing_employees = (
-            db_session.query(Employee).filter(
-                Employee.fineos_customer_number == fineos_customer_number
-            )
-        ).all()
-        if len(existing_employees) > 1:
-            log_attributes["employee_duplicate_count"] = len(existing_employees)
-            logger.warning(
-                "Duplicate employees found for fineos_customer_number. Skipping",
-                extra=log_attributes,
-            )
-            log_entry.increment(Metrics.EMPLOYEE_SKIPPED_COUNT)
-            continue
-        else:
-            existing_employee = existing_employees[0] if len(existing_employees) == 1 else None
-
-        existing_employer = (
-            db_session.query(Employer).filter(Employer.employer_fein == employer_fein)
-        ).one_or_none()
-
-        if not existing_employee:
-            logger.warning("No matching employee found", extra=log_attributes)
-            continue
-
-        log_attributes["employee_id"] = existing_employee.employee_id
-
-        if not existing_employer:
-            logger.warning("No matching employer found for employee", extra=log_attributes)
-            continue
-
-        log_attributes["employer_id"] = existing_employer.employer_id
-
-        employee_occupations = (
-            db_session.query(EmployeeOccupation).filter(
-                EmployeeOccupation.employee_id == existing_employee.employee_id,
-                EmployeeOccupation.employer_id == existing_employer.employer_id,
-            )
-        ).all()
-
-        found_reporting_unit = (
-            db_session.query(DuaReportingUnit).filter(
-                DuaReportingUnit.dua_id == employer_reporting_unit_number,
-                DuaReportingUnit.employer_id == existing_employer.employer_id,
-            )
-        ).one_or_none()
-
-        if not found_reporting_unit:
-            logger.warning("No matching DUA Reporting Unit found", extra=log_attributes)
-            log_entry.increment(Metrics.MISSING_DUA_REPORTING_UNIT_COUNT)
-            continue
-
-        if not found_reporting_unit.organization_unit_id:
-            logger.warning(
-                "DUA Reporting Unit has no FINEOS Org Unit associated", extra=log_attributes
-            )
-            log_entry.increment(Metrics.DUA_REPORTING_UNIT_MISSING_FINEOS_ORG_UNIT_COUNT)
-            continue
-
-        if found_reporting_unit.organization_unit.employer_id != existing_employer.employer_id:
-            log_attributes["dua_reporting_unit_id"] = found_reporting_unit.dua_reporting_unit_id
-            log_attributes["organization_unit_id"] = found_reporting_unit.organization_unit_id
-            logger.warning("FINEOS Org Unit is not for same employer", extra=log_attributes)
-            log_entry.increment(Metrics.DUA_REPORTING_UNIT_MISMATCHED_EMPLOYER_COUNT)
-            continue
-
-        # Create an EmployeeOccupation if it doesn't exist
-        if len(employee_occupations) == 0:
-            employee_occupation = EmployeeOccupation()
-            employee_occupation.employee_id = existing_employee.employee_id
-            employee_occupation.organization_unit_id = found_reporting_unit.organization_unit_id
-            employee_occupation.employer_id = existing_employer.employer_id
-
-            db_session.add(employee_occupation)
-
-            log_entry.increment(Metrics.CREATED_EMPLOYEE_OCCUPATION_COUNT)
-        else:
-            # this should only ever be 1, although multiple are technically supported
-            for occupation in employee_occupations:
-                # do not act on records with an organization_unit_id already set
-                if not occupation.organization_unit_id:
-                    log_entry.increment(Metrics.OCCUPATION_ORG_UNIT_SET_COUNT)
-                    occupation.organization_unit_id = found_reporting_unit.organization_unit_id
-                    db_session.add(
-                        EmployeePushToFineosQueue(
-                            employee_id=existing_employee.employee_id,
-                            employer_id=existing_employer.employer_id,
-                            action="UPDATE_NEW_EMPLOYER",
-                        )
-                    )
-                else:
-                    log_entry.increment(Metrics.OCCUPATION_ORG_UNIT_SKIPPED_COUNT)
+    ).yield_per(chunk_size)
+
+    demographic_rows = iter(demographic_data)
+    while chunk := list(itertools.islice(demographic_rows, chunk_size)):
+        lookups = _load_chunk_lookups(db_session, chunk)
+
+        for row in chunk:
+            _set_employee_occupation_from_demographic_row(db_session, log_entry, row, lookups)
+
+        db_session.flush()
 
     db_session.commit()
 
 
+def _set_employee_occupation_from_demographic_row(
+    db_session: db.Session,
+    log_entry: batch_log.LogEntry,
+    row: DuaEmployeeDemographics,
+    lookups: DemographicsChunkLookups,
+) -> None:
+    fineos_customer_number = row.fineos_customer_number
+    employer_reporting_unit_number = row.employer_reporting_unit_number
+    # some of the FEINs in the DUA data are missing their leading zeros/are
+    # not 9 digits long, so to have best chance to match against our
+    # Employer records (which all correctly have 9 digit FEINs) pad the left
+    # with zero
+    employer_fein = cast(str, row.employer_fein).zfill(9)
+
+    log_attributes: Dict[str, Any] = {
+        "employee_fineos_customer_number": fineos_customer_number,
+        "dua_employee_demographics_id": row.dua_employee_demographics_id,
+        "dua_reporting_unit_number": employer_reporting_unit_number,
+    }
+
+    # we *should* always have fineos_customer_number given this is how DUA
+    # identifies employees in the return file and a missing FEIN would seem
+    # very unlikely, but just in case...
+    if not fineos_customer_number or not employer_fein:
+        logger.warning(
+            "Employee FINEOS customer number or Employer FEIN missing. Skipping.",
+            extra=log_attributes,
+        )
+        return
+
+    existing_employees = lookups.employees_by_customer_number.get(fineos_customer_number, [])
+    if len(existing_employees) > 1:
+        log_attributes["employee_duplicate_count"] = len(existing_employees)
+        logger.warning(
+            "Duplicate employees found for fineos_customer_number. Skipping",
+            extra=log_attributes,
+        )
+        log_entry.increment(Metrics.EMPLOYEE_SKIPPED_COUNT)
+        return
+    else:
+        existing_employee = existing_employees[0] if len(existing_employees) == 1 else None
+
+    existing_employer = lookups.employers_by_fein.get(employer_fein)
+
+    if not existing_employee:
+        logger.warning("No matching employee found", extra=log_attributes)
+        return
+
+    log_attributes["employee_id"] = existing_employee.employee_id
+
+    if not existing_employer:
+        logger.warning("No matching employer found for employee", extra=log_attributes)
+        return
+
+    log_attributes["employer_id"] = existing_employer.employer_id
+
+    occupation_key = (existing_employee.employee_id, existing_employer.employer_id)
+    employee_occupations = lookups.occupations[occupation_key]
+
+    found_reporting_unit = lookups.reporting_units.get(
+        (employer_reporting_unit_number, existing_employer.employer_id)
+    )
+
+    if not found_reporting_unit:
+        logger.warning("No matching DUA Reporting Unit found", extra=log_attributes)
+        log_entry.increment(Metrics.MISSING_DUA_REPORTING_UNIT_COUNT)
+        return
+
+    if not found_reporting_unit.organization_unit_id:
+        logger.warning("DUA Reporting Unit has no FINEOS Org Unit associated", extra=log_attributes)
+        log_entry.increment(Metrics.DUA_REPORTING_UNIT_MISSING_FINEOS_ORG_UNIT_COUNT)
+        return
+
+    if found_reporting_unit.organization_unit.employer_id != existing_employer.employer_id:
+        log_attributes["dua_reporting_unit_id"] = found_reporting_unit.dua_reporting_unit_id
+        log_attributes["organization_unit_id"] = found_reporting_unit.organization_unit_id
+        logger.warning("FINEOS Org Unit is not for same employer", extra=log_attributes)
+        log_entry.increment(Metrics.DUA_REPORTING_UNIT_MISMATCHED_EMPLOYER_COUNT)
+        return
+
+    # Create an EmployeeOccupation if it doesn't exist
+    if len(employee_occupations) == 0:
+        employee_occupation = EmployeeOccupation()
+        employee_occupation.employee_id = existing_employee.employee_id
+        employee_occupation.organization_unit_id = found_reporting_unit.organization_unit_id
+        employee_occupation.employer_id = existing_employer.employer_id
+
+        db_session.add(employee_occupation)
+        # A later row in the chunk for the same pair (e.g. an unpadded FEIN) updates this one
+        employee_occupations.append(employee_occupation)
+
+        log_entry.increment(Metrics.CREATED_EMPLOYEE_OCCUPATION_COUNT)
+    else:
+        # this should only ever be 1, although multiple are technically supported
+        for occupation in employee_occupations:
+            # do not act on records with an organization_unit_id already set
+            if not occupation.organization_unit_id:
+                log_entry.increment(Metrics.OCCUPATION_ORG_UNIT_SET_COUNT)
+                occupation.organization_unit_id = found_reporting_unit.organization_unit_id
+                db_session.add(
+                    EmployeePushToFineosQueue(
+                        employee_id=existing_employee.employee_id,
+                        employer_id=existing_employer.employer_id,
+                        action="UPDATE_NEW_EMPLOYER",
+                    )
+                )
+            else:
+                log_entry.increment(Metrics.OCCUPATION_ORG_UNIT_SKIPPED_COUNT)
+
+
 def _load_demographic_rows_from_file_path(
     file_location: str, db_session: db.Session
 ) -> Tuple[int, int]:
@@ -1,11 +1,14 @@
 import csv
 import re
-from typing import Any, Dict, List
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from sqlalchemy.dialects.postgresql import insert
 
 import massgov.pfml.db as db
 import massgov.pfml.util.files as file_util
+import massgov.pfml.util.logging as logging
+from massgov.pfml.db.content_hash import content_hash
 from massgov.pfml.db.models.employees import ReferenceFile
 from massgov.pfml.dua.config import DUAMoveItConfig, DUATransferConfig
 from massgov.pfml.util.datetime import utcnow
@@ -14,6 +17,15 @@ from massgov.pfml.util.sftp_s3_transfer import (
     copy_from_sftp_to_s3_and_archive_files,
 )
 
+logger = logging.get_logger(__name__)
+
+# Number of rows sent per INSERT statement when loading a DUA file
+INSERT_CHUNK_SIZE = 5000
+
+# Number of recently seen rows checked for duplicates before they are sent to the database, for
+# tables without a row hash (see load_rows_from_file_path)
+DEDUPE_WINDOW_SIZE = 100000
+
 
 def convert_dict_with_csv_keys_to_db_keys(
     csv_data: Dict[str, Any], csv_columns: Dict[str, str]
@@ -23,36 +35,94 @@ def convert_dict_with_csv_keys_to_db_keys(
 
 
 def load_rows_from_file_path(
-    file_location: str, db_session: db.Session, csv_columns: Dict[str, str], insert_table: Any
+    file_location: str,
+    db_session: db.Session,
+    csv_columns: Dict[str, str],
+    insert_table: Any,
+    chunk_size: int = INSERT_CHUNK_SIZE,
+    dedupe_window_size: int = DEDUPE_WINDOW_SIZE,
 ) -> Dict[str, Any]:
-
+    """Stream the rows of a DUA CSV file into a table, skipping rows it already has.
+
+    Rows are inserted a chunk at a time with ON CONFLICT DO NOTHING, so no INSERT statement is
+    bigger than chunk_size rows. Everything is committed at the end, so a file is loaded completely
+    or not at all.
+
+    Tables with row_data_columns, like dua_employer_data, are deduplicated on the unique hash of
+    those columns, both against earlier files and within the file. For other tables the unique
+    index over the data columns dedupes rows against earlier files, and only the
+    dedupe_window_size most recently seen rows of the file are checked before they are sent. That
+    index has to coalesce its nullable columns, like the one on dua_employer_demographics, to catch
+    repeats that are further apart.
+    """
     total_row_count = 0
     inserted_row_count = 0
+    chunk_count = 0
+
+    table = insert_table.__table__
+    row_data_columns: Optional[Sequence[str]] = getattr(insert_table, "row_data_columns", None)
+    if row_data_columns is not None:
+        statement = insert(table).on_conflict_do_nothing(index_elements=[table.c.row_data_hash])
+    else:
+        statement = insert(table).on_conflict_do_nothing()
 
-    # filter out duplicate rows in same file
-    unique_rows = set()
-    rows_to_insert = []
+    # filter out duplicate rows in the same file
+    seen_rows: "OrderedDict[Tuple[Any, ...], None]" = OrderedDict()
+    rows_to_insert: List[Dict[str, Any]] = []
+
+    def insert_chunk() -> None:
+        nonlocal inserted_row_count, chunk_count
+
+        result = db_session.execute(statement.values(rows_to_insert))
+        inserted_row_count += result.rowcount
+        chunk_count += 1
+        rows_to_insert.clear()
+
+        logger.info(
+            "Loaded DUA file chunk",
+            extra={
+                "file_location": file_location,
+                "table": insert_table.__tablename__,
+                "chunk_count": chunk_count,
+                "total_row_count": total_row_count,
+                "inserted_row_count": inserted_row_count,
+            },
+        )
 
     # Load to database.
     with file_util.open_stream(file_location) as file:
         for row in csv.DictReader(file):
             total_row_count += 1
 
-            row_values = tuple(row.values())
-            if row_values not in unique_rows:
-                db_data = convert_dict_with_csv_keys_to_db_keys(row, csv_columns)
-                db_data["created_at"] = utcnow()
-                unique_rows.add(tuple(row.values()))
-                rows_to_insert.append(db_data)
+            if row_data_columns is None:
+                row_values = tuple(row.values())
+                if row_values in seen_rows:
+                    seen_rows.move_to_end(row_values)
+                    continue
 
-        result = db_session.execute(
-            insert(insert_table.__table__).on_conflict_do_nothing().values(rows_to_insert)
-        )
-        inserted_row_count += result.rowcount
+                seen_rows[row_values] = None
+                if len(seen_rows) > dedupe_window_size:
+                    seen_rows.popitem(last=False)
+
+            db_data = convert_dict_with_csv_keys_to_db_keys(row, csv_columns)
+            db_data["created_at"] = utcnow()
+            if row_data_columns is not None:
+                db_data["row_data_hash"] = content_hash(table, row_data_columns, db_data)
+            rows_to_insert.append(db_data)
+
+            if len(rows_to_insert) >= chunk_size:
+                insert_chunk()
+
+        if rows_to_insert:
+            insert_chunk()
 
     db_session.commit()
 
-    final_count = {"total_row_count": total_row_count, "inserted_row_count": inserted_row_count}
+    final_count = {
+        "total_row_count": total_row_count,
+        "inserted_row_count": inserted_row_count,
+        "chunk_count": chunk_count,
+    }
 
     return final_count
 
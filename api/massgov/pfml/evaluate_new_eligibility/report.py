@@ -12,7 +12,10 @@ from sqlalchemy import tuple_
 import massgov.pfml.util.files as file_util
 import massgov.pfml.util.logging
 from massgov.pfml import db
-from massgov.pfml.api.eligibility.eligibility import compute_financial_eligibility
+from massgov.pfml.api.eligibility.batch import (
+    FinancialEligibilityRequest,
+    compute_financial_eligibility_batch,
+)
 from massgov.pfml.db.models.employees import Claim, EmployeeOccupation, Employer
 from massgov.pfml.util.bg import background_task
 
@@ -173,6 +176,9 @@ def generate_report(cli_args, db_session, output_csv):
         .all()
     )
     logger.info(f"claims len: {len(all_claims)}")
+
+    requests = []
+    prior_results = {}
     for claim in all_claims:
         old_claim_result = log_eligibility_dict.get(
             (str(claim.employee_id), str(claim.employer_id), str(claim.absence_period_start_date))
@@ -189,43 +195,41 @@ def generate_report(cli_args, db_session, output_csv):
             )
             continue
 
-        leave_start_date = date.fromisoformat(str(old_claim_result.get("leave_start_date")))
-        employment_status = old_claim_result.get("employment_status") or claim.employment_status
-        prior_eligibility = old_claim_result.get("financially_eligible") == "True"
-        prior_description = old_claim_result.get("description")
-        claimaint_id = str(claim.employee_id)
-        application_submitted_date = date.fromisoformat(
-            str(old_claim_result.get("application_submitted_date"))
+        request = FinancialEligibilityRequest(
+            employee_id=claim.employee_id,
+            employer_id=claim.employer_id,
+            leave_start_date=date.fromisoformat(str(old_claim_result.get("leave_start_date"))),
+            application_submitted_date=date.fromisoformat(
+                str(old_claim_result.get("application_submitted_date"))
+            ),
+            employment_status=old_claim_result.get("employment_status") or claim.employment_status,
         )
+        requests.append(request)
+        prior_results[request] = old_claim_result
 
-        try:
-            eligibility = compute_financial_eligibility(
-                db_session=db_session,
-                employee_id=claim.employee_id,
-                employer_id=claim.employer_id,
-                application_submitted_date=application_submitted_date,
-                leave_start_date=leave_start_date,
-                employment_status=employment_status,
-            )
-            new_eligibility = eligibility.financially_eligible
-            new_description = eligibility.description
-            if new_eligibility != prior_eligibility:
-                result = [
-                    claimaint_id,
-                    application_submitted_date,
-                    leave_start_date,
+    # Recompute eligibility for every claim in one pass
+    for result in compute_financial_eligibility_batch(db_session, requests):
+        if result.response is None:
+            continue
+
+        request = result.request
+        old_claim_result = prior_results[request]
+        prior_eligibility = old_claim_result.get("financially_eligible") == "True"
+        prior_description = old_claim_result.get("description")
+        new_eligibility = result.response.financially_eligible
+        new_description = result.response.description
+        if new_eligibility != prior_eligibility:
+            output_csv.writerow(
+                [
+                    str(request.employee_id),
+                    request.application_submitted_date,
+                    request.leave_start_date,
                     prior_eligibility,
                     prior_description,
                     new_eligibility,
                     new_description,
-                    eligibility.total_wages,
+                    result.response.total_wages,
                 ]
-                output_csv.writerow(result)
-        except Exception as ex:
-            logger.warning(
-                "unable to process claim ",
-                exc_info=ex,
-                extra={"employee_id": claim.employee_id, "employer_id": claim.employer_id},
             )
 
 
@@ -0,0 +1,243 @@
+#
+# Experian Address Validate SOAP client with a persistent result cache.
+#
+# The same claimant addresses are validated again on every payments run. Search responses are
+# stored in experian_address_validation_result, keyed by a hash of the normalized search request,
+# and reused until they are older than the configured maximum age. Requests that are not in the
+# cache can be prefetched from Experian by a bounded pool of worker threads.
+#
+
+import enum
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import newrelic.agent
+from pydantic import Field
+
+import massgov.pfml.util.logging
+import massgov.pfml.util.pydantic
+from massgov.pfml import db
+from massgov.pfml.db.models.employees import ExperianAddressValidationResult
+from massgov.pfml.experian.address_validate_soap.client import Client
+from massgov.pfml.experian.address_validate_soap.models import SearchRequest, SearchResponse
+from massgov.pfml.util.datetime import utcnow
+
+logger = massgov.pfml.util.logging.get_logger(__name__)
+
+# Number of cached results read with one query
+CACHE_LOOKUP_CHUNK_SIZE = 1000
+
+# Separators that do not change the address Experian matches
+SEARCH_TEXT_SEPARATORS = re.compile(r"[\s,.]+")
+
+# Outcome of one search: the response, or the exception Experian raised
+SearchOutcome = Tuple[Optional[SearchResponse], Optional[Exception]]
+
+
+class Metrics(str, enum.Enum):
+    EXPERIAN_CACHE_HIT_COUNT = "experian_cache_hit_count"
+    EXPERIAN_CACHE_MISS_COUNT = "experian_cache_miss_count"
+    EXPERIAN_CACHE_STALE_COUNT = "experian_cache_stale_count"
+    EXPERIAN_SEARCH_COUNT = "experian_search_count"
+    EXPERIAN_SEARCH_MILLISECONDS = "experian_search_milliseconds"
+
+
+class ExperianValidationCacheConfig(massgov.pfml.util.pydantic.PydanticBaseSettings):
+    # Cached results older than this are validated again. 0 disables the cache.
+    cache_max_age_days: int = Field(30, ge=0)
+    # Most Experian searches made at once when prefetching
+    max_workers: int = Field(8, ge=1)
+
+    class Config:
+        env_prefix = "EXPERIAN_VALIDATION_"
+
+
+def normalize_search_text(search: str) -> str:
+    return SEARCH_TEXT_SEPARATORS.sub(" ", search).strip().upper()
+
+
+def search_request_hash(request: SearchRequest) -> str:
+    """Hash a search request, ignoring differences in case, spacing and punctuation."""
+    engine = (
+        request.engine.value if isinstance(request.engine, enum.Enum) else request.engine.json()
+    )
+    layout = request.layout.value if request.layout else None
+    key = json.dumps([engine, layout, request.country, normalize_search_text(request.search)])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class CachedClient(Client):
+    """Client that answers searches from the validation cache before calling Experian.
+
+    Usage::
+
+        cached_client = CachedClient(client, db_session, increment=step.increment)
+        cached_client.prefetch(requests)
+        response = cached_client.search(request)
+
+    prefetch() is optional. Searches that were not prefetched read the cache and call Experian one
+    at a time. New responses are added to db_session, so they are saved when it is committed.
+    Exceptions raised by Experian are not cached.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        db_session: db.Session,
+        config: Optional[ExperianValidationCacheConfig] = None,
+        increment: Optional[Callable[[str, int], None]] = None,
+    ):
+        if config is None:
+            config = ExperianValidationCacheConfig()
+
+        super().__init__(client._caller)
+        self.client = client
+        self.db_session = db_session
+        self.max_age: Optional[timedelta] = (
+            timedelta(days=config.cache_max_age_days) if config.cache_max_age_days else None
+        )
+        self.max_workers = config.max_workers
+        self._increment = increment
+        self._outcomes: Dict[str, SearchOutcome] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age is not None
+
+    def search(self, request: SearchRequest) -> SearchResponse:
+        address_hash = search_request_hash(request)
+
+        outcome = self._outcomes.get(address_hash)
+        if outcome is None:
+            response = self._get_cached_responses([address_hash]).get(address_hash)
+            if response is not None:
+                outcome = (response, None)
+            else:
+                outcome = self._record_search(address_hash, *self._timed_search(request))
+            self._outcomes[address_hash] = outcome
+
+        response, error = outcome
+        if error is not None:
+            raise error
+
+        return response  # type: ignore
+
+    def prefetch(self, requests: Iterable[SearchRequest]) -> None:
+        """Read the cached responses for the requests, and search Experian for the rest in parallel.
+
+        Experian is called from worker threads. The cache and the metrics are only updated on
+        the calling thread, after every search has finished.
+        """
+        requests_by_hash: Dict[str, SearchRequest] = {}
+        for request in requests:
+            address_hash = search_request_hash(request)
+            if address_hash not in self._outcomes:
+                requests_by_hash.setdefault(address_hash, request)
+
+        cached_responses = self._get_cached_responses(list(requests_by_hash.keys()))
+        for address_hash, response in cached_responses.items():
+            self._outcomes[address_hash] = (response, None)
+
+        misses = [
+            (address_hash, request)
+            for address_hash, request in requests_by_hash.items()
+            if address_hash not in cached_responses
+        ]
+
+        start_time = time.monotonic()
+        if misses:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(misses)),
+                thread_name_prefix="experian-search",
+            ) as executor:
+                results = list(executor.map(lambda miss: self._timed_search(miss[1]), misses))
+
+            for (address_hash, _), result in zip(misses, results):
+                self._outcomes[address_hash] = self._record_search(address_hash, *result)
+
+        logger.info(
+            "Prefetched Experian search responses",
+            extra={
+                "request_count": len(requests_by_hash),
+                "cache_hit_count": len(cached_responses),
+                "experian_search_count": len(misses),
+                "elapsed_seconds": round(time.monotonic() - start_time, 3),
+                "max_workers": self.max_workers,
+            },
+        )
+
+    def _get_cached_responses(self, address_hashes: List[str]) -> Dict[str, SearchResponse]:
+        if not self.enabled or not address_hashes:
+            return {}
+
+        cached_results: List[ExperianAddressValidationResult] = []
+        for i in range(0, len(address_hashes), CACHE_LOOKUP_CHUNK_SIZE):
+            chunk = address_hashes[i : i + CACHE_LOOKUP_CHUNK_SIZE]
+            cached_results.extend(
+                self.db_session.query(ExperianAddressValidationResult).filter(
+                    ExperianAddressValidationResult.address_hash.in_(chunk)
+                )
+            )
+
+        oldest_valid = utcnow() - self.max_age  # type: ignore
+        responses = {}
+        for cached_result in cached_results:
+            if cached_result.validated_at < oldest_valid:
+                self._record_metric(Metrics.EXPERIAN_CACHE_STALE_COUNT)
+                continue
+
+            responses[cached_result.address_hash] = SearchResponse.parse_obj(
+                cached_result.search_response
+            )
+
+        self._record_metric(Metrics.EXPERIAN_CACHE_HIT_COUNT, len(responses))
+        self._record_metric(Metrics.EXPERIAN_CACHE_MISS_COUNT, len(address_hashes) - len(responses))
+        newrelic.agent.record_custom_metric("Custom/Experian/ValidationCache/Hits", len(responses))
+        newrelic.agent.record_custom_metric(
+            "Custom/Experian/ValidationCache/Misses", len(address_hashes) - len(responses)
+        )
+
+        return responses
+
+    def _timed_search(
+        self, request: SearchRequest
+    ) -> Tuple[Optional[SearchResponse], Optional[Exception], float]:
+        start_time = time.monotonic()
+        try:
+            response = self.client.search(request)
+        except Exception as e:
+            return None, e, time.monotonic() - start_time
+
+        return response, None, time.monotonic() - start_time
+
+    def _record_search(
+        self,
+        address_hash: str,
+        response: Optional[SearchResponse],
+        error: Optional[Exception],
+        elapsed_seconds: float,
+    ) -> SearchOutcome:
+        self._record_metric(Metrics.EXPERIAN_SEARCH_COUNT)
+        self._record_metric(Metrics.EXPERIAN_SEARCH_MILLISECONDS, int(elapsed_seconds * 1000))
+        newrelic.agent.record_custom_metric("Custom/Experian/DoSearch/Latency", elapsed_seconds)
+
+        if response is not None and self.enabled:
+            self.db_session.merge(
+                ExperianAddressValidationResult(
+                    address_hash=address_hash,
+                    verify_level=response.verify_level.value,
+                    search_response=json.loads(response.json(by_alias=True)),
+                    validated_at=utcnow(),
+                )
+            )
+
+        return response, error
+
+    def _record_metric(self, metric: Metrics, value: int = 1) -> None:
+        if self._increment and value:
+            self._increment(metric.value, value)
@@ -31,7 +31,7 @@ import phonenumbers
 import smart_open
 from pydantic import BaseSettings, Field, PositiveInt
 from sqlalchemy import desc, func, or_
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, joinedload
 
 import massgov.pfml.db as db
 import massgov.pfml.util.csv as csv_util
@@ -77,6 +77,12 @@ class EligibilityFeedExportConfig(BaseSettings):
     employer_ids: str = Field(
         None, env="ELIGIBILITY_FEED_LIST_OF_EMPLOYER_IDS"
     )  # Applies to "list" mode only. Pass a list of employer Id's to process.
+    full_export_streaming: bool = Field(
+        False, env="ELIGIBILITY_FEED_FULL_EXPORT_STREAMING"
+    )  # Applies to "full" mode only. Use process_all_employers_streaming.
+    full_export_partition_count: Optional[PositiveInt] = Field(
+        None, env="ELIGIBILITY_FEED_FULL_EXPORT_PARTITION_COUNT"
+    )  # Applies to streaming "full" mode only. Defaults to twice the CPU count.
 
 
 DEFAULT_DATE = date(1753, 1, 1)
@@ -793,6 +799,206 @@ def process_all_employers(
     return report
 
 
+# The streaming full export splits employers into partitions by the last byte of
+# their (random) UUID, so there can be at most 256
+MAX_FULL_EXPORT_PARTITION_COUNT = 256
+
+
+def employer_partition_filter(employer_id_column: Any, partition: int, partition_count: int) -> Any:
+    return func.get_byte(func.uuid_send(employer_id_column), 15) % partition_count == partition
+
+
+def query_employer_employee_pairs_for_partition(
+    db_session: db.Session, partition: int, partition_count: int
+) -> "Query[Tuple[Employer, int, Optional[Employee]]]":
+    """Query every employer in a partition with each of its employees, ordered by employer.
+
+    Employees are those with any wages for the employer, as in query_employees_for_employer.
+    Employers without any employees are included once with an employee of None. Each row also
+    has the employer's position among all employers, used to pick its bundle directory.
+    """
+    employer_index = (
+        db_session.query(
+            Employer.employer_id,
+            (func.row_number().over(order_by=Employer.employer_id) - 1).label("employer_index"),
+        )
+    ).subquery()
+
+    employer_employee_pairs = (
+        db_session.query(WagesAndContributions.employer_id, WagesAndContributions.employee_id)
+        .filter(
+            employer_partition_filter(WagesAndContributions.employer_id, partition, partition_count)
+        )
+        .distinct()
+    ).subquery()
+
+    return (
+        db_session.query(Employer, employer_index.c.employer_index, Employee)
+        .join(employer_index, employer_index.c.employer_id == Employer.employer_id)
+        .outerjoin(
+            employer_employee_pairs,
+            employer_employee_pairs.c.employer_id == Employer.employer_id,
+        )
+        .outerjoin(Employee, Employee.employee_id == employer_employee_pairs.c.employee_id)
+        .filter(employer_partition_filter(Employer.employer_id, partition, partition_count))
+        .order_by(Employer.employer_id, Employee.employee_id)
+        .options(joinedload(Employee.tax_identifier))
+    )
+
+
+def process_employer_partition_worker(
+    config: EligibilityFeedExportConfig,
+    partition: int,
+    partition_count: int,
+    total_employers_count: int,
+) -> EligibilityFeedExportReport:
+    """Write the eligibility feed for every employer in one partition.
+
+    The employer and employee rows come from a single streamed query ordered by employer, and
+    each employer's file is written as soon as all of its rows have been read.
+    """
+    global db_session, fineos, output_transport_params
+
+    report = EligibilityFeedExportReport(start=utcnow().isoformat())
+
+    if not db_session or not fineos:
+        logger.error("Database session and FINEOS client not initialized for task")
+        raise RuntimeError("Database session and FINEOS client not initialized for task")
+
+    rows = query_employer_employee_pairs_for_partition(
+        db_session, partition, partition_count
+    ).yield_per(1000)
+
+    try:
+        for _employer_id, employer_rows in itertools.groupby(
+            rows, key=lambda row: row[0].employer_id
+        ):
+            group = list(employer_rows)
+            employer, employer_index, _ = group[0]
+            employees = [employee for _, _, employee in group if employee is not None]
+
+            report.employers_total_count += 1
+            status = write_employer_eligibility_file(
+                config, employer, employer_index, total_employers_count, employees
+            )
+
+            if status is TaskResultStatus.SUCCESS:
+                report.employers_success_count += 1
+                report.employee_and_employer_pairs_total_count += len(employees)
+            elif status is TaskResultStatus.SKIPPED:
+                report.employers_skipped_count += 1
+            else:
+                report.employers_error_count += 1
+    finally:
+        db_session.close()
+
+    report.end = utcnow().isoformat()
+    logger.info(
+        "Finished eligibility feed partition %i of %i",
+        partition + 1,
+        partition_count,
+        extra={"report": dataclasses.asdict(report)},
+    )
+    return report
+
+
+def write_employer_eligibility_file(
+    config: EligibilityFeedExportConfig,
+    employer: Employer,
+    employer_index: int,
+    total_employers_count: int,
+    employees: List[Employee],
+) -> TaskResultStatus:
+    try:
+        # Find FINEOS employer id using employer FEIN
+        fineos_employer_id = get_fineos_employer_id(cast(AbstractFINEOSClient, fineos), employer)
+        if fineos_employer_id is None:
+            logger.info(
+                "FINEOS employer id not in Portal DB. Continuing.",
+                extra={"account_key": employer.account_key},
+            )
+            return TaskResultStatus.SKIPPED
+
+        output_bundle_dir_path = determine_bundle_path(
+            config.output_directory_path,
+            employer_index,
+            total_employers_count,
+            total_bundles=config.bundle_count,
+        )
+
+        open_and_write_to_eligibility_file(
+            output_bundle_dir_path,
+            fineos_employer_id,
+            employer,
+            len(employees),
+            employees,
+            output_transport_params,
+        )
+        return TaskResultStatus.SUCCESS
+    except Exception:
+        logger.exception(
+            "Error creating employer export", extra={"employer_id": employer.employer_id}
+        )
+        return TaskResultStatus.ERROR
+
+
+def process_all_employers_streaming(
+    make_db_session: Callable[[], db.Session],
+    make_fineos_client: Callable[[], AbstractFINEOSClient],
+    make_fineos_boto_session: Callable[[EligibilityFeedExportConfig], boto3.Session],
+    config: EligibilityFeedExportConfig,
+) -> EligibilityFeedExportReport:
+    """Write the eligibility feed for all employers, one worker process per employer partition.
+
+    Produces the same files as process_all_employers, but instead of a task and several queries
+    per employer, each worker streams the employers and employees of its partition from one query.
+    """
+    start_time = utcnow()
+    report = EligibilityFeedExportReport(start=start_time.isoformat())
+
+    with db.session_scope(make_db_session(), close=True) as db_session:
+        employers_count = db_session.query(Employer.employer_id).count()
+
+    partition_count = config.full_export_partition_count or (os.cpu_count() or 1) * 2
+    partition_count = min(partition_count, MAX_FULL_EXPORT_PARTITION_COUNT)
+
+    logger.info(
+        "Starting streaming eligibility feeds generation for all employers",
+        extra={"employers_count": employers_count, "partition_count": partition_count},
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=partition_count,
+        initializer=process_all_worker_initializer,
+        initargs=(make_db_session, make_fineos_client, make_fineos_boto_session, config),
+    ) as executor:
+        futures = [
+            executor.submit(
+                process_employer_partition_worker,
+                config,
+                partition,
+                partition_count,
+                employers_count,
+            )
+            for partition in range(partition_count)
+        ]
+
+        for future in concurrent.futures.as_completed(futures):
+            partition_report = future.result()
+            report.employers_total_count += partition_report.employers_total_count
+            report.employers_success_count += partition_report.employers_success_count
+            report.employers_skipped_count += partition_report.employers_skipped_count
+            report.employers_error_count += partition_report.employers_error_count
+            report.employee_and_employer_pairs_total_count += (
+                partition_report.employee_and_employer_pairs_total_count
+            )
+
+    end_time = utcnow()
+    report.end = end_time.isoformat()
+
+    return report
+
+
 # Used by Prod Support to fix a small number of employers.
 # This method is not meant to be used for high volumes.
 def process_a_list_of_employers(
@@ -93,6 +93,10 @@ def main_with_return():
                 "If you intended to start task in this mode please provide a list of "
                 "employers to process in the ELIGIBILITY_FEED_LIST_OF_EMPLOYER_IDS environment variable."
             )
+    elif config.full_export_streaming:
+        process_result = eligibility_feed.process_all_employers_streaming(
+            make_db_session, make_fineos_client, make_fineos_boto_session, config
+        )
     else:
         process_result = eligibility_feed.process_all_employers(
             make_db_session, make_fineos_client, make_fineos_boto_session, config
@@ -2,9 +2,12 @@
 # FINEOS client - factory.
 #
 
-from typing import Optional
+import os
+import threading
+from typing import Dict, Optional, Tuple
 
 import oauthlib.oauth2
+import requests.adapters
 import requests_oauthlib
 
 import massgov.pfml.util.logging
@@ -24,31 +27,63 @@ class FINEOSClientConfig(massgov.pfml.util.pydantic.PydanticBaseSettings):
     oauth2_url: Optional[str]
     oauth2_client_id: Optional[str]
     oauth2_client_secret: Optional[str]
+    pool_connections: int = 10
+    pool_maxsize: int = 10
 
     class Config:
         env_prefix = "FINEOS_CLIENT_"
 
 
+# Real FINEOS clients are shared within a worker process so that the OAuth token and the pooled
+# keep-alive connections are reused across requests, instead of every call paying for a token
+# fetch and a new TLS handshake. Keyed by process ID as well as config, as connections must not be
+# shared with processes forked after a client was created.
+_shared_clients: Dict[Tuple, client.AbstractFINEOSClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
 def create_client(config: Optional[FINEOSClientConfig] = None) -> client.AbstractFINEOSClient:
     """Factory to create the right type of client object for the given configuration."""
     if config is None:
         config = FINEOSClientConfig()
 
     if config.customer_api_url:
-        backend = oauthlib.oauth2.BackendApplicationClient(client_id=config.oauth2_client_id)
-        oauth_session = requests_oauthlib.OAuth2Session(client=backend, scope="service-gateway/all")
-
-        return fineos_client.FINEOSClient(
-            integration_services_api_url=config.integration_services_api_url,
-            group_client_api_url=config.group_client_api_url,
-            customer_api_url=config.customer_api_url,
-            wscomposer_url=config.wscomposer_api_url,
-            wscomposer_user_id=config.wscomposer_user_id,
-            oauth2_url=config.oauth2_url,
-            client_id=config.oauth2_client_id,
-            client_secret=config.oauth2_client_secret,
-            oauth_session=oauth_session,
-        )
+        key = (os.getpid(), *sorted(config.dict().items()))
+        with _shared_clients_lock:
+            fineos = _shared_clients.get(key)
+            if fineos is None:
+                fineos = _create_fineos_client(config)
+                _shared_clients[key] = fineos
+        return fineos
     else:
         logger.warning("using mock FINEOS client")
         return mock_client.MockFINEOSClient()
+
+
+def clear_shared_clients() -> None:
+    """Drop the shared clients, so the next create_client() builds new ones from its config"""
+    with _shared_clients_lock:
+        _shared_clients.clear()
+
+
+def _create_fineos_client(config: FINEOSClientConfig) -> fineos_client.FINEOSClient:
+    backend = oauthlib.oauth2.BackendApplicationClient(client_id=config.oauth2_client_id)
+    oauth_session = requests_oauthlib.OAuth2Session(client=backend, scope="service-gateway/all")
+
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=config.pool_connections, pool_maxsize=config.pool_maxsize
+    )
+    oauth_session.mount("https://", adapter)
+    oauth_session.mount("http://", adapter)
+
+    return fineos_client.FINEOSClient(
+        integration_services_api_url=config.integration_services_api_url,
+        group_client_api_url=config.group_client_api_url,
+        customer_api_url=config.customer_api_url,
+        wscomposer_url=config.wscomposer_api_url,
+        wscomposer_user_id=config.wscomposer_user_id,
+        oauth2_url=config.oauth2_url,
+        client_id=config.oauth2_client_id,
+        client_secret=config.oauth2_client_secret,
+        oauth_session=oauth_session,
+    )
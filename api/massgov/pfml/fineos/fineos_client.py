@@ -6,6 +6,8 @@ import base64
 import datetime
 import json
 import os.path
+import threading
+import time
 import urllib.parse
 import xml.etree.ElementTree
 from decimal import Decimal
@@ -35,6 +37,10 @@ from . import client, exception, models
 logger = massgov.pfml.util.logging.get_logger(__name__)
 MILLISECOND = datetime.timedelta(milliseconds=1)
 
+# Get a new OAuth token this long before the current one expires, so that a request never starts
+# with a token that expires before it reaches FINEOS.
+OAUTH_TOKEN_REFRESH_MARGIN_SECONDS = 60
+
 # Failure messages that are expected and don't need to be logged or tracked as errors.
 EXPECTED_UNPROCESSABLE_ENTITY_FAILURES = {
     "encoded file data is mandatory",
@@ -98,6 +104,8 @@ class FINEOSClient(client.AbstractFINEOSClient):
     client_secret: str
     request_count: int
     oauth_session: Any
+    oauth_token_fetch_count: int
+    oauth_token_cache_hit_count: int
 
     def __init__(
         self,
@@ -121,6 +129,10 @@ class FINEOSClient(client.AbstractFINEOSClient):
         self.client_secret = client_secret
         self.oauth_session = oauth_session
         self.request_count = 0
+        self.oauth_token_fetch_count = 0
+        self.oauth_token_cache_hit_count = 0
+        self._oauth_token_expires_at: Optional[float] = None
+        self._oauth_token_lock = threading.Lock()
         logger.info(
             "customer_api_url %s, wscomposer_url %s, group_client_api_url %s, "
             "integration_services_api_url %s",
@@ -136,6 +148,34 @@ class FINEOSClient(client.AbstractFINEOSClient):
 
     def _init_oauth_session(self):
         """Set up an OAuth session and get a token."""
+        with self._oauth_token_lock:
+            self._fetch_oauth_token()
+
+    def _ensure_oauth_token(self) -> None:
+        """Reuse the current token, or get a new one if it is about to expire.
+
+        The client is shared by the threads of a worker process (see factory.create_client), so
+        only one of them fetches a replacement token while the others wait and then reuse it.
+        """
+        if self._oauth_token_is_fresh():
+            self.oauth_token_cache_hit_count += 1
+            newrelic.agent.record_custom_metric("Custom/FINEOS/OAuthToken/CacheHit", 1)
+            return
+
+        with self._oauth_token_lock:
+            # Another thread may have refreshed the token while this one waited for the lock
+            if self._oauth_token_is_fresh():
+                return
+            self._fetch_oauth_token()
+
+    def _oauth_token_is_fresh(self) -> bool:
+        return (
+            self._oauth_token_expires_at is not None
+            and time.time() < self._oauth_token_expires_at - OAUTH_TOKEN_REFRESH_MARGIN_SECONDS
+        )
+
+    def _fetch_oauth_token(self) -> None:
+        """Get a new token. Must be called with _oauth_token_lock held."""
         try:
             token = self.oauth_session.fetch_token(
                 token_url=self.oauth2_url,
@@ -150,6 +190,10 @@ class FINEOSClient(client.AbstractFINEOSClient):
         ) as ex:
             self._handle_client_side_exception("POST", self.oauth2_url, ex, "init_oauth_session")
 
+        self._oauth_token_expires_at = token["expires_at"]
+        self.oauth_token_fetch_count += 1
+        newrelic.agent.record_custom_metric("Custom/FINEOS/OAuthToken/Fetch", 1)
+
         logger.info(
             "POST %s => type %s, expires %is (at %s)",
             self.oauth2_url,
@@ -217,6 +261,8 @@ class FINEOSClient(client.AbstractFINEOSClient):
         #
         request_timeout = 29
 
+        self._ensure_oauth_token()
+
         try:
             try:
                 response = self.oauth_session.request(
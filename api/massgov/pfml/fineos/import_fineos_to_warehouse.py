@@ -6,6 +6,7 @@
 import argparse
 import os
 from datetime import datetime, timedelta
+from typing import List, Tuple
 
 from pydantic import BaseSettings, Field
 
@@ -196,6 +197,7 @@ def process_date(date, s3_fineos, fineos_s3_path, bi_warehouse_path, include_ful
     # Get files in remote S3. Top level files are todays extracts generated at 7pm EST.
     # The next day, FINEOS moves them into a folder when the next day is generated.
     all_fineos_extracts = massgov.pfml.util.files.list_files(fineos_s3_path, s3_fineos)
+    copies: List[Tuple[str, str]] = []
 
     # Get the full daily extracts we care about
     for fineos_extract in all_fineos_extracts:
@@ -217,7 +219,7 @@ def process_date(date, s3_fineos, fineos_s3_path, bi_warehouse_path, include_ful
                         logger.info("Copying %s to %s", source_file, dest_file)
 
                         # We knowingly overwrite the warehouse file to ensure all updated rows are included
-                        massgov.pfml.util.files.copy_file(source_file, dest_file)
+                        copies.append((source_file, dest_file))
 
             # Handle the extracts that need a YYYY/MM/DD folder structure.
             for daily_extract in fineos_warehouse_daily_extracts:
@@ -237,7 +239,9 @@ def process_date(date, s3_fineos, fineos_s3_path, bi_warehouse_path, include_ful
                     logger.info("Copying %s to %s", source_file, dest_file)
 
                     # In this case we do not overwrite and are able to use the date/time in the filename
-                    massgov.pfml.util.files.copy_file(source_file, dest_file)
+                    copies.append((source_file, dest_file))
+
+    massgov.pfml.util.files.copy_files(copies)
 
 
 # This is used to ensure the date arguments are correctly provided
@@ -1,9 +1,23 @@
+import itertools
+import uuid
 from dataclasses import dataclass
-from typing import List
+from typing import Any, Dict, Iterable, List, Type, Union
+
+from sqlalchemy.dialects.postgresql import insert
 
 import massgov.pfml.db as db
+from massgov.pfml.db.content_hash import content_hash, normalize_value
 from massgov.pfml.db.models.absences import AbsenceStatus
-from massgov.pfml.db.models.employees import Claim, Employee
+from massgov.pfml.db.models.employees import (
+    Claim,
+    DiaReductionPayment,
+    DuaReductionPayment,
+    Employee,
+)
+from massgov.pfml.util.datetime import utcnow
+
+# Number of payment rows sent per INSERT statement when loading agency payment lists
+REDUCTION_PAYMENT_INSERT_CHUNK_SIZE = 1000
 
 OUTBOUND_STATUSES = {
     AbsenceStatus.ADJUDICATION.absence_status_id,
@@ -35,3 +49,55 @@ def get_claimants_for_outbound(db_session: db.Session) -> List[Employee]:
         .filter(Claim.fineos_absence_status_id.in_(OUTBOUND_STATUSES))
         .all()
     )
+
+
+def insert_new_reduction_payments(
+    db_session: db.Session,
+    model: Union[Type[DuaReductionPayment], Type[DiaReductionPayment]],
+    rows: Iterable[Dict[str, Any]],
+    chunk_size: int = REDUCTION_PAYMENT_INSERT_CHUNK_SIZE,
+) -> int:
+    """Insert the payment rows that are not already in the table, and return how many were new.
+
+    Rows are normalized and deduplicated on the hash of their payment data, so a row that is
+    already in the table, or earlier in the same file, is skipped. A row that can not be
+    normalized raises an exception, and nothing is committed.
+    """
+    table = model.__table__
+    primary_key = table.primary_key.columns.values()[0].name
+    data_columns = [table.c[name] for name in model.payment_data_columns]
+
+    new_row_count = 0
+    rows_iter = iter(rows)
+    while chunk := list(itertools.islice(rows_iter, chunk_size)):
+        now = utcnow()
+        values = []
+        for row in chunk:
+            unknown_columns = row.keys() - set(model.payment_data_columns)
+            if unknown_columns:
+                raise ValueError("unknown payment columns: %s" % sorted(unknown_columns))
+
+            normalized = {
+                column.name: normalize_value(column, row.get(column.name))
+                for column in data_columns
+            }
+            values.append(
+                {
+                    **normalized,
+                    primary_key: uuid.uuid4(),
+                    "payment_data_hash": content_hash(
+                        table, model.payment_data_columns, normalized
+                    ),
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+
+        statement = (
+            insert(table)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=[table.c.payment_data_hash])
+        )
+        new_row_count += db_session.execute(statement).rowcount
+
+    return new_row_count
@@ -2,7 +2,7 @@ import csv
 import io
 import os
 import tempfile
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 
 import massgov.pfml.api.util.state_log_util as state_log_util
 import massgov.pfml.db as db
@@ -17,7 +17,11 @@ from massgov.pfml.db.models.employees import (
     State,
 )
 from massgov.pfml.delegated_payments.delegated_payments_util import move_file_and_update_ref_file
-from massgov.pfml.reductions.common import AgencyLoadResult, get_claimants_for_outbound
+from massgov.pfml.reductions.common import (
+    AgencyLoadResult,
+    get_claimants_for_outbound,
+    insert_new_reduction_payments,
+)
 from massgov.pfml.reductions.config import get_moveit_config, get_s3_config
 from massgov.pfml.util.batch.log import LogEntry
 from massgov.pfml.util.datetime import get_now_us_eastern
@@ -325,35 +329,16 @@ def _convert_dict_with_csv_keys_to_db_keys(csv_data: Dict[str, Any]) -> Dict[str
     }
 
 
-def _get_matching_dia_reduction_payments(
-    db_data: Dict[str, Any], db_session: db.Session
-) -> List[DiaReductionPayment]:
-    # https://stackoverflow.com/questions/7604967/sqlalchemy-build-query-filter-dynamically-from-dict
-    query = db_session.query(DiaReductionPayment)
-    for attr, value in db_data.items():
-        # Empty fields are read as empty strings. Convert those values to nulls for the database.
-        if value == "":
-            value = None
-
-        query = query.filter(getattr(DiaReductionPayment, attr) == value)
-
-    return query.all()
-
-
 def _load_new_rows_from_file(file: io.StringIO, db_session: db.Session) -> Tuple[int, int]:
-    rows = csv.DictReader(file, fieldnames=Constants.PAYMENT_LIST_FIELDS)
-
-    new_row_count = 0
     total_row_count = 0
 
-    for row in rows:
-        total_row_count += 1
-        db_data = _convert_dict_with_csv_keys_to_db_keys(row)
-        if len(_get_matching_dia_reduction_payments(db_data, db_session)) == 0:
-            dia_reduction_payment = DiaReductionPayment(**db_data)
-            db_session.add(dia_reduction_payment)
+    def db_rows() -> Iterator[Dict[str, Any]]:
+        nonlocal total_row_count
+        for row in csv.DictReader(file, fieldnames=Constants.PAYMENT_LIST_FIELDS):
+            total_row_count += 1
+            yield _convert_dict_with_csv_keys_to_db_keys(row)
 
-            new_row_count += 1
+    new_row_count = insert_new_reduction_payments(db_session, DiaReductionPayment, db_rows())
 
     return new_row_count, total_row_count
 
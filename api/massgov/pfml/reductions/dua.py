@@ -5,7 +5,7 @@ import pathlib
 import re
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import massgov.pfml.api.util.state_log_util as state_log_util
 import massgov.pfml.db as db
@@ -23,7 +23,11 @@ from massgov.pfml.db.models.employees import (
     State,
 )
 from massgov.pfml.delegated_payments.delegated_payments_util import move_file_and_update_ref_file
-from massgov.pfml.reductions.common import AgencyLoadResult, get_claimants_for_outbound
+from massgov.pfml.reductions.common import (
+    AgencyLoadResult,
+    get_claimants_for_outbound,
+    insert_new_reduction_payments,
+)
 from massgov.pfml.reductions.config import get_moveit_config, get_s3_config
 from massgov.pfml.util.datetime import get_now_us_eastern, utcnow
 from massgov.pfml.util.files import create_csv_from_list, upload_to_s3
@@ -330,39 +334,19 @@ def _convert_dict_with_csv_keys_to_db_keys(csv_data: Dict[str, Any]) -> Dict[str
     }
 
 
-def _get_matching_dua_reduction_payments(
-    db_data: Dict[str, Any], db_session: db.Session
-) -> List[DuaReductionPayment]:
-    # https://stackoverflow.com/questions/7604967/sqlalchemy-build-query-filter-dynamically-from-dict
-    query = db_session.query(DuaReductionPayment)
-    for attr, value in db_data.items():
-        # Empty fields are read as empty strings. Convert those values to nulls for the database.
-        if value == "":
-            value = None
-
-        query = query.filter(getattr(DuaReductionPayment, attr) == value)
-
-    return query.all()
-
-
 def _load_new_rows_from_file(file: io.StringIO, db_session: db.Session) -> Tuple[int, int]:
-    new_row_count = 0
     total_row_count = 0
 
-    for row in csv.DictReader(file):
-        total_row_count += 1
-        db_data = _convert_dict_with_csv_keys_to_db_keys(row)
-        if len(_get_matching_dua_reduction_payments(db_data, db_session)) == 0:
-            dua_reduction_payment = DuaReductionPayment(**db_data)
-            db_session.add(dua_reduction_payment)
+    def db_rows() -> Iterator[Dict[str, Any]]:
+        nonlocal total_row_count
+        for row in csv.DictReader(file):
+            total_row_count += 1
+            yield _convert_dict_with_csv_keys_to_db_keys(row)
 
-            new_row_count += 1
+    new_row_count = insert_new_reduction_payments(db_session, DuaReductionPayment, db_rows())
 
     return new_row_count, total_row_count
 
-    # Commit these changes to the database after we've updated the ReferenceFile's file_location
-    # in the calling code.
-
 
 def download_payment_list_from_moveit(db_session: db.Session, log_entry: batch_log.LogEntry) -> int:
     s3_config = get_s3_config()
@@ -0,0 +1,100 @@
+#
+# Deliver the messages in the ServiceNow outbox.
+#
+# By default, sends every message that is due and exits, for running on a schedule. With
+# --poll-seconds, keeps running and checks for new messages at that interval.
+#
+
+import argparse
+import sys
+import time
+from typing import List
+
+import massgov.pfml.util.logging as logging
+from massgov.pfml import db
+from massgov.pfml.servicenow import outbox
+from massgov.pfml.servicenow.abstract_client import AbstractServiceNowClient
+from massgov.pfml.servicenow.factory import create_client
+from massgov.pfml.util.batch import log
+from massgov.pfml.util.bg import background_task
+
+logger = logging.get_logger(__name__)
+
+
+class Metrics:
+    QUEUE_DEPTH = "queue_depth"
+    DELIVERED_COUNT = "delivered_count"
+    RETRY_COUNT = "retry_count"
+    FAILED_COUNT = "failed_count"
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Deliver the messages in the ServiceNow outbox")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=outbox.DELIVERY_BATCH_SIZE,
+        help="Messages claimed and sent at a time",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=outbox.DELIVERY_MAX_WORKERS,
+        help="Messages sent to ServiceNow at once",
+    )
+    parser.add_argument(
+        "--poll-seconds",
+        type=float,
+        default=None,
+        help="Keep running, checking for messages at this interval",
+    )
+    return parser.parse_args(args)
+
+
+@background_task("service-now-deliver-outbox")
+def main():
+    args = parse_args(sys.argv[1:])
+    service_now_client = create_client()
+
+    with db.session_scope(db.init(), close=True) as db_session, db.session_scope(
+        db.init(), close=True
+    ) as log_entry_db_session:
+        while True:
+            with log.LogEntry(log_entry_db_session, "ServiceNowDeliverOutbox") as log_entry:
+                deliver_outbox(
+                    db_session, service_now_client, log_entry, args.batch_size, args.max_workers
+                )
+
+            if args.poll_seconds is None:
+                break
+
+            # Only start another import log once there is something to deliver
+            while True:
+                time.sleep(args.poll_seconds)
+                due_count = outbox.get_queue_depth(db_session, due_only=True)
+                db_session.commit()
+                if due_count:
+                    break
+
+
+def deliver_outbox(
+    db_session: db.Session,
+    service_now_client: AbstractServiceNowClient,
+    log_entry: log.LogEntry,
+    batch_size: int = outbox.DELIVERY_BATCH_SIZE,
+    max_workers: int = outbox.DELIVERY_MAX_WORKERS,
+) -> outbox.DeliveryResult:
+    log_entry.set_metrics({Metrics.QUEUE_DEPTH: outbox.record_queue_depth(db_session)})
+
+    result = outbox.drain(db_session, service_now_client, batch_size, max_workers)
+
+    log_entry.set_metrics(
+        {
+            Metrics.DELIVERED_COUNT: result.delivered_count,
+            Metrics.RETRY_COUNT: result.retry_count,
+            Metrics.FAILED_COUNT: result.failed_count,
+        }
+    )
+
+    logger.info("Delivered ServiceNow outbox", extra={"Metrics": log_entry.metrics})
+    return result
@@ -0,0 +1,249 @@
+#
+# ServiceNow outbox - messages stored in the database and delivered later.
+#
+# Sending a message to ServiceNow is a blocking HTTP request. Instead of sending it while handling
+# an API request, the message can be added to service_now_outbox_message and sent by a delivery
+# worker (see deliver_outbox.py). The worker claims pending messages in batches with
+# SELECT ... FOR UPDATE SKIP LOCKED, so more than one worker can run at once, and retries failed
+# messages with exponential backoff.
+#
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple, cast
+from uuid import UUID
+
+import newrelic.agent
+from sqlalchemy import func
+
+import massgov.pfml.util.logging as logging
+from massgov.pfml import db
+from massgov.pfml.db.models.applications import ServiceNowOutboxMessage
+from massgov.pfml.util.datetime import utcnow
+
+from . import abstract_client, exception, models
+
+logger = logging.get_logger(__name__)
+
+# Table that notification messages are sent to
+DEFAULT_TABLE_NAME = "u_cps_notifications"
+
+# Messages claimed and sent by one call to deliver_batch()
+DELIVERY_BATCH_SIZE = 50
+
+# Messages sent at once within a batch
+DELIVERY_MAX_WORKERS = 4
+
+# Attempts made before a message is marked as failed
+MAX_ATTEMPTS = 8
+
+# Delay before the first retry, doubled for each attempt after that
+BACKOFF_BASE = timedelta(seconds=30)
+
+# Longest delay between attempts
+BACKOFF_MAX = timedelta(hours=1)
+
+
+@dataclass
+class DeliveryResult:
+    delivered_count: int = 0
+    retry_count: int = 0
+    failed_count: int = 0
+
+    @property
+    def claimed_count(self) -> int:
+        return self.delivered_count + self.retry_count + self.failed_count
+
+
+def enqueue_message(
+    db_session: db.Session,
+    message: models.OutboundMessage,
+    notification_id: Optional[UUID] = None,
+    table_name: str = DEFAULT_TABLE_NAME,
+) -> ServiceNowOutboxMessage:
+    """Add a message to the outbox. It is sent once db_session is committed."""
+    outbox_message = ServiceNowOutboxMessage(
+        notification_id=notification_id,
+        table_name=table_name,
+        message=json.loads(message.json()),
+        attempt_count=0,
+        next_attempt_at=utcnow(),
+    )
+    db_session.add(outbox_message)
+    return outbox_message
+
+
+def get_queue_depth(db_session: db.Session, due_only: bool = False) -> int:
+    """Count the pending messages, including ones waiting for a retry unless due_only is set."""
+    query = db_session.query(
+        func.count(ServiceNowOutboxMessage.service_now_outbox_message_id)
+    ).filter(
+        ServiceNowOutboxMessage.delivered_at.is_(None), ServiceNowOutboxMessage.failed_at.is_(None)
+    )
+    if due_only:
+        query = query.filter(ServiceNowOutboxMessage.next_attempt_at <= utcnow())
+
+    return query.scalar()
+
+
+def record_queue_depth(db_session: db.Session) -> int:
+    queue_depth = get_queue_depth(db_session)
+    newrelic.agent.record_custom_metric("Custom/ServiceNowOutbox/QueueDepth", queue_depth)
+    return queue_depth
+
+
+def backoff_delay(attempt_count: int) -> timedelta:
+    """Delay before the next attempt, after attempt_count failed attempts."""
+    return min(BACKOFF_BASE * (2 ** (attempt_count - 1)), BACKOFF_MAX)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether a failed send may succeed later.
+
+    ServiceNow rejecting the message with a 4xx status will not change on a retry. Anything else,
+    such as ServiceNow being unavailable or the connection failing, may.
+    """
+    if isinstance(error, exception.ServiceNowUnavailable):
+        return True
+
+    if isinstance(error, exception.ServiceNowError) and error.response_status is not None:
+        return not (400 <= error.response_status < 500)
+
+    return True
+
+
+def deliver_batch(
+    db_session: db.Session,
+    service_now_client: abstract_client.AbstractServiceNowClient,
+    batch_size: int = DELIVERY_BATCH_SIZE,
+    max_workers: int = DELIVERY_MAX_WORKERS,
+) -> DeliveryResult:
+    """Claim up to batch_size pending messages that are due, send them, and commit the outcome.
+
+    The messages stay locked until the commit, so other workers skip them.
+    """
+    now = utcnow()
+    outbox_messages: List[ServiceNowOutboxMessage] = (
+        db_session.query(ServiceNowOutboxMessage)
+        .filter(
+            ServiceNowOutboxMessage.delivered_at.is_(None),
+            ServiceNowOutboxMessage.failed_at.is_(None),
+            ServiceNowOutboxMessage.next_attempt_at <= now,
+        )
+        .order_by(ServiceNowOutboxMessage.next_attempt_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+    result = DeliveryResult()
+    if not outbox_messages:
+        db_session.commit()
+        return result
+
+    sends = [
+        (models.OutboundMessage.parse_obj(outbox_message.message), outbox_message.table_name)
+        for outbox_message in outbox_messages
+    ]
+
+    # Only the parsed messages are passed to the worker threads, never the session
+    def send_message(
+        send_args: Tuple[models.OutboundMessage, str]
+    ) -> Tuple[Optional[Exception], float]:
+        message, table_name = send_args
+        start_time = time.monotonic()
+        try:
+            service_now_client.send_message(message, table=table_name)
+        except Exception as error:
+            return error, time.monotonic() - start_time
+        return None, time.monotonic() - start_time
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(sends)), thread_name_prefix="service-now-outbox"
+    ) as executor:
+        outcomes = list(executor.map(send_message, sends))
+
+    finished_at = utcnow()
+    for outbox_message, (error, elapsed_seconds) in zip(outbox_messages, outcomes):
+        outbox_message.attempt_count += 1
+        newrelic.agent.record_custom_metric("Custom/ServiceNowOutbox/SendLatency", elapsed_seconds)
+
+        log_attributes: Dict[str, Any] = {
+            "service_now_outbox_message_id": str(outbox_message.service_now_outbox_message_id),
+            "notification_id": str(outbox_message.notification_id),
+            "absence_case_id": cast(Dict[str, Any], outbox_message.message).get("u_absence_id"),
+            "attempt_count": outbox_message.attempt_count,
+        }
+
+        if error is None:
+            outbox_message.delivered_at = finished_at
+            outbox_message.last_error = None
+            result.delivered_count += 1
+
+            delivery_latency = (finished_at - outbox_message.created_at).total_seconds()
+            newrelic.agent.record_custom_metric(
+                "Custom/ServiceNowOutbox/DeliveryLatency", delivery_latency
+            )
+            logger.info(
+                "Delivered ServiceNow outbox message",
+                extra={**log_attributes, "delivery_latency_seconds": delivery_latency},
+            )
+            continue
+
+        outbox_message.last_error = str(error)
+        if is_retryable(error) and outbox_message.attempt_count < MAX_ATTEMPTS:
+            outbox_message.next_attempt_at = finished_at + backoff_delay(
+                outbox_message.attempt_count
+            )
+            result.retry_count += 1
+            logger.warning(
+                "Failed to deliver ServiceNow outbox message, will retry",
+                extra={**log_attributes, "next_attempt_at": outbox_message.next_attempt_at},
+                exc_info=error,
+            )
+        else:
+            outbox_message.failed_at = finished_at
+            result.failed_count += 1
+            logger.error(
+                "Failed to deliver ServiceNow outbox message, giving up",
+                extra=log_attributes,
+                exc_info=error,
+            )
+            newrelic.agent.record_custom_event(
+                "ServiceNowOutboxFailure",
+                {
+                    **log_attributes,
+                    "error.class": type(error).__name__,
+                    "error.message": str(error),
+                },
+            )
+
+    db_session.commit()
+
+    newrelic.agent.record_custom_metric("Custom/ServiceNowOutbox/Delivered", result.delivered_count)
+    newrelic.agent.record_custom_metric("Custom/ServiceNowOutbox/Retried", result.retry_count)
+    newrelic.agent.record_custom_metric("Custom/ServiceNowOutbox/Failed", result.failed_count)
+
+    return result
+
+
+def drain(
+    db_session: db.Session,
+    service_now_client: abstract_client.AbstractServiceNowClient,
+    batch_size: int = DELIVERY_BATCH_SIZE,
+    max_workers: int = DELIVERY_MAX_WORKERS,
+) -> DeliveryResult:
+    """Deliver batches until no pending message is due."""
+    total = DeliveryResult()
+
+    while True:
+        result = deliver_batch(db_session, service_now_client, batch_size, max_workers)
+        total.delivered_count += result.delivered_count
+        total.retry_count += result.retry_count
+        total.failed_count += result.failed_count
+
+        if result.claimed_count < batch_size:
+            return total
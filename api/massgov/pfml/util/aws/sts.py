@@ -1,7 +1,24 @@
-from typing import Optional
+import threading
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import boto3
 import boto3_extensions
+import botocore
+import botocore.session
+from botocore.credentials import RefreshableCredentials
+
+import massgov.pfml.util.logging as logging
+from massgov.pfml.util.datetime import utcnow
+
+logger = logging.get_logger(__name__)
+
+# Requested lifetime of assumed role credentials
+ASSUME_ROLE_DURATION = timedelta(hours=1)
+
+# Assume the role again this long before the current credentials expire
+REFRESH_BEFORE_EXPIRY = timedelta(minutes=5)
 
 
 def assume_session(
@@ -19,3 +36,235 @@ def assume_session(
     )
 
     return session
+
+
+# (role_arn, role_session_name, external_id, region_name)
+RoleKey = Tuple[str, str, Optional[str], Optional[str]]
+
+
+class AssumedRoleCredentials(RefreshableCredentials):
+    """Credentials for an assumed role that assume it again refresh_before_expiry before they
+    expire.
+
+    botocore refreshes them as they are used, so clients made with them can be kept for longer
+    than the credentials last.
+    """
+
+    def __init__(self, refresh_before_expiry: timedelta, **kwargs: Any):
+        super().__init__(**kwargs)
+        # Every refresh blocks until it's done, rather than botocore's default of carrying on with
+        # the old credentials for a while when another thread is already refreshing them
+        self._advisory_refresh_timeout = int(refresh_before_expiry.total_seconds())
+        self._mandatory_refresh_timeout = self._advisory_refresh_timeout
+
+
+@dataclass
+class AssumedRole:
+    session: boto3.Session
+    credentials: AssumedRoleCredentials
+    # Clients made from the session, by (service name, bucket name)
+    clients: Dict[Tuple[str, str], botocore.client.BaseClient] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class SessionRegistryStats:
+    hit_count: int = 0
+    miss_count: int = 0
+    refresh_count: int = 0
+
+
+def create_sts_client(region_name: Optional[str]) -> botocore.client.BaseClient:
+    return boto3.client("sts", region_name=region_name)
+
+
+class AssumedRoleSessionRegistry:
+    """Clients for assumed roles, shared across calls and threads.
+
+    Each role is assumed once, and its session and clients reused for the life of the process.
+    The session's credentials assume the role again shortly before they expire, so a client keeps
+    working however long it is held.
+
+    Unlike assume_session(), which runs an AssumeRole for every new session, this only calls STS
+    once per role per credential lifetime.
+    """
+
+    def __init__(
+        self,
+        sts_client_factory: Callable[
+            [Optional[str]], botocore.client.BaseClient
+        ] = create_sts_client,
+        duration: timedelta = ASSUME_ROLE_DURATION,
+        refresh_before_expiry: timedelta = REFRESH_BEFORE_EXPIRY,
+        now: Callable[[], datetime] = utcnow,
+    ):
+        self.sts_client_factory = sts_client_factory
+        self.duration = duration
+        self.refresh_before_expiry = refresh_before_expiry
+        self.now = now
+        self.stats = SessionRegistryStats()
+        self._roles: Dict[RoleKey, AssumedRole] = {}
+        self._role_locks: Dict[RoleKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_client(
+        self,
+        service_name: str,
+        bucket_name: str,
+        role_arn: str,
+        role_session_name: str,
+        external_id: Optional[str] = None,
+        region_name: Optional[str] = None,
+    ) -> botocore.client.BaseClient:
+        """Get a client for the service under the assumed role, reusing one made earlier."""
+        role_key: RoleKey = (role_arn, role_session_name, external_id, region_name)
+        assumed_role = self._get_assumed_role(role_key)
+
+        # boto3 sessions are not thread safe, so clients are made from them one at a time
+        with assumed_role.lock:
+            client_key = (service_name, bucket_name)
+            client = assumed_role.clients.get(client_key)
+            if client is None:
+                client = assumed_role.session.client(service_name)
+                assumed_role.clients[client_key] = client
+
+        return client
+
+    def get_session(
+        self,
+        role_arn: str,
+        role_session_name: str,
+        external_id: Optional[str] = None,
+        region_name: Optional[str] = None,
+    ) -> boto3.Session:
+        """Get the session for the assumed role, which refreshes its own credentials."""
+        role_key: RoleKey = (role_arn, role_session_name, external_id, region_name)
+        return self._get_assumed_role(role_key).session
+
+    def clear(self) -> None:
+        with self._lock:
+            self._roles.clear()
+            self._role_locks.clear()
+            self.stats = SessionRegistryStats()
+
+    def _get_assumed_role(self, role_key: RoleKey) -> AssumedRole:
+        with self._lock:
+            assumed_role = self._roles.get(role_key)
+            if assumed_role:
+                self.stats.hit_count += 1
+                return assumed_role
+
+            role_lock = self._role_locks.setdefault(role_key, threading.Lock())
+
+        # Only one thread assumes a given role at a time. The others wait here, then find the new
+        # session in place.
+        with role_lock:
+            with self._lock:
+                assumed_role = self._roles.get(role_key)
+                if assumed_role:
+                    self.stats.hit_count += 1
+                    return assumed_role
+
+            metadata = self._assume_role(role_key, is_refresh=False)
+            credentials = AssumedRoleCredentials(
+                refresh_before_expiry=self.refresh_before_expiry,
+                access_key=metadata["access_key"],
+                secret_key=metadata["secret_key"],
+                token=metadata["token"],
+                expiry_time=datetime.fromisoformat(metadata["expiry_time"]),
+                refresh_using=lambda: self._assume_role(role_key, is_refresh=True),
+                method="sts-assume-role",
+                time_fetcher=self.now,
+            )
+
+            # Sessions can't be given refreshable credentials directly, only through botocore
+            botocore_session = botocore.session.get_session()
+            botocore_session._credentials = credentials
+            session = boto3.Session(botocore_session=botocore_session, region_name=role_key[3])
+
+            assumed_role = AssumedRole(session=session, credentials=credentials)
+            with self._lock:
+                self._roles[role_key] = assumed_role
+
+            return assumed_role
+
+    def _assume_role(self, role_key: RoleKey, is_refresh: bool) -> Dict[str, Any]:
+        """Assume the role, and return its credentials in the form RefreshableCredentials takes"""
+        role_arn, role_session_name, external_id, region_name = role_key
+
+        assume_role_args: Dict[str, Any] = {
+            "RoleArn": role_arn,
+            "RoleSessionName": role_session_name,
+            "DurationSeconds": int(self.duration.total_seconds()),
+        }
+        if external_id:
+            assume_role_args["ExternalId"] = external_id
+
+        sts_client = self.sts_client_factory(region_name)
+        credentials = sts_client.assume_role(**assume_role_args)["Credentials"]
+
+        with self._lock:
+            if is_refresh:
+                self.stats.refresh_count += 1
+            else:
+                self.stats.miss_count += 1
+            stats = replace(self.stats)
+
+        logger.info(
+            "Assumed role",
+            extra={
+                "role_arn": role_arn,
+                "role_session_name": role_session_name,
+                "expiration": credentials["Expiration"].isoformat(),
+                "is_refresh": is_refresh,
+                "hit_count": stats.hit_count,
+                "miss_count": stats.miss_count,
+                "refresh_count": stats.refresh_count,
+            },
+        )
+
+        return {
+            "access_key": credentials["AccessKeyId"],
+            "secret_key": credentials["SecretAccessKey"],
+            "token": credentials["SessionToken"],
+            "expiry_time": credentials["Expiration"].isoformat(),
+        }
+
+
+class MockSTSClient:
+    """Stand-in for the boto3 STS client that hands out fake credentials.
+
+    Credentials expire DurationSeconds after now(), so expiry and refresh can be tested by moving the
+    clock.
+    """
+
+    def __init__(self, now: Callable[[], datetime] = utcnow):
+        self.now = now
+        self.assume_role_calls: list = []
+
+    def assume_role(self, RoleArn, RoleSessionName, DurationSeconds=3600, ExternalId=None):
+        self.assume_role_calls.append(
+            {"RoleArn": RoleArn, "RoleSessionName": RoleSessionName, "ExternalId": ExternalId}
+        )
+        call_number = len(self.assume_role_calls)
+
+        return {
+            "Credentials": {
+                "AccessKeyId": f"ASIAMOCK{call_number:012d}",
+                "SecretAccessKey": "mock-secret-access-key",
+                "SessionToken": f"mock-session-token-{call_number}",
+                "Expiration": self.now() + timedelta(seconds=DurationSeconds),
+            },
+            "AssumedRoleUser": {
+                "AssumedRoleId": f"AROAMOCK:{RoleSessionName}",
+                "Arn": f"{RoleArn}/{RoleSessionName}",
+            },
+        }
+
+
+# Shared by everything in the process that reads from cross-account buckets
+_registry = AssumedRoleSessionRegistry()
+
+
+def get_session_registry() -> AssumedRoleSessionRegistry:
+    return _registry
@@ -1,9 +1,13 @@
 # Utilities for gating user access to features
 
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+import botocore.exceptions
+import newrelic.agent
 import yaml
 
 import massgov.pfml.util.files as file_utils
@@ -35,32 +39,120 @@ class FeaturesCache:
            - /employers/*
         start: "2021-06-19 17:00:00-04"
         end: "2021-06-19 18:00:00-04"
+
+    When the TTL expires the file is reloaded on the calling thread, or, with
+    background_refresh, on a separate thread while callers keep using the
+    previous mapping. For files on S3 the ETag and Last-Modified of the object
+    are checked first, and the file is only downloaded and parsed if they changed.
     """
 
-    def __init__(self, file_path: str, ttl: int):
+    def __init__(self, file_path: str, ttl: int, background_refresh: bool = False):
         self.file_path = file_path.strip()
         self.ttl = timedelta(seconds=ttl)
-        self.expiry = datetime.now() + self.ttl
+        self.background_refresh = background_refresh
+        self._file_version: Optional[Tuple[Any, ...]] = None
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+        self._file_version = self._get_file_version()
         self._features_mapping = self._load_features_mapping()
+        self.expiry = datetime.now() + self.ttl
 
     def features_mapping(self) -> Dict[str, Feature]:
-        if datetime.now() >= self.expiry:
-            self._features_mapping = self._load_features_mapping()
-            self.expiry = datetime.now() + self.ttl
+        self._refresh_if_expired()
         return self._features_mapping
 
     def check_enabled(self, name: str) -> bool:
         """
         Check if the feature is currently enabled.
         """
-        if datetime.now() >= self.expiry:
-            self._features_mapping = self._load_features_mapping()
-            self.expiry = datetime.now() + self.ttl
+        self._refresh_if_expired()
         feature = self._features_mapping.get(name, None)
         if feature is None:
             return False
         return bool(feature.enabled)
 
+    def _refresh_if_expired(self) -> None:
+        if datetime.now() < self.expiry:
+            return
+
+        if not self.background_refresh:
+            with self._refresh_lock:
+                # Another thread may have refreshed while this one waited for the lock
+                if datetime.now() >= self.expiry:
+                    self._refresh()
+            return
+
+        # Stale while revalidate: start a refresh unless one is already running, and carry on
+        # with the current mapping
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_in_background, name="features-cache-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self._refresh()
+        except Exception:
+            logger.exception(
+                "Error refreshing features in background", extra={"file_path": self.file_path}
+            )
+            # Try again at the next TTL rather than on every call
+            self.expiry = datetime.now() + self.ttl
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self) -> None:
+        """Reload the features file if it changed, then reset the TTL.
+
+        The new mapping is built completely before it replaces the old one, so readers on other
+        threads see either the old or the new mapping and never a partial one.
+        """
+        start_time = time.monotonic()
+
+        file_version = self._get_file_version()
+        changed = file_version is None or file_version != self._file_version
+        if changed:
+            self._features_mapping = self._load_features_mapping()
+            self._file_version = file_version
+
+        self.expiry = datetime.now() + self.ttl
+
+        refresh_seconds = time.monotonic() - start_time
+        newrelic.agent.record_custom_metric("Custom/FeaturesCache/RefreshSeconds", refresh_seconds)
+        logger.info(
+            "Refreshed features",
+            extra={
+                "file_path": self.file_path,
+                "changed": changed,
+                "refresh_seconds": round(refresh_seconds, 3),
+            },
+        )
+
+    def _get_file_version(self) -> Optional[Tuple[Any, ...]]:
+        """Get the ETag and Last-Modified of a features file on S3.
+
+        None means the version is unknown and the file should always be reloaded, which is the
+        case for local files (cheap to read) and for any error checking the object.
+        """
+        if not file_utils.is_s3_path(self.file_path):
+            return None
+
+        bucket, key = file_utils.split_s3_url(self.file_path)
+        try:
+            head = file_utils.get_s3_client(bucket).head_object(Bucket=bucket, Key=key)
+        except botocore.exceptions.ClientError:
+            logger.warning(
+                "Could not check features file version",
+                extra={"file_path": self.file_path},
+            )
+            return None
+
+        return (head.get("ETag"), head.get("LastModified"))
+
     def _load_features_mapping(self) -> Dict[str, Feature]:
         """
         This loads the features from the YAML file and is intended to be
@@ -8,7 +8,11 @@ import os
 import pathlib
 import shutil
 import tempfile
-from typing import Dict, Iterable, List, Optional, Sequence
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 import boto3
@@ -16,6 +20,7 @@ import botocore
 import ebcdic  # noqa: F401
 import paramiko
 import smart_open
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 
 import massgov.pfml.util.aws.sts as aws_sts
@@ -26,6 +31,28 @@ logger = logging.get_logger(__name__)
 EBCDIC_ENCODING = "cp1140"  # See https://pypi.org/project/ebcdic/ for further details
 FINEOS_BUCKET_PREFIX = "fin-som"
 
+# Objects larger than this are copied in parts, several at a time
+S3_MULTIPART_COPY_THRESHOLD = 128 * 1024 * 1024
+
+# Size of each part of a multipart copy
+S3_MULTIPART_COPY_CHUNKSIZE = 64 * 1024 * 1024
+
+# Parts of one object copied at a time
+S3_COPY_MAX_CONCURRENCY = 10
+
+# Files copied at a time by copy_files() and rename_files()
+COPY_FILES_MAX_WORKERS = 8
+
+# Streamed copies hold each part in memory until it's uploaded, so they use smaller parts, fewer
+# at a time, than copies S3 makes itself. Each stream holds at most
+# S3_STREAM_CHUNKSIZE * S3_STREAM_MAX_CONCURRENCY bytes.
+S3_STREAM_CHUNKSIZE = 8 * 1024 * 1024
+S3_STREAM_MAX_CONCURRENCY = 2
+
+# Streamed copies running at a time across every copy_files() worker in the process
+S3_MAX_CONCURRENT_STREAMS = 4
+_s3_stream_slots = threading.BoundedSemaphore(S3_MAX_CONCURRENT_STREAMS)
+
 
 def is_s3_path(path):
     return path.startswith("s3://")
@@ -79,13 +106,17 @@ def get_s3_client(
     elif bucket_name.startswith(FINEOS_BUCKET_PREFIX):
         # This should get passed in from the method but getting it
         # directly from the environment due to time constraints.
-        fineos_boto_session = aws_sts.assume_session(
+        #
+        # The assumed role is shared by every call in the process, so this only goes to STS when
+        # the role's credentials are about to expire.
+        return aws_sts.get_session_registry().get_client(
+            "s3",
+            bucket_name,
             role_arn=os.environ["FINEOS_AWS_IAM_ROLE_ARN"],
             external_id=os.environ["FINEOS_AWS_IAM_ROLE_EXTERNAL_ID"],
             role_session_name="payments_copy_file",
             region_name="us-east-1",
         )
-        return fineos_boto_session.client("s3")
     else:
         return boto3.client("s3")
 
@@ -239,67 +270,205 @@ def list_s3_files_and_directories_by_level(
     return contents_by_level
 
 
-def copy_file(source, destination):
-    logger.info(f"Copying file from {source} to {destination}")
-    is_source_s3 = is_s3_path(source)
-    is_dest_s3 = is_s3_path(destination)
+@dataclass
+class CopyResult:
+    file_count: int = 0
+    size_bytes: int = 0
+    elapsed_seconds: float = 0.0
 
-    # This isn't a download or upload method
-    # Don't allow "copying" between mismatched locations
-    if is_source_s3 != is_dest_s3:
-        raise Exception("Cannot download/upload between disk and S3 using this method")
+    @property
+    def megabytes_per_second(self) -> float:
+        if not self.elapsed_seconds:
+            return 0.0
+        return self.size_bytes / (1024 * 1024) / self.elapsed_seconds
 
-    if is_source_s3:
-        source_bucket, source_path = split_s3_url(source)
-        dest_bucket, dest_path = split_s3_url(destination)
 
-        # TODO - switch back to this after FINEOS roles have the updated permissions.
-        # s3 = boto3.client("s3")
-        # copy_source = {"Bucket": source_bucket, "Key": source_path}
-        # s3.copy(copy_source, dest_bucket, dest_path)
+def get_s3_transfer_config() -> TransferConfig:
+    return TransferConfig(
+        multipart_threshold=S3_MULTIPART_COPY_THRESHOLD,
+        multipart_chunksize=S3_MULTIPART_COPY_CHUNKSIZE,
+        max_concurrency=S3_COPY_MAX_CONCURRENCY,
+    )
+
+
+def get_s3_stream_transfer_config() -> TransferConfig:
+    config = TransferConfig(
+        multipart_threshold=S3_STREAM_CHUNKSIZE,
+        multipart_chunksize=S3_STREAM_CHUNKSIZE,
+        max_concurrency=S3_STREAM_MAX_CONCURRENCY,
+    )
+    # Parts read from a non-seekable stream and waiting to upload. Not a boto3 TransferConfig
+    # argument, but s3transfer reads it from the config.
+    config.max_in_memory_upload_chunks = S3_STREAM_MAX_CONCURRENCY
+    return config
+
+
+class S3Clients:
+    """S3 clients by bucket, made once and shared by the copies in a batch.
+
+    Creating boto3 clients isn't thread safe, so a batch makes every client it needs before
+    starting its worker threads.
+    """
+
+    def __init__(self, buckets: Iterable[str] = (), with_default_client: bool = False):
+        self.clients = {bucket: get_s3_client(bucket) for bucket in buckets}
+        self._default_client = boto3.client("s3") if with_default_client else None
+
+    def for_bucket(self, bucket_name: str) -> botocore.client.BaseClient:
+        client = self.clients.get(bucket_name)
+        if client is None:
+            client = self.clients[bucket_name] = get_s3_client(bucket_name)
+        return client
+
+    @property
+    def default_client(self) -> botocore.client.BaseClient:
+        """Client with the default credentials, as used by delete_file()."""
+        if self._default_client is None:
+            self._default_client = boto3.client("s3")
+        return self._default_client
+
 
-        # Simulate copy for now using independent download and upload.
+def uses_same_s3_credentials(source_bucket: str, dest_bucket: str) -> bool:
+    """Whether get_s3_client() uses the same credentials for both buckets.
+
+    S3 can only copy an object server side when one set of credentials can read the source and
+    write the destination. FINEOS buckets are read with an assumed role that can't write to our
+    buckets, and the other way around.
+    """
+    return source_bucket.startswith(FINEOS_BUCKET_PREFIX) == dest_bucket.startswith(
+        FINEOS_BUCKET_PREFIX
+    )
 
-        # TODO - temporarily commenting this out to use get_s3_client() helper function.
-        # source_boto3_session = boto3
-        # dest_boto3_session = boto3
 
-        # is_fineos_source = source_bucket.startswith("fin-som")
-        # is_fineos_dest = dest_bucket.startswith("fin-som")
+def copy_file(source: str, destination: str) -> CopyResult:
+    """Copy a file between any two local or S3 paths.
 
-        # if is_fineos_source or is_fineos_dest:
-        #     # This should get passed in from the method but getting it
-        #     # directly from the environment due to time constraints.
-        #     fineos_boto_session = aws_sts.assume_session(
-        #         role_arn=os.environ["FINEOS_AWS_IAM_ROLE_ARN"],
-        #         external_id=os.environ["FINEOS_AWS_IAM_ROLE_EXTERNAL_ID"],
-        #         role_session_name="payments_copy_file",
-        #         region_name="us-east-1",
-        #     )
+    Between S3 buckets that share credentials, S3 copies the object itself: one CopyObject, or
+    UploadPartCopy for several parts at a time once the object is larger than
+    S3_MULTIPART_COPY_THRESHOLD. Otherwise the file is streamed from the source to the destination,
+    S3_STREAM_CHUNKSIZE at a time.
+    """
+    logger.info(f"Copying file from {source} to {destination}")
+    return _copy_file(source, destination, S3Clients())
 
-        #     if is_fineos_source:
-        #         source_boto3_session = fineos_boto_session
 
-        #     if is_fineos_dest:
-        #         dest_boto3_session = fineos_boto_session
+def copy_files(
+    copies: Sequence[Tuple[str, str]], max_workers: int = COPY_FILES_MAX_WORKERS
+) -> CopyResult:
+    """Copy each (source, destination) pair with copy_file(), up to max_workers at a time."""
+    return _run_batch(_copy_file, "Copied files", copies, max_workers)
 
-        file_descriptor, tempfile_path = tempfile.mkstemp()
 
-        try:
-            # dest_s3 = source_boto3_session.client("s3")
-            source_s3 = get_s3_client(source_bucket)
-            source_s3.download_file(source_bucket, source_path, tempfile_path)
+def _copy_file(source: str, destination: str, s3_clients: S3Clients) -> CopyResult:
+    start_time = time.monotonic()
+    is_source_s3 = is_s3_path(source)
+    is_dest_s3 = is_s3_path(destination)
 
-            # dest_s3 = dest_boto3_session.client("s3")
-            dest_s3 = get_s3_client(dest_bucket)
-            dest_s3.upload_file(tempfile_path, dest_bucket, dest_path)
-        finally:
-            os.close(file_descriptor)
-            os.remove(tempfile_path)
+    # Bytes reported by the S3 transfer manager, which may call back from several threads
+    transferred: List[int] = []
+    transfer_args = {"Config": get_s3_transfer_config(), "Callback": transferred.append}
+
+    if is_source_s3 and is_dest_s3:
+        source_bucket, source_path = split_s3_url(source)
+        dest_bucket, dest_path = split_s3_url(destination)
+
+        if uses_same_s3_credentials(source_bucket, dest_bucket):
+            copy_method = "server_side"
+            copy_source = {"Bucket": source_bucket, "Key": source_path}
+            s3_clients.for_bucket(dest_bucket).copy(
+                copy_source, dest_bucket, dest_path, **transfer_args
+            )
+        else:
+            # Stream the object through memory rather than a tempfile, a few parts at a time
+            copy_method = "stream"
+            transfer_args["Config"] = get_s3_stream_transfer_config()
+            with _s3_stream_slots:
+                body = s3_clients.for_bucket(source_bucket).get_object(
+                    Bucket=source_bucket, Key=source_path
+                )["Body"]
+                try:
+                    s3_clients.for_bucket(dest_bucket).upload_fileobj(
+                        body, dest_bucket, dest_path, **transfer_args
+                    )
+                finally:
+                    body.close()
+
+    elif is_source_s3:
+        copy_method = "download"
+        source_bucket, source_path = split_s3_url(source)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        s3_clients.for_bucket(source_bucket).download_file(
+            source_bucket, source_path, destination, **transfer_args
+        )
+
+    elif is_dest_s3:
+        copy_method = "upload"
+        dest_bucket, dest_path = split_s3_url(destination)
+        s3_clients.for_bucket(dest_bucket).upload_file(
+            source, dest_bucket, dest_path, **transfer_args
+        )
 
     else:
+        copy_method = "local"
         os.makedirs(os.path.dirname(destination), exist_ok=True)
         shutil.copy2(source, destination)
+        transferred.append(os.path.getsize(destination))
+
+    result = CopyResult(
+        file_count=1, size_bytes=sum(transferred), elapsed_seconds=time.monotonic() - start_time
+    )
+    logger.info(
+        "Copied file",
+        extra={
+            "source": source,
+            "destination": destination,
+            "copy_method": copy_method,
+            "size_bytes": result.size_bytes,
+            "elapsed_seconds": round(result.elapsed_seconds, 3),
+            "megabytes_per_second": round(result.megabytes_per_second, 2),
+        },
+    )
+    return result
+
+
+def _run_batch(
+    operation: Callable[[str, str, S3Clients], CopyResult],
+    message: str,
+    pairs: Sequence[Tuple[str, str]],
+    max_workers: int,
+) -> CopyResult:
+    start_time = time.monotonic()
+
+    s3_clients = S3Clients(
+        buckets={split_s3_url(path)[0] for pair in pairs for path in pair if is_s3_path(path)},
+        with_default_client=any(is_s3_path(source) for source, _ in pairs),
+    )
+
+    def run(pair: Tuple[str, str]) -> CopyResult:
+        source, destination = pair
+        return operation(source, destination, s3_clients)
+
+    total = CopyResult()
+    if pairs:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(pairs)), thread_name_prefix="copy-files"
+        ) as executor:
+            for result in executor.map(run, pairs):
+                total.file_count += result.file_count
+                total.size_bytes += result.size_bytes
+
+    total.elapsed_seconds = time.monotonic() - start_time
+    logger.info(
+        message,
+        extra={
+            "file_count": total.file_count,
+            "size_bytes": total.size_bytes,
+            "elapsed_seconds": round(total.elapsed_seconds, 3),
+            "megabytes_per_second": round(total.megabytes_per_second, 2),
+            "max_workers": max_workers,
+        },
+    )
+    return total
 
 
 def delete_file(path):
@@ -312,22 +481,38 @@ def delete_file(path):
         os.remove(path)
 
 
-def rename_file(source, destination):
-    is_source_s3 = is_s3_path(source)
-    is_dest_s3 = is_s3_path(destination)
+def rename_file(source: str, destination: str) -> CopyResult:
+    return _rename_file(source, destination, S3Clients())
+
 
-    # This isn't a download or upload method
-    # Don't allow "copying" between mismatched locations
-    if is_source_s3 != is_dest_s3:
-        raise Exception("Cannot download/upload between disk and S3 using this method")
+def rename_files(
+    renames: Sequence[Tuple[str, str]], max_workers: int = COPY_FILES_MAX_WORKERS
+) -> CopyResult:
+    """Rename each (source, destination) pair with rename_file(), up to max_workers at a time."""
+    return _run_batch(_rename_file, "Renamed files", renames, max_workers)
 
-    if is_source_s3:
+
+def _rename_file(source: str, destination: str, s3_clients: S3Clients) -> CopyResult:
+    if is_s3_path(source):
         # S3 doesn't have any actual rename process, need to copy and delete the old
-        copy_file(source, destination)
-        delete_file(source)
-    else:
-        # This will create any missing intermediary directories
-        os.renames(source, destination)
+        result = _copy_file(source, destination, s3_clients)
+
+        bucket, s3_path = split_s3_url(source)
+        s3_clients.default_client.delete_object(Bucket=bucket, Key=s3_path)
+        return result
+
+    if is_s3_path(destination):
+        result = _copy_file(source, destination, s3_clients)
+        os.remove(source)
+        return result
+
+    # This will create any missing intermediary directories
+    start_time = time.monotonic()
+    size_bytes = os.path.getsize(source)
+    os.renames(source, destination)
+    return CopyResult(
+        file_count=1, size_bytes=size_bytes, elapsed_seconds=time.monotonic() - start_time
+    )
 
 
 def download_from_s3(source, destination):
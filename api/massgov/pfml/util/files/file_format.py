@@ -2,8 +2,8 @@
 # File format utility class for character length formatted files
 #
 
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 
 class LineParseError(Exception):
@@ -24,10 +24,50 @@ class FieldFormat:
     conversion_function: Optional[Callable[[str], Any]] = None
 
 
+@dataclass
+class ParsedLines:
+    """Column oriented result of FileFormat.parse_lines.
+
+    Each entry in `columns` holds the converted values of one field, in input order, for every
+    line that parsed successfully. `line_indexes` holds the position of each of those lines in
+    the input, and `errors` the position and error of every line that was rejected.
+    """
+
+    property_names: Sequence[str]
+    columns: Dict[str, List[Any]] = field(default_factory=dict)
+    line_indexes: List[int] = field(default_factory=list)
+    errors: List[Tuple[int, LineParseError]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.line_indexes)
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Yield each parsed line as a dict, the same shape returned by FileFormat.parse_line."""
+        property_names = self.property_names
+        for values in zip(*(self.columns[name] for name in property_names)):
+            yield dict(zip(property_names, values))
+
+
 class FileFormat:
     def __init__(self, format: Sequence[FieldFormat]):
         self.format = format
         self.line_length = sum(map(lambda field: field.length, format))
+        self.property_names = tuple(column_format.property_name for column_format in format)
+
+        # Slice offsets are fixed for a format, so compute them once rather than on every line.
+        self._columns: List[Tuple[str, int, int, Optional[Callable[[str], Any]]]] = []
+        start_index = 0
+        for column_format in format:
+            end_index = start_index + column_format.length
+            self._columns.append(
+                (
+                    column_format.property_name,
+                    start_index,
+                    end_index,
+                    column_format.conversion_function,
+                )
+            )
+            start_index = end_index
 
     def parse_line(self, line: str) -> Dict:
         line = line.rstrip("\r\n")
@@ -37,15 +77,9 @@ class FileFormat:
             )
 
         object = {}
-        start_index = 0
-        for column_format in self.format:
-            property_name = column_format.property_name
-            end_index = start_index + column_format.length
-
+        for property_name, start_index, end_index, conversion_function in self._columns:
             column_value = line[start_index:end_index].strip()
 
-            conversion_function = column_format.conversion_function
-
             # if no conversion function is provided, ensure empty strings are parsed as None
             if conversion_function is None:
                 object[property_name] = parse_empty_as_none(column_value)
@@ -55,9 +89,98 @@ class FileFormat:
                 except ValueError:
                     raise LineParseError("failed to parse field " + property_name)
 
-            start_index = end_index
-
         return object
 
+    def parse_lines(self, lines: Iterable[str]) -> ParsedLines:
+        """Parse a buffer of lines in bulk into columns.
+
+        Equivalent to calling parse_line on every line, but each field is sliced and converted a
+        column at a time. Conversion functions are expected to be pure, so each distinct raw value
+        in a column is only converted once per call (filing periods, dates and common amounts
+        repeat heavily in DOR files). Lines that fail to parse are reported in `errors` as a
+        LineParseError instead of aborting the batch.
+        """
+        parsed = ParsedLines(property_names=self.property_names)
+
+        valid_lines = []
+        for index, line in enumerate(lines):
+            line = line.rstrip("\r\n")
+            if len(line) != self.line_length:
+                parsed.errors.append(
+                    (
+                        index,
+                        LineParseError(
+                            "invalid line length %i (expected %i)" % (len(line), self.line_length)
+                        ),
+                    )
+                )
+                continue
+
+            valid_lines.append(line)
+            parsed.line_indexes.append(index)
+
+        failed_positions: Dict[int, LineParseError] = {}
+        for property_name, start_index, end_index, conversion_function in self._columns:
+            raw_values = [line[start_index:end_index].strip() for line in valid_lines]
+
+            if conversion_function is None:
+                # if no conversion function is provided, ensure empty strings are parsed as None
+                parsed.columns[property_name] = [value or None for value in raw_values]
+            else:
+                parsed.columns[property_name] = _convert_column(
+                    property_name, raw_values, conversion_function, failed_positions
+                )
+
+        if failed_positions:
+            # failed_positions is keyed by position among the valid lines, map back to input index
+            parsed.errors.extend(
+                (parsed.line_indexes[position], error)
+                for position, error in failed_positions.items()
+            )
+            parsed.errors.sort(key=lambda error: error[0])
+            _drop_positions(parsed, set(failed_positions))
+
+        return parsed
+
     def get_line_length(self):
         return self.line_length
+
+
+def _convert_column(
+    property_name: str,
+    raw_values: List[str],
+    conversion_function: Callable[[str], Any],
+    failed_positions: Dict[int, LineParseError],
+) -> List[Any]:
+    converted_by_raw_value: Dict[str, Any] = {}
+    invalid_raw_values: Set[str] = set()
+
+    for raw_value in set(raw_values):
+        try:
+            converted_by_raw_value[raw_value] = conversion_function(raw_value)
+        except Exception:
+            # Broader than parse_line so that one bad cell (e.g. decimal.InvalidOperation from a
+            # malformed amount) rejects its line rather than the whole buffer
+            invalid_raw_values.add(raw_value)
+
+    if not invalid_raw_values:
+        return list(map(converted_by_raw_value.__getitem__, raw_values))
+
+    for position, raw_value in enumerate(raw_values):
+        # Only the first failing field of a line is reported, as with parse_line
+        if raw_value in invalid_raw_values and position not in failed_positions:
+            failed_positions[position] = LineParseError("failed to parse field " + property_name)
+
+    return list(map(converted_by_raw_value.get, raw_values))
+
+
+def _drop_positions(parsed: ParsedLines, positions: Set[int]) -> None:
+    for property_name, values in parsed.columns.items():
+        parsed.columns[property_name] = [
+            value for position, value in enumerate(values) if position not in positions
+        ]
+    parsed.line_indexes = [
+        line_index
+        for position, line_index in enumerate(parsed.line_indexes)
+        if position not in positions
+    ]
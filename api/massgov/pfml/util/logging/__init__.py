@@ -24,6 +24,7 @@ LOGGING: Dict[str, Any] = {
     "disable_existing_loggers": False,
     "formatters": {
         "json": {"()": formatters.JsonFormatter},
+        "json_fast": {"()": formatters.FastJsonFormatter},
         "develop": {"()": formatters.DevelopFormatter},
     },
     "handlers": {"console": {"class": "logging.StreamHandler", "formatter": "json"}},
@@ -56,6 +57,8 @@ def init(program_name, develop=False):
     """Initialize the logging system."""
     if develop:
         LOGGING["handlers"]["console"]["formatter"] = "develop"
+    elif os.environ.get("LOGGING_FAST_JSON", "0") == "1":
+        LOGGING["handlers"]["console"]["formatter"] = "json_fast"
     logging.config.dictConfig(LOGGING)
     logger.info(
         "start %s: %s %s %s, hostname %s, pid %i, user %i(%s)",
@@ -6,6 +6,7 @@ import datetime
 import json
 import logging  # noqa: B1
 import re
+from typing import Any, Dict, Tuple
 
 import flask
 import newrelic.api.time_trace
@@ -58,6 +59,16 @@ TIN_RE = re.compile(
 
 MOST_COMPACT_JSON_SEPARATORS = (",", ":")
 
+# Shortest string that TIN_RE can match.
+TIN_MIN_LENGTH = 9
+
+# Attributes that FastJsonFormatter does not mask, in addition to ALLOW_NO_MASK. The function name
+# is a Python identifier, so every digit in it follows a word character and TIN_RE can not match.
+FAST_ALLOW_NO_MASK = ALLOW_NO_MASK | {"funcName"}
+
+# Reused for every line, instead of json.dumps() creating an encoder each call.
+JSON_ENCODER = json.JSONEncoder(separators=MOST_COMPACT_JSON_SEPARATORS, check_circular=False)
+
 
 class JsonFormatter(logging.Formatter):  # noqa: B1
     """A logging formatter which formats each line as JSON."""
@@ -114,6 +125,80 @@ class JsonFormatter(logging.Formatter):  # noqa: B1
         return json.dumps(output, separators=MOST_COMPACT_JSON_SEPARATORS)
 
 
+class FastJsonFormatter(JsonFormatter):
+    """A JsonFormatter with less overhead per line, for processes that log a line per record.
+
+    The output has the same attributes with the same masking as JsonFormatter:
+
+    - fast_str_mask_pii() skips the regular expression only where it can not match
+    - the Flask request attributes are read and masked once per request, not once per line
+    - the line is encoded with a shared encoder instead of a new one per line
+    """
+
+    def format(self, record):
+        has_request_context = flask.has_request_context()
+
+        request_attributes: Dict[str, Tuple[Any, str]] = {}
+        if has_request_context:
+            request_attributes = get_request_log_attributes()
+            for key, (value, _masked_value) in request_attributes.items():
+                record.__dict__[key] = value
+
+        # Skip JsonFormatter.format(), which this replaces
+        super(JsonFormatter, self).format(record)
+
+        output = {}
+        for key, value in record.__dict__.items():
+            if key in EXCLUDE_ATTRIBUTES or value is None:
+                continue
+
+            request_attribute = request_attributes.get(key)
+            if request_attribute is not None and request_attribute[0] is value:
+                output[key] = request_attribute[1]
+            else:
+                output[key] = fast_str_mask_pii(key, value)
+
+        # Inject user metadata without PII masking, as in JsonFormatter
+        if has_request_context:
+            user_attributes = flask.g.get("current_user_log_attributes")
+            azure_user_sub_id = flask.g.get("azure_user_sub_id")
+
+            if user_attributes:
+                output.update(user_attributes)
+            if azure_user_sub_id:
+                output.update({"azure_user.sub_id": azure_user_sub_id})
+
+        output.update(newrelic.api.time_trace.get_linking_metadata())
+        return JSON_ENCODER.encode(output)
+
+
+def get_request_log_attributes() -> Dict[str, Tuple[Any, str]]:
+    """Get the attributes JsonFormatter adds for the current Flask request, with masked values.
+
+    Computed on the first call in a request and stored in flask.g for the rest of it."""
+    request_attributes = flask.g.get("request_log_attributes")
+    if request_attributes is None:
+        request = flask.request
+        values = {
+            # legacy keys
+            "method": request.method,
+            "path": request.path,
+            # keys corresponding to New Relic Flask attributes
+            "request.method": request.method,
+            "request.path": request.path,
+            "request.url_rule": request.url_rule,
+            # custom features
+            "request_id": request.headers.get("x-amzn-requestid", ""),
+            "mass_pfml_agent_id": request.headers.get("Mass-PFML-Agent-ID", ""),
+        }
+        request_attributes = {
+            key: (value, str_mask_pii(key, value)) for key, value in values.items()
+        }
+        flask.g.request_log_attributes = request_attributes
+
+    return request_attributes
+
+
 def str_mask_pii(key, value):
     """Convert value to str and replace suspected PII with placeholder text."""
     if key in ALLOW_NO_MASK:
@@ -121,6 +206,29 @@ def str_mask_pii(key, value):
     return TIN_RE.sub("*********", str(value))
 
 
+def fast_str_mask_pii(key, value):
+    """Same result as str_mask_pii(), skipping the regular expression where it can not match."""
+    value_type = type(value)
+
+    if value_type is str:
+        str_value = value
+    elif value_type is bool:
+        return str(value)
+    elif value_type is int and key not in ALLOW_NO_MASK:
+        # The digits of an int only match if there are exactly 9 of them
+        if 100_000_000 <= value < 1_000_000_000:
+            return "*********"
+        if -1_000_000_000 < value <= -100_000_000:
+            return "-*********"
+        return str(value)
+    else:
+        str_value = str(value)
+
+    if len(str_value) < TIN_MIN_LENGTH or key in FAST_ALLOW_NO_MASK:
+        return str_value
+    return TIN_RE.sub("*********", str_value)
+
+
 class DevelopFormatter(logging.Formatter):  # noqa: B1
     """A logging formatter which formats each line as text."""
 
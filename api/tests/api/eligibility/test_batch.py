@@ -0,0 +1,122 @@
+#
+# Tests for massgov.pfml.api.eligibility.batch.
+#
+from datetime import date
+
+from massgov.pfml.api.eligibility import eligibility
+from massgov.pfml.api.eligibility.batch import (
+    FinancialEligibilityRequest,
+    compute_financial_eligibility_batch,
+)
+from massgov.pfml.api.eligibility.mock.scenario_data_generator import (
+    generate_eligibility_scenario_data_in_db,
+)
+from massgov.pfml.api.eligibility.mock.scenarios import EligibilityScenarioDescriptor
+from massgov.pfml.api.models.applications.common import EligibilityEmploymentStatus
+
+SCENARIOS = [
+    EligibilityScenarioDescriptor(
+        last_x_quarters_wages=["0", "0", "2000", "3000", "5000", "5000"],
+        application_submitted_date=date(2021, 1, 5),
+        leave_start_date=date(2021, 1, 5),
+        current_quarter_has_data=False,
+        employment_status=EligibilityEmploymentStatus.employed,
+    ),
+    EligibilityScenarioDescriptor(
+        last_x_quarters_wages=["1000", "8000", "0", "0", "0", "0"],
+        application_submitted_date=date(2021, 1, 5),
+        leave_start_date=date(2021, 1, 5),
+        current_quarter_has_data=False,
+        employment_status=EligibilityEmploymentStatus.employed,
+    ),
+    EligibilityScenarioDescriptor(
+        last_x_quarters_wages=["6000"],
+        last_x_quarters_wages_other_employer=["10000", "10000", "10000"],
+        application_submitted_date=date(2021, 4, 2),
+        leave_start_date=date(2021, 4, 2),
+        employment_status=EligibilityEmploymentStatus.self_employed,
+    ),
+    EligibilityScenarioDescriptor(
+        last_x_quarters_wages=[],
+        application_submitted_date=date(2021, 1, 2),
+        leave_start_date=date(2021, 1, 2),
+        employment_status=EligibilityEmploymentStatus.employed,
+    ),
+]
+
+
+def _request(scenario_data):
+    return FinancialEligibilityRequest(
+        employee_id=scenario_data.employee.employee_id,
+        employer_id=scenario_data.employer.employer_id,
+        leave_start_date=scenario_data.leave_start_date,
+        application_submitted_date=scenario_data.application_submitted_date,
+        employment_status=scenario_data.employment_status,
+    )
+
+
+def test_compute_financial_eligibility_batch_matches_single(
+    test_db_session, initialize_factories_session, sqlalchemy_query_counter
+):
+    requests = [
+        _request(generate_eligibility_scenario_data_in_db(scenario, test_db_session))
+        for scenario in SCENARIOS
+    ]
+    test_db_session.commit()
+
+    # The savepoint the test session starts after the commit, two queries for the state metrics,
+    # and one for the wages of every employee
+    with sqlalchemy_query_counter(test_db_session, expected_query_count=4):
+        results = list(
+            compute_financial_eligibility_batch(test_db_session, requests, chunk_size=10)
+        )
+
+    assert [result.request for result in results] == requests
+    for result in results:
+        request = result.request
+        assert result.error is None
+        assert result.response == eligibility.compute_financial_eligibility(
+            test_db_session,
+            request.employee_id,
+            request.employer_id,
+            request.leave_start_date,
+            request.application_submitted_date,
+            request.employment_status,
+        )
+
+
+def test_compute_financial_eligibility_batch_chunks(test_db_session, initialize_factories_session):
+    requests = [
+        _request(generate_eligibility_scenario_data_in_db(scenario, test_db_session))
+        for scenario in SCENARIOS
+    ]
+
+    results = list(compute_financial_eligibility_batch(test_db_session, requests, chunk_size=3))
+    unchunked_results = list(compute_financial_eligibility_batch(test_db_session, requests))
+
+    assert results == unchunked_results
+
+
+def test_compute_financial_eligibility_batch_error(test_db_session, initialize_factories_session):
+    requests = [
+        _request(generate_eligibility_scenario_data_in_db(scenario, test_db_session))
+        for scenario in SCENARIOS[:1]
+    ]
+    # No state metrics are in effect this early
+    requests.insert(
+        0,
+        FinancialEligibilityRequest(
+            employee_id=requests[0].employee_id,
+            employer_id=requests[0].employer_id,
+            leave_start_date=date(2019, 1, 1),
+            application_submitted_date=date(2019, 1, 1),
+            employment_status=EligibilityEmploymentStatus.employed,
+        ),
+    )
+
+    results = list(compute_financial_eligibility_batch(test_db_session, requests))
+
+    assert results[0].response is None
+    assert "Benefits metrics were not found" in results[0].error
+    assert results[1].error is None
+    assert results[1].response.financially_eligible is True
@@ -5,7 +5,10 @@
 import datetime
 import decimal
 
+import pytest
+
 from massgov.pfml.api.eligibility import eligibility_util
+from massgov.pfml.db.models.applications import BenefitsMetrics, UnemploymentMetric
 from massgov.pfml.db.models.factories import BenefitsMetricsFactory, UnemploymentMetricFactory
 
 
@@ -138,3 +141,41 @@ def test_fetch_state_metric_multiple_yrs(initialize_factories_session, test_db_s
         benefits_metrics_data.maximum_weekly_benefit_amount
         == benefits_metrics_2019.maximum_weekly_benefit_amount
     )
+
+
+def test_state_metric_ranges():
+    state_metric_ranges = eligibility_util.StateMetricRanges(
+        [
+            BenefitsMetrics(datetime.date(2021, 1, 1), "1487.78", "850.00"),
+            BenefitsMetrics(datetime.date(2020, 10, 1), "1431.66", "850.00"),
+        ],
+        [UnemploymentMetric(datetime.date(2020, 10, 1), "5100.00")],
+    )
+
+    (benefits_metrics, unemployment_metric) = state_metric_ranges.get(datetime.date(2020, 12, 31))
+    assert benefits_metrics.average_weekly_wage == decimal.Decimal("1431.66")
+    assert unemployment_metric.unemployment_minimum_earnings == decimal.Decimal("5100.00")
+
+    (benefits_metrics, unemployment_metric) = state_metric_ranges.get(datetime.date(2021, 1, 1))
+    assert benefits_metrics.average_weekly_wage == decimal.Decimal("1487.78")
+    assert unemployment_metric.unemployment_minimum_earnings == decimal.Decimal("5100.00")
+
+    with pytest.raises(RuntimeError, match="Benefits metrics were not found"):
+        state_metric_ranges.get(datetime.date(2020, 9, 30))
+
+
+def test_fetch_state_metric_cached(initialize_factories_session, test_db_session, monkeypatch):
+    monkeypatch.setattr(eligibility_util.get_state_metrics_cache(), "ttl", 3600)
+    effective_date = datetime.date(2022, 3, 1)
+
+    (benefits_metrics, _) = eligibility_util.fetch_state_metric(test_db_session, effective_date)
+    assert benefits_metrics.average_weekly_wage == decimal.Decimal("1694.24")
+
+    # Changes are not seen until the cache expires
+    BenefitsMetricsFactory.create(effective_date=effective_date, average_weekly_wage=1700)
+    (benefits_metrics, _) = eligibility_util.fetch_state_metric(test_db_session, effective_date)
+    assert benefits_metrics.average_weekly_wage == decimal.Decimal("1694.24")
+
+    eligibility_util.get_state_metrics_cache().clear()
+    (benefits_metrics, _) = eligibility_util.fetch_state_metric(test_db_session, effective_date)
+    assert benefits_metrics.average_weekly_wage == decimal.Decimal("1700")
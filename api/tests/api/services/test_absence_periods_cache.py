@@ -0,0 +1,84 @@
+from datetime import date
+
+import massgov.pfml.api.services.absence_periods_cache as absence_periods_cache_module
+from massgov.pfml.api.services.absence_periods_cache import (
+    AbsencePeriodsCache,
+    hash_absence_periods,
+)
+from massgov.pfml.fineos.models.customer_api.spec import AbsencePeriod as FineosAbsencePeriod
+
+
+def absence_period(end_date=None):
+    if end_date is None:
+        end_date = date(2021, 1, 30)
+
+    return FineosAbsencePeriod(
+        id="PL-14449-0000002237",
+        reason="Child Bonding",
+        startDate=date(2021, 1, 29),
+        endDate=end_date,
+        absenceType="Continuous",
+    )
+
+
+def test_hash_absence_periods():
+    assert hash_absence_periods([absence_period()]) == hash_absence_periods([absence_period()])
+    assert hash_absence_periods([absence_period()]) != hash_absence_periods(
+        [absence_period(end_date=date(2021, 1, 31))]
+    )
+
+
+def test_cache_ttl():
+    cache = AbsencePeriodsCache(ttl=60, max_size=10)
+    assert cache.get("NTN-1-ABS-01") is None
+
+    cache.put("NTN-1-ABS-01", [absence_period()])
+    entry = cache.get("NTN-1-ABS-01")
+    assert entry.is_fresh()
+    assert entry.absence_periods == [absence_period()]
+
+    # Expired entries are still returned so the last payload hash is known
+    entry.expires_at = 0
+    assert not cache.get("NTN-1-ABS-01").is_fresh()
+
+
+def test_cache_lru_eviction():
+    cache = AbsencePeriodsCache(ttl=60, max_size=2)
+    cache.put("NTN-1-ABS-01", [absence_period()])
+    cache.put("NTN-2-ABS-01", [absence_period()])
+
+    # Reading an entry makes it the most recently used
+    cache.get("NTN-1-ABS-01")
+    cache.put("NTN-3-ABS-01", [absence_period()])
+
+    assert cache.get("NTN-1-ABS-01") is not None
+    assert cache.get("NTN-2-ABS-01") is None
+    assert cache.get("NTN-3-ABS-01") is not None
+
+
+def test_cache_invalidate():
+    cache = AbsencePeriodsCache(ttl=60, max_size=10)
+    cache.put("NTN-1-ABS-01", [absence_period()])
+
+    cache.invalidate("NTN-1-ABS-01")
+    cache.invalidate(None)
+
+    assert cache.get("NTN-1-ABS-01") is None
+
+
+def test_cache_disabled():
+    cache = AbsencePeriodsCache(ttl=0, max_size=10)
+    assert not cache.enabled
+
+    entry = cache.put("NTN-1-ABS-01", [absence_period()])
+    assert entry.payload_hash == hash_absence_periods([absence_period()])
+    assert cache.get("NTN-1-ABS-01") is None
+
+
+def test_get_absence_periods_cache_caps_ttl(monkeypatch):
+    monkeypatch.setattr(absence_periods_cache_module, "absence_periods_cache", None)
+    monkeypatch.setenv("CLAIM_ABSENCE_PERIODS_CACHE_TTL_SECONDS", "3600")
+
+    cache = absence_periods_cache_module.get_absence_periods_cache()
+
+    assert cache.ttl == absence_periods_cache_module.MAX_TTL_SECONDS
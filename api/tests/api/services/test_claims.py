@@ -4,6 +4,7 @@ from unittest import mock
 
 import pytest
 
+from massgov.pfml.api.services.absence_periods_cache import AbsencePeriodsCache
 from massgov.pfml.api.services.claims import ClaimWithdrawnError, get_claim_detail
 from massgov.pfml.db.models.factories import ManagedRequirementFactory
 from massgov.pfml.db.queries.absence_periods import (
@@ -102,6 +103,47 @@ class TestGetClaimDetail:
 
         assert managed_req_response_matches_managed_req(req, expected_req)
 
+    @mock.patch("massgov.pfml.api.services.claims.sync_customer_api_absence_periods_to_db")
+    @mock.patch("massgov.pfml.api.services.claims.get_absence_periods_from_claim")
+    def test_cached_absence_periods(
+        self, mock_get_absence_periods, mock_sync, app, claim, fineos_absence_period
+    ):
+        absence_periods_cache = AbsencePeriodsCache(ttl=60, max_size=10)
+        mock_get_absence_periods.return_value = [fineos_absence_period]
+
+        with mock.patch(
+            "massgov.pfml.api.services.claims.get_absence_periods_cache",
+            return_value=absence_periods_cache,
+        ):
+            first_claim_detail = self.get_claim_detail_with_app_context(claim, app)
+            second_claim_detail = self.get_claim_detail_with_app_context(claim, app)
+
+            # The second view is served from the cache without calling FINEOS or syncing
+            assert first_claim_detail.absence_periods == second_claim_detail.absence_periods
+            assert mock_get_absence_periods.call_count == 1
+            assert mock_sync.call_count == 1
+
+            # Once expired, FINEOS is called again but the unchanged payload is not re-synced
+            absence_periods_cache.get(claim.fineos_absence_id).expires_at = 0
+            self.get_claim_detail_with_app_context(claim, app)
+            assert mock_get_absence_periods.call_count == 2
+            assert mock_sync.call_count == 1
+
+            # A changed payload is synced
+            absence_periods_cache.get(claim.fineos_absence_id).expires_at = 0
+            mock_get_absence_periods.return_value = [
+                fineos_absence_period.copy(update={"endDate": date(2021, 2, 28)})
+            ]
+            self.get_claim_detail_with_app_context(claim, app)
+            assert mock_get_absence_periods.call_count == 3
+            assert mock_sync.call_count == 2
+
+            # Invalidating the claim, as when a change request is submitted, forces a sync
+            absence_periods_cache.invalidate(claim.fineos_absence_id)
+            self.get_claim_detail_with_app_context(claim, app)
+            assert mock_get_absence_periods.call_count == 4
+            assert mock_sync.call_count == 3
+
 
 def claim_detail_matches_claim(claim_detail, claim):
     if claim_detail.fineos_absence_id != claim.fineos_absence_id:
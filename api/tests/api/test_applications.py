@@ -486,6 +486,37 @@ def test_applications_get_all_pagination_limit_double(client, user, auth_token):
         assert str(application.application_id) == app_response["application_id"]
 
 
+def test_applications_get_all_pagination_cursor(client, user, auth_token):
+    applications = [ApplicationFactory.create(user=user) for _ in range(DEFAULT_PAGE_SIZE + 5)]
+    applications = sorted(
+        applications, key=lambda app: (app.created_at, app.application_id), reverse=True
+    )
+
+    response = client.get(
+        "/v1/applications?page_cursor=&total_records=none",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 200
+    response_body = response.get_json()
+    paging = response_body["meta"]["paging"]
+    assert "total_records" not in paging
+    assert len(response_body["data"]) == DEFAULT_PAGE_SIZE
+
+    response = client.get(
+        f"/v1/applications?page_cursor={paging['next_page_cursor']}",
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 200
+    response_body = response.get_json()
+    paging = response_body["meta"]["paging"]
+    assert paging["total_records"] == DEFAULT_PAGE_SIZE + 5
+    assert paging["total_records_approximate"] is False
+    assert "next_page_cursor" not in paging
+
+    response_ids = [app["application_id"] for app in response_body["data"]]
+    assert response_ids == [str(app.application_id) for app in applications[DEFAULT_PAGE_SIZE:]]
+
+
 class TestApplicationsImport:
     @pytest.fixture
     def claim(self, claim, test_db_session) -> Claim:
@@ -2952,6 +2952,22 @@ class TestGetClaimsEndpoint:
 
             assert len(response_body["data"]) == 2
 
+        def test_get_claims_search_first_last_without_middle_name(
+            self, client, employer_auth_token, employer
+        ):
+            employee = EmployeeFactory.create(
+                first_name="Nomiddle", middle_name=None, last_name="Person"
+            )
+            ClaimFactory.create(employer=employer, employee=employee, claim_type_id=1)
+
+            response = self.perform_search("Nomiddle Person", client, employer_auth_token)
+
+            assert response.status_code == 200
+            response_body = response.get_json()
+
+            assert len(response_body["data"]) == 1
+            assert response_body["data"][0]["employee"]["first_name"] == "Nomiddle"
+
         def test_get_claims_search_last_first_fineos(self, client, employer_auth_token):
             search_string = "123 456"
             response = self.perform_search(search_string, client, employer_auth_token)
@@ -5,7 +5,9 @@ from unittest import mock
 import pytest
 
 import tests.api
-from massgov.pfml.db.models.applications import Notification
+from massgov.pfml.api.app import get_app_config
+from massgov.pfml.api.services.absence_periods_cache import AbsencePeriodsCache
+from massgov.pfml.db.models.applications import Notification, ServiceNowOutboxMessage
 from massgov.pfml.db.models.employees import (
     AbsencePeriod,
     Claim,
@@ -151,6 +153,32 @@ def test_notifications_post_leave_admin(client, test_db_session, fineos_user_tok
     assert associated_claim.employee_id is None
 
 
+def test_notifications_post_leave_admin_outbox(
+    app, client, test_db_session, fineos_user_token, employer, monkeypatch
+):
+    monkeypatch.setattr(get_app_config(app), "enable_service_now_outbox", True)
+
+    with mock.patch(
+        "massgov.pfml.api.notifications.send_notification_to_service_now"
+    ) as send_notification:
+        response = client.post(
+            "/v1/notifications",
+            headers={"Authorization": f"Bearer {fineos_user_token}"},
+            json=leave_admin_body,
+        )
+
+    assert response.status_code == 201
+    send_notification.assert_not_called()
+
+    notification = test_db_session.query(Notification).one()
+    outbox_message = test_db_session.query(ServiceNowOutboxMessage).one()
+    assert outbox_message.notification_id == notification.notification_id
+    assert outbox_message.table_name == "u_cps_notifications"
+    assert outbox_message.message["u_absence_id"] == leave_admin_body["absence_case_id"]
+    assert outbox_message.attempt_count == 0
+    assert outbox_message.delivered_at is None
+
+
 def test_notifications_update_claims(client, test_db_session, fineos_user_token, employer):
     existing_claim = Claim(fineos_absence_id=leave_admin_body["absence_case_id"])
     test_db_session.add(existing_claim)
@@ -171,6 +199,26 @@ def test_notifications_update_claims(client, test_db_session, fineos_user_token,
     assert claim_record.employee_id is None
 
 
+def test_notifications_post_invalidates_cached_absence_periods(
+    client, test_db_session, fineos_user_token, employer
+):
+    absence_periods_cache = AbsencePeriodsCache(ttl=60, max_size=10)
+    absence_periods_cache.put(leave_admin_body["absence_case_id"], [])
+
+    with mock.patch(
+        "massgov.pfml.api.notifications.get_absence_periods_cache",
+        return_value=absence_periods_cache,
+    ):
+        response = client.post(
+            "/v1/notifications",
+            headers={"Authorization": f"Bearer {fineos_user_token}"},
+            json=leave_admin_body,
+        )
+
+    assert response.status_code == 201
+    assert absence_periods_cache.get(leave_admin_body["absence_case_id"]) is None
+
+
 def test_notifications_post_leave_admin_no_document_type(
     client, test_db_session, fineos_user_token, employer
 ):
@@ -1,4 +1,18 @@
-from massgov.pfml.api.util.paginate.paginator import Paginator
+from datetime import timedelta
+
+import pytest
+from werkzeug.exceptions import BadRequest
+
+from massgov.pfml.api.models.common import OrderData, PagingData, SearchEnvelope, TotalRecordsMode
+from massgov.pfml.api.util.paginate import paginator as paginator_module
+from massgov.pfml.api.util.paginate.paginator import (
+    KeysetPaginator,
+    PaginationAPIContext,
+    Paginator,
+    TotalRecordsCache,
+    decode_cursor,
+    encode_cursor,
+)
 from massgov.pfml.db.models.applications import Application
 from massgov.pfml.db.models.employees import Claim, UserLeaveAdministrator
 from massgov.pfml.db.models.factories import (
@@ -7,6 +21,7 @@ from massgov.pfml.db.models.factories import (
     EmployerFactory,
     UserFactory,
 )
+from massgov.pfml.util.datetime import utcnow
 
 
 class TestPaginator:
@@ -127,3 +142,131 @@ class TestPaginator:
                 entity=Application, query_set=query_set, page_size=5, page_offset=1
             )
             assert paginator.total_records == filter_condition["total_count"]
+
+    def test_keyset_pagination(self, user, test_db_session):
+        # Applications share a created_at in threes, so the primary key has to break the tie
+        created_at = utcnow()
+        applications = [
+            ApplicationFactory.create(user=user, created_at=created_at - timedelta(seconds=i // 3))
+            for i in range(23)
+        ]
+        expected_ids = [
+            application.application_id
+            for application in sorted(
+                applications,
+                key=lambda application: (application.created_at, application.application_id),
+                reverse=True,
+            )
+        ]
+
+        query_set = test_db_session.query(Application).filter(Application.user_id == user.user_id)
+        paged_ids = []
+        cursor = ""
+        page_sizes = []
+        while cursor is not None:
+            paginator = KeysetPaginator(
+                Application, query_set, Application.created_at, "descending", page_size=10
+            )
+            page = paginator.page_after(cursor)
+            page_sizes.append(len(page.values))
+            paged_ids.extend(application.application_id for application in page.values)
+            cursor = page.next_cursor
+
+        assert page_sizes == [10, 10, 3]
+        assert paged_ids == expected_ids
+        assert page.total_records == 23
+        assert page.total_records_approximate is False
+
+    def test_total_records_modes(self, user, test_db_session):
+        for _ in range(3):
+            ApplicationFactory.create(user=user)
+        query_set = test_db_session.query(Application).filter(Application.user_id == user.user_id)
+
+        paginator = Paginator(Application, query_set, total_records_mode=TotalRecordsMode.none)
+        assert paginator.total_records is None
+        assert paginator.total_pages is None
+        assert len(paginator.page_at(1).values) == 3
+
+        # Small estimates are replaced with an exact count
+        paginator = Paginator(Application, query_set, total_records_mode=TotalRecordsMode.estimated)
+        assert paginator.total_records == 3
+        assert paginator.total_records_approximate is False
+
+        paginator_module.total_records_cache.clear()
+        paginator = Paginator(Application, query_set, total_records_mode=TotalRecordsMode.cached)
+        assert paginator.total_records == 3
+        assert paginator.total_records_approximate is False
+
+        # A new record isn't counted until the cached count expires
+        ApplicationFactory.create(user=user)
+        paginator = Paginator(Application, query_set, total_records_mode=TotalRecordsMode.cached)
+        assert paginator.total_records == 3
+        assert paginator.total_records_approximate is True
+
+        paginator_module.total_records_cache.clear()
+        paginator = Paginator(Application, query_set, total_records_mode=TotalRecordsMode.cached)
+        assert paginator.total_records == 4
+
+    def test_total_records_cache_expiry(self, user, test_db_session, monkeypatch):
+        cache = TotalRecordsCache(ttl_seconds=60, max_size=1)
+        query_set = test_db_session.query(Application).filter(Application.user_id == user.user_id)
+        count_query = query_set.statement.with_only_columns([paginator_module.func.count()])
+        other_query_set = test_db_session.query(Claim)
+        other_count_query = other_query_set.statement.with_only_columns(
+            [paginator_module.func.count()]
+        )
+
+        now = 1000.0
+        monkeypatch.setattr(paginator_module.time, "monotonic", lambda: now)
+
+        assert cache.get_or_count(query_set, count_query) == (0, False)
+        assert cache.get_or_count(query_set, count_query) == (0, True)
+
+        now += 61
+        assert cache.get_or_count(query_set, count_query) == (0, False)
+
+        # Only max_size counts are kept
+        cache.get_or_count(other_query_set, other_count_query)
+        assert cache.get_or_count(query_set, count_query) == (0, False)
+
+
+def test_cursor_round_trip():
+    created_at = utcnow()
+    application_id = ApplicationFactory.build().application_id
+
+    cursor = encode_cursor("created_at", "descending", [created_at, application_id])
+
+    assert decode_cursor(cursor, "created_at", "descending") == [created_at, application_id]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor",
+        "e30",
+        encode_cursor("created_at", "ascending", [1, 2]),
+        encode_cursor("updated_at", "descending", [1, 2]),
+        encode_cursor("created_at", "descending", [1]),
+        encode_cursor("created_at", "descending", [{"unknown": "1"}, 2]),
+    ],
+)
+def test_decode_cursor_invalid(cursor):
+    with pytest.raises(BadRequest):
+        decode_cursor(cursor, "created_at", "descending")
+
+
+def test_pagination_context_cursor_order_keys():
+    def context(order_by):
+        return PaginationAPIContext(
+            Claim,
+            SearchEnvelope[None](  # type: ignore
+                terms=None, order=OrderData(by=order_by), paging=PagingData(cursor="")
+            ),
+        )
+
+    assert context("created_at").page_cursor == ""
+
+    # Relationships, hybrid properties and nullable columns can't be paged by cursor
+    for order_by in ["employee", "latest_follow_up_date", "fineos_absence_id"]:
+        with pytest.raises(BadRequest, match="cursor"):
+            context(order_by)
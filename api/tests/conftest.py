@@ -25,6 +25,7 @@ from sqlalchemy.orm import scoped_session, sessionmaker
 
 import massgov.pfml.api.app
 import massgov.pfml.api.authentication as authentication
+import massgov.pfml.api.eligibility.eligibility_util as eligibility_util
 import massgov.pfml.api.employees
 import massgov.pfml.db.models.employees as employee_models
 import massgov.pfml.util.files as file_util
@@ -73,6 +74,13 @@ def set_no_db_factories_alert():
     os.environ["DB_FACTORIES_DISABLE_DB_ACCESS"] = "1"
 
 
+@pytest.fixture(autouse=True)
+def clear_state_metrics_cache():
+    """State metrics are cached for the life of the process, but each test has its own."""
+    yield
+    eligibility_util.get_state_metrics_cache().clear()
+
+
 @pytest.fixture
 def app_cors(monkeypatch, test_db):
     monkeypatch.setenv("CORS_ORIGINS", "http://example.com")
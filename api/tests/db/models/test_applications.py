@@ -39,6 +39,8 @@ def test_state_metric_init(initialize_factories_session, test_db_session):
     UnemploymentMetricFactory.create(
         effective_date=datetime.date(2022, 1, 1), unemployment_minimum_earnings=5300
     )
+    # The metrics fetched above are cached until they expire
+    eligibility_util.get_state_metrics_cache().clear()
 
     effective_date = datetime.date(2022, 1, 1)
     (benefits_metrics_data, unemployment_metric_data) = eligibility_util.fetch_state_metric(
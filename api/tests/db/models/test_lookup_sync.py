@@ -0,0 +1,60 @@
+import datetime
+
+import massgov.pfml.db.models as models
+from massgov.pfml.db.models import lookup_sync
+from massgov.pfml.db.models.applications import Holiday, LkPhoneType, PhoneType
+
+
+def test_compute_fingerprint():
+    holidays = [
+        Holiday(holiday_id=1, date=datetime.date(2022, 1, 1), holiday_name="New Year's Day")
+    ]
+    fingerprint = lookup_sync.compute_fingerprint([PhoneType], holidays)
+
+    assert lookup_sync.compute_fingerprint([PhoneType], holidays) == fingerprint
+    assert lookup_sync.compute_fingerprint([PhoneType], []) != fingerprint
+
+    moved_holidays = [
+        Holiday(holiday_id=1, date=datetime.date(2022, 1, 3), holiday_name="New Year's Day")
+    ]
+    assert lookup_sync.compute_fingerprint([PhoneType], moved_holidays) != fingerprint
+
+
+def test_compute_fingerprint_template_changed(monkeypatch):
+    fingerprint = lookup_sync.compute_fingerprint([PhoneType], [])
+
+    monkeypatch.setattr(PhoneType, "FAX", LkPhoneType(2, "Facsimile"))
+    assert lookup_sync.compute_fingerprint([PhoneType], []) != fingerprint
+
+
+def test_get_lookup_tables():
+    lookup_tables = lookup_sync.get_lookup_tables()
+
+    assert PhoneType in lookup_tables
+    assert lookup_tables == models.LOOKUP_SYNC_TABLES
+
+
+def test_sync_lookups_fingerprint_current(test_db_session):
+    # The test database was synced when it was created
+    assert lookup_sync.get_fingerprint(test_db_session) == models.LOOKUP_SYNC_FINGERPRINT
+
+    assert models.sync_lookups(test_db_session) is False
+    assert PhoneType.description_to_id["Cell"] == 1
+    assert PhoneType.get_instance(test_db_session, template=PhoneType.CELL).phone_type_id == 1
+
+
+def test_sync_lookups_fingerprint_changed(test_db_session):
+    lookup_sync.set_fingerprint(test_db_session, "outdated")
+    test_db_session.query(LkPhoneType).filter(LkPhoneType.phone_type_id == 2).update(
+        {LkPhoneType.phone_type_description: "Facsimile"}
+    )
+
+    assert models.sync_lookups(test_db_session) is True
+
+    assert lookup_sync.get_fingerprint(test_db_session) == models.LOOKUP_SYNC_FINGERPRINT
+    assert (
+        test_db_session.query(LkPhoneType.phone_type_description)
+        .filter(LkPhoneType.phone_type_id == 2)
+        .scalar()
+        == "Fax"
+    )
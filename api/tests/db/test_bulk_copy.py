@@ -0,0 +1,43 @@
+import uuid
+from decimal import Decimal
+
+from massgov.pfml.db.bulk_copy import copy_rows, format_copy_value
+from massgov.pfml.db.models.employees import ReferenceFile, ReferenceFileType
+
+
+def test_format_copy_value():
+    assert format_copy_value(None) == "\\N"
+    assert format_copy_value("") == ""
+    assert format_copy_value(12) == "12"
+    assert format_copy_value(Decimal("1.50")) == "1.50"
+    assert format_copy_value(True) == "True"
+    assert format_copy_value("a\tb\nc\rd\\e") == "a\\tb\\nc\\rd\\\\e"
+
+
+def test_copy_rows(test_db_session):
+    rows = [
+        (
+            uuid.uuid4(),
+            f"s3://bucket/path/{i}\twith tab",
+            ReferenceFileType.GAX.reference_file_type_id,
+        )
+        for i in range(5)
+    ]
+    chunk_counts = []
+
+    row_count = copy_rows(
+        test_db_session,
+        ReferenceFile.__tablename__,
+        ["reference_file_id", "file_location", "reference_file_type_id"],
+        rows,
+        chunk_size=2,
+        on_chunk=chunk_counts.append,
+    )
+
+    assert row_count == 5
+    assert chunk_counts == [2, 4, 5]
+
+    reference_files = test_db_session.query(ReferenceFile).all()
+    assert {reference_file.file_location for reference_file in reference_files} == {
+        row[1] for row in rows
+    }
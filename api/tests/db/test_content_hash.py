@@ -0,0 +1,89 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+
+from massgov.pfml.db.content_hash import content_hash, content_hash_sql, normalize_value
+from massgov.pfml.db.models.employees import DiaReductionPayment, DuaReductionPayment
+
+DIA_TABLE = DiaReductionPayment.__table__
+DIA_COLUMNS = DiaReductionPayment.payment_data_columns
+
+
+def test_normalize_value():
+    assert normalize_value(DIA_TABLE.c.award_date, "20210105") == date(2021, 1, 5)
+    assert normalize_value(DIA_TABLE.c.award_date, "2021-01-05") == date(2021, 1, 5)
+    assert normalize_value(DIA_TABLE.c.award_date, "01/05/2021") == date(2021, 1, 5)
+    assert normalize_value(DIA_TABLE.c.award_date, date(2021, 1, 5)) == date(2021, 1, 5)
+    assert normalize_value(DIA_TABLE.c.award_amount, "50.00") == Decimal("50.00")
+    assert normalize_value(DIA_TABLE.c.board_no, "") is None
+    assert normalize_value(DIA_TABLE.c.board_no, None) is None
+
+    with pytest.raises(ValueError):
+        normalize_value(DIA_TABLE.c.award_date, "STRING INSTEAD OF DATE")
+
+
+def test_content_hash_matches_for_raw_and_typed_values():
+    raw = {
+        "fineos_customer_number": "1234",
+        "board_no": "",
+        "award_amount": "50.00",
+        "award_date": "20210105",
+        "weekly_amount": "0.0",
+    }
+    typed = {
+        "fineos_customer_number": "1234",
+        "board_no": None,
+        "award_amount": Decimal(50),
+        "award_date": date(2021, 1, 5),
+        "weekly_amount": Decimal(0),
+    }
+
+    assert content_hash(DIA_TABLE, DIA_COLUMNS, raw) == content_hash(DIA_TABLE, DIA_COLUMNS, typed)
+
+
+def test_content_hash_differs_by_column():
+    # A separator in a value must not make two different rows hash the same
+    first = {"fineos_customer_number": "1234|", "board_no": "5"}
+    second = {"fineos_customer_number": "1234", "board_no": "|5"}
+
+    assert content_hash(DIA_TABLE, DIA_COLUMNS, first) != content_hash(
+        DIA_TABLE, DIA_COLUMNS, second
+    )
+
+
+def test_content_hash_sql_matches_python(test_db_session, initialize_factories_session):
+    payment = DiaReductionPayment(
+        fineos_customer_number="12|34\\",
+        award_amount=Decimal("50.10"),
+        award_date=date(2021, 1, 5),
+        weekly_amount=Decimal("-0.00"),
+    )
+    test_db_session.add(payment)
+    test_db_session.commit()
+
+    column_types = {
+        column_name: DIA_TABLE.c[column_name].type.__visit_name__.lower()
+        for column_name in DIA_COLUMNS
+    }
+    sql_hash = test_db_session.execute(
+        text(
+            f"SELECT {content_hash_sql(column_types)} FROM dia_reduction_payment "
+            "WHERE dia_reduction_payment_id = :id"
+        ),
+        {"id": payment.dia_reduction_payment_id},
+    ).scalar()
+
+    assert payment.payment_data_hash == sql_hash
+
+
+def test_content_hash_default_for_orm_rows(test_db_session, initialize_factories_session):
+    data = {"fineos_customer_number": "1234", "payment_date": date(2021, 1, 5)}
+    payment = DuaReductionPayment(**data)
+    test_db_session.add(payment)
+    test_db_session.commit()
+
+    assert payment.payment_data_hash == content_hash(
+        DuaReductionPayment.__table__, DuaReductionPayment.payment_data_columns, data
+    )
@@ -400,3 +400,27 @@ def test_lookup_modified_as_foreign_key_other_session(
     assert widget.shape == square
     assert widget.colour_id == 3
     assert widget.shape_id == 2
+
+
+def test_populate_db_instance_cache(test_db_session, class_colour, class_shape):
+    Colour, Shape = class_colour, class_shape
+
+    Colour.sync_to_database(test_db_session)
+    Shape.sync_to_database(test_db_session)
+    test_db_session.commit()
+
+    # As a process that finds the database already synced would
+    Colour.populate_db_instance_cache()
+    Shape.populate_db_instance_cache()
+    assert Colour.description_to_id == {"orange": 1, "blue": 2, "purple": 3}
+
+    purple = Colour.get_instance(test_db_session, template=Colour.PURPLE)
+    square = Shape.get_instance(test_db_session, description="square")
+    assert purple.colour_name == "purple"
+    assert square.corners == 4
+
+    widget = Widget(name="Test widget 1", colour=purple, shape=square)
+    test_db_session.add(widget)
+    test_db_session.commit()
+    assert widget.colour_id == 3
+    assert widget.shape_id == 2
@@ -9,6 +9,7 @@ from massgov.pfml.db.models.factories import (
     TaxIdentifierFactory,
 )
 from massgov.pfml.delegated_payments.irs_1099.generate_documents import Generate1099DocumentsStep
+from massgov.pfml.util.batch.log import LogEntry
 
 
 @pytest.fixture
@@ -173,3 +174,108 @@ def test_run_step_success(generate_1099_document_step: Generate1099DocumentsStep
         mock_update_1099_template.return_value = None
         mock_generate_1099_documents.return_value = None
         generate_1099_document_step.run_step()
+
+
+def test_generate_1099_documents_concurrently(
+    generate_1099_document_step: Generate1099DocumentsStep, test_db_session, test_db_other_session
+):
+    batch = Pfml1099BatchFactory.create()
+    pfml_list = []
+    for _ in range(5):
+        employee = EmployeeFactory.create()
+        pfml_list.append(
+            Pfml1099Factory.create(
+                pfml_1099_batch_id=batch.pfml_1099_batch_id,
+                employee_id=employee.employee_id,
+                tax_identifier_id=employee.tax_identifier_id,
+                s3_location=None,
+            )
+        )
+    failed_id = str(pfml_list[3].pfml_1099_id)
+
+    def post(url, json, headers):
+        response = mock.Mock()
+        response.ok = json["id"] != failed_id
+        response.text = "Error"
+        return response
+
+    generate_1099_document_step.pdfApiEndpoint = "http://localhost:5001/api/pdf/generate"
+    with mock.patch(
+        "massgov.pfml.delegated_payments.irs_1099.generate_documents.MAX_RECORDS_IN_SUBBATCH", 2
+    ), mock.patch("requests.Session.post", side_effect=post) as mocked_post, LogEntry(
+        test_db_other_session, "test"
+    ) as log_entry:
+        generate_1099_document_step.log_entry = log_entry
+        generate_1099_document_step._generate_1099_documents_concurrently(
+            str(batch.pfml_1099_batch_id), pfml_list, 3, max_workers=3
+        )
+
+    assert mocked_post.call_count == 5
+
+    # Sub-batches follow the order of the records, not the order requests complete
+    for i, pfml_1099 in enumerate(pfml_list):
+        test_db_session.refresh(pfml_1099)
+        if i == 3:
+            assert pfml_1099.s3_location is None
+        else:
+            assert pfml_1099.s3_location == (
+                f"Batch-{batch.pfml_1099_batch_id}/Forms/Sub-batch-{3 + i // 2}/"
+                f"{pfml_1099.pfml_1099_id}.pdf"
+            )
+
+    metrics = generate_1099_document_step.log_entry.metrics
+    assert metrics[Generate1099DocumentsStep.Metrics.DOCUMENT_COUNT] == 4
+    assert metrics[Generate1099DocumentsStep.Metrics.DOCUMENT_ERROR] == 1
+    assert metrics[Generate1099DocumentsStep.Metrics.DOCUMENT_ERROR_RATE] == 0.2
+
+
+def test_generate_1099_documents_concurrently_continues_after_errors(
+    generate_1099_document_step: Generate1099DocumentsStep, test_db_session, test_db_other_session
+):
+    batch = Pfml1099BatchFactory.create()
+    pfml_list = []
+    for _ in range(4):
+        employee = EmployeeFactory.create()
+        pfml_list.append(
+            Pfml1099Factory.create(
+                pfml_1099_batch_id=batch.pfml_1099_batch_id,
+                employee_id=employee.employee_id,
+                tax_identifier_id=employee.tax_identifier_id,
+                s3_location=None,
+            )
+        )
+    build_error_id = pfml_list[1].pfml_1099_id
+    post_error_id = str(pfml_list[2].pfml_1099_id)
+    build_document_dto = generate_1099_document_step._build_document_dto
+
+    def build(record, sub_batch, ssn):
+        if record.pfml_1099_id == build_error_id:
+            raise ValueError("bad record")
+        return build_document_dto(record, sub_batch, ssn)
+
+    def post(url, json, headers):
+        if json["id"] == post_error_id:
+            raise ValueError("bad response")
+        response = mock.Mock()
+        response.ok = True
+        return response
+
+    generate_1099_document_step.pdfApiEndpoint = "http://localhost:5001/api/pdf/generate"
+    with mock.patch.object(
+        generate_1099_document_step, "_build_document_dto", side_effect=build
+    ), mock.patch("requests.Session.post", side_effect=post), LogEntry(
+        test_db_other_session, "test"
+    ) as log_entry:
+        generate_1099_document_step.log_entry = log_entry
+        generate_1099_document_step._generate_1099_documents_concurrently(
+            str(batch.pfml_1099_batch_id), pfml_list, 1, max_workers=2
+        )
+
+    for i, pfml_1099 in enumerate(pfml_list):
+        test_db_session.refresh(pfml_1099)
+        assert (pfml_1099.s3_location is None) == (i in (1, 2))
+
+    metrics = generate_1099_document_step.log_entry.metrics
+    assert metrics[Generate1099DocumentsStep.Metrics.DOCUMENT_COUNT] == 2
+    assert metrics[Generate1099DocumentsStep.Metrics.DOCUMENT_ERROR] == 2
+    assert metrics[Generate1099DocumentsStep.Metrics.DOCUMENT_ERROR_RATE] == 0.5
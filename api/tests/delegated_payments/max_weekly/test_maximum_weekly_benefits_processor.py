@@ -746,3 +746,73 @@ def test_validate_payments_with_employer_reimbursement(maximum_weekly_processor,
 
     validate_payment_success(employer_reimbursement_payment3)
     validate_payment_success(standard_payment3)
+
+
+def test_preload_prior_payments(
+    maximum_weekly_processor, test_db_session, sqlalchemy_query_counter
+):
+    employee1 = EmployeeFactory.create()
+    employee2 = EmployeeFactory.create()
+    employee_without_payments = EmployeeFactory.create()
+
+    # A current payment for each employee that, with their prior payments, goes over the cap
+    payment_container1 = _create_payment_container(
+        employee1,
+        Decimal("500.00"),
+        test_db_session,
+        is_ready_for_max_weekly_benefit_validation=True,
+    )
+    payment_container2 = _create_payment_container(
+        employee2,
+        Decimal("500.00"),
+        test_db_session,
+        is_ready_for_max_weekly_benefit_validation=True,
+    )
+
+    prior_payment1 = _create_payment_container(
+        employee1, Decimal("500.00"), test_db_session, has_processed_state=True
+    )
+    overpayment1 = _create_payment_container(
+        employee1,
+        Decimal("-200.00"),
+        test_db_session,
+        is_overpayment=True,
+        payment_transaction_type=PaymentTransactionType.OVERPAYMENT,
+    )
+    prior_payment2 = _create_payment_container(
+        employee2, Decimal("500.00"), test_db_session, has_processed_state=True
+    )
+    # Errored payments are not prior payments
+    _create_payment_container(employee2, Decimal("500.00"), test_db_session, has_errored_state=True)
+
+    current_payment_ids = [
+        payment_container1.payment.payment_id,
+        payment_container2.payment.payment_id,
+    ]
+    maximum_weekly_processor.preload_prior_payments(
+        [employee1.employee_id, employee2.employee_id, employee_without_payments.employee_id],
+        current_payment_ids,
+    )
+
+    def prior_payment_ids(employee):
+        return {
+            container.payment.payment_id
+            for container in maximum_weekly_processor._get_prior_payments(
+                employee, current_payment_ids
+            )
+        }
+
+    with sqlalchemy_query_counter(test_db_session, expected_query_count=0):
+        assert prior_payment_ids(employee1) == {
+            prior_payment1.payment.payment_id,
+            overpayment1.payment.payment_id,
+        }
+        assert prior_payment_ids(employee2) == {prior_payment2.payment.payment_id}
+        assert prior_payment_ids(employee_without_payments) == set()
+
+    maximum_weekly_processor.process(employee1, [payment_container1])
+    maximum_weekly_processor.process(employee2, [payment_container2])
+
+    # 500 + 500 - 200 is under the $850 cap, 500 + 500 is over it
+    validate_payment_success(payment_container1)
+    validate_payment_failed(payment_container2)
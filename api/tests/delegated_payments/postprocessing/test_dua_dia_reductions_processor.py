@@ -362,3 +362,42 @@ def test_multiple_payments(dua_dia_reductions_processor, test_db_session):
         )
         .one_or_none()
     )
+
+
+def test_preload_reductions(
+    dua_dia_reductions_processor, test_db_session, sqlalchemy_query_counter
+):
+    employee = EmployeeFactory.create(fineos_customer_number="1")
+    claim = ClaimFactory.create(employee=employee)
+    payment = PaymentFactory.create(
+        claim=claim, period_start_date=date(2021, 1, 16), period_end_date=date(2021, 1, 16)
+    )
+
+    # request week begins within the period
+    DuaReductionPaymentFactory.create(
+        fineos_customer_number="1", request_week_begin_date=date(2021, 1, 16)
+    )
+    # request week ends (begin date + 6) within the period
+    DuaReductionPaymentFactory.create(
+        fineos_customer_number="1", request_week_begin_date=date(2021, 1, 10)
+    )
+    # request week spans the period, but neither begins nor ends in it
+    DuaReductionPaymentFactory.create(
+        fineos_customer_number="1", request_week_begin_date=date(2021, 1, 12)
+    )
+    DiaReductionPaymentFactory.create(fineos_customer_number="1")
+    test_db_session.commit()
+
+    dua_dia_reductions_processor.preload_reductions([payment])
+
+    dua_index = dua_dia_reductions_processor._get_dua_index("1")
+    overlapping = dua_index.overlapping(payment.period_start_date, payment.period_end_date)
+    assert [r.request_week_begin_date for r in overlapping] == [
+        date(2021, 1, 10),
+        date(2021, 1, 16),
+    ]
+
+    # Checking a preloaded claimant does not query for reductions
+    with sqlalchemy_query_counter(test_db_session, expected_query_count=0):
+        dua_dia_reductions_processor._get_dua_index("1")
+        assert len(dua_dia_reductions_processor._get_dia_reductions("1")) == 1
@@ -13,6 +13,7 @@ from massgov.pfml.db.models.factories import (
     EmployeeWithFineosNumberFactory,
     ExperianAddressPairFactory,
     PaymentFactory,
+    ReferenceFileFactory,
 )
 from massgov.pfml.db.models.geo import GeoState
 from massgov.pfml.delegated_payments.address_validation import Constants
@@ -224,3 +225,50 @@ def test_formatted_address(address_factory, claimant_address_step):
         address_factory
     )
     assert result_text_address_old != result_text_address_new
+
+
+def test_process_address_data_shares_pair_for_repeated_address(claimant_address_step):
+    employee = EmployeeFactory.build()
+    addresses = [
+        AddressFactory.build(
+            address_line_one=line_one,
+            address_line_two="",
+            city="Boston",
+            geo_state_id=GeoState.MA.geo_state_id,
+            zip_code="02110",
+        )
+        for line_one in ("1 Main St", " 1 MAIN ST")
+    ]
+    feed = [mock.Mock(customerno="1234"), mock.Mock(customerno="1234")]
+    address_pairs = []
+
+    def process_address_via_soap_api(client, address, address_pair, new_address, *args):
+        address_pairs.append((address_pair, new_address))
+        return None
+
+    with mock.patch(
+        "massgov.pfml.delegated_payments.claimant_address_validation._get_experian_soap_client",
+        return_value=soap_api.Client(MockVerificationZeepCaller()),
+    ), mock.patch(
+        "massgov.pfml.delegated_payments.delegated_payments_util.find_existing_address_pair",
+        return_value=None,
+    ) as find_existing_address_pair, mock.patch.object(
+        claimant_address_step, "get_fineos_employee_feed", return_value=feed
+    ), mock.patch.object(
+        claimant_address_step, "get_employee_record", return_value=employee
+    ), mock.patch.object(
+        claimant_address_step, "construct_address_data", side_effect=addresses
+    ), mock.patch.object(
+        claimant_address_step,
+        "process_address_via_soap_api",
+        side_effect=process_address_via_soap_api,
+    ), mock.patch.object(
+        claimant_address_step, "upload_results_s3", return_value=ReferenceFileFactory.build()
+    ):
+        claimant_address_step.process_address_data()
+
+    find_existing_address_pair.assert_called_once()
+    assert len(address_pairs) == 2
+    assert address_pairs[0][0] is address_pairs[1][0]
+    assert address_pairs[0][0].fineos_address is addresses[0]
+    assert [new_address for _, new_address in address_pairs] == [True, True]
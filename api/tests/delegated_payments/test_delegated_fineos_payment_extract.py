@@ -484,6 +484,58 @@ def test_run_step_happy_path(payment_extract_step, test_db_session):
     assert import_log_report["standard_valid_payment_count"] == 2
 
 
+def test_payment_extract_prefetch(payment_extract_step, test_db_session):
+    payment_data = FineosPaymentData()
+    add_db_records_from_fineos_data(test_db_session, payment_data)
+    # No tax identifier or claim exists for this one
+    missing_payment_data = FineosPaymentData()
+
+    reference_file = ReferenceFileFactory.create(
+        reference_file_type_id=ReferenceFileType.FINEOS_PAYMENT_EXTRACT.reference_file_type_id
+    )
+    claimant_reference_file = ReferenceFileFactory.create(
+        reference_file_type_id=ReferenceFileType.FINEOS_CLAIMANT_EXTRACT.reference_file_type_id
+    )
+    stage_data(
+        [payment_data, missing_payment_data],
+        test_db_session,
+        reference_file=reference_file,
+        claimant_reference_file=claimant_reference_file,
+    )
+    raw_payment_records = (
+        test_db_session.query(FineosExtractVpei)
+        .filter(FineosExtractVpei.reference_file_id == reference_file.reference_file_id)
+        .all()
+    )
+
+    prefetch = extractor.PaymentExtractPrefetch(
+        test_db_session, reference_file, claimant_reference_file, raw_payment_records
+    )
+
+    ci_key = (payment_data.c_value, payment_data.i_value)
+    assert len(prefetch.payment_details_by_ci[ci_key]) == 1
+    assert len(prefetch.payment_lines_by_ci[ci_key]) == 1
+    assert len(prefetch.claim_details_by_ci[ci_key]) == 1
+    assert len(prefetch.requested_absences_by_leave_request_id[payment_data.leave_request_id]) == 1
+
+    claim = prefetch.claims_by_absence_case_number[payment_data.absence_case_number]
+    assert claim.fineos_absence_id == payment_data.absence_case_number
+    assert prefetch.tax_identifier_found_by_tin[payment_data.tin] is True
+    assert prefetch.employees_by_tin[payment_data.tin].employee_id == claim.employee_id
+
+    assert prefetch.claims_by_absence_case_number[missing_payment_data.absence_case_number] is None
+    assert prefetch.tax_identifier_found_by_tin[missing_payment_data.tin] is False
+    assert prefetch.employees_by_tin[missing_payment_data.tin] is None
+
+    # The step answers lookups from the prefetched indexes
+    payment_extract_step.prefetch = prefetch
+    assert payment_extract_step._get_claim(payment_data.absence_case_number) == claim
+    assert payment_extract_step._get_tax_identifier_and_employee(missing_payment_data.tin) == (
+        False,
+        None,
+    )
+
+
 def test_run_step_multiple_times(payment_extract_step, test_db_session):
     # Test what happens if we run multiple times on the same data
     # After the first run, the step should no-op as the reference file
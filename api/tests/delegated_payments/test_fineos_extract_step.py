@@ -516,6 +516,126 @@ def test_vbi_taskreport_som_extracts(
     validate_records(filtered_records, FineosExtractVbiTaskReportSom, "TASKID", test_db_session)
 
 
+def test_run_with_copy_loader(
+    mock_s3_bucket,
+    mock_fineos_s3_bucket,
+    set_exporter_env_vars,
+    test_db_session,
+    monkeypatch,
+):
+    monkeypatch.setenv("FINEOS_PAYMENT_EXTRACT_MAX_HISTORY_DATE", "2019-12-31")
+    monkeypatch.setenv("FINEOS_CLAIMANT_EXTRACT_MAX_HISTORY_DATE", "2019-12-31")
+    monkeypatch.setenv("ENABLE_FINEOS_EXTRACT_COPY_LOADER", "1")
+
+    payment_data = [FineosPaymentData(), FineosPaymentData(), FineosPaymentData()]
+    claimant_data = [FineosPaymentData(), FineosPaymentData(), FineosPaymentData()]
+
+    upload_fineos_payment_data(mock_fineos_s3_bucket, payment_data)
+    upload_fineos_claimant_data(mock_fineos_s3_bucket, claimant_data)
+
+    for extract_config in [CLAIMANT_EXTRACT_CONFIG, PAYMENT_EXTRACT_CONFIG]:
+        fineos_extract_step = FineosExtractStep(
+            db_session=test_db_session,
+            log_entry_db_session=test_db_session,
+            extract_config=extract_config,
+        )
+        assert fineos_extract_step.use_copy_loader
+        fineos_extract_step.run()
+
+    # The rows loaded with COPY should be identical to those from the ORM path
+    validate_records(
+        [record.get_employee_feed_record() for record in claimant_data],
+        FineosExtractEmployeeFeed,
+        "I",
+        test_db_session,
+    )
+    validate_records(
+        [record.get_requested_absence_som_record() for record in claimant_data],
+        FineosExtractVbiRequestedAbsenceSom,
+        "ABSENCE_CASENUMBER",
+        test_db_session,
+    )
+    validate_records(
+        [record.get_requested_absence_record() for record in claimant_data],
+        FineosExtractVbiRequestedAbsence,
+        "LEAVEREQUEST_ID",
+        test_db_session,
+    )
+    validate_records(
+        [record.get_vpei_record() for record in payment_data],
+        FineosExtractVpei,
+        "I",
+        test_db_session,
+    )
+    validate_records(
+        [record.get_claim_details_record() for record in payment_data],
+        FineosExtractVpeiClaimDetails,
+        "LEAVEREQUESTI",
+        test_db_session,
+    )
+    validate_records(
+        [record.get_payment_details_record() for record in payment_data],
+        FineosExtractVpeiPaymentDetails,
+        "PEINDEXID",
+        test_db_session,
+    )
+    validate_records(
+        [record.get_payment_line_record() for record in payment_data],
+        FineosExtractVpeiPaymentLine,
+        "I",
+        test_db_session,
+    )
+
+    payment_reference_file = (
+        test_db_session.query(ReferenceFile)
+        .filter(
+            ReferenceFile.reference_file_type_id
+            == ReferenceFileType.FINEOS_PAYMENT_EXTRACT.reference_file_type_id
+        )
+        .one()
+    )
+    assert payment_reference_file.file_location.startswith(
+        f"s3://{mock_s3_bucket}/cps/inbound/processed/"
+    )
+    for vpei in test_db_session.query(FineosExtractVpei).all():
+        assert vpei.reference_file_id == payment_reference_file.reference_file_id
+
+
+def test_vbi_taskreport_som_extracts_with_copy_loader(
+    mock_s3_bucket,
+    mock_fineos_s3_bucket,
+    set_exporter_env_vars,
+    test_db_session,
+    monkeypatch,
+):
+    monkeypatch.setenv("FINEOS_VBI_TASKREPORT_SOM_EXTRACT_MAX_HISTORY_DATE", "2019-12-31")
+
+    records = get_vbi_taskreport_som_extract_records()
+
+    folder_path = os.path.join(f"s3://{mock_fineos_s3_bucket}", "DT2/dataexports/")
+    create_vbi_taskreport_som_extract_files(
+        records, folder_path, datetime.strptime(date_str, "%Y-%m-%d-%H-%M-%S")
+    )
+
+    fineos_extract_step = FineosExtractStep(
+        db_session=test_db_session,
+        log_entry_db_session=test_db_session,
+        extract_config=VBI_TASKREPORT_SOM_EXTRACT_CONFIG,
+        use_copy_loader=True,
+    )
+    fineos_extract_step.run()
+
+    # Filters are applied while streaming, before rows reach COPY
+    filtered_records = get_vbi_taskreport_som_extract_filtered_records(records)
+    validate_records(filtered_records, FineosExtractVbiTaskReportSom, "TASKID", test_db_session)
+
+    metrics = fineos_extract_step.log_entry.metrics
+    assert metrics[FineosExtractStep.Metrics.RECORDS_PROCESSED_COUNT] == len(filtered_records)
+    assert metrics[FineosExtractStep.Metrics.RECORDS_FILTERED_OUT_COUNT] == len(records) - len(
+        filtered_records
+    )
+
+
 def test_run_with_error_during_processing(
     mock_s3_bucket,
     mock_fineos_s3_bucket,
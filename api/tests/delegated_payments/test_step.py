@@ -1,10 +1,11 @@
 import enum
+from typing import List, Optional
 
 import pytest
 from freezegun.api import freeze_time
 
 from massgov.pfml import db
-from massgov.pfml.db.models.employees import ImportLogReportQueue
+from massgov.pfml.db.models.employees import ImportLog, ImportLogReportQueue, ReferenceFile
 from massgov.pfml.delegated_payments.step import Step
 
 
@@ -25,6 +26,56 @@ class ExampleErrorStep(Step):
         raise Exception()
 
 
+class ExampleChunkedStep(Step):
+    """Adds a reference file per record, failing at fail_at_key if set."""
+
+    class Metrics(str, enum.Enum):
+        PROCESSED_COUNT = "processed_count"
+
+    checkpoint_interval: Optional[int] = 3
+
+    def __init__(self, db_session, log_entry_db_session, record_keys, fail_at_key=None):
+        super().__init__(db_session, log_entry_db_session)
+        self.record_keys = record_keys
+        self.fail_at_key = fail_at_key
+        self.processed_keys: List[int] = []
+
+    def run_step(self):
+        self.process_records_with_checkpoints(
+            self.record_keys, lambda key: key, self.process_record
+        )
+
+    def process_record(self, key):
+        if key == self.fail_at_key:
+            raise Exception(f"Failed at record {key}")
+
+        # file_location is unique, so processing a committed record again would fail
+        self.db_session.add(ReferenceFile(file_location=f"s3://test/chunked/record-{key:03}"))
+        self.processed_keys.append(key)
+        self.increment(self.Metrics.PROCESSED_COUNT)
+
+
+def _committed_keys(db_session):
+    db_session.expire_all()
+    return sorted(
+        int(file_location.rsplit("-", 1)[1])
+        for (file_location,) in db_session.query(ReferenceFile.file_location).filter(
+            ReferenceFile.file_location.like("s3://test/chunked/%")
+        )
+    )
+
+
+def _import_logs(db_session):
+    # The checkpoints are written with an UPDATE, which leaves loaded import logs as they were
+    db_session.expire_all()
+    return (
+        db_session.query(ImportLog)
+        .filter(ImportLog.source == ExampleChunkedStep.__name__)
+        .order_by(ImportLog.import_log_id)
+        .all()
+    )
+
+
 @pytest.mark.parametrize(
     "business_days,date_ran,found_log",
     [
@@ -99,3 +150,77 @@ def test_add_to_report_queue__flag_set(
 
     assert len(report_queue_items) == 1
     assert report_queue_items[0].import_log_id == example_step.get_import_log_id()
+
+
+def test_chunked_step_failure_keeps_committed_chunks(initialize_factories_session, test_db_session):
+    step = ExampleChunkedStep(
+        test_db_session, test_db_session, record_keys=range(1, 11), fail_at_key=8
+    )
+
+    with pytest.raises(Exception, match="Failed at record 8"):
+        step.run()
+
+    # Records 1-6 were committed in two chunks, record 7 was rolled back with the failure
+    assert _committed_keys(test_db_session) == [1, 2, 3, 4, 5, 6]
+
+    (import_log,) = _import_logs(test_db_session)
+    assert import_log.status == "error"
+    assert import_log.checkpoint == {"last_key": 6, "metrics": {"processed_count": 6}}
+
+
+def test_chunked_step_resumes_from_checkpoint(initialize_factories_session, test_db_session):
+    record_keys = range(1, 11)
+
+    with pytest.raises(Exception, match="Failed at record 8"):
+        ExampleChunkedStep(test_db_session, test_db_session, record_keys, fail_at_key=8).run()
+
+    # Failing again before the next checkpoint keeps the original checkpoint
+    with pytest.raises(Exception, match="Failed at record 9"):
+        ExampleChunkedStep(test_db_session, test_db_session, record_keys, fail_at_key=9).run()
+    assert _committed_keys(test_db_session) == [1, 2, 3, 4, 5, 6]
+
+    step = ExampleChunkedStep(test_db_session, test_db_session, record_keys)
+    step.run()
+
+    assert step.processed_keys == [7, 8, 9, 10]
+    assert _committed_keys(test_db_session) == list(record_keys)
+
+    first_import_log, second_import_log, third_import_log = _import_logs(test_db_session)
+    assert second_import_log.checkpoint == first_import_log.checkpoint
+    assert third_import_log.status == "success"
+    assert third_import_log.checkpoint == {
+        "last_key": 10,
+        "metrics": {
+            "processed_count": 10,
+            "resumed_from_import_log_id": second_import_log.import_log_id,
+        },
+    }
+    assert step.log_entry.metrics["processed_count"] == 10
+    assert step.log_entry.metrics["resumed_from_import_log_id"] == second_import_log.import_log_id
+
+
+def test_chunked_step_starts_over_after_success(initialize_factories_session, test_db_session):
+    ExampleChunkedStep(test_db_session, test_db_session, range(1, 5)).run()
+
+    step = ExampleChunkedStep(test_db_session, test_db_session, range(1, 8))
+    # Only the new records are processed, as the earlier ones would collide
+    step.record_keys = range(5, 8)
+    step.run()
+
+    assert step.resume_key is None
+    assert step.processed_keys == [5, 6, 7]
+    assert "resumed_from_import_log_id" not in step.log_entry.metrics
+
+
+def test_step_without_checkpoints_is_all_or_nothing(initialize_factories_session, test_db_session):
+    step = ExampleChunkedStep(
+        test_db_session, test_db_session, record_keys=range(1, 11), fail_at_key=8
+    )
+    step.checkpoint_interval = None
+
+    with pytest.raises(Exception, match="Failed at record 8"):
+        step.run()
+
+    assert _committed_keys(test_db_session) == []
+    (import_log,) = _import_logs(test_db_session)
+    assert import_log.checkpoint is None
@@ -0,0 +1,230 @@
+import logging  # noqa: B1
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from massgov.pfml.delegated_payments.step_runner import StepDefinition, StepGraph, StepRunner
+
+# Long enough that a step waiting on another only times out if the runner is broken
+BARRIER_TIMEOUT_SECONDS = 5
+
+
+class RecordingSteps:
+    """Makes fake steps that record when they run, and can wait for each other to prove they
+    overlap."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = []
+        self.sessions = {}
+        self.running = 0
+        self.max_running = 0
+
+    def definition(self, name, reads=(), writes=(), barrier=None, error=None, seconds=0):
+        def make_step(db_session, log_entry_db_session):
+            return FakeStep(self, name, db_session, log_entry_db_session, barrier, error, seconds)
+
+        return StepDefinition(name, make_step, frozenset(reads), frozenset(writes))
+
+
+class FakeStep:
+    def __init__(self, steps, name, db_session, log_entry_db_session, barrier, error, seconds):
+        self.steps = steps
+        self.name = name
+        self.db_session = db_session
+        self.log_entry_db_session = log_entry_db_session
+        self.barrier = barrier
+        self.error = error
+        self.seconds = seconds
+
+    def run(self):
+        with self.steps.lock:
+            self.steps.started.append(self.name)
+            self.steps.sessions[self.name] = (self.db_session, self.log_entry_db_session)
+            self.steps.running += 1
+            self.steps.max_running = max(self.steps.max_running, self.steps.running)
+
+        try:
+            if self.barrier:
+                self.barrier.wait(timeout=BARRIER_TIMEOUT_SECONDS)
+            time.sleep(self.seconds)
+            if self.error:
+                raise self.error
+        finally:
+            with self.steps.lock:
+                self.steps.running -= 1
+
+
+@pytest.fixture
+def steps():
+    return RecordingSteps()
+
+
+def test_graph_dependencies(steps):
+    graph = StepGraph.build(
+        [
+            steps.definition("load-a", writes={"staging_a"}),
+            steps.definition("load-b", writes={"staging_b"}),
+            steps.definition("extract-a", reads={"staging_a"}, writes={"claim"}),
+            steps.definition("extract-b", reads={"staging_b", "claim"}, writes={"payment"}),
+            steps.definition("validate", reads={"claim"}, writes={"payment"}),
+            steps.definition("unrelated", writes={"other"}),
+        ]
+    )
+
+    assert graph.dependencies == {
+        "load-a": [],
+        "load-b": [],
+        "extract-a": ["load-a"],
+        "extract-b": ["load-b", "extract-a"],
+        # Also depends on extract-a, through extract-b
+        "validate": ["extract-b"],
+        "unrelated": [],
+    }
+
+    formatted = graph.format()
+    assert "extract-b" in formatted
+    assert "after: load-b, extract-a" in formatted
+
+
+def test_graph_write_after_read(steps):
+    # A later step that changes what an earlier step reads has to wait for it
+    graph = StepGraph.build(
+        [
+            steps.definition("report", reads={"payment"}),
+            steps.definition("cleanup", writes={"payment"}),
+        ]
+    )
+
+    assert graph.dependencies["cleanup"] == ["report"]
+
+
+def test_graph_requires_unique_names(steps):
+    with pytest.raises(ValueError, match="unique"):
+        StepGraph.build([steps.definition("a"), steps.definition("a")])
+
+
+def test_requires_session_factory_to_run_in_parallel(steps):
+    with pytest.raises(ValueError, match="make_db_session"):
+        StepRunner([steps.definition("a")], max_parallelism=2)
+
+
+def test_run_one_at_a_time_in_listed_order(steps):
+    db_session, log_entry_db_session = mock.MagicMock(), mock.MagicMock()
+
+    StepRunner(
+        [
+            steps.definition("c", writes={"x"}),
+            steps.definition("a"),
+            steps.definition("b", reads={"x"}),
+        ]
+    ).run(db_session, log_entry_db_session)
+
+    assert steps.started == ["c", "a", "b"]
+    assert steps.max_running == 1
+    assert set(steps.sessions.values()) == {(db_session, log_entry_db_session)}
+
+
+def test_run_independent_steps_in_parallel(steps):
+    # Both loads have to be running at once to get past the barrier
+    barrier = threading.Barrier(2)
+    make_db_session = mock.MagicMock(side_effect=lambda: mock.MagicMock())
+
+    runner = StepRunner(
+        [
+            steps.definition("load-a", writes={"staging_a"}, barrier=barrier),
+            steps.definition("load-b", writes={"staging_b"}, barrier=barrier),
+            steps.definition("extract", reads={"staging_a", "staging_b"}),
+        ],
+        max_parallelism=2,
+        make_db_session=make_db_session,
+    )
+    runner.run(mock.MagicMock(), mock.MagicMock())
+
+    assert not barrier.broken
+    assert steps.started[2] == "extract"
+    assert steps.max_running == 2
+
+    # Each step gets its own pair of sessions, which are committed and closed
+    assert make_db_session.call_count == 6
+    sessions = [session for pair in steps.sessions.values() for session in pair]
+    assert len(set(sessions)) == 6
+    for session in sessions:
+        session.commit.assert_called_once()
+        session.close.assert_called_once()
+
+    assert [timing.name for timing in runner.timings][2] == "extract"
+    extract_timing = runner.timings[2]
+    assert all(timing.end <= extract_timing.start for timing in runner.timings[:2])
+
+
+def test_run_limits_parallelism(steps):
+    runner = StepRunner(
+        [steps.definition(f"step-{i}") for i in range(6)],
+        max_parallelism=3,
+        make_db_session=mock.MagicMock,
+    )
+    runner.run(mock.MagicMock(), mock.MagicMock())
+
+    assert steps.max_running <= 3
+    # Ready steps start in the order they are listed
+    assert steps.started[:3] == ["step-0", "step-1", "step-2"]
+    assert sorted(steps.started) == [f"step-{i}" for i in range(6)]
+
+
+def test_failure_stops_later_steps(steps):
+    runner = StepRunner(
+        [
+            steps.definition("load", writes={"staging"}, error=Exception("load failed")),
+            steps.definition("extract", reads={"staging"}),
+            steps.definition("unrelated", writes={"other"}),
+        ],
+        max_parallelism=1,
+    )
+
+    with pytest.raises(Exception, match="load failed"):
+        runner.run(mock.MagicMock(), mock.MagicMock())
+
+    assert steps.started == ["load"]
+
+
+def test_parallel_failure_lets_running_steps_finish(steps):
+    barrier = threading.Barrier(2)
+    runner = StepRunner(
+        [
+            steps.definition(
+                "load-a", writes={"staging_a"}, barrier=barrier, error=Exception("load failed")
+            ),
+            # Still running when load-a fails
+            steps.definition("load-b", writes={"staging_b"}, barrier=barrier, seconds=0.5),
+            steps.definition("extract", reads={"staging_a"}),
+            steps.definition("unrelated", writes={"other"}),
+        ],
+        max_parallelism=2,
+        make_db_session=mock.MagicMock,
+    )
+
+    with pytest.raises(Exception, match="load failed"):
+        runner.run(mock.MagicMock(), mock.MagicMock())
+
+    assert sorted(steps.started) == ["load-a", "load-b"]
+    assert sorted(timing.name for timing in runner.timings) == ["load-a", "load-b"]
+
+
+def test_run_logs_timeline(steps, caplog):
+    caplog.set_level(logging.INFO)  # noqa: B1
+
+    StepRunner([steps.definition("load", writes={"staging"}), steps.definition("extract")]).run(
+        mock.MagicMock(), mock.MagicMock()
+    )
+
+    finished = [record for record in caplog.records if record.msg == "Finished step %s in %.2fs"]
+    assert [record.step for record in finished] == ["load", "extract"]
+    assert all(record.outcome == "success" for record in finished)
+
+    timeline = next(record for record in caplog.records if record.msg == "Step timeline: %s")
+    assert timeline.step_count == 2
+    assert timeline.max_parallelism == 1
+    assert "load 0.00s-" in timeline.getMessage()
@@ -941,6 +941,99 @@ def test_employee_wage_data_update(test_db_session, dor_employer_lookups):
     # ------------
 
 
+def test_employee_wage_data_copy_import(test_db_session, dor_employer_lookups):
+    report, report_log_entry = get_new_import_report(test_db_session)
+
+    employer_payload = test_data.get_new_employer()
+    import_dor.import_employers(
+        test_db_session, [employer_payload], report, report_log_entry.import_log_id
+    )
+    employer_id = (
+        test_db_session.query(Employer)
+        .filter(Employer.account_key == employer_payload["account_key"])
+        .one()
+        .employer_id
+    )
+
+    # initial import creates the wage row, unknown employer rows are skipped
+    employee_wage_data_payload = test_data.get_new_employee_wage_data()
+    unknown_employer_payload = copy.deepcopy(employee_wage_data_payload)
+    unknown_employer_payload["account_key"] = "00000000000"
+
+    employee_id_by_ssn = {}
+    import_dor.import_employees_and_wage_data(
+        test_db_session,
+        [employee_wage_data_payload, unknown_employer_payload],
+        employee_id_by_ssn,
+        report,
+        report_log_entry.import_log_id,
+        copy_wage_import=True,
+    )
+    employee_id = employee_id_by_ssn[employee_wage_data_payload["employee_ssn"]]
+
+    assert report.created_wages_and_contributions_count == 1
+    assert report.skipped_wages_count == 1
+    validate_wage_persistence(
+        employee_wage_data_payload,
+        dor_persistence_util.get_wages_and_contributions_by_employee_id_and_filling_period(
+            test_db_session, employee_id, employer_id, employee_wage_data_payload["filing_period"]
+        ),
+        report_log_entry.import_log_id,
+    )
+
+    # unchanged rows are left alone
+    report2, report_log_entry2 = get_new_import_report(test_db_session)
+    import_dor.import_employees_and_wage_data(
+        test_db_session,
+        [employee_wage_data_payload],
+        EMPTY_SSN_TO_EMPLOYEE_ID_MAP,
+        report2,
+        report_log_entry2.import_log_id,
+        copy_wage_import=True,
+    )
+
+    assert report2.created_wages_and_contributions_count == 0
+    assert report2.updated_wages_and_contributions_count == 0
+    assert report2.unmodified_wages_and_contributions_count == 1
+    assert test_db_session.query(WagesAndContributionsHistory).count() == 0
+
+    # changed rows are updated and their previous state captured in history
+    report3, report_log_entry3 = get_new_import_report(test_db_session)
+    updated_employee_wage_data_payload = test_data.get_updated_employee_wage_data()
+    import_dor.import_employees_and_wage_data(
+        test_db_session,
+        [updated_employee_wage_data_payload],
+        EMPTY_SSN_TO_EMPLOYEE_ID_MAP,
+        report3,
+        report_log_entry3.import_log_id,
+        copy_wage_import=True,
+    )
+
+    assert report3.created_wages_and_contributions_count == 0
+    assert report3.updated_wages_and_contributions_count == 1
+    assert report3.unmodified_wages_and_contributions_count == 0
+
+    test_db_session.expire_all()
+    persisted_wage_info = (
+        dor_persistence_util.get_wages_and_contributions_by_employee_id_and_filling_period(
+            test_db_session,
+            employee_id,
+            employer_id,
+            updated_employee_wage_data_payload["filing_period"],
+        )
+    )
+    validate_wage_persistence(
+        updated_employee_wage_data_payload, persisted_wage_info, report_log_entry3.import_log_id
+    )
+
+    wage_history_records = test_db_session.query(WagesAndContributionsHistory).all()
+    assert len(wage_history_records) == 1
+    assert wage_history_records[0].wage_and_contribution == persisted_wage_info
+    validate_wage_history_persistence(
+        employee_wage_data_payload, wage_history_records[0], report_log_entry.import_log_id
+    )
+
+
 # == Validation Helpers ==
 
 
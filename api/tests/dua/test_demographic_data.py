@@ -1,6 +1,7 @@
 import os
 from datetime import date, datetime
 
+import pytest
 from freezegun import freeze_time
 
 import massgov.pfml.util.files as file_util
@@ -241,6 +242,41 @@ def test_set_employee_occupation_from_demographics_data(
         assert eligibility_updates[0].employer_id == employer.employer_id
 
 
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_set_employee_occupation_from_demographics_data_unpadded_fein(
+    test_db_session, initialize_factories_session, chunk_size
+):
+    with LogEntry(test_db_session, "test log entry") as log_entry:
+        employer = EmployerFactory(employer_fein="012345678")
+        org_unit = OrganizationUnitFactory(employer=employer)
+        reporting_unit = DuaReportingUnitFactory(organization_unit=org_unit, employer=employer)
+        employee = EmployeeWithFineosNumberFactory()
+
+        # Both rows resolve to the same employee and employer, so the occupation created for the
+        # first must be seen by the second, whether or not they are in the same chunk
+        for employer_fein in ("12345678", "012345678"):
+            DuaEmployeeDemographicsFactory(
+                fineos_customer_number=employee.fineos_customer_number,
+                employer_fein=employer_fein,
+                employer_reporting_unit_number=reporting_unit.dua_id,
+            )
+
+        test_db_session.commit()
+
+        set_employee_occupation_from_demographic_data(
+            test_db_session, log_entry=log_entry, chunk_size=chunk_size
+        )
+
+        metrics = log_entry.metrics
+
+        assert metrics["created_employee_occupation_count"] == 1
+        assert metrics["occupation_org_unit_skipped_count"] == 1
+
+        occupations = employee.employee_occupations.all()
+        assert len(occupations) == 1
+        assert occupations[0].organization_unit_id == org_unit.organization_unit_id
+
+
 def test_set_employee_demographics_duplicate_employee_fineos_customer_numbers(
     test_db_session, initialize_factories_session
 ):
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+import massgov.pfml.dua.employer as employer
+from massgov.pfml.db.models.dua import DuaEmployer
+from massgov.pfml.db.models.employees import DuaEmployeeDemographics
+from massgov.pfml.dua.constants import Constants
+from massgov.pfml.dua.util import load_rows_from_file_path
+
+DEMOGRAPHICS_FILE = os.path.join(
+    os.path.dirname(__file__), "test_files", "test_dua_demographic_data.csv"
+)
+
+
+@pytest.mark.parametrize(
+    "chunk_size, dedupe_window_size, expected_chunk_count",
+    [
+        # the whole file in one chunk, duplicates dropped before insert
+        (1000, 1000, 1),
+        # duplicates are further apart than the window, so the database drops them
+        (2, 1, 6),
+    ],
+)
+def test_load_rows_from_file_path_in_chunks(
+    test_db_session, chunk_size, dedupe_window_size, expected_chunk_count
+):
+    result = load_rows_from_file_path(
+        DEMOGRAPHICS_FILE,
+        test_db_session,
+        Constants.DUA_DEMOGRAPHIC_CSV_COLUMN_TO_TABLE_DATA_FIELD_MAP,
+        DuaEmployeeDemographics,
+        chunk_size=chunk_size,
+        dedupe_window_size=dedupe_window_size,
+    )
+
+    assert result == {
+        "total_row_count": 11,
+        "inserted_row_count": 10,
+        "chunk_count": expected_chunk_count,
+    }
+    assert test_db_session.query(DuaEmployeeDemographics).count() == 10
+
+
+def test_load_employer_rows_dedupes_rows_with_null_columns(test_db_session, tmp_path):
+    # The trailing NAICS columns are missing from the repeated row, so they load as NULL, which
+    # uix_dua_employer never matches. The row hash catches the repeat, in the file and in later files.
+    employer_file = tmp_path / "employer.csv"
+    employer_file.write_text(
+        "FineosEmployerID,DBA,Attention,Email,PhoneNumber,AddressLine1,AddressLine2,AddressCity,"
+        "ZipCode,State,NAICS,NAICSDesc\n"
+        "1234567,,,abc@abc.com,123-456-7890,123 main st,,boston,03323,ma\n"
+        "1111111,,,cap@cap.com,352-356-2323,423 k st,,baltimore,24234,md,654209,Chauffeurs\n"
+        "2222222,,,dog@dog.com,352-356-2324,424 k st,,baltimore,24234,md,654209,Chauffeurs\n"
+        "1234567,,,abc@abc.com,123-456-7890,123 main st,,boston,03323,ma\n"
+    )
+
+    total_row_count, inserted_row_count = employer._load_employer_rows_from_file_path(
+        str(employer_file), test_db_session
+    )
+
+    assert (total_row_count, inserted_row_count) == (4, 3)
+    assert employer._load_employer_rows_from_file_path(str(employer_file), test_db_session) == (
+        4,
+        0,
+    )
+    employers = (
+        test_db_session.query(DuaEmployer).filter(DuaEmployer.fineos_employer_id == "1234567").all()
+    )
+    assert len(employers) == 1
+    assert employers[0].naics_code is None
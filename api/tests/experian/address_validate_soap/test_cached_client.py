@@ -0,0 +1,145 @@
+from datetime import timedelta
+
+import pytest
+
+import massgov.pfml.experian.address_validate_soap.models as sm
+from massgov.pfml.db.models.employees import ExperianAddressValidationResult
+from massgov.pfml.experian.address_validate_soap.cached_client import (
+    CachedClient,
+    ExperianValidationCacheConfig,
+    Metrics,
+    search_request_hash,
+)
+from massgov.pfml.experian.address_validate_soap.client import Client
+from massgov.pfml.experian.address_validate_soap.layouts import Layout
+from massgov.pfml.experian.address_validate_soap.mock_caller import MockVerificationZeepCaller
+from massgov.pfml.util.datetime import utcnow
+
+
+def _search_request(search: str) -> sm.SearchRequest:
+    return sm.SearchRequest(engine=sm.EngineEnum.VERIFICATION, search=search, layout=Layout.StateMA)
+
+
+class FailingCaller(MockVerificationZeepCaller):
+    def DoSearch(self, **kwargs):
+        self.call_count += 1
+        raise Exception("Experian is down")
+
+
+@pytest.fixture
+def mock_caller():
+    return MockVerificationZeepCaller()
+
+
+@pytest.fixture
+def metrics():
+    return {}
+
+
+def _cached_client(mock_caller, db_session, metrics, cache_max_age_days=30, max_workers=4):
+    def increment(name, value=1):
+        metrics[name] = metrics.get(name, 0) + value
+
+    return CachedClient(
+        Client(mock_caller),
+        db_session,
+        config=ExperianValidationCacheConfig(
+            cache_max_age_days=cache_max_age_days, max_workers=max_workers
+        ),
+        increment=increment,
+    )
+
+
+def test_search_request_hash_normalizes_search_text():
+    address_hash = search_request_hash(_search_request("1 Main St,Boston,MA,02111"))
+
+    assert search_request_hash(_search_request("1 main st., Boston, MA 02111")) == address_hash
+    assert search_request_hash(_search_request("2 Main St,Boston,MA,02111")) != address_hash
+    assert (
+        search_request_hash(
+            sm.SearchRequest(
+                engine=sm.EngineEnum.SINGLELINE, search="1 Main St,Boston,MA,02111", layout=None
+            )
+        )
+        != address_hash
+    )
+
+
+def test_prefetch_without_cache(mock_caller, metrics):
+    # With caching disabled, the client never touches the database
+    cached_client = _cached_client(mock_caller, None, metrics, cache_max_age_days=0)
+    requests = [
+        _search_request("1 Main St,Boston,MA,02111"),
+        _search_request("1 MAIN ST, BOSTON, MA, 02111"),
+        _search_request("2 Main St,Boston,MA,02111"),
+        _search_request("3 Main St,Boston,MA,02111"),
+    ]
+
+    cached_client.prefetch(requests)
+    assert mock_caller.call_count == 3
+
+    for request in requests:
+        response = cached_client.search(request)
+        assert response.verify_level == sm.VerifyLevel.VERIFIED
+
+    # Every search was answered by the prefetch
+    assert mock_caller.call_count == 3
+    assert metrics[Metrics.EXPERIAN_SEARCH_COUNT] == 3
+    assert Metrics.EXPERIAN_CACHE_HIT_COUNT not in metrics
+
+
+def test_prefetch_exception_raised_on_search(metrics):
+    failing_caller = FailingCaller()
+    cached_client = _cached_client(failing_caller, None, metrics, cache_max_age_days=0)
+    request = _search_request("1 Main St,Boston,MA,02111")
+
+    cached_client.prefetch([request])
+
+    with pytest.raises(Exception, match="Experian is down"):
+        cached_client.search(request)
+
+    assert failing_caller.call_count == 1
+
+
+def test_search_uses_cached_result(test_db_session, mock_caller, metrics):
+    request = _search_request("1 Main St,Boston,MA,02111")
+
+    _cached_client(mock_caller, test_db_session, metrics).search(request)
+    test_db_session.commit()
+    assert mock_caller.call_count == 1
+
+    cached_result = test_db_session.query(ExperianAddressValidationResult).one()
+    assert cached_result.address_hash == search_request_hash(request)
+    assert cached_result.verify_level == sm.VerifyLevel.VERIFIED.value
+
+    # A later run gets the same response from the cache, even for differently formatted text
+    cached_client = _cached_client(mock_caller, test_db_session, metrics)
+    other_format_request = _search_request("1 main st, boston, ma 02111")
+    cached_client.prefetch([other_format_request])
+    response = cached_client.search(other_format_request)
+
+    assert mock_caller.call_count == 1
+    assert response == mock_caller.search_responses["1 Main St,Boston,MA,02111"]
+    assert metrics[Metrics.EXPERIAN_CACHE_HIT_COUNT] == 1
+    assert metrics[Metrics.EXPERIAN_CACHE_MISS_COUNT] == 1
+
+
+def test_prefetch_revalidates_stale_result(test_db_session, mock_caller, metrics):
+    request = _search_request("1 Main St,Boston,MA,02111")
+
+    _cached_client(mock_caller, test_db_session, metrics).search(request)
+    test_db_session.query(ExperianAddressValidationResult).update(
+        {ExperianAddressValidationResult.validated_at: utcnow() - timedelta(days=31)}
+    )
+    test_db_session.commit()
+
+    cached_client = _cached_client(mock_caller, test_db_session, metrics)
+    cached_client.prefetch([request])
+    cached_client.search(request)
+    test_db_session.commit()
+
+    assert mock_caller.call_count == 2
+    assert metrics[Metrics.EXPERIAN_CACHE_STALE_COUNT] == 1
+    assert test_db_session.query(ExperianAddressValidationResult).one().validated_at > (
+        utcnow() - timedelta(days=1)
+    )
@@ -0,0 +1,12 @@
+import pytest
+
+import massgov.pfml.fineos.factory
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_fineos_clients():
+    # Clients are shared per process, so one built from a test's monkeypatched config would
+    # otherwise be handed to later tests
+    massgov.pfml.fineos.factory.clear_shared_clients()
+    yield
+    massgov.pfml.fineos.factory.clear_shared_clients()
@@ -679,6 +679,85 @@ def test_process_all_employers_skips_nonexistent_employer(
     assert_number_of_data_lines_in_each_file(batch_output_dir, 5)
 
 
+def call_process_all_employers_streaming(monkeypatch, output_path, partition_count=3):
+    monkeypatch.setenv("OUTPUT_DIRECTORY_PATH", str(output_path))
+    monkeypatch.setenv("FINEOS_AWS_IAM_ROLE_ARN", "foo")
+    monkeypatch.setenv("FINEOS_AWS_IAM_ROLE_EXTERNAL_ID", "bar")
+    monkeypatch.setenv("ELIGIBILITY_FEED_FULL_EXPORT_PARTITION_COUNT", str(partition_count))
+
+    return ef.process_all_employers_streaming(
+        make_test_db, make_fineos_client, make_s3_session, ef.EligibilityFeedExportConfig()
+    )
+
+
+def test_process_all_employers_streaming(
+    local_test_db_session, local_initialize_factories_session, tmp_path, monkeypatch
+):
+    # One employer with several employees, several employers for one employee, and repeated
+    # wages for one pair
+    wages = WagesAndContributionsFactory.create_batch(size=5, employer=EmployerFactory.create())
+    wages += WagesAndContributionsFactory.create_batch(size=3, employee=EmployeeFactory.create())
+    wages += WagesAndContributionsFactory.create_batch(
+        size=3, employee=EmployeeFactory.create(), employer=EmployerFactory.create()
+    )
+
+    # An employer without any employees still gets a file, as in process_all_employers
+    employer_without_employees = EmployerFactory.create()
+
+    batch_output_dir = tmp_path / "absence-eligibility" / "upload"
+    batch_output_dir.mkdir(parents=True)
+
+    process_results = call_process_all_employers_streaming(monkeypatch, tmp_path)
+
+    assert process_results.start
+    assert process_results.end
+    assert process_results.employers_total_count == 6
+    assert process_results.employers_success_count == 6
+    assert process_results.employers_error_count == 0
+    assert process_results.employers_skipped_count == 0
+    assert process_results.employee_and_employer_pairs_total_count == 9
+
+    assert_employer_file_exists(batch_output_dir, wages[0].employer.fineos_employer_id)
+    with open(next(batch_output_dir.glob(f"*_{wages[0].employer.fineos_employer_id}.csv"))) as f:
+        assert_number_of_data_lines_in_file(f, 5)
+
+    assert_employer_file_exists(batch_output_dir, employer_without_employees.fineos_employer_id)
+    with open(
+        next(batch_output_dir.glob(f"*_{employer_without_employees.fineos_employer_id}.csv"))
+    ) as f:
+        assert_number_of_data_lines_in_file(f, 0)
+
+
+def test_process_all_employers_streaming_with_skip_and_error(
+    local_test_db_session, local_initialize_factories_session, tmp_path, monkeypatch
+):
+    skipped_wage = WagesAndContributionsFactory.create()
+    error_wage = WagesAndContributionsFactory.create()
+    WagesAndContributionsFactory.create()
+
+    def mock(fineos, employer):
+        if employer.employer_id == skipped_wage.employer_id:
+            return None
+        if employer.employer_id == error_wage.employer_id:
+            raise Exception
+        return employer.fineos_employer_id
+
+    monkeypatch.setattr(ef, "get_fineos_employer_id", mock)
+
+    batch_output_dir = tmp_path / "absence-eligibility" / "upload"
+    batch_output_dir.mkdir(parents=True)
+
+    process_results = call_process_all_employers_streaming(monkeypatch, tmp_path)
+
+    assert process_results.employers_total_count == 3
+    assert process_results.employers_success_count == 1
+    assert process_results.employers_error_count == 1
+    assert process_results.employers_skipped_count == 1
+    assert process_results.employee_and_employer_pairs_total_count == 1
+
+    assert_number_of_data_lines_in_each_file(batch_output_dir, 1)
+
+
 def test_get_employer_to_employee_map_from_queue_and_most_recent_wages_for_single_employee_different_employers(
     local_test_db_session, local_initialize_factories_session, tmp_path
 ):
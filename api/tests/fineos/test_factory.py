@@ -18,6 +18,8 @@ def test_fineos_client_config_from_env_default():
         oauth2_url=None,
         oauth2_client_id=None,
         oauth2_client_secret=None,
+        pool_connections=10,
+        pool_maxsize=10,
     )
 
 
@@ -32,6 +34,7 @@ def test_fineos_client_config_from_env(monkeypatch):
     monkeypatch.setenv("FINEOS_CLIENT_OAUTH2_URL", "https://1.ghi.test/oauth2/token")
     monkeypatch.setenv("FINEOS_CLIENT_OAUTH2_CLIENT_ID", "1234567890abcdefghij")
     monkeypatch.setenv("FINEOS_CLIENT_OAUTH2_CLIENT_SECRET", "abcdefghijklmnopqrstuvwxyz")
+    monkeypatch.setenv("FINEOS_CLIENT_POOL_MAXSIZE", "25")
 
     config = massgov.pfml.fineos.factory.FINEOSClientConfig()
     assert config == massgov.pfml.fineos.factory.FINEOSClientConfig(
@@ -43,6 +46,7 @@ def test_fineos_client_config_from_env(monkeypatch):
         oauth2_url="https://1.ghi.test/oauth2/token",
         oauth2_client_id="1234567890abcdefghij",
         oauth2_client_secret="abcdefghijklmnopqrstuvwxyz",
+        pool_maxsize=25,
     )
 
 
@@ -115,3 +119,33 @@ def test_create_client_from_config(monkeypatch):
     assert client.wscomposer_url == "https://3.def.test/wscomposer/"
     assert client.wscomposer_user_id == "ABC3"
     assert client.oauth2_url == "https://3.ghi.test/oauth2/token"
+
+
+def test_create_client_is_shared(monkeypatch):
+    config = massgov.pfml.fineos.factory.FINEOSClientConfig(
+        integration_services_api_url="https://4.abc.test/integrationservicesapi/",
+        group_client_api_url="https://4.abc.test/groupclientapi/",
+        customer_api_url="https://4.abc.test/customerapi/",
+        wscomposer_api_url="https://4.def.test/wscomposer/",
+        oauth2_url="https://4.ghi.test/oauth2/token",
+        oauth2_client_id="1234567890abcdefghij",
+        oauth2_client_secret="abcdefghijklmnopqrstuvwxyz",
+        pool_maxsize=30,
+    )
+    monkeypatch.setattr(requests_oauthlib.OAuth2Session, "fetch_token", fake_fetch_token)
+
+    client = massgov.pfml.fineos.factory.create_client(config)
+
+    # The same configuration gets the same client, and its session and connection pool
+    assert massgov.pfml.fineos.factory.create_client(config) is client
+    assert client.oauth_token_fetch_count == 1
+
+    adapter = client.oauth_session.get_adapter("https://4.abc.test/customerapi/")
+    assert adapter._pool_maxsize == 30
+
+    other_config = config.copy(update={"customer_api_url": "https://5.abc.test/customerapi/"})
+    assert massgov.pfml.fineos.factory.create_client(other_config) is not client
+
+    # After a reset the same configuration gets a new client
+    massgov.pfml.fineos.factory.clear_shared_clients()
+    assert massgov.pfml.fineos.factory.create_client(config) is not client
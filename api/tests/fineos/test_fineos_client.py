@@ -337,6 +337,25 @@ def test_create_or_update_employer_unicode_name(httpserver, fineos_client):
     assert fineos_employer_id == 5157438
 
 
+def test_oauth_token_is_cached(httpserver, fineos_client):
+    httpserver.expect_request(
+        "/groupclientapi/groupClient/cases/NTN-100-ABS-01/eforms/3333/readEform", method="GET"
+    ).respond_with_data(get_eform_response, content_type="application/json")
+
+    # The constructor fetches the first token, which is reused while it is fresh
+    assert fineos_client.oauth_token_fetch_count == 1
+    fineos_client.get_eform("FINEOS_WEB_ID", "NTN-100-ABS-01", 3333)
+    fineos_client.get_eform("FINEOS_WEB_ID", "NTN-100-ABS-01", 3333)
+    assert fineos_client.oauth_token_fetch_count == 1
+    assert fineos_client.oauth_token_cache_hit_count == 2
+
+    # A token inside the refresh margin is replaced before the request is made
+    fineos_client._oauth_token_expires_at = time.time() + 10
+    fineos_client.get_eform("FINEOS_WEB_ID", "NTN-100-ABS-01", 3333)
+    assert fineos_client.oauth_token_fetch_count == 2
+    assert fineos_client.oauth_token_cache_hit_count == 2
+
+
 def test_get_eform(httpserver, fineos_client):
 
     httpserver.expect_ordered_request(
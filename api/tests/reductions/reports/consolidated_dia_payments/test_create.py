@@ -2,6 +2,7 @@ import datetime
 import os
 
 import boto3
+import factory
 import pytest
 
 import massgov.pfml.reductions.reports.consolidated_dia_payments.create as create_report
@@ -591,12 +592,13 @@ def test_create_report_consolidated_dia_payments_to_dfml(
 
     employee_1 = EmployeeFactory.create(fineos_customer_number="9787")
 
-    # If first record in the group has no start date, the group will get saved to the error report
+    # If first record in the group has no start date, the group will get saved to the error report.
+    # The records differ in event_id, as identical records are deduplicated.
     DiaReductionPaymentFactory.create_batch(
         size=2,
         fineos_customer_number=employee_1.fineos_customer_number,
         board_no="group1",
-        event_id=None,
+        event_id=factory.Iterator([None, "2"]),
         event_description="Test",
         eve_created_date=None,
         event_occurrence_date=None,
@@ -619,7 +621,7 @@ def test_create_report_consolidated_dia_payments_to_dfml(
         size=2,
         fineos_customer_number=employee_2.fineos_customer_number,
         board_no="group2",
-        event_id=None,
+        event_id=factory.Iterator([None, "2"]),
         event_description="Test",
         eve_created_date=None,
         event_occurrence_date=None,
@@ -1,8 +1,10 @@
 import csv
+import io
 import os
 import random
 import string
 from datetime import date, datetime
+from decimal import Decimal
 from typing import Dict, Optional
 
 import boto3
@@ -784,3 +786,70 @@ def test_load_new_dia_payments_handles_duplicates(
         .scalar()
         == 2
     )
+
+
+def test_load_new_rows_from_file_matches_existing_rows(
+    test_db_session, initialize_factories_session
+):
+    existing_payment = DiaReductionPayment(
+        fineos_customer_number="1234",
+        board_no="567890",
+        event_id="111111",
+        event_description="PC",
+        eve_created_date=date(2021, 1, 4),
+        event_occurrence_date=date(2021, 1, 5),
+        award_id="42",
+        award_code="100",
+        award_amount=Decimal("500.00"),
+        award_date=date(2021, 1, 6),
+        start_date=date(2021, 1, 7),
+        end_date=None,
+        weekly_amount=Decimal("50.50"),
+        award_created_date=date(2021, 1, 8),
+        termination_date=None,
+    )
+    test_db_session.add(existing_payment)
+    test_db_session.commit()
+
+    same_row = {
+        "DFML_ID": "1234",
+        "BOARD_NO": "567890",
+        "EVENT_ID": "111111",
+        "INS_FORM_OR_MEET": "PC",
+        "EVE_CREATED_DATE": "20210104",
+        "FORM_RECEIVED_OR_DISPOSITION": "20210105",
+        "AWARD_ID": "42",
+        "AWARD_CODE": "100",
+        # The same amounts at a different scale, and the same empty dates
+        "AWARD_AMOUNT": "500",
+        "AWARD_DATE": "20210106",
+        "START_DATE": "20210107",
+        "END_DATE": "",
+        "WEEKLY_AMOUNT": "50.5",
+        "AWARD_CREATED_DATE": "20210108",
+        "TERMINATION_DATE": "",
+    }
+    changed_row = {**same_row, "TERMINATION_DATE": "20210301"}
+
+    csv_file = io.StringIO()
+    writer = csv.DictWriter(csv_file, fieldnames=Constants.PAYMENT_LIST_FIELDS)
+    writer.writerow(same_row)
+    writer.writerow(changed_row)
+    csv_file.seek(0)
+
+    new_row_count, total_row_count = dia._load_new_rows_from_file(csv_file, test_db_session)
+    test_db_session.commit()
+
+    assert new_row_count == 1
+    assert total_row_count == 2
+
+    payments = (
+        test_db_session.query(DiaReductionPayment)
+        .filter(DiaReductionPayment.fineos_customer_number == "1234")
+        .order_by(DiaReductionPayment.created_at)
+        .all()
+    )
+    assert len(payments) == 2
+    assert payments[0].dia_reduction_payment_id == existing_payment.dia_reduction_payment_id
+    assert payments[1].termination_date == date(2021, 3, 1)
+    assert payments[1].payment_data_hash != existing_payment.payment_data_hash
@@ -18,6 +18,7 @@ import massgov.pfml.reductions.dua as dua
 import massgov.pfml.util.csv as csv_util
 import massgov.pfml.util.datetime as datetime_util
 import massgov.pfml.util.files as file_util
+from massgov.pfml.db.content_hash import content_hash
 from massgov.pfml.db.models.absences import AbsenceStatus
 from massgov.pfml.db.models.employees import (
     DuaReductionPayment,
@@ -145,6 +146,17 @@ def test_get_pending_dua_payment_reference_files(
     assert len(ref_files) == pending_ref_file_count
 
 
+def _get_matching_dua_reduction_payments(db_data, db_session):
+    payment_data_hash = content_hash(
+        DuaReductionPayment.__table__, DuaReductionPayment.payment_data_columns, db_data
+    )
+    return (
+        db_session.query(DuaReductionPayment)
+        .filter(DuaReductionPayment.payment_data_hash == payment_data_hash)
+        .all()
+    )
+
+
 @pytest.mark.parametrize(
     "existing_db_record_count, new_rows, duplicate_rows",
     (
@@ -265,13 +277,11 @@ def test_load_new_rows_from_file_success(
 
     if len(new_rows) > 0:
         random_new_row = random.choice(new_rows)
-        assert len(dua._get_matching_dua_reduction_payments(random_new_row, test_db_session)) > 0
+        assert len(_get_matching_dua_reduction_payments(random_new_row, test_db_session)) > 0
 
     if len(duplicate_rows) > 0:
         random_duplicate_row = random.choice(duplicate_rows)
-        assert (
-            len(dua._get_matching_dua_reduction_payments(random_duplicate_row, test_db_session)) > 0
-        )
+        assert len(_get_matching_dua_reduction_payments(random_duplicate_row, test_db_session)) > 0
 
 
 def test_load_new_rows_from_file_dua_example(dua_reduction_payment_unique_index, test_db_session):
@@ -300,6 +310,26 @@ def test_load_new_rows_from_file_dua_example(dua_reduction_payment_unique_index,
     )
 
 
+def test_load_new_rows_from_file_duplicates_in_file(
+    dua_reduction_payment_unique_index, test_db_session
+):
+    csv_file = tempfile.TemporaryFile(mode="w+")
+    csv_file.write(",".join(EXPECTED_DUA_PAYMENT_CSV_FILE_HEADERS) + "\n")
+
+    db_data = _get_valid_dua_payment_data()
+    csv_row = csv_util.encode_row(db_data, DUA_PAYMENT_LIST_ENCODERS)
+    for _i in range(3):
+        csv_file.write(",".join(list(csv_row.values())) + "\n")
+    csv_file.seek(0)
+
+    new_row_count, total_row_count = dua._load_new_rows_from_file(csv_file, test_db_session)
+    test_db_session.commit()
+
+    assert new_row_count == 1
+    assert total_row_count == 3
+    assert len(_get_matching_dua_reduction_payments(db_data, test_db_session)) == 1
+
+
 @pytest.mark.parametrize(
     "headers, csv_rows",
     (
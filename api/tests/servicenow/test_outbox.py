@@ -0,0 +1,135 @@
+from datetime import timedelta
+from typing import Dict, List
+
+import pytest
+
+from massgov.pfml.db.models.applications import ServiceNowOutboxMessage
+from massgov.pfml.servicenow import outbox
+from massgov.pfml.servicenow.abstract_client import AbstractServiceNowClient
+from massgov.pfml.servicenow.exception import (
+    ServiceNowError,
+    ServiceNowFatalError,
+    ServiceNowUnavailable,
+)
+from massgov.pfml.servicenow.models import OutboundMessage
+from massgov.pfml.util.datetime import utcnow
+
+
+class FakeServiceNowClient(AbstractServiceNowClient):
+    """Records the messages sent, and raises the configured error for an absence id."""
+
+    def __init__(self):
+        self.sent: List[OutboundMessage] = []
+        self.errors: Dict[str, Exception] = {}
+
+    def send_message(self, message, table="u_cps_notifications"):
+        error = self.errors.get(message.u_absence_id)
+        if error:
+            raise error
+        self.sent.append(message)
+        return None
+
+
+def _message(absence_id: str) -> OutboundMessage:
+    return OutboundMessage(
+        u_absence_id=absence_id,
+        u_organization_name="Wayne Enterprises",
+        u_claimant_info="{}",
+        u_document_type="Legal Notice",
+        u_recipients=["{}"],
+        u_source="Call Center",
+        u_trigger="test.trigger",
+        u_user_type="Leave Administrator",
+        u_link="https://www.example.com",
+        u_employer_customer_number=10,
+    )
+
+
+@pytest.fixture
+def service_now_client():
+    return FakeServiceNowClient()
+
+
+def test_backoff_delay():
+    assert outbox.backoff_delay(1) == outbox.BACKOFF_BASE
+    assert outbox.backoff_delay(2) == outbox.BACKOFF_BASE * 2
+    assert outbox.backoff_delay(3) == outbox.BACKOFF_BASE * 4
+    assert outbox.backoff_delay(20) == outbox.BACKOFF_MAX
+
+
+def test_is_retryable():
+    url = "https://example.com"
+    assert outbox.is_retryable(ServiceNowUnavailable(url, 503))
+    assert outbox.is_retryable(ServiceNowError(url, 500))
+    assert outbox.is_retryable(ServiceNowFatalError(url, Exception("connection reset")))
+    assert not outbox.is_retryable(ServiceNowError(url, 400))
+
+
+def test_drain_delivers_in_batches(test_db_session, service_now_client):
+    for i in range(5):
+        outbox.enqueue_message(test_db_session, _message(f"NTN-{i}-ABS-01"))
+    test_db_session.commit()
+    assert outbox.get_queue_depth(test_db_session) == 5
+
+    result = outbox.drain(test_db_session, service_now_client, batch_size=2, max_workers=2)
+
+    assert result.delivered_count == 5
+    assert sorted(message.u_absence_id for message in service_now_client.sent) == [
+        f"NTN-{i}-ABS-01" for i in range(5)
+    ]
+    assert outbox.get_queue_depth(test_db_session) == 0
+    for outbox_message in test_db_session.query(ServiceNowOutboxMessage):
+        assert outbox_message.delivered_at is not None
+        assert outbox_message.attempt_count == 1
+
+
+def test_deliver_batch_retries_with_backoff(test_db_session, service_now_client):
+    outbox_message = outbox.enqueue_message(test_db_session, _message("NTN-1-ABS-01"))
+    test_db_session.commit()
+    service_now_client.errors["NTN-1-ABS-01"] = ServiceNowUnavailable("https://example.com")
+
+    result = outbox.deliver_batch(test_db_session, service_now_client)
+
+    assert result.retry_count == 1
+    test_db_session.refresh(outbox_message)
+    assert outbox_message.attempt_count == 1
+    assert outbox_message.delivered_at is None
+    assert outbox_message.failed_at is None
+    assert "ServiceNowUnavailable" in outbox_message.last_error
+    assert outbox_message.next_attempt_at > utcnow() + outbox.BACKOFF_BASE - timedelta(seconds=5)
+
+    # Not due yet, so the next batch leaves it alone
+    assert outbox.deliver_batch(test_db_session, service_now_client).claimed_count == 0
+    assert outbox.get_queue_depth(test_db_session) == 1
+    assert outbox.get_queue_depth(test_db_session, due_only=True) == 0
+
+    # Once due, it is sent again
+    del service_now_client.errors["NTN-1-ABS-01"]
+    outbox_message.next_attempt_at = utcnow()
+    test_db_session.commit()
+
+    assert outbox.deliver_batch(test_db_session, service_now_client).delivered_count == 1
+    test_db_session.refresh(outbox_message)
+    assert outbox_message.attempt_count == 2
+    assert outbox_message.delivered_at is not None
+    assert outbox_message.last_error is None
+
+
+def test_deliver_batch_gives_up(test_db_session, service_now_client):
+    rejected_message = outbox.enqueue_message(test_db_session, _message("NTN-1-ABS-01"))
+    exhausted_message = outbox.enqueue_message(test_db_session, _message("NTN-2-ABS-01"))
+    exhausted_message.attempt_count = outbox.MAX_ATTEMPTS - 1
+    test_db_session.commit()
+    service_now_client.errors["NTN-1-ABS-01"] = ServiceNowError("https://example.com", 400)
+    service_now_client.errors["NTN-2-ABS-01"] = ServiceNowUnavailable("https://example.com")
+
+    result = outbox.deliver_batch(test_db_session, service_now_client)
+
+    assert result.failed_count == 2
+    test_db_session.refresh(rejected_message)
+    test_db_session.refresh(exhausted_message)
+    assert rejected_message.attempt_count == 1
+    assert rejected_message.failed_at is not None
+    assert exhausted_message.attempt_count == outbox.MAX_ATTEMPTS
+    assert exhausted_message.failed_at is not None
+    assert outbox.get_queue_depth(test_db_session) == 0
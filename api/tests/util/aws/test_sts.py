@@ -0,0 +1,139 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+
+import massgov.pfml.util.aws.sts as aws_sts
+import massgov.pfml.util.files as file_util
+from massgov.pfml.util.datetime import utcnow
+
+ROLE_ARN = "arn:aws:iam::000000000000:role/fineos-s3-access"
+
+
+class Clock:
+    def __init__(self):
+        self.current_time = utcnow()
+
+    def __call__(self):
+        return self.current_time
+
+    def advance(self, delta):
+        self.current_time += delta
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def mock_sts_client(clock):
+    return aws_sts.MockSTSClient(now=clock)
+
+
+@pytest.fixture
+def registry(reset_aws_env_vars, mock_sts_client, clock):
+    return aws_sts.AssumedRoleSessionRegistry(
+        sts_client_factory=lambda region_name: mock_sts_client, now=clock
+    )
+
+
+def _get_client(registry, bucket_name="fin-somdev-data-export", role_arn=ROLE_ARN):
+    return registry.get_client(
+        "s3",
+        bucket_name,
+        role_arn=role_arn,
+        role_session_name="payments_copy_file",
+        external_id="123",
+        region_name="us-east-1",
+    )
+
+
+def test_get_client_reuses_assumed_role(registry, mock_sts_client):
+    client = _get_client(registry)
+
+    assert _get_client(registry) is client
+    assert _get_client(registry, bucket_name="fin-somdev-data-import") is not client
+    assert len(mock_sts_client.assume_role_calls) == 1
+    assert mock_sts_client.assume_role_calls[0] == {
+        "RoleArn": ROLE_ARN,
+        "RoleSessionName": "payments_copy_file",
+        "ExternalId": "123",
+    }
+    assert registry.stats == aws_sts.SessionRegistryStats(hit_count=2, miss_count=1)
+
+    credentials = client._request_signer._credentials
+    assert credentials.access_key == "ASIAMOCK000000000001"
+    assert credentials.token == "mock-session-token-1"
+
+
+def test_get_client_keys_by_role(registry, mock_sts_client):
+    client = _get_client(registry)
+    other_role_client = _get_client(registry, role_arn=f"{ROLE_ARN}-2")
+
+    assert other_role_client is not client
+    assert len(mock_sts_client.assume_role_calls) == 2
+    assert registry.stats.miss_count == 2
+
+
+def _frozen_credentials(client):
+    return client._request_signer._credentials.get_frozen_credentials()
+
+
+def test_get_client_refreshes_credentials_before_expiry(registry, mock_sts_client, clock):
+    client = _get_client(registry)
+
+    # Still well within the credential lifetime
+    clock.advance(
+        aws_sts.ASSUME_ROLE_DURATION - aws_sts.REFRESH_BEFORE_EXPIRY - timedelta(seconds=1)
+    )
+    assert _get_client(registry) is client
+    assert _frozen_credentials(client).token == "mock-session-token-1"
+    assert len(mock_sts_client.assume_role_calls) == 1
+
+    # Close enough to expiry that the role is assumed again, and the client held since the start
+    # signs with the new credentials
+    clock.advance(timedelta(seconds=2))
+    assert _frozen_credentials(client).token == "mock-session-token-2"
+    assert _get_client(registry) is client
+    assert len(mock_sts_client.assume_role_calls) == 2
+    assert registry.stats == aws_sts.SessionRegistryStats(
+        hit_count=2, miss_count=1, refresh_count=1
+    )
+
+    # Refreshes keep coming for as long as the client is used
+    clock.advance(aws_sts.ASSUME_ROLE_DURATION)
+    assert _frozen_credentials(client).token == "mock-session-token-3"
+
+
+def test_get_session_refreshes_credentials(registry, mock_sts_client, clock):
+    session = registry.get_session(ROLE_ARN, "payments_copy_file", region_name="us-east-1")
+
+    clock.advance(aws_sts.ASSUME_ROLE_DURATION)
+
+    assert session.get_credentials().get_frozen_credentials().token == "mock-session-token-2"
+    assert registry.get_session(ROLE_ARN, "payments_copy_file", region_name="us-east-1") is session
+
+
+def test_get_client_assumes_role_once_across_threads(registry, mock_sts_client):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: _get_client(registry), range(50)))
+
+    assert len(set(map(id, clients))) == 1
+    assert len(mock_sts_client.assume_role_calls) == 1
+    assert registry.stats.miss_count == 1
+    assert registry.stats.hit_count == 49
+
+
+def test_get_s3_client_uses_registry(registry, mock_sts_client, monkeypatch):
+    monkeypatch.setattr(aws_sts, "_registry", registry)
+    monkeypatch.setenv("FINEOS_AWS_IAM_ROLE_ARN", ROLE_ARN)
+    monkeypatch.setenv("FINEOS_AWS_IAM_ROLE_EXTERNAL_ID", "123")
+
+    client = file_util.get_s3_client("fin-somdev-data-export")
+    for _ in range(10):
+        assert file_util.get_s3_client("fin-somdev-data-export") is client
+
+    file_util.get_s3_client("test_bucket")
+
+    assert len(mock_sts_client.assume_role_calls) == 1
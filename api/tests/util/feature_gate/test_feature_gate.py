@@ -1,4 +1,5 @@
 import io
+import threading
 import unittest.mock as mock
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -6,6 +7,7 @@ from pathlib import Path
 import pytest
 from freezegun import freeze_time
 
+import massgov.pfml.util.files as file_util
 from massgov.pfml.util.feature_gate.features_cache import FeaturesCache
 
 
@@ -92,6 +94,62 @@ def test_feature_gate_missing_path():
     assert enabled is False
 
 
+def test_feature_gate_background_refresh(features_file_path):
+    start_time = datetime.now()
+    ttl = 60 * 15
+    features_cache = FeaturesCache(file_path=features_file_path, ttl=ttl, background_refresh=True)
+
+    assert features_cache.check_enabled("test_feature_disabled") is False
+
+    mock_features_file = io.StringIO(
+        """
+test_feature_disabled:
+    enabled: 1
+"""
+    )
+
+    # Hold the refresh open until the stale mapping has been checked
+    features_file_read = threading.Event()
+
+    def open_features_file(path):
+        features_file_read.wait(timeout=5)
+        return mock_features_file
+
+    with mock.patch("massgov.pfml.util.files.open_stream", side_effect=open_features_file):
+        with freeze_time(start_time + timedelta(seconds=ttl + 30)):
+            # The expired mapping is still served while the refresh runs
+            assert features_cache.check_enabled("test_feature_disabled") is False
+            assert features_cache._refresh_thread.is_alive()
+
+            features_file_read.set()
+            features_cache._refresh_thread.join()
+            assert features_cache.check_enabled("test_feature_disabled") is True
+
+
+def test_feature_gate_s3_unchanged_file_not_reloaded(features_file_path, mock_s3_bucket):
+    s3_path = f"s3://{mock_s3_bucket}/features.yaml"
+    file_util.upload_to_s3(features_file_path, s3_path)
+
+    start_time = datetime.now()
+    ttl = 60 * 15
+    features_cache = FeaturesCache(file_path=s3_path, ttl=ttl)
+    assert features_cache.check_enabled("test_feature_enabled") is True
+
+    with mock.patch.object(
+        features_cache, "_load_features_mapping", wraps=features_cache._load_features_mapping
+    ) as load_features_mapping:
+        with freeze_time(start_time + timedelta(seconds=ttl + 30)):
+            assert features_cache.check_enabled("test_feature_enabled") is True
+            load_features_mapping.assert_not_called()
+
+        with file_util.write_file(s3_path) as features_file:
+            features_file.write("test_feature_enabled:\n    enabled: 0\n")
+
+        with freeze_time(start_time + timedelta(seconds=2 * ttl + 60)):
+            assert features_cache.check_enabled("test_feature_enabled") is False
+            load_features_mapping.assert_called_once()
+
+
 @pytest.fixture
 def features_file_path():
     path = Path(__file__).parent / "features.yaml"
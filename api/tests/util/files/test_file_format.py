@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from massgov.pfml.util.files.file_format import FieldFormat, FileFormat
 
 test_format = (
@@ -16,3 +18,48 @@ def test_file_format():
     assert parsed_obj["name"] == "Jane"
     assert parsed_obj["age"] == 27
     assert parsed_obj["active"] is True
+
+
+def test_parse_lines_matches_parse_line():
+    file_format = FileFormat(test_format)
+    lines = ["Jane27 T\n", "Bob 100F\r\n", "    003F"]
+
+    parsed = file_format.parse_lines(lines)
+
+    assert len(parsed) == 3
+    assert parsed.errors == []
+    assert parsed.line_indexes == [0, 1, 2]
+    assert parsed.columns["age"] == [27, 100, 3]
+    assert list(parsed.records()) == [file_format.parse_line(line) for line in lines]
+    assert parsed.columns["name"] == ["Jane", "Bob", None]
+
+
+def test_parse_lines_reports_invalid_lines():
+    file_format = FileFormat(test_format)
+    lines = ["Jane27 T", "Jane27", "Bob abcT", "Ann 4x T", "Sue 31 F"]
+
+    parsed = file_format.parse_lines(lines)
+
+    assert parsed.line_indexes == [0, 4]
+    assert [record["name"] for record in parsed.records()] == ["Jane", "Sue"]
+
+    assert [index for index, _ in parsed.errors] == [1, 2, 3]
+    assert str(parsed.errors[0][1]) == "invalid line length 6 (expected 8)"
+    assert str(parsed.errors[1][1]) == "failed to parse field age"
+    assert str(parsed.errors[2][1]) == "failed to parse field age"
+
+
+def test_parse_lines_empty():
+    parsed = FileFormat(test_format).parse_lines([])
+
+    assert len(parsed) == 0
+    assert list(parsed.records()) == []
+
+
+def test_parse_lines_rejects_line_on_any_conversion_error():
+    file_format = FileFormat((FieldFormat("amount", 5, Decimal),))
+
+    parsed = file_format.parse_lines(["12.50", "1.2.3", "00.10"])
+
+    assert parsed.columns["amount"] == [Decimal("12.50"), Decimal("0.10")]
+    assert [index for index, _ in parsed.errors] == [1]
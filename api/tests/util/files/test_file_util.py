@@ -1,5 +1,7 @@
+import logging  # noqa: B1
 import os
 import tempfile
+import threading
 
 import boto3
 import pytest
@@ -367,6 +369,142 @@ def test_rename_file_s3(mock_s3_bucket):
         file_util.read_file_lines(source_path)
 
 
+def _copy_methods(caplog):
+    return [record.copy_method for record in caplog.records if record.msg == "Copied file"]
+
+
+def test_copy_file_s3_multipart(mock_s3_bucket, monkeypatch, caplog):
+    caplog.set_level(logging.INFO)  # noqa: B1
+    # Parts other than the last must be at least 5 MB
+    monkeypatch.setattr(file_util, "S3_MULTIPART_COPY_THRESHOLD", 5 * 1024 * 1024)
+    monkeypatch.setattr(file_util, "S3_MULTIPART_COPY_CHUNKSIZE", 5 * 1024 * 1024)
+    body = os.urandom(12 * 1024 * 1024)
+
+    s3 = boto3.client("s3")
+    s3.put_object(Bucket=mock_s3_bucket, Key="test_folder/large.bin", Body=body)
+
+    result = file_util.copy_file(
+        f"s3://{mock_s3_bucket}/test_folder/large.bin",
+        f"s3://{mock_s3_bucket}/another_folder/large.bin",
+    )
+
+    assert result.size_bytes == len(body)
+    assert _copy_methods(caplog) == ["server_side"]
+    assert s3.get_object(Bucket=mock_s3_bucket, Key="another_folder/large.bin")["Body"].read() == (
+        body
+    )
+
+
+def test_copy_file_s3_stream(mock_s3_bucket, monkeypatch, caplog):
+    caplog.set_level(logging.INFO)  # noqa: B1
+    # Buckets that need different credentials, such as FINEOS and PFML buckets, can't be copied
+    # between server side
+    monkeypatch.setattr(file_util, "uses_same_s3_credentials", lambda source, dest: False)
+
+    s3 = boto3.client("s3")
+    s3.put_object(Bucket=mock_s3_bucket, Key="test_folder/test.txt", Body="line1\nline2")
+
+    result = file_util.copy_file(
+        f"s3://{mock_s3_bucket}/test_folder/test.txt",
+        f"s3://{mock_s3_bucket}/another_folder/test.txt",
+    )
+
+    assert result.size_bytes == 11
+    assert _copy_methods(caplog) == ["stream"]
+    assert list(file_util.read_file_lines(f"s3://{mock_s3_bucket}/another_folder/test.txt")) == [
+        "line1",
+        "line2",
+    ]
+
+
+def test_copy_file_s3_stream_multipart(mock_s3_bucket, monkeypatch, caplog):
+    caplog.set_level(logging.INFO)  # noqa: B1
+    monkeypatch.setattr(file_util, "uses_same_s3_credentials", lambda source, dest: False)
+    # Parts other than the last must be at least 5 MB
+    monkeypatch.setattr(file_util, "S3_STREAM_CHUNKSIZE", 5 * 1024 * 1024)
+    monkeypatch.setattr(file_util, "_s3_stream_slots", threading.BoundedSemaphore(1))
+    body = os.urandom(12 * 1024 * 1024)
+
+    s3 = boto3.client("s3")
+    s3.put_object(Bucket=mock_s3_bucket, Key="test_folder/large.bin", Body=body)
+
+    result = file_util.copy_file(
+        f"s3://{mock_s3_bucket}/test_folder/large.bin",
+        f"s3://{mock_s3_bucket}/another_folder/large.bin",
+    )
+
+    assert result.size_bytes == len(body)
+    assert _copy_methods(caplog) == ["stream"]
+    assert s3.get_object(Bucket=mock_s3_bucket, Key="another_folder/large.bin")["Body"].read() == (
+        body
+    )
+    # The stream gave back its slot
+    assert file_util._s3_stream_slots.acquire(blocking=False)
+
+
+def test_copy_file_between_s3_and_fs(mock_s3_bucket, tmp_path, caplog):
+    caplog.set_level(logging.INFO)  # noqa: B1
+    local_source = tmp_path / "source" / "test.txt"
+    local_source.parent.mkdir()
+    local_source.write_text("line1\nline2")
+    s3_path = f"s3://{mock_s3_bucket}/test_folder/test.txt"
+    local_dest = tmp_path / "dest" / "test.txt"
+
+    file_util.copy_file(str(local_source), s3_path)
+    file_util.copy_file(s3_path, str(local_dest))
+
+    assert _copy_methods(caplog) == ["upload", "download"]
+    assert local_dest.read_text() == "line1\nline2"
+
+
+def test_copy_files_s3(mock_s3_bucket):
+    s3 = boto3.client("s3")
+    copies = []
+    for i in range(20):
+        s3.put_object(Bucket=mock_s3_bucket, Key=f"received/file{i}.csv", Body=f"line{i}")
+        copies.append(
+            (
+                f"s3://{mock_s3_bucket}/received/file{i}.csv",
+                f"s3://{mock_s3_bucket}/out/file{i}.csv",
+            )
+        )
+
+    result = file_util.copy_files(copies, max_workers=4)
+
+    assert result.file_count == 20
+    assert result.size_bytes == sum(len(f"line{i}") for i in range(20))
+    assert sorted(file_util.list_files(f"s3://{mock_s3_bucket}/out")) == sorted(
+        f"file{i}.csv" for i in range(20)
+    )
+    assert len(file_util.list_files(f"s3://{mock_s3_bucket}/received")) == 20
+
+
+def test_rename_files_s3(mock_s3_bucket):
+    s3 = boto3.client("s3")
+    renames = []
+    for i in range(5):
+        s3.put_object(Bucket=mock_s3_bucket, Key=f"received/file{i}.csv", Body=f"line{i}")
+        renames.append(
+            (
+                f"s3://{mock_s3_bucket}/received/file{i}.csv",
+                f"s3://{mock_s3_bucket}/out/file{i}.csv",
+            )
+        )
+
+    result = file_util.rename_files(renames, max_workers=2)
+
+    assert result.file_count == 5
+    assert len(file_util.list_files(f"s3://{mock_s3_bucket}/out")) == 5
+    assert file_util.list_files(f"s3://{mock_s3_bucket}/received") == []
+
+
+def test_rename_files_empty():
+    result = file_util.rename_files([])
+
+    assert result.file_count == 0
+    assert result.size_bytes == 0
+
+
 def test_rename_file_fs(test_fs_path, tmp_path):
     file_name = "test.txt"
     full_path = "{}/{}".format(str(test_fs_path), file_name)
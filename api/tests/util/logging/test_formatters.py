@@ -2,6 +2,17 @@
 # Tests for massgov.pfml.util.logging.
 #
 
+import copy
+import json
+import logging  # noqa: B1
+import sys
+import uuid
+from http import HTTPStatus
+from unittest import mock
+
+import flask
+import pytest
+
 from massgov.pfml.util.logging import formatters
 
 
@@ -45,3 +56,133 @@ def test_str_mask_pii_not_hostname():
         formatters.str_mask_pii("message", "hostname ip-10-11-12-134.ec2.internal")
         == "hostname ip-10-11-12-134.ec2.internal"
     )
+
+
+FAST_STR_MASK_PII_CASES = [
+    ("message", ""),
+    ("message", "short"),
+    ("message", "test 999-00-0000 test 999-99-0000"),
+    ("message", "9-990-00000"),
+    ("message", "test=999000000."),
+    ("message", "hostname ip-10-11-12-134.ec2.internal"),
+    ("message", 1),
+    ("message", 99999999),
+    ("message", 100000000),
+    ("message", 999000000),
+    ("message", 999999999),
+    ("message", 1000000000),
+    ("message", -99999999),
+    ("message", -100000000),
+    ("message", -999999999),
+    ("message", -1000000000),
+    ("message", 999000000.5),
+    ("message", 0.123456789),
+    ("message", 123456789.0),
+    ("message", True),
+    ("message", False),
+    ("message", HTTPStatus.OK),
+    ("message", {"a": "x", "b": "999000000"}),
+    ("message", ["999000000", 1]),
+    ("message", uuid.UUID("00000000-0000-0000-0000-999000000000")),
+    ("count", 999000000),
+    ("count", "999000000"),
+    ("created", 999000000.25),
+    ("funcName", "process_999000000"),
+    ("funcName", "run"),
+    ("name", "massgov.pfml.999000000"),
+]
+
+
+@pytest.mark.parametrize("key,value", FAST_STR_MASK_PII_CASES)
+def test_fast_str_mask_pii_matches_str_mask_pii(key, value):
+    assert formatters.fast_str_mask_pii(key, value) == formatters.str_mask_pii(key, value)
+
+
+def _make_record(msg, levelno=logging.INFO, **attributes):  # noqa: B1
+    attributes.update(name="test", msg=msg, levelno=levelno)
+    return logging.makeLogRecord(attributes)  # noqa: B1
+
+
+def _log_records():
+    records = [
+        _make_record("plain message"),
+        _make_record("ssn %s", args=("999-00-0000",)),
+        _make_record(
+            "extras",
+            levelno=logging.WARNING,  # noqa: B1
+            tin=999000000,
+            count=999000000,
+            amount=999000000.5,
+            flag=True,
+            payload={"b": "999000000"},
+            missing=None,
+            unicode="café ✓",
+        ),
+    ]
+
+    try:
+        raise ValueError("bad value 999000000")
+    except ValueError:
+        records.append(
+            _make_record(
+                "failed",
+                levelno=logging.ERROR,  # noqa: B1
+                exc_info=sys.exc_info(),
+            )
+        )
+
+    return records
+
+
+def _format_both(record):
+    slow = formatters.JsonFormatter().format(copy.copy(record))
+    fast = formatters.FastJsonFormatter().format(copy.copy(record))
+    return json.loads(slow), json.loads(fast)
+
+
+@pytest.mark.parametrize("record", _log_records())
+def test_fast_json_formatter_matches_json_formatter(record):
+    slow, fast = _format_both(record)
+
+    assert fast == slow
+    # Only the allowed key and the decimal number are left unmasked
+    assert "999000000" not in json.dumps(
+        {k: v for k, v in fast.items() if k not in ("count", "amount")}
+    )
+
+
+@pytest.mark.parametrize("record", _log_records())
+def test_fast_json_formatter_matches_json_formatter_in_request(record):
+    app = flask.Flask(__name__)
+
+    with app.test_request_context(
+        "/v1/employers/999000000", headers={"x-amzn-requestid": "request-1"}
+    ):
+        flask.g.current_user_log_attributes = {"current_user.user_id": "user-1"}
+        slow, fast = _format_both(record)
+
+    assert fast == slow
+    assert fast["path"] == "/v1/employers/*********"
+    assert fast["request_id"] == "request-1"
+    assert fast["current_user.user_id"] == "user-1"
+
+
+def test_fast_json_formatter_request_attributes_computed_once():
+    app = flask.Flask(__name__)
+    formatter = formatters.FastJsonFormatter()
+
+    with app.test_request_context("/v1/status"):
+        formatter.format(_make_record("first"))
+        request_attributes = flask.g.request_log_attributes
+
+        with mock.patch.object(formatters, "str_mask_pii") as str_mask_pii:
+            line = json.loads(formatter.format(_make_record("second")))
+
+        str_mask_pii.assert_not_called()
+        assert flask.g.request_log_attributes is request_attributes
+        assert line["request.path"] == "/v1/status"
+
+    with app.test_request_context("/v1/users/current"):
+        line = json.loads(formatter.format(_make_record("next request")))
+
+    assert line["path"] == "/v1/users/current"